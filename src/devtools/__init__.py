@@ -15,19 +15,27 @@
 # with this program; if not, see <https://www.gnu.org/licenses/>.
 
 
-from typing import TYPE_CHECKING
-
-from qgis.core import QgsRuntimeProfiler
-
-from devtools.core.exceptions import DevToolsReloadAfterUpdateWarning
-from devtools.core.settings import DevToolsSettings
-from devtools.devtools_interface import DevToolsInterface
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from qgis.gui import QgisInterface
 
+    from devtools.devtools_interface import DevToolsInterface
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    # The package is also imported by worker processes running outside of
+    # QGIS, so modules depending on QGIS are imported on first access
+    if name == "DevToolsInterface":
+        from devtools.devtools_interface import DevToolsInterface
+
+        return DevToolsInterface
 
-def classFactory(_iface: "QgisInterface") -> DevToolsInterface:
+    message = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(message)
+
+
+def classFactory(_iface: "QgisInterface") -> "DevToolsInterface":
     """Create and return an instance of the DevTools plugin.
 
     :param _iface: QGIS interface instance passed by QGIS at plugin load.
@@ -35,6 +43,11 @@ def classFactory(_iface: "QgisInterface") -> DevToolsInterface:
     :returns: An instance of DevToolsInterface (plugin or stub).
     :rtype: DevToolsInterface
     """
+    from qgis.core import QgsRuntimeProfiler
+
+    from devtools.core.exceptions import DevToolsReloadAfterUpdateWarning
+    from devtools.core.settings import DevToolsSettings
+
     settings = DevToolsSettings()
 
     try:
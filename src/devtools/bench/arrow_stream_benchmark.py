@@ -0,0 +1,255 @@
+# QGIS DevTools Plugin
+# Copyright (C) 2025  NextGIS
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or any
+# later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+import json
+import statistics
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+
+from osgeo import gdal
+from qgis.core import QgsVectorLayer
+
+from devtools.bench.utils import BENCHMARK_LAYER_NAME, write_layer_copy
+from devtools.data.arrays import (
+    DEFAULT_BATCH_SIZE,
+    FeatureBatch,
+    require_numpy,
+    to_arrays,
+)
+from devtools.data.ogr_arrow import (
+    is_arrow_stream_available,
+    is_arrow_stream_supported,
+    stream_arrays,
+)
+from devtools.data.synthetic import SyntheticDatasetSpec, generate_dataset
+
+
+@dataclass(frozen=True)
+class ArrowStreamMeasurement:
+    """Time needed by a reader to stream all features of the layer.
+
+    :param reader: Reader name.
+    :type reader: str
+    :param features: Number of read features.
+    :type features: int
+    :param time: Median read time in seconds.
+    :type time: float
+    :param throughput: Read features per second.
+    :type throughput: float
+    """
+
+    reader: str
+    features: int
+    time: float
+    throughput: float
+
+
+@dataclass
+class ArrowStreamBenchmarkResult:
+    """Result of the ArrowStream benchmark.
+
+    :param source: Benchmarked data source.
+    :type source: str
+    :param gdal_version: GDAL version.
+    :type gdal_version: str
+    :param geometry: Geometry mode of the reads.
+    :type geometry: Optional[str]
+    :param measurements: Measurements of the available readers.
+    :type measurements: List[ArrowStreamMeasurement]
+    """
+
+    source: str
+    gdal_version: str
+    geometry: Optional[str]
+    measurements: List[ArrowStreamMeasurement] = field(default_factory=list)
+
+    @property
+    def speedup(self) -> Optional[float]:
+        """Return the speedup of ArrowStream against the QGIS iterator.
+
+        :returns: Speedup or None if ArrowStream was not measured.
+        :rtype: Optional[float]
+        """
+        times = {item.reader: item.time for item in self.measurements}
+        iterator_time = times.get(ArrowStreamBenchmark.QGIS_ITERATOR)
+        arrow_time = times.get(ArrowStreamBenchmark.ARROW_STREAM)
+        if not iterator_time or not arrow_time:
+            return None
+        return iterator_time / arrow_time
+
+    def table(self) -> str:
+        """Return the measurements as a text table.
+
+        :returns: Multiline table text.
+        :rtype: str
+        """
+        header = (
+            f"Columnar read of {self.source} "
+            f"(GDAL {self.gdal_version}, geometry: {self.geometry})"
+        )
+        lines = [header]
+        lines.extend(
+            f"  {item.reader:<24} {item.features:>10} features "
+            f"{item.time * 1000:>10.1f} ms "
+            f"{item.throughput:>12.0f} features/s"
+            for item in self.measurements
+        )
+
+        speedup = self.speedup
+        if speedup is None:
+            lines.append("  ArrowStream is not available for this source")
+        else:
+            lines.append(f"  ArrowStream speedup: {speedup:.1f}x")
+        return "\n".join(lines)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the result as a JSON serializable dictionary.
+
+        :returns: Benchmark parameters and measurements.
+        :rtype: Dict[str, Any]
+        """
+        result = asdict(self)
+        result["speedup"] = self.speedup
+        return result
+
+    def to_json(self, path: Union[str, Path, None] = None) -> str:
+        """Serialize the result to JSON.
+
+        :param path: Optional file to write the JSON to.
+        :type path: Union[str, Path, None]
+        :returns: JSON document.
+        :rtype: str
+        """
+        document = json.dumps(self.to_dict(), indent=2, ensure_ascii=False)
+        if path is not None:
+            Path(path).write_text(document, encoding="utf-8")
+        return document
+
+
+class ArrowStreamBenchmark:
+    """Compares the OGR ArrowStream reader with the QGIS feature iterator.
+
+    Layers not read through OGR are copied to a temporary GeoPackage.
+    Without a layer a synthetic GeoPackage dataset is generated.
+    """
+
+    QGIS_ITERATOR = "QGIS iterator"
+    ARROW_STREAM = "OGR ArrowStream"
+
+    def __init__(
+        self,
+        layer: Optional[QgsVectorLayer] = None,
+        *,
+        dataset: Optional[SyntheticDatasetSpec] = None,
+        geometry: Optional[str] = "wkb",
+        repeat: int = 3,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> None:
+        """Initialize ArrowStreamBenchmark instance.
+
+        :param layer: Vector layer to read.
+        :type layer: Optional[QgsVectorLayer]
+        :param dataset: Synthetic dataset to generate when no layer is
+            given.
+        :type dataset: Optional[SyntheticDatasetSpec]
+        :param geometry: Geometry mode of the reads.
+        :type geometry: Optional[str]
+        :param repeat: Number of reads per reader.
+        :type repeat: int
+        :param batch_size: Maximum number of features per batch.
+        :type batch_size: int
+        """
+        self.__layer = layer
+        self.__dataset = dataset
+        self.__geometry = geometry
+        self.__repeat = max(repeat, 1)
+        self.__batch_size = batch_size
+
+    def run(self) -> ArrowStreamBenchmarkResult:
+        """Read the layer with every available reader.
+
+        :returns: Benchmark result.
+        :rtype: ArrowStreamBenchmarkResult
+        :raises DataError: If NumPy is not installed or the layer can't be
+            read.
+        :raises BenchmarkRunError: If the GeoPackage copy can't be created.
+        :raises DataError: If the synthetic dataset can't be generated.
+        """
+        require_numpy()
+
+        if self.__layer is not None and is_arrow_stream_available(
+            self.__layer
+        ):
+            return self.__measure(self.__layer, self.__layer.name())
+
+        with tempfile.TemporaryDirectory(prefix="devtools_bench_") as path:
+            copy_path = Path(path) / f"{BENCHMARK_LAYER_NAME}.gpkg"
+            if self.__layer is None:
+                dataset = self.__dataset or SyntheticDatasetSpec()
+                layer = generate_dataset(dataset, copy_path)
+                source = (
+                    f"synthetic GeoPackage ({dataset.features} "
+                    f"{dataset.geometry_type} features)"
+                )
+            else:
+                write_layer_copy(self.__layer, copy_path, "GPKG")
+                layer = QgsVectorLayer(
+                    str(copy_path), BENCHMARK_LAYER_NAME, "ogr"
+                )
+                source = f"GeoPackage copy of {self.__layer.name()}"
+            result = self.__measure(layer, source)
+            # Release the file before the directory is removed
+            del layer
+        return result
+
+    def __measure(
+        self, layer: QgsVectorLayer, source: str
+    ) -> ArrowStreamBenchmarkResult:
+        readers: Dict[str, Callable[[], Iterator[FeatureBatch]]] = {
+            self.QGIS_ITERATOR: lambda: to_arrays(
+                layer, geometry=self.__geometry, batch_size=self.__batch_size
+            ),
+        }
+        if is_arrow_stream_supported():
+            readers[self.ARROW_STREAM] = lambda: stream_arrays(
+                layer, geometry=self.__geometry, batch_size=self.__batch_size
+            )
+
+        result = ArrowStreamBenchmarkResult(
+            source, gdal.__version__, self.__geometry
+        )
+        for reader, read in readers.items():
+            times = []
+            features = 0
+            for _ in range(self.__repeat):
+                started = time.perf_counter()
+                features = sum(len(batch) for batch in read())
+                times.append(time.perf_counter() - started)
+
+            median = statistics.median(times)
+            result.measurements.append(
+                ArrowStreamMeasurement(
+                    reader,
+                    features,
+                    median,
+                    features / median if median else 0.0,
+                )
+            )
+        return result
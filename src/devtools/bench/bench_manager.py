@@ -0,0 +1,259 @@
+# QGIS DevTools Plugin
+# Copyright (C) 2025  NextGIS
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or any
+# later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+from qgis.core import QgsVectorLayer
+from qgis.PyQt.QtCore import QObject, pyqtSlot
+from qgis.PyQt.QtWidgets import QAction
+from qgis.utils import iface
+
+from devtools.bench.arrow_stream_benchmark import (
+    ArrowStreamBenchmark,
+    ArrowStreamBenchmarkResult,
+)
+from devtools.bench.bulk_edit_benchmark import (
+    BulkEditBenchmark,
+    BulkEditBenchmarkResult,
+)
+from devtools.bench.feature_benchmark import (
+    FeatureBenchmark,
+    FeatureBenchmarkResult,
+)
+from devtools.bench.memory_layer_benchmark import (
+    MemoryLayerBenchmark,
+    MemoryLayerBenchmarkResult,
+)
+from devtools.bench.processing_benchmark import (
+    ProcessingBenchmark,
+    ProcessingBenchmarkResult,
+)
+from devtools.bench.ui.processing_benchmark_dialog import (
+    ProcessingBenchmarkDialog,
+)
+from devtools.core.constants import MENU_NAME
+from devtools.data.arrays import DEFAULT_BATCH_SIZE
+from devtools.data.bulk_edit import DEFAULT_CHUNK_SIZE
+from devtools.data.synthetic import SyntheticDatasetSpec
+
+if TYPE_CHECKING:
+    from qgis.gui import QgisInterface
+
+    from devtools.devtools_interface import DevToolsInterface
+
+    assert isinstance(iface, QgisInterface)
+
+
+class BenchmarkManager(QObject):
+    """Benchmark manager for QGIS DevTools.
+
+    Provides benchmark entry points for the Python console and the
+    benchmark dialogs.
+    """
+
+    __processing_dialog: Optional[ProcessingBenchmarkDialog]
+    __processing_action: Optional[QAction]  # type: ignore reportInvalidTypeForm
+
+    def __init__(self, parent: "DevToolsInterface") -> None:
+        """Initialize BenchmarkManager instance.
+
+        :param parent: Plugin interface instance.
+        :type parent: DevToolsInterface
+        """
+        super().__init__(parent)
+        self._plugin = parent
+        self.__processing_dialog = None
+        self.__processing_action = None
+
+    def load(self) -> None:
+        """Add benchmark actions to the plugin menu."""
+        self.__processing_action = QAction(
+            text=self.tr("Processing Benchmark…")
+        )
+        self.__processing_action.triggered.connect(
+            self.__show_processing_dialog
+        )
+        iface.addPluginToMenu(MENU_NAME, self.__processing_action)
+
+    def unload(self) -> None:
+        """Remove benchmark actions and dialogs."""
+        if self.__processing_action is not None:
+            iface.removePluginMenu(MENU_NAME, self.__processing_action)
+            self.__processing_action.deleteLater()
+            self.__processing_action = None
+
+        if self.__processing_dialog is not None:
+            self.__processing_dialog.close()
+            self.__processing_dialog.deleteLater()
+            self.__processing_dialog = None
+
+    def processing(
+        self,
+        algorithm_id: str,
+        parameters: Dict[str, Any],
+        *,
+        repeat: int = 5,
+        warmup: int = 1,
+        parallel: bool = False,
+    ) -> ProcessingBenchmarkResult:
+        """Benchmark a processing algorithm.
+
+        :param algorithm_id: Processing algorithm identifier.
+        :type algorithm_id: str
+        :param parameters: Algorithm parameters.
+        :type parameters: Dict[str, Any]
+        :param repeat: Number of measured runs.
+        :type repeat: int
+        :param warmup: Number of unmeasured runs before measuring.
+        :type warmup: int
+        :param parallel: Run measured runs concurrently in background
+            tasks instead of sequentially in-process.
+        :type parallel: bool
+        :returns: Benchmark result with statistical summaries.
+        :rtype: ProcessingBenchmarkResult
+        :raises BenchmarkError: If the algorithm is not found or a run
+            fails.
+        """
+        benchmark = ProcessingBenchmark(
+            algorithm_id,
+            parameters,
+            repeat=repeat,
+            warmup=warmup,
+            parallel=parallel,
+        )
+        return benchmark.run()
+
+    def features(
+        self,
+        layer: QgsVectorLayer,
+        *,
+        repeat: int = 3,
+        copies: bool = True,
+        limit: Optional[int] = None,
+    ) -> FeatureBenchmarkResult:
+        """Benchmark feature iteration with different request shapes.
+
+        Compares ``NoGeometry``, ``SubsetOfAttributes``, filter rectangles
+        and feature id versus expression filters on the layer and,
+        optionally, on its memory, GeoPackage and SpatiaLite copies.
+
+        :param layer: Vector layer to benchmark.
+        :type layer: QgsVectorLayer
+        :param repeat: Number of iterations per measurement.
+        :type repeat: int
+        :param copies: Also benchmark copies of the layer in other
+            providers.
+        :type copies: bool
+        :param limit: Maximum number of features to copy.
+        :type limit: Optional[int]
+        :returns: Measurements with a recommendation table.
+        :rtype: FeatureBenchmarkResult
+        :raises BenchmarkError: If a copy of the layer can't be created.
+        """
+        benchmark = FeatureBenchmark(
+            layer, repeat=repeat, copies=copies, limit=limit
+        )
+        return benchmark.run()
+
+    def bulk_edit(
+        self, *, features: int = 10000, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> BulkEditBenchmarkResult:
+        """Benchmark ``devtools.data.bulk_edit`` against per-feature loops.
+
+        :param features: Number of features to change.
+        :type features: int
+        :param chunk_size: Chunk size used by ``bulk_edit``.
+        :type chunk_size: int
+        :returns: Time of every edit strategy with the speedup against the
+            edit buffer loop.
+        :rtype: BulkEditBenchmarkResult
+        :raises BenchmarkError: If the benchmark dataset can't be created.
+        """
+        benchmark = BulkEditBenchmark(features=features, chunk_size=chunk_size)
+        return benchmark.run()
+
+    def memory_layer(
+        self,
+        *,
+        features: int = 100000,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        seed: int = 0,
+    ) -> MemoryLayerBenchmarkResult:
+        """Benchmark ``devtools.data.memory_layer_from_arrays`` throughput.
+
+        :param features: Number of features to load.
+        :type features: int
+        :param chunk_size: Chunk size used by ``memory_layer_from_arrays``.
+        :type chunk_size: int
+        :param seed: Seed of the random dataset.
+        :type seed: int
+        :returns: Time and throughput of every loading strategy with the
+            speedup against the edit buffer loop.
+        :rtype: MemoryLayerBenchmarkResult
+        :raises DataError: If NumPy is not installed.
+        """
+        benchmark = MemoryLayerBenchmark(
+            features=features, chunk_size=chunk_size, seed=seed
+        )
+        return benchmark.run()
+
+    def arrow_stream(
+        self,
+        layer: Optional[QgsVectorLayer] = None,
+        *,
+        dataset: Optional[SyntheticDatasetSpec] = None,
+        geometry: Optional[str] = "wkb",
+        repeat: int = 3,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> ArrowStreamBenchmarkResult:
+        """Compare OGR ArrowStream reads with the QGIS feature iterator.
+
+        :param layer: Vector layer to read. Layers not read through OGR are
+            copied to a temporary GeoPackage.
+        :type layer: Optional[QgsVectorLayer]
+        :param dataset: Synthetic dataset to generate when no layer is
+            given.
+        :type dataset: Optional[SyntheticDatasetSpec]
+        :param geometry: ``"wkb"``, ``"xy"`` or None to skip geometries.
+        :type geometry: Optional[str]
+        :param repeat: Number of reads per reader.
+        :type repeat: int
+        :param batch_size: Maximum number of features per batch.
+        :type batch_size: int
+        :returns: Throughput of both readers side by side.
+        :rtype: ArrowStreamBenchmarkResult
+        :raises DevToolsError: If NumPy is missing or the layer can't be
+            read or copied.
+        """
+        benchmark = ArrowStreamBenchmark(
+            layer,
+            dataset=dataset,
+            geometry=geometry,
+            repeat=repeat,
+            batch_size=batch_size,
+        )
+        return benchmark.run()
+
+    @pyqtSlot()
+    def __show_processing_dialog(self) -> None:
+        if self.__processing_dialog is None:
+            self.__processing_dialog = ProcessingBenchmarkDialog(
+                self._plugin, iface.mainWindow()
+            )
+        self.__processing_dialog.show()
+        self.__processing_dialog.raise_()
+        self.__processing_dialog.activateWindow()
@@ -0,0 +1,248 @@
+# QGIS DevTools Plugin
+# Copyright (C) 2025  NextGIS
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or any
+# later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+import json
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Union
+
+from qgis.core import (
+    QgsFeature,
+    QgsGeometry,
+    QgsPointXY,
+    QgsVectorLayer,
+)
+
+from devtools.bench.utils import BENCHMARK_LAYER_NAME, write_layer_copy
+from devtools.core.compat import QgsChangedAttributesMap
+from devtools.core.logging import logger
+from devtools.data.bulk_edit import DEFAULT_CHUNK_SIZE, bulk_edit
+from devtools.data.exceptions import DataCapabilityError
+
+
+@dataclass(frozen=True)
+class BulkEditMeasurement:
+    """Time needed by an edit strategy to change all features.
+
+    :param strategy: Edit strategy name.
+    :type strategy: str
+    :param time: Elapsed time in seconds.
+    :type time: float
+    :param speedup: Speedup against the per-feature edit buffer loop.
+    :type speedup: float
+    """
+
+    strategy: str
+    time: float
+    speedup: float
+
+
+@dataclass
+class BulkEditBenchmarkResult:
+    """Result of the bulk edit benchmark.
+
+    :param features: Number of changed features.
+    :type features: int
+    :param chunk_size: Chunk size used by ``bulk_edit``.
+    :type chunk_size: int
+    :param measurements: Measurements, slowest strategy first.
+    :type measurements: List[BulkEditMeasurement]
+    """
+
+    features: int
+    chunk_size: int
+    measurements: List[BulkEditMeasurement] = field(default_factory=list)
+
+    def table(self) -> str:
+        """Return the measurements as a text table.
+
+        :returns: Multiline table text.
+        :rtype: str
+        """
+        header = (
+            f"Bulk edit of {self.features} GeoPackage features "
+            f"(chunks of {self.chunk_size})"
+        )
+        lines = [header]
+        lines.extend(
+            f"  {item.strategy:<36} {item.time * 1000:>10.1f} ms "
+            f"{item.speedup:>7.1f}x"
+            for item in self.measurements
+        )
+        return "\n".join(lines)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the result as a JSON serializable dictionary.
+
+        :returns: Benchmark parameters and measurements.
+        :rtype: Dict[str, Any]
+        """
+        return asdict(self)
+
+    def to_json(self, path: Union[str, Path, None] = None) -> str:
+        """Serialize the result to JSON.
+
+        :param path: Optional file to write the JSON to.
+        :type path: Union[str, Path, None]
+        :returns: JSON document.
+        :rtype: str
+        """
+        document = json.dumps(self.to_dict(), indent=2, ensure_ascii=False)
+        if path is not None:
+            Path(path).write_text(document, encoding="utf-8")
+        return document
+
+
+class BulkEditBenchmark:
+    """Compares ``bulk_edit`` with hand written per-feature edit loops.
+
+    Every strategy changes an integer attribute of all features of a
+    freshly written GeoPackage dataset.
+    """
+
+    EDIT_BUFFER_LOOP = "edit buffer loop (changeAttributeValue)"
+    PROVIDER_LOOP = "provider loop (one feature per call)"
+    BULK_EDIT = "bulk_edit"
+    BULK_EDIT_TRANSACTION = "bulk_edit (transaction)"
+    BULK_EDIT_UNDO = "bulk_edit (edit buffer, undo)"
+
+    def __init__(
+        self,
+        *,
+        features: int = 10000,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        """Initialize BulkEditBenchmark instance.
+
+        :param features: Number of features to change.
+        :type features: int
+        :param chunk_size: Chunk size used by ``bulk_edit``.
+        :type chunk_size: int
+        """
+        self.__features = max(features, 1)
+        self.__chunk_size = chunk_size
+
+    def run(self) -> BulkEditBenchmarkResult:
+        """Run all edit strategies.
+
+        :returns: Benchmark result.
+        :rtype: BulkEditBenchmarkResult
+        :raises BenchmarkRunError: If the dataset can't be created.
+        """
+        strategies: Dict[str, Callable[[QgsVectorLayer, int], None]] = {
+            self.EDIT_BUFFER_LOOP: self.__edit_buffer_loop,
+            self.PROVIDER_LOOP: self.__provider_loop,
+            self.BULK_EDIT: self.__bulk_edit,
+            self.BULK_EDIT_TRANSACTION: self.__bulk_edit_transaction,
+            self.BULK_EDIT_UNDO: self.__bulk_edit_undo,
+        }
+
+        times: Dict[str, float] = {}
+        with tempfile.TemporaryDirectory(prefix="devtools_bench_") as path:
+            layer = self.__create_layer(Path(path))
+            for offset, (name, strategy) in enumerate(strategies.items()):
+                started = time.perf_counter()
+                try:
+                    strategy(layer, offset + 1)
+                except DataCapabilityError as error:
+                    logger.debug(f"Skipping {name!r}: {error.log_message}")
+                    continue
+                times[name] = time.perf_counter() - started
+            # Release the file before the directory is removed
+            del layer
+
+        baseline = times.get(self.EDIT_BUFFER_LOOP)
+        result = BulkEditBenchmarkResult(self.__features, self.__chunk_size)
+        result.measurements.extend(
+            BulkEditMeasurement(
+                name,
+                duration,
+                baseline / duration if baseline and duration else 1.0,
+            )
+            for name, duration in sorted(
+                times.items(), key=lambda item: item[1], reverse=True
+            )
+        )
+        return result
+
+    def __create_layer(self, directory: Path) -> QgsVectorLayer:
+        memory_layer = QgsVectorLayer(
+            "Point?crs=EPSG:4326&field=value:integer",
+            BENCHMARK_LAYER_NAME,
+            "memory",
+        )
+        features = []
+        for index in range(self.__features):
+            feature = QgsFeature(memory_layer.fields())
+            feature.setAttributes([0])
+            feature.setGeometry(
+                QgsGeometry.fromPointXY(QgsPointXY(index % 360 - 180, 0))
+            )
+            features.append(feature)
+        memory_layer.dataProvider().addFeatures(features)
+
+        path = directory / "benchmark.gpkg"
+        write_layer_copy(memory_layer, path, "GPKG")
+        return QgsVectorLayer(str(path), BENCHMARK_LAYER_NAME, "ogr")
+
+    def __changes(
+        self, layer: QgsVectorLayer, value: int
+    ) -> QgsChangedAttributesMap:
+        field_index = layer.fields().indexOf("value")
+        return {
+            feature_id: {field_index: value}
+            for feature_id in layer.allFeatureIds()
+        }
+
+    def __edit_buffer_loop(self, layer: QgsVectorLayer, value: int) -> None:
+        changes = self.__changes(layer, value)
+        layer.startEditing()
+        for feature_id, values in changes.items():
+            for field_index, field_value in values.items():
+                layer.changeAttributeValue(
+                    feature_id, field_index, field_value
+                )
+        layer.commitChanges()
+
+    def __provider_loop(self, layer: QgsVectorLayer, value: int) -> None:
+        provider = layer.dataProvider()
+        for feature_id, values in self.__changes(layer, value).items():
+            provider.changeAttributeValues({feature_id: values})
+
+    def __bulk_edit(self, layer: QgsVectorLayer, value: int) -> None:
+        bulk_edit(
+            layer,
+            self.__changes(layer, value),
+            chunk_size=self.__chunk_size,
+        )
+
+    def __bulk_edit_transaction(
+        self, layer: QgsVectorLayer, value: int
+    ) -> None:
+        bulk_edit(
+            layer,
+            self.__changes(layer, value),
+            chunk_size=self.__chunk_size,
+            transaction=True,
+        )
+
+    def __bulk_edit_undo(self, layer: QgsVectorLayer, value: int) -> None:
+        layer.startEditing()
+        bulk_edit(layer, self.__changes(layer, value), undo=True)
+        layer.commitChanges()
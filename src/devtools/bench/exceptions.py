@@ -0,0 +1,98 @@
+# QGIS DevTools Plugin
+# Copyright (C) 2025  NextGIS
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or any
+# later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+from typing import Optional
+
+from qgis.core import QgsApplication
+
+from devtools.core.exceptions import DevToolsError
+
+
+class BenchmarkError(DevToolsError):
+    """General benchmark error in QGIS DevTools.
+
+    :param log_message: Log message for debugging.
+    :type log_message: str or None
+    :param user_message: Message for user display.
+    :type user_message: str or None
+    :param detail: Detailed error description.
+    :type detail: str or None
+    """
+
+    def __init__(
+        self,
+        log_message: Optional[str] = None,
+        *,
+        user_message: Optional[str] = None,
+        detail: Optional[str] = None,
+    ) -> None:
+        """Initialize BenchmarkError.
+
+        :param log_message: Log message for debugging.
+        :type log_message: str or None
+        :param user_message: Message for user display.
+        :type user_message: str or None
+        :param detail: Detailed error description.
+        :type detail: str or None
+        """
+        default_message = QgsApplication.translate(
+            "Exceptions", "An error occurred while running the benchmark"
+        )
+
+        if log_message is None:
+            log_message = default_message
+        if user_message is None:
+            user_message = default_message
+
+        super().__init__(
+            log_message=log_message,
+            user_message=user_message,
+            detail=detail,
+        )
+
+
+class BenchmarkAlgorithmNotFoundError(BenchmarkError):
+    """Processing algorithm to benchmark is not registered."""
+
+    def __init__(self, algorithm_id: str) -> None:
+        """Initialize BenchmarkAlgorithmNotFoundError.
+
+        :param algorithm_id: Identifier of the missing algorithm.
+        :type algorithm_id: str
+        """
+        message = QgsApplication.translate(
+            "Exceptions", 'Processing algorithm "{algorithm_id}" not found'
+        ).format(algorithm_id=algorithm_id)
+        super().__init__(log_message=message, user_message=message)
+        self._need_logs = False
+
+
+class BenchmarkRunError(BenchmarkError):
+    """Benchmarked operation failed."""
+
+    def __init__(self, detail: Optional[str] = None) -> None:
+        """Initialize BenchmarkRunError.
+
+        :param detail: Failure details.
+        :type detail: Optional[str]
+        """
+        message = QgsApplication.translate(
+            "Exceptions", "Benchmarked operation failed"
+        )
+        super().__init__(
+            log_message=message, user_message=message, detail=detail
+        )
@@ -0,0 +1,489 @@
+# QGIS DevTools Plugin
+# Copyright (C) 2025  NextGIS
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or any
+# later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+import json
+import statistics
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from qgis.core import (
+    QgsDataSourceUri,
+    QgsFeatureRequest,
+    QgsRectangle,
+    QgsVectorLayer,
+)
+
+from devtools.bench.utils import BENCHMARK_LAYER_NAME, write_layer_copy
+from devtools.core.compat import FeatureRequestFlag
+from devtools.core.logging import logger
+
+
+@dataclass(frozen=True)
+class FeatureMeasurement:
+    """Iteration speed of a request shape on a data source.
+
+    :param source: Data source description.
+    :type source: str
+    :param request: Request shape name.
+    :type request: str
+    :param features: Number of iterated features.
+    :type features: int
+    :param time: Median iteration time in seconds.
+    :type time: float
+    """
+
+    source: str
+    request: str
+    features: int
+    time: float
+
+    @property
+    def throughput(self) -> float:
+        """Return iterated features per second.
+
+        :returns: Features per second.
+        :rtype: float
+        """
+        return self.features / self.time if self.time > 0 else 0.0
+
+
+@dataclass(frozen=True)
+class Recommendation:
+    """Request shape advice derived from measurements.
+
+    :param advice: What to do.
+    :type advice: str
+    :param speedup: How many times faster the advised shape is.
+    :type speedup: float
+    :param source: Data source the advice was measured on.
+    :type source: str
+    """
+
+    advice: str
+    speedup: float
+    source: str
+
+
+@dataclass
+class FeatureBenchmarkResult:
+    """Result of a feature iteration benchmark.
+
+    :param layer_name: Benchmarked layer name.
+    :type layer_name: str
+    :param repeat: Number of iterations per measurement.
+    :type repeat: int
+    :param measurements: Measurements for every source and request shape.
+    :type measurements: List[FeatureMeasurement]
+    """
+
+    layer_name: str
+    repeat: int
+    measurements: List[FeatureMeasurement] = field(default_factory=list)
+
+    def measurement(
+        self, source: str, request: str
+    ) -> Optional[FeatureMeasurement]:
+        """Find the measurement of a request shape on a source.
+
+        :param source: Data source description.
+        :type source: str
+        :param request: Request shape name.
+        :type request: str
+        :returns: Measurement or None if it wasn't taken.
+        :rtype: Optional[FeatureMeasurement]
+        """
+        for measurement in self.measurements:
+            if measurement.source == source and measurement.request == request:
+                return measurement
+        return None
+
+    @property
+    def sources(self) -> List[str]:
+        """Return measured data sources in measurement order.
+
+        :returns: Data source descriptions.
+        :rtype: List[str]
+        """
+        return list(
+            dict.fromkeys(
+                measurement.source for measurement in self.measurements
+            )
+        )
+
+    def recommendations(self) -> List[Recommendation]:
+        """Derive request shape advice from the measurements.
+
+        Only advice that makes iteration at least 10 % faster is returned.
+
+        :returns: Recommendations, largest speedup first.
+        :rtype: List[Recommendation]
+        """
+        comparisons = (
+            (
+                FeatureBenchmark.DEFAULT,
+                FeatureBenchmark.NO_GEOMETRY,
+                "Set the NoGeometry flag when geometries are not used",
+                False,
+            ),
+            (
+                FeatureBenchmark.DEFAULT,
+                FeatureBenchmark.SUBSET_OF_ATTRIBUTES,
+                "Request only the used attributes",
+                False,
+            ),
+            (
+                FeatureBenchmark.DEFAULT,
+                FeatureBenchmark.NO_GEOMETRY_SUBSET,
+                "Combine NoGeometry with a subset of attributes",
+                False,
+            ),
+            (
+                FeatureBenchmark.EXPRESSION_FILTER,
+                FeatureBenchmark.FID_FILTER,
+                "Filter by feature ids instead of an $id expression",
+                True,
+            ),
+            (
+                FeatureBenchmark.RECT_EXACT,
+                FeatureBenchmark.RECT,
+                "Skip ExactIntersect when bounding box hits are enough",
+                True,
+            ),
+        )
+
+        result = []
+        for source in self.sources:
+            for baseline, advised, advice, same_features in comparisons:
+                speedup = self.__speedup(
+                    source, baseline, advised, same_features=same_features
+                )
+                if speedup is not None and speedup >= 1.1:  # noqa: PLR2004
+                    result.append(Recommendation(advice, speedup, source))
+
+        default_times = [
+            measurement
+            for measurement in self.measurements
+            if measurement.request == FeatureBenchmark.DEFAULT
+        ]
+        if len(default_times) > 1:
+            fastest = max(default_times, key=lambda item: item.throughput)
+            slowest = min(default_times, key=lambda item: item.throughput)
+            if slowest.throughput > 0:
+                result.append(
+                    Recommendation(
+                        f"Work on a {fastest.source} copy of the data "
+                        f"instead of {slowest.source}",
+                        fastest.throughput / slowest.throughput,
+                        fastest.source,
+                    )
+                )
+
+        result.sort(key=lambda item: item.speedup, reverse=True)
+        return result
+
+    def table(self) -> str:
+        """Return the measurements and recommendations as a text table.
+
+        :returns: Multiline table text.
+        :rtype: str
+        """
+        header = (
+            f"{'Source':<24} {'Request':<34} {'Features':>9} "
+            f"{'Time, ms':>10} {'Features/s':>12}"
+        )
+        lines = [f"Feature iteration: {self.layer_name}", header]
+        lines.extend(
+            f"{measurement.source:<24} {measurement.request:<34} "
+            f"{measurement.features:>9} {measurement.time * 1000:>10.1f} "
+            f"{measurement.throughput:>12.0f}"
+            for measurement in self.measurements
+        )
+
+        recommendations = self.recommendations()
+        if recommendations:
+            lines.append("")
+            lines.append("Recommendations:")
+            lines.extend(
+                f"  {item.speedup:>5.1f}x  {item.advice} ({item.source})"
+                for item in recommendations
+            )
+        return "\n".join(lines)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the result as a JSON serializable dictionary.
+
+        :returns: Measurements and recommendations.
+        :rtype: Dict[str, Any]
+        """
+        return {
+            "layer": self.layer_name,
+            "repeat": self.repeat,
+            "measurements": [
+                {**asdict(measurement), "throughput": measurement.throughput}
+                for measurement in self.measurements
+            ],
+            "recommendations": [
+                asdict(item) for item in self.recommendations()
+            ],
+        }
+
+    def to_json(self, path: Union[str, Path, None] = None) -> str:
+        """Serialize the result to JSON.
+
+        :param path: Optional file to write the JSON to.
+        :type path: Union[str, Path, None]
+        :returns: JSON document.
+        :rtype: str
+        """
+        document = json.dumps(self.to_dict(), indent=2, ensure_ascii=False)
+        if path is not None:
+            Path(path).write_text(document, encoding="utf-8")
+        return document
+
+    def __speedup(
+        self,
+        source: str,
+        baseline: str,
+        advised: str,
+        *,
+        same_features: bool,
+    ) -> Optional[float]:
+        baseline_measurement = self.measurement(source, baseline)
+        advised_measurement = self.measurement(source, advised)
+        if baseline_measurement is None or advised_measurement is None:
+            return None
+
+        if same_features:
+            if advised_measurement.time <= 0:
+                return None
+            return baseline_measurement.time / advised_measurement.time
+
+        if baseline_measurement.throughput <= 0:
+            return None
+        return advised_measurement.throughput / baseline_measurement.throughput
+
+
+class FeatureBenchmark:
+    """Measures feature iteration speed for different request shapes.
+
+    The layer is benchmarked as is and, optionally, as memory, GeoPackage
+    and SpatiaLite copies of the same features, so the cost of a request
+    shape can be compared across providers.
+    """
+
+    DEFAULT = "default"
+    NO_GEOMETRY = "NoGeometry"
+    SUBSET_OF_ATTRIBUTES = "SubsetOfAttributes"
+    NO_GEOMETRY_SUBSET = "NoGeometry + SubsetOfAttributes"
+    RECT = "filter rect"
+    RECT_EXACT = "filter rect + ExactIntersect"
+    FID_FILTER = "fid filter"
+    EXPRESSION_FILTER = "$id expression filter"
+
+    FILTERED_FEATURES_LIMIT = 1000
+
+    def __init__(
+        self,
+        layer: QgsVectorLayer,
+        *,
+        repeat: int = 3,
+        copies: bool = True,
+        limit: Optional[int] = None,
+    ) -> None:
+        """Initialize FeatureBenchmark instance.
+
+        :param layer: Vector layer to benchmark.
+        :type layer: QgsVectorLayer
+        :param repeat: Number of iterations per measurement; the median
+            time is reported.
+        :type repeat: int
+        :param copies: Also benchmark memory, GeoPackage and SpatiaLite
+            copies of the layer.
+        :type copies: bool
+        :param limit: Maximum number of features to copy.
+        :type limit: Optional[int]
+        """
+        self.__layer = layer
+        self.__repeat = max(repeat, 1)
+        self.__copies = copies
+        self.__limit = limit
+
+    def run(self) -> FeatureBenchmarkResult:
+        """Benchmark all request shapes on all sources.
+
+        :returns: Benchmark result.
+        :rtype: FeatureBenchmarkResult
+        :raises BenchmarkRunError: If a copy of the layer can't be created.
+        """
+        result = FeatureBenchmarkResult(self.__layer.name(), self.__repeat)
+        provider_name = self.__layer.providerType()
+        self.__measure_source(
+            result, f"source ({provider_name})", self.__layer
+        )
+        if not self.__copies:
+            return result
+
+        with tempfile.TemporaryDirectory(prefix="devtools_bench_") as path:
+            for source, factory in (
+                ("memory", self.__memory_copy),
+                ("ogr (GeoPackage)", self.__geopackage_copy),
+                ("spatialite", self.__spatialite_copy),
+            ):
+                layer = factory(Path(path))
+                self.__measure_source(result, source, layer)
+                # Release files before the directory is removed
+                del layer
+
+        return result
+
+    def __measure_source(
+        self,
+        result: FeatureBenchmarkResult,
+        source: str,
+        layer: QgsVectorLayer,
+    ) -> None:
+        logger.debug(f"Benchmarking feature iteration on {source}")
+        for name, request in self.__requests(layer):
+            features, duration = self.__measure(layer, request)
+            result.measurements.append(
+                FeatureMeasurement(source, name, features, duration)
+            )
+
+    def __requests(
+        self, layer: QgsVectorLayer
+    ) -> List[Tuple[str, QgsFeatureRequest]]:
+        requests = [(self.DEFAULT, QgsFeatureRequest())]
+        requests.append(
+            (
+                self.NO_GEOMETRY,
+                QgsFeatureRequest().setFlags(FeatureRequestFlag.NoGeometry),
+            )
+        )
+
+        if layer.fields().count() > 0:
+            subset = [0]
+            requests.append(
+                (
+                    self.SUBSET_OF_ATTRIBUTES,
+                    QgsFeatureRequest().setSubsetOfAttributes(subset),
+                )
+            )
+            requests.append(
+                (
+                    self.NO_GEOMETRY_SUBSET,
+                    QgsFeatureRequest()
+                    .setFlags(FeatureRequestFlag.NoGeometry)
+                    .setSubsetOfAttributes(subset),
+                )
+            )
+
+        if layer.isSpatial():
+            rectangle = self.__central_rectangle(layer.extent())
+            requests.append(
+                (self.RECT, QgsFeatureRequest().setFilterRect(rectangle))
+            )
+            requests.append(
+                (
+                    self.RECT_EXACT,
+                    QgsFeatureRequest()
+                    .setFilterRect(rectangle)
+                    .setFlags(FeatureRequestFlag.ExactIntersect),
+                )
+            )
+
+        feature_ids = self.__sample_ids(layer)
+        if feature_ids:
+            requests.append(
+                (
+                    self.FID_FILTER,
+                    QgsFeatureRequest().setFilterFids(feature_ids),
+                )
+            )
+            ids = ", ".join(str(feature_id) for feature_id in feature_ids)
+            requests.append(
+                (
+                    self.EXPRESSION_FILTER,
+                    QgsFeatureRequest().setFilterExpression(f"$id IN ({ids})"),
+                )
+            )
+
+        return requests
+
+    def __measure(
+        self, layer: QgsVectorLayer, request: QgsFeatureRequest
+    ) -> Tuple[int, float]:
+        durations = []
+        features = 0
+        for _ in range(self.__repeat):
+            features = 0
+            started = time.perf_counter()
+            for _feature in layer.getFeatures(request):
+                features += 1
+            durations.append(time.perf_counter() - started)
+        return features, statistics.median(durations)
+
+    def __sample_ids(self, layer: QgsVectorLayer) -> List[int]:
+        request = (
+            QgsFeatureRequest()
+            .setFlags(FeatureRequestFlag.NoGeometry)
+            .setNoAttributes()
+        )
+        feature_ids = [feature.id() for feature in layer.getFeatures(request)]
+        step = max(len(feature_ids) // self.FILTERED_FEATURES_LIMIT, 1)
+        return feature_ids[::step][: self.FILTERED_FEATURES_LIMIT]
+
+    def __central_rectangle(self, extent: QgsRectangle) -> QgsRectangle:
+        rectangle = QgsRectangle(extent)
+        rectangle.scale(0.5)
+        return rectangle
+
+    def __copy_request(self) -> QgsFeatureRequest:
+        request = QgsFeatureRequest()
+        if self.__limit is not None:
+            request.setLimit(self.__limit)
+        return request
+
+    def __memory_copy(self, _: Path) -> QgsVectorLayer:
+        return self.__layer.materialize(self.__copy_request())
+
+    def __geopackage_copy(self, directory: Path) -> QgsVectorLayer:
+        path = directory / "benchmark.gpkg"
+        self.__write(path, "GPKG", [])
+        return QgsVectorLayer(str(path), BENCHMARK_LAYER_NAME, "ogr")
+
+    def __spatialite_copy(self, directory: Path) -> QgsVectorLayer:
+        path = directory / "benchmark.sqlite"
+        self.__write(path, "SQLite", ["SPATIALITE=YES"])
+        uri = QgsDataSourceUri()
+        uri.setDatabase(str(path))
+        uri.setDataSource(
+            "",
+            BENCHMARK_LAYER_NAME,
+            "GEOMETRY" if self.__layer.isSpatial() else "",
+        )
+        return QgsVectorLayer(uri.uri(), BENCHMARK_LAYER_NAME, "spatialite")
+
+    def __write(
+        self, path: Path, driver_name: str, dataset_options: List[str]
+    ) -> None:
+        source = self.__layer
+        if self.__limit is not None:
+            source = source.materialize(self.__copy_request())
+        write_layer_copy(source, path, driver_name, dataset_options)
@@ -0,0 +1,261 @@
+# QGIS DevTools Plugin
+# Copyright (C) 2025  NextGIS
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or any
+# later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+import importlib.util
+import json
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple, Union
+
+from qgis.core import QgsFeature, QgsGeometry, QgsPointXY, QgsVectorLayer
+
+from devtools.bench.utils import BENCHMARK_LAYER_NAME
+from devtools.data.arrays import memory_layer_from_arrays, require_numpy
+from devtools.data.bulk_edit import DEFAULT_CHUNK_SIZE
+
+numpy = None
+if importlib.util.find_spec("numpy"):
+    import numpy
+
+Columns = Dict[str, "numpy.ndarray"]
+Coordinates = Tuple["numpy.ndarray", "numpy.ndarray"]
+
+
+@dataclass(frozen=True)
+class MemoryLayerMeasurement:
+    """Time needed by a loading strategy to fill a memory layer.
+
+    :param strategy: Loading strategy name.
+    :type strategy: str
+    :param time: Elapsed time in seconds.
+    :type time: float
+    :param throughput: Loaded features per second.
+    :type throughput: float
+    :param speedup: Speedup against the edit buffer loop.
+    :type speedup: float
+    """
+
+    strategy: str
+    time: float
+    throughput: float
+    speedup: float
+
+
+@dataclass
+class MemoryLayerBenchmarkResult:
+    """Result of the memory layer loading benchmark.
+
+    :param features: Number of loaded features.
+    :type features: int
+    :param chunk_size: Chunk size used by ``memory_layer_from_arrays``.
+    :type chunk_size: int
+    :param measurements: Measurements, slowest strategy first.
+    :type measurements: List[MemoryLayerMeasurement]
+    """
+
+    features: int
+    chunk_size: int
+    measurements: List[MemoryLayerMeasurement] = field(default_factory=list)
+
+    def table(self) -> str:
+        """Return the measurements as a text table.
+
+        :returns: Multiline table text.
+        :rtype: str
+        """
+        header = (
+            f"Loading {self.features} point features into a memory layer "
+            f"(chunks of {self.chunk_size})"
+        )
+        lines = [header]
+        lines.extend(
+            f"  {item.strategy:<36} {item.time * 1000:>10.1f} ms "
+            f"{item.throughput:>12.0f} features/s {item.speedup:>7.1f}x"
+            for item in self.measurements
+        )
+        return "\n".join(lines)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the result as a JSON serializable dictionary.
+
+        :returns: Benchmark parameters and measurements.
+        :rtype: Dict[str, Any]
+        """
+        return asdict(self)
+
+    def to_json(self, path: Union[str, Path, None] = None) -> str:
+        """Serialize the result to JSON.
+
+        :param path: Optional file to write the JSON to.
+        :type path: Union[str, Path, None]
+        :returns: JSON document.
+        :rtype: str
+        """
+        document = json.dumps(self.to_dict(), indent=2, ensure_ascii=False)
+        if path is not None:
+            Path(path).write_text(document, encoding="utf-8")
+        return document
+
+
+class MemoryLayerBenchmark:
+    """Compares ``memory_layer_from_arrays`` with per-row feature loading.
+
+    Every strategy loads the same random point dataset with an integer,
+    a floating point and a string attribute.
+    """
+
+    EDIT_BUFFER_LOOP = "edit buffer loop (addFeature)"
+    PROVIDER_LOOP = "provider loop (one feature per call)"
+    FROM_ARRAYS = "memory_layer_from_arrays"
+    FROM_ARRAYS_INDEXED = "memory_layer_from_arrays (spatial index)"
+
+    def __init__(
+        self,
+        *,
+        features: int = 100000,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        seed: int = 0,
+    ) -> None:
+        """Initialize MemoryLayerBenchmark instance.
+
+        :param features: Number of features to load.
+        :type features: int
+        :param chunk_size: Chunk size used by ``memory_layer_from_arrays``.
+        :type chunk_size: int
+        :param seed: Seed of the random dataset.
+        :type seed: int
+        """
+        self.__features = max(features, 1)
+        self.__chunk_size = chunk_size
+        self.__seed = seed
+
+    def run(self) -> MemoryLayerBenchmarkResult:
+        """Run all loading strategies.
+
+        :returns: Benchmark result.
+        :rtype: MemoryLayerBenchmarkResult
+        :raises DataLibraryNotInstalledError: If NumPy is not installed.
+        """
+        require_numpy()
+
+        random = numpy.random.default_rng(self.__seed)
+        columns = {
+            "id": numpy.arange(self.__features, dtype="int64"),
+            "value": random.random(self.__features),
+            "name": numpy.char.add(
+                "feature_", numpy.arange(self.__features).astype(str)
+            ),
+        }
+        xy = (
+            random.uniform(-180, 180, self.__features),
+            random.uniform(-90, 90, self.__features),
+        )
+
+        strategies: Dict[str, Callable[[Columns, Coordinates], None]] = {
+            self.EDIT_BUFFER_LOOP: self.__edit_buffer_loop,
+            self.PROVIDER_LOOP: self.__provider_loop,
+            self.FROM_ARRAYS: self.__from_arrays,
+            self.FROM_ARRAYS_INDEXED: self.__from_arrays_indexed,
+        }
+
+        times: Dict[str, float] = {}
+        for name, strategy in strategies.items():
+            started = time.perf_counter()
+            strategy(columns, xy)
+            times[name] = time.perf_counter() - started
+
+        baseline = times[self.EDIT_BUFFER_LOOP]
+        result = MemoryLayerBenchmarkResult(self.__features, self.__chunk_size)
+        result.measurements.extend(
+            MemoryLayerMeasurement(
+                name,
+                duration,
+                self.__features / duration if duration else 0.0,
+                baseline / duration if duration else 1.0,
+            )
+            for name, duration in sorted(
+                times.items(), key=lambda item: item[1], reverse=True
+            )
+        )
+        return result
+
+    def __empty_layer(self) -> QgsVectorLayer:
+        return QgsVectorLayer(
+            "Point?crs=EPSG:4326"
+            "&field=id:long&field=value:double&field=name:string",
+            BENCHMARK_LAYER_NAME,
+            "memory",
+        )
+
+    def __features_from_rows(
+        self,
+        layer: QgsVectorLayer,
+        columns: Columns,
+        xy: Coordinates,
+    ) -> List[QgsFeature]:
+        fields = layer.fields()
+        rows = zip(
+            columns["id"].tolist(),
+            columns["value"].tolist(),
+            columns["name"].tolist(),
+            xy[0].tolist(),
+            xy[1].tolist(),
+        )
+        features = []
+        for feature_id, value, name, x, y in rows:
+            feature = QgsFeature(fields)
+            feature.setAttributes([feature_id, value, name])
+            feature.setGeometry(QgsGeometry.fromPointXY(QgsPointXY(x, y)))
+            features.append(feature)
+        return features
+
+    def __edit_buffer_loop(self, columns: Columns, xy: Coordinates) -> None:
+        layer = self.__empty_layer()
+        layer.startEditing()
+        for feature in self.__features_from_rows(layer, columns, xy):
+            layer.addFeature(feature)
+        layer.commitChanges()
+
+    def __provider_loop(self, columns: Columns, xy: Coordinates) -> None:
+        layer = self.__empty_layer()
+        provider = layer.dataProvider()
+        for feature in self.__features_from_rows(layer, columns, xy):
+            provider.addFeature(feature)
+
+    def __from_arrays(self, columns: Columns, xy: Coordinates) -> None:
+        memory_layer_from_arrays(
+            columns,
+            xy,
+            "EPSG:4326",
+            name=BENCHMARK_LAYER_NAME,
+            chunk_size=self.__chunk_size,
+        )
+
+    def __from_arrays_indexed(
+        self,
+        columns: Columns,
+        xy: Coordinates,
+    ) -> None:
+        memory_layer_from_arrays(
+            columns,
+            xy,
+            "EPSG:4326",
+            name=BENCHMARK_LAYER_NAME,
+            chunk_size=self.__chunk_size,
+            spatial_index=True,
+        )
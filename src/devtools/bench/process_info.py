@@ -0,0 +1,50 @@
+# QGIS DevTools Plugin
+# Copyright (C) 2025  NextGIS
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or any
+# later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+import importlib.util
+import sys
+from typing import Optional
+
+psutil = None
+if importlib.util.find_spec("psutil"):
+    import psutil
+
+resource = None
+if importlib.util.find_spec("resource"):
+    import resource
+
+
+def peak_rss() -> Optional[int]:
+    """Return the peak resident set size of the QGIS process.
+
+    The value is a high-water mark of the whole process since its start,
+    so it only grows when a benchmarked operation needs more memory than
+    anything before it.
+
+    :returns: Peak RSS in bytes or None if it can't be determined.
+    :rtype: Optional[int]
+    """
+    if resource is not None:
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reports kilobytes, macOS reports bytes
+        return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+    if psutil is not None:
+        memory_info = psutil.Process().memory_info()
+        return getattr(memory_info, "peak_wset", memory_info.rss)
+
+    return None
@@ -0,0 +1,464 @@
+# QGIS DevTools Plugin
+# Copyright (C) 2025  NextGIS
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or any
+# later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+import json
+import platform
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from osgeo import gdal
+from qgis.core import (
+    Qgis,
+    QgsApplication,
+    QgsProcessingAlgRunnerTask,
+    QgsProcessingContext,
+    QgsProcessingException,
+    QgsProcessingFeedback,
+    QgsProject,
+)
+from qgis.PyQt.QtCore import QEventLoop, QObject, QThread, pyqtSignal
+
+from devtools.bench.exceptions import (
+    BenchmarkAlgorithmNotFoundError,
+    BenchmarkRunError,
+)
+from devtools.bench.process_info import peak_rss
+from devtools.bench.statistics import Summary
+from devtools.core.compat import ProcessingAlgorithmFlag
+from devtools.core.logging import logger
+
+StepTiming = Tuple[str, float]
+"""Feedback step label and its duration in seconds."""
+
+
+@dataclass
+class ProcessingRun:
+    """Measurements of a single algorithm run.
+
+    :param wall_time: Elapsed time in seconds.
+    :type wall_time: float
+    :param cpu_time: Process CPU time in seconds. None for runs executed
+        in parallel tasks, where CPU time can't be attributed to a run.
+    :type cpu_time: Optional[float]
+    :param peak_rss: Process peak RSS in bytes after the run.
+    :type peak_rss: Optional[int]
+    :param steps: Durations between consecutive feedback messages.
+    :type steps: List[StepTiming]
+    """
+
+    wall_time: float
+    cpu_time: Optional[float]
+    peak_rss: Optional[int]
+    steps: List[StepTiming] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the run as a JSON serializable dictionary.
+
+        :returns: Run fields.
+        :rtype: Dict[str, Any]
+        """
+        return {
+            "wall_time": self.wall_time,
+            "cpu_time": self.cpu_time,
+            "peak_rss": self.peak_rss,
+            "steps": [
+                {"step": step, "time": duration}
+                for step, duration in self.steps
+            ],
+        }
+
+
+@dataclass
+class ProcessingBenchmarkResult:
+    """Result of a processing algorithm benchmark.
+
+    :param algorithm_id: Benchmarked algorithm identifier.
+    :type algorithm_id: str
+    :param parameters: Algorithm parameters.
+    :type parameters: Dict[str, Any]
+    :param parallel: Whether runs were executed in parallel tasks.
+    :type parallel: bool
+    :param warmup: Number of discarded warmup runs.
+    :type warmup: int
+    :param runs: Measured runs.
+    :type runs: List[ProcessingRun]
+    :param total_wall_time: Elapsed time of all measured runs in seconds.
+    :type total_wall_time: float
+    :param total_cpu_time: Process CPU time of all measured runs in
+        seconds.
+    :type total_cpu_time: float
+    :param environment: QGIS, GDAL, Python and platform versions.
+    :type environment: Dict[str, Any]
+    """
+
+    algorithm_id: str
+    parameters: Dict[str, Any]
+    parallel: bool
+    warmup: int
+    runs: List[ProcessingRun]
+    total_wall_time: float
+    total_cpu_time: float
+    environment: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def wall_time(self) -> Summary:
+        """Return the summary of run wall times.
+
+        :returns: Wall time summary in seconds.
+        :rtype: Summary
+        """
+        return Summary.from_values([run.wall_time for run in self.runs])
+
+    @property
+    def cpu_time(self) -> Optional[Summary]:
+        """Return the summary of run CPU times.
+
+        :returns: CPU time summary in seconds or None for parallel runs.
+        :rtype: Optional[Summary]
+        """
+        values = [
+            run.cpu_time for run in self.runs if run.cpu_time is not None
+        ]
+        return Summary.from_values(values) if values else None
+
+    @property
+    def peak_rss(self) -> Optional[int]:
+        """Return the largest process peak RSS observed during the runs.
+
+        :returns: Peak RSS in bytes or None if unavailable.
+        :rtype: Optional[int]
+        """
+        values = [run.peak_rss for run in self.runs if run.peak_rss]
+        return max(values) if values else None
+
+    @property
+    def step_times(self) -> Dict[str, Summary]:
+        """Return per-step duration summaries.
+
+        :returns: Step label to duration summary mapping.
+        :rtype: Dict[str, Summary]
+        """
+        durations: Dict[str, List[float]] = {}
+        for run in self.runs:
+            for step, duration in run.steps:
+                durations.setdefault(step, []).append(duration)
+        return {
+            step: Summary.from_values(values)
+            for step, values in durations.items()
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the result as a JSON serializable dictionary.
+
+        :returns: Result with statistical summaries and raw runs.
+        :rtype: Dict[str, Any]
+        """
+        cpu_time = self.cpu_time
+        return {
+            "algorithm_id": self.algorithm_id,
+            "parameters": self.parameters,
+            "mode": "parallel" if self.parallel else "in-process",
+            "repeat": len(self.runs),
+            "warmup": self.warmup,
+            "environment": self.environment,
+            "total_wall_time": self.total_wall_time,
+            "total_cpu_time": self.total_cpu_time,
+            "wall_time": self.wall_time.to_dict(),
+            "cpu_time": cpu_time.to_dict() if cpu_time else None,
+            "peak_rss": self.peak_rss,
+            "steps": {
+                step: summary.to_dict()
+                for step, summary in self.step_times.items()
+            },
+            "runs": [run.to_dict() for run in self.runs],
+        }
+
+    def to_json(self, path: Union[str, Path, None] = None) -> str:
+        """Serialize the result to JSON.
+
+        Parameter values that are not JSON serializable, like layers, are
+        stored as their string representation.
+
+        :param path: Optional file to write the JSON to.
+        :type path: Union[str, Path, None]
+        :returns: JSON document.
+        :rtype: str
+        """
+        document = json.dumps(
+            self.to_dict(), indent=2, ensure_ascii=False, default=str
+        )
+        if path is not None:
+            Path(path).write_text(document, encoding="utf-8")
+        return document
+
+    def summary(self) -> str:
+        """Return a human readable summary.
+
+        :returns: Multiline summary text.
+        :rtype: str
+        """
+        wall_time = self.wall_time
+        mode = "in parallel tasks" if self.parallel else "in-process"
+        header = (
+            f"{self.algorithm_id}: {wall_time.count} run(s) {mode}, "
+            f"{self.warmup} warmup"
+        )
+        lines = [header]
+        lines.append(
+            f"  wall: median {wall_time.median * 1000:.1f} ms, "
+            f"mean {wall_time.mean * 1000:.1f} ms, "
+            f"p95 {wall_time.p95 * 1000:.1f} ms, "
+            f"stdev {wall_time.stdev * 1000:.1f} ms"
+        )
+        cpu_time = self.cpu_time
+        if cpu_time is not None:
+            lines.append(
+                f"  cpu: median {cpu_time.median * 1000:.1f} ms, "
+                f"mean {cpu_time.mean * 1000:.1f} ms"
+            )
+        else:
+            lines.append(
+                f"  cpu: {self.total_cpu_time * 1000:.1f} ms for all runs"
+            )
+        if self.peak_rss is not None:
+            lines.append(f"  peak RSS: {self.peak_rss / 2**20:.1f} MiB")
+        for step, summary in self.step_times.items():
+            lines.append(
+                f"  step {step!r}: median {summary.median * 1000:.1f} ms"
+            )
+        return "\n".join(lines)
+
+
+class _TimingFeedback(QgsProcessingFeedback):
+    """Feedback that timestamps progress texts and info messages."""
+
+    MAX_LABEL_LENGTH = 80
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.restart()
+
+    def restart(self) -> None:
+        self.__marks = [("<start>", time.perf_counter())]
+
+    def steps(self, end: float) -> List[StepTiming]:
+        marks = [*self.__marks, ("", end)]
+        return [
+            (label, next_time - start_time)
+            for (label, start_time), (_, next_time) in zip(marks, marks[1:])
+        ]
+
+    def setProgressText(self, text: Optional[str]) -> None:  # noqa: N802
+        self.__mark(text)
+        super().setProgressText(text)
+
+    def pushInfo(self, info: Optional[str]) -> None:  # noqa: N802
+        self.__mark(info)
+        super().pushInfo(info)
+
+    def __mark(self, text: Optional[str]) -> None:
+        label = (text or "").strip().splitlines()
+        if not label:
+            return
+        self.__marks.append(
+            (label[0][: self.MAX_LABEL_LENGTH], time.perf_counter())
+        )
+
+
+class ProcessingBenchmark(QObject):
+    """Runs a processing algorithm repeatedly and measures each run.
+
+    Runs are executed either sequentially in the main thread through
+    ``processing.run`` or concurrently as ``QgsProcessingAlgRunnerTask``
+    instances in the QGIS task manager. Warmup runs are always executed
+    in-process and are not measured.
+    """
+
+    run_finished = pyqtSignal(int, int)
+    """Signal emitted with finished and total measured runs count."""
+
+    def __init__(
+        self,
+        algorithm_id: str,
+        parameters: Dict[str, Any],
+        *,
+        repeat: int = 5,
+        warmup: int = 1,
+        parallel: bool = False,
+    ) -> None:
+        """Initialize ProcessingBenchmark instance.
+
+        :param algorithm_id: Processing algorithm identifier.
+        :type algorithm_id: str
+        :param parameters: Algorithm parameters.
+        :type parameters: Dict[str, Any]
+        :param repeat: Number of measured runs.
+        :type repeat: int
+        :param warmup: Number of unmeasured runs before measuring.
+        :type warmup: int
+        :param parallel: Run measured runs concurrently in tasks.
+        :type parallel: bool
+        :raises BenchmarkAlgorithmNotFoundError: If the algorithm is not
+            registered.
+        """
+        super().__init__()
+        registry = QgsApplication.processingRegistry()
+        algorithm = registry.algorithmById(algorithm_id)
+        if algorithm is None:
+            raise BenchmarkAlgorithmNotFoundError(algorithm_id)
+
+        self.__algorithm = algorithm
+        self.__parameters = dict(parameters)
+        self.__repeat = max(repeat, 1)
+        self.__warmup = max(warmup, 0)
+        self.__parallel = parallel
+
+        if parallel and (
+            algorithm.flags() & ProcessingAlgorithmFlag.NoThreading
+        ):
+            logger.warning(
+                f"Algorithm {algorithm_id} can't run in background tasks, "
+                "benchmarking it in-process"
+            )
+            self.__parallel = False
+
+    def run(self) -> ProcessingBenchmarkResult:
+        """Execute warmup and measured runs.
+
+        :returns: Benchmark result.
+        :rtype: ProcessingBenchmarkResult
+        :raises BenchmarkRunError: If any run fails.
+        """
+        algorithm_id = self.__algorithm.id()
+        logger.debug(
+            f"Benchmarking {algorithm_id}: {self.__repeat} run(s), "
+            f"{self.__warmup} warmup"
+        )
+        for _ in range(self.__warmup):
+            self.__run_in_process()
+
+        cpu_started = time.process_time()
+        wall_started = time.perf_counter()
+        if self.__parallel:
+            runs = self.__run_in_tasks()
+        else:
+            runs = []
+            for index in range(self.__repeat):
+                runs.append(self.__run_in_process())
+                self.run_finished.emit(index + 1, self.__repeat)
+
+        return ProcessingBenchmarkResult(
+            algorithm_id=algorithm_id,
+            parameters=self.__parameters,
+            parallel=self.__parallel,
+            warmup=self.__warmup,
+            runs=runs,
+            total_wall_time=time.perf_counter() - wall_started,
+            total_cpu_time=time.process_time() - cpu_started,
+            environment=self.__environment(),
+        )
+
+    def __run_in_process(self) -> ProcessingRun:
+        # Processing is a core plugin which may be disabled
+        import processing  # noqa: PLC0415
+
+        feedback = _TimingFeedback()
+        cpu_started = time.process_time()
+        wall_started = time.perf_counter()
+        try:
+            processing.run(
+                self.__algorithm.id(),
+                dict(self.__parameters),
+                feedback=feedback,
+            )
+        except QgsProcessingException as error:
+            raise BenchmarkRunError(str(error)) from error
+        wall_finished = time.perf_counter()
+
+        return ProcessingRun(
+            wall_time=wall_finished - wall_started,
+            cpu_time=time.process_time() - cpu_started,
+            peak_rss=peak_rss(),
+            steps=feedback.steps(wall_finished),
+        )
+
+    def __run_in_tasks(self) -> List[ProcessingRun]:
+        runs: Dict[int, ProcessingRun] = {}
+        errors: List[str] = []
+        started: Dict[int, float] = {}
+        # Contexts and feedbacks must outlive the tasks
+        contexts: List[QgsProcessingContext] = []
+        feedbacks: List[_TimingFeedback] = []
+        loop = QEventLoop()
+
+        def on_begun(index: int) -> None:
+            started[index] = time.perf_counter()
+            feedbacks[index].restart()
+
+        def on_executed(index: int, successful: bool) -> None:
+            finished = time.perf_counter()
+            if successful:
+                runs[index] = ProcessingRun(
+                    wall_time=finished - started.get(index, finished),
+                    cpu_time=None,
+                    peak_rss=peak_rss(),
+                    steps=feedbacks[index].steps(finished),
+                )
+            else:
+                errors.append(f"Run {index + 1} failed")
+
+            done = len(runs) + len(errors)
+            self.run_finished.emit(done, self.__repeat)
+            if done == self.__repeat:
+                loop.quit()
+
+        task_manager = QgsApplication.taskManager()
+        for index in range(self.__repeat):
+            context = QgsProcessingContext()
+            context.setProject(QgsProject.instance())
+            feedback = _TimingFeedback()
+            contexts.append(context)
+            feedbacks.append(feedback)
+
+            task = QgsProcessingAlgRunnerTask(
+                self.__algorithm, dict(self.__parameters), context, feedback
+            )
+            task.begun.connect(lambda index=index: on_begun(index))
+            task.executed.connect(
+                lambda successful, _, index=index: on_executed(
+                    index, successful
+                )
+            )
+            task_manager.addTask(task)
+
+        loop.exec()
+
+        if errors:
+            raise BenchmarkRunError("\n".join(errors))
+
+        return [runs[index] for index in sorted(runs)]
+
+    def __environment(self) -> Dict[str, Any]:
+        return {
+            "qgis": Qgis.version(),
+            "gdal": gdal.__version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "threads": QThread.idealThreadCount(),
+        }
@@ -0,0 +1,91 @@
+# QGIS DevTools Plugin
+# Copyright (C) 2025  NextGIS
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or any
+# later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+import math
+import statistics
+from dataclasses import asdict, dataclass
+from typing import Dict, Sequence
+
+from devtools.core.utils import percentile
+
+
+@dataclass(frozen=True)
+class Summary:
+    """Statistical summary of benchmark measurements.
+
+    :param count: Number of measurements.
+    :type count: int
+    :param minimum: Smallest value.
+    :type minimum: float
+    :param maximum: Largest value.
+    :type maximum: float
+    :param mean: Arithmetic mean.
+    :type mean: float
+    :param median: Median value.
+    :type median: float
+    :param stdev: Sample standard deviation.
+    :type stdev: float
+    :param p95: 95th percentile.
+    :type p95: float
+    """
+
+    count: int
+    minimum: float
+    maximum: float
+    mean: float
+    median: float
+    stdev: float
+    p95: float
+
+    @classmethod
+    def from_values(cls, values: Sequence[float]) -> "Summary":
+        """Summarize measurements.
+
+        :param values: Measured values.
+        :type values: Sequence[float]
+        :returns: Summary of the values, NaN-filled for an empty sequence.
+        :rtype: Summary
+        """
+        if len(values) == 0:
+            return cls(0, *([math.nan] * 6))
+
+        return cls(
+            count=len(values),
+            minimum=min(values),
+            maximum=max(values),
+            mean=statistics.mean(values),
+            median=statistics.median(values),
+            stdev=statistics.stdev(values) if len(values) > 1 else 0.0,
+            p95=percentile(values, 95),
+        )
+
+    @property
+    def relative_stdev(self) -> float:
+        """Return the coefficient of variation.
+
+        :returns: Standard deviation divided by the mean.
+        :rtype: float
+        """
+        return self.stdev / self.mean if self.mean else math.nan
+
+    def to_dict(self) -> Dict[str, float]:
+        """Return the summary as a JSON serializable dictionary.
+
+        :returns: Summary fields.
+        :rtype: Dict[str, float]
+        """
+        return asdict(self)
@@ -0,0 +1,161 @@
+# QGIS DevTools Plugin
+# Copyright (C) 2025  NextGIS
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or any
+# later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+from qgis.core import QgsApplication
+from qgis.PyQt import uic
+from qgis.PyQt.QtCore import QCoreApplication, Qt, pyqtSlot
+from qgis.PyQt.QtGui import QGuiApplication
+from qgis.PyQt.QtWidgets import (
+    QCompleter,
+    QDialog,
+    QFileDialog,
+    QVBoxLayout,
+    QWidget,
+)
+
+from devtools.bench.exceptions import BenchmarkError
+from devtools.bench.processing_benchmark import (
+    ProcessingBenchmark,
+    ProcessingBenchmarkResult,
+)
+from devtools.core.exceptions import DevToolsUiLoadError
+from devtools.core.logging import logger
+
+if TYPE_CHECKING:
+    from devtools.devtools_interface import DevToolsInterface
+
+
+class ProcessingBenchmarkDialog(QDialog):
+    """Dialog for benchmarking a processing algorithm."""
+
+    __result: Optional[ProcessingBenchmarkResult]
+
+    def __init__(
+        self, plugin: "DevToolsInterface", parent: Optional[QWidget] = None
+    ) -> None:
+        """Initialize the processing benchmark dialog.
+
+        :param plugin: Plugin interface instance.
+        :type plugin: DevToolsInterface
+        :param parent: Optional parent widget.
+        :type parent: Optional[QWidget]
+        """
+        super().__init__(parent)
+        self.setWindowTitle(self.tr("Processing Benchmark"))
+        self.__plugin = plugin
+        self.__result = None
+        self.__load_ui()
+
+    def __load_ui(self) -> None:
+        widget: Optional[QWidget] = None
+        try:
+            widget = uic.loadUi(
+                str(
+                    Path(__file__).parent
+                    / "processing_benchmark_dialog_base.ui"
+                )
+            )
+        except Exception as error:
+            raise DevToolsUiLoadError from error
+
+        if widget is None:
+            raise DevToolsUiLoadError
+
+        self.__widget = widget
+        self.__widget.setParent(self)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.__widget)
+
+        algorithm_ids = sorted(
+            algorithm.id()
+            for algorithm in QgsApplication.processingRegistry().algorithms()
+        )
+        completer = QCompleter(algorithm_ids, self)
+        completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        completer.setFilterMode(Qt.MatchFlag.MatchContains)
+        self.__widget.algorithm_lineedit.setCompleter(completer)
+
+        self.__widget.run_button.clicked.connect(self.__run)
+        self.__widget.export_button.clicked.connect(self.__export)
+
+    @pyqtSlot()
+    def __run(self) -> None:
+        algorithm_id = self.__widget.algorithm_lineedit.text().strip()
+        try:
+            parameters = json.loads(
+                self.__widget.parameters_edit.toPlainText() or "{}"
+            )
+        except ValueError as error:
+            message = self.tr("Algorithm parameters are not valid JSON")
+            self.__plugin.notifier.display_exception(
+                BenchmarkError(
+                    message, user_message=message, detail=str(error)
+                )
+            )
+            return
+
+        self.__widget.run_button.setEnabled(False)
+        self.__widget.progress_bar.setValue(0)
+        QGuiApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+        try:
+            benchmark = ProcessingBenchmark(
+                algorithm_id,
+                parameters,
+                repeat=self.__widget.repeat_spinbox.value(),
+                warmup=self.__widget.warmup_spinbox.value(),
+                parallel=self.__widget.parallel_checkbox.isChecked(),
+            )
+            benchmark.run_finished.connect(self.__on_run_finished)
+            self.__result = benchmark.run()
+        except BenchmarkError as error:
+            logger.exception("Processing benchmark failed")
+            self.__plugin.notifier.display_exception(error)
+            return
+        finally:
+            QGuiApplication.restoreOverrideCursor()
+            self.__widget.run_button.setEnabled(True)
+
+        self.__widget.result_edit.setPlainText(self.__result.summary())
+        self.__widget.export_button.setEnabled(True)
+
+    @pyqtSlot(int, int)
+    def __on_run_finished(self, finished: int, total: int) -> None:
+        self.__widget.progress_bar.setMaximum(total)
+        self.__widget.progress_bar.setValue(finished)
+        QCoreApplication.processEvents()
+
+    @pyqtSlot()
+    def __export(self) -> None:
+        if self.__result is None:
+            return
+
+        file_path, _ = QFileDialog.getSaveFileName(
+            self,
+            self.tr("Export Benchmark Result"),
+            f"{self.__result.algorithm_id.replace(':', '_')}.json",
+            self.tr("JSON files (*.json)"),
+        )
+        if not file_path:
+            return
+
+        self.__result.to_json(file_path)
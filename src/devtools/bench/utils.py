@@ -0,0 +1,59 @@
+# QGIS DevTools Plugin
+# Copyright (C) 2025  NextGIS
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or any
+# later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+from pathlib import Path
+from typing import List, Optional
+
+from qgis.core import (
+    QgsCoordinateTransformContext,
+    QgsVectorFileWriter,
+    QgsVectorLayer,
+)
+
+from devtools.bench.exceptions import BenchmarkRunError
+
+BENCHMARK_LAYER_NAME = "benchmark"
+
+
+def write_layer_copy(
+    layer: QgsVectorLayer,
+    path: Path,
+    driver_name: str,
+    datasource_options: Optional[List[str]] = None,
+) -> None:
+    """Write features of a layer to a new file for benchmarking.
+
+    :param layer: Source layer.
+    :type layer: QgsVectorLayer
+    :param path: Destination file path.
+    :type path: Path
+    :param driver_name: OGR driver name.
+    :type driver_name: str
+    :param datasource_options: OGR dataset creation options.
+    :type datasource_options: Optional[List[str]]
+    :raises BenchmarkRunError: If the file can't be written.
+    """
+    options = QgsVectorFileWriter.SaveVectorOptions()
+    options.driverName = driver_name
+    options.layerName = BENCHMARK_LAYER_NAME
+    options.datasourceOptions = datasource_options or []
+    error, message, *_ = QgsVectorFileWriter.writeAsVectorFormatV3(
+        layer, str(path), QgsCoordinateTransformContext(), options
+    )
+    if error != QgsVectorFileWriter.WriterError.NoError:
+        detail = f"{driver_name} copy failed: {message}"
+        raise BenchmarkRunError(detail)
@@ -0,0 +1,131 @@
+# QGIS DevTools Plugin
+# Copyright (C) 2025  NextGIS
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or any
+# later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+import os
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from types import FrameType
+from typing import Optional, Tuple
+
+from qgis import utils as qgis_utils
+
+DEVTOOLS_DIRECTORY = str(Path(__file__).parents[1])
+
+
+@dataclass(frozen=True)
+class CallSite:
+    """Source location of a call.
+
+    :param plugin: Package name of the plugin the code belongs to.
+    :type plugin: Optional[str]
+    :param filename: Source file path.
+    :type filename: str
+    :param lineno: Line number.
+    :type lineno: int
+    :param function: Function name.
+    :type function: str
+    """
+
+    plugin: Optional[str]
+    filename: str
+    lineno: int
+    function: str
+
+    def __str__(self) -> str:
+        """Return the call site as ``plugin: file:line (function)``.
+
+        :returns: Call site description.
+        :rtype: str
+        """
+        plugin = self.plugin if self.plugin is not None else "<unknown>"
+        return f"{plugin}: {self.filename}:{self.lineno} ({self.function})"
+
+
+def _normalize_path(path: str) -> str:
+    return os.path.normcase(os.path.realpath(path))
+
+
+def plugin_for_file(filename: str) -> Optional[str]:
+    """Return the loaded plugin a source file belongs to.
+
+    :param filename: Source file path.
+    :type filename: str
+    :returns: Plugin package name or None for code outside plugins.
+    :rtype: Optional[str]
+    """
+    # Loaded plugins are a part of the cache key, so that installing,
+    # removing or reloading a plugin does not leave stale results
+    plugin_files = tuple(
+        (plugin_name, getattr(sys.modules.get(plugin_name), "__file__", None))
+        for plugin_name in list(qgis_utils.plugins)
+    )
+    return _plugin_for_file(filename, plugin_files)
+
+
+@lru_cache(maxsize=4096)
+def _plugin_for_file(
+    filename: str, plugin_files: Tuple[Tuple[str, Optional[str]], ...]
+) -> Optional[str]:
+    path = _normalize_path(filename)
+    for plugin_name, module_file in plugin_files:
+        if module_file is None:
+            continue
+        plugin_directory = str(Path(_normalize_path(module_file)).parent)
+        if path.startswith(plugin_directory + os.sep):
+            return plugin_name
+    return None
+
+
+def caller_frame(frame: Optional[FrameType]) -> Optional[FrameType]:
+    """Skip DevTools frames to find the frame of the instrumented caller.
+
+    :param frame: Frame to start from.
+    :type frame: Optional[FrameType]
+    :returns: First frame outside the DevTools package or None.
+    :rtype: Optional[FrameType]
+    """
+    while frame is not None and frame.f_code.co_filename.startswith(
+        DEVTOOLS_DIRECTORY
+    ):
+        frame = frame.f_back
+    return frame
+
+
+def caller_site(depth: int = 1) -> CallSite:
+    """Return the call site of the code calling the current function.
+
+    DevTools frames are skipped, so wrappers installed by DevTools report
+    the location of the instrumented plugin code.
+
+    :param depth: Number of frames to skip above the calling function.
+    :type depth: int
+    :returns: Call site description.
+    :rtype: CallSite
+    """
+    frame = caller_frame(sys._getframe(depth + 1))  # noqa: SLF001
+    if frame is None:
+        return CallSite(None, "<unknown>", 0, "<unknown>")
+
+    code = frame.f_code
+    return CallSite(
+        plugin_for_file(code.co_filename),
+        code.co_filename,
+        frame.f_lineno,
+        code.co_name,
+    )
@@ -15,15 +15,20 @@
 # with this program; if not, see <https://www.gnu.org/licenses/>.
 
 
-from typing import TYPE_CHECKING, Any, Dict, List, Set
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set
 
 from qgis.core import (
     Qgis,
+    QgsApplication,
+    QgsDatabaseQueryLog,
     QgsFeature,
     QgsFeatureRequest,
+    QgsFeatureSource,
     QgsGeometry,
     QgsMapLayerProxyModel,
     QgsMapLayerType,
+    QgsProcessingAlgorithm,
+    QgsVectorDataProvider,
     QgsWkbTypes,
 )
 from qgis.PyQt.QtCore import QMetaType, QVariant
@@ -44,9 +49,7 @@ QgsFeatureList = List[QgsFeature]
 
 QgsAttributeList = List[int]
 QgsAttributeMap = Dict[int, Any]
-QgsChangedAttributesMap = Dict[
-    QgsFeatureId, Dict[QgsFeatureId, QgsAttributeMap]
-]
+QgsChangedAttributesMap = Dict[QgsFeatureId, QgsAttributeMap]
 
 QgsGeometryMap = Dict[QgsFeatureId, QgsGeometry]
 
@@ -105,6 +108,41 @@ else:
     FeatureRequestFlag = QgsFeatureRequest.Flag
     FeatureRequestFlags = QgsFeatureRequest.Flags
 
+if Qgis.versionInt() >= QGIS_3_36 or TYPE_CHECKING:
+    ProcessingAlgorithmFlag = Qgis.ProcessingAlgorithmFlag
+
+else:
+    ProcessingAlgorithmFlag = QgsProcessingAlgorithm.Flag
+    ProcessingAlgorithmFlag.NoThreading = (
+        QgsProcessingAlgorithm.Flag.FlagNoThreading
+    )
+    ProcessingAlgorithmFlag.NoThreading.is_monkey_patched = True
+
+
+if Qgis.versionInt() >= QGIS_3_40 or TYPE_CHECKING:
+    VectorProviderCapability = Qgis.VectorProviderCapability
+
+else:
+    VectorProviderCapability = QgsVectorDataProvider.Capability
+
+if Qgis.versionInt() >= QGIS_3_36 or TYPE_CHECKING:
+    SpatialIndexPresence = Qgis.SpatialIndexPresence
+
+else:
+    SpatialIndexPresence = QgsFeatureSource.SpatialIndexPresence
+    SpatialIndexPresence.Unknown = (
+        QgsFeatureSource.SpatialIndexPresence.SpatialIndexUnknown
+    )
+    SpatialIndexPresence.Unknown.is_monkey_patched = True
+    SpatialIndexPresence.NotPresent = (
+        QgsFeatureSource.SpatialIndexPresence.SpatialIndexNotPresent
+    )
+    SpatialIndexPresence.NotPresent.is_monkey_patched = True
+    SpatialIndexPresence.Present = (
+        QgsFeatureSource.SpatialIndexPresence.SpatialIndexPresent
+    )
+    SpatialIndexPresence.Present.is_monkey_patched = True
+
 
 if Qgis.versionInt() >= QGIS_3_38 or TYPE_CHECKING:
     FieldType = QMetaType.Type
@@ -119,6 +157,20 @@ else:
     FieldType.QDateTime = QVariant.Type.DateTime
     FieldType.QDateTime.is_monkey_patched = True
 
+
+def database_query_log() -> Optional[QgsDatabaseQueryLog]:
+    """Return the provider database query log.
+
+    Query log entries are usable from Python since QGIS 3.34.
+
+    :returns: ``QgsDatabaseQueryLog`` instance or None on older versions.
+    :rtype: Optional[QgsDatabaseQueryLog]
+    """
+    if Qgis.versionInt() < QGIS_3_34:
+        return None
+    return QgsApplication.databaseQueryLog()
+
+
 try:
     from packaging import version
 
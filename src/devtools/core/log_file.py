@@ -0,0 +1,452 @@
+# QGIS DevTools Plugin
+# Copyright (C) 2025  NextGIS
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or any
+# later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+import copy
+import gzip
+import importlib.util
+import json
+import logging
+import os
+import queue
+import shutil
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from pathlib import Path
+from typing import IO, List, Optional, Tuple, Union
+
+zstandard = None
+if importlib.util.find_spec("zstandard"):
+    import zstandard
+
+fcntl = None
+if importlib.util.find_spec("fcntl"):
+    import fcntl
+
+msvcrt = None
+if importlib.util.find_spec("msvcrt"):
+    import msvcrt
+
+GZIP_COMPRESSION = "gzip"
+ZSTD_COMPRESSION = "zstd"
+
+LOCK_FILE_EXTENSION = ".lock"
+
+COMPRESSION_EXTENSIONS = {
+    GZIP_COMPRESSION: ".gz",
+    ZSTD_COMPRESSION: ".zst",
+}
+
+
+def available_compressions() -> List[str]:
+    """Return compressions supported in the current environment.
+
+    zstd requires the optional ``zstandard`` package.
+
+    :returns: Compression names.
+    :rtype: List[str]
+    """
+    compressions = [GZIP_COMPRESSION]
+    if zstandard is not None:
+        compressions.append(ZSTD_COMPRESSION)
+    return compressions
+
+
+def open_compressed(path: Union[str, Path], mode: str = "rb") -> IO[bytes]:
+    """Open a compressed log file.
+
+    The compression is detected by the file extension.
+
+    :param path: File path.
+    :type path: Union[str, Path]
+    :param mode: Binary file mode.
+    :type mode: str
+    :returns: File object with decompressed content.
+    :rtype: IO[bytes]
+    :raises ValueError: If the compression is not supported.
+    """
+    path = Path(path)
+    if path.suffix == COMPRESSION_EXTENSIONS[ZSTD_COMPRESSION]:
+        if zstandard is None:
+            message = "zstandard package is required to open zstd files"
+            raise ValueError(message)
+        return zstandard.open(path, mode)
+    return gzip.open(path, mode)  # type: ignore[return-value]
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Formats records as JSON objects, one per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format a record as a JSON line.
+
+        :param record: Log record
+        :type record: logging.LogRecord
+        :returns: JSON object without a trailing newline.
+        :rtype: str
+        """
+        data = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc)
+            .astimezone()
+            .isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "module": record.module,
+            "line": record.lineno,
+            "function": record.funcName,
+            "thread": record.threadName,
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            data["exception"] = record.exc_text
+        if record.stack_info:
+            data["stack"] = self.formatStack(record.stack_info)
+        return json.dumps(data, ensure_ascii=False)
+
+
+class _LockFile:
+    """File locked by the process writing a log file.
+
+    The operating system releases the lock when the process exits, so a
+    lock file which exists but can be locked was left by a crash.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.__file: Optional[IO[str]] = None
+
+    def acquire(self) -> bool:
+        file = self.path.open("a+", encoding="utf-8")
+        try:
+            file.seek(0)
+            if fcntl is not None:
+                fcntl.flock(file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            elif msvcrt is not None:
+                msvcrt.locking(file.fileno(), msvcrt.LK_NBLCK, 1)
+        except OSError:
+            file.close()
+            return False
+
+        file.truncate()
+        file.write(str(os.getpid()))
+        file.flush()
+        self.__file = file
+        return True
+
+    def release(self) -> None:
+        file = self.__file
+        if file is None:
+            return
+        self.__file = None
+        file.seek(0)
+        if fcntl is not None:
+            fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+        elif msvcrt is not None:
+            msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+        file.close()
+        # A missing lock file marks a clean shutdown
+        self.path.unlink()
+
+
+class CompressedRotatingFileHandler(RotatingFileHandler):
+    """Rotating file handler which compresses rotated files.
+
+    The active file is plain text and is flushed after every record, so
+    it survives a crash. It is rotated by size only, rotated files are
+    named ``<name>.<n>.jsonl.gz`` (or ``.zst``).
+
+    While the handler is open, it holds a lock on ``<name>.jsonl.lock``,
+    which is removed on close. A lock file left by a crashed session
+    makes the handler preserve a copy of the active file as
+    ``<name>-crash-<time>.jsonl.gz`` outside the rotation. If another
+    QGIS instance holds the lock, the handler writes to
+    ``<name>-2.jsonl`` and so on instead.
+    """
+
+    MAX_CRASH_LOGS = 5
+    MAX_INSTANCES = 8
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        *,
+        max_bytes: int,
+        backup_count: int,
+        compression: str = GZIP_COMPRESSION,
+        preserve_last_backup: bool = False,
+    ) -> None:
+        """Initialize CompressedRotatingFileHandler instance.
+
+        :param path: Active log file path.
+        :type path: Union[str, Path]
+        :param max_bytes: Size of the active file to rotate at.
+        :type max_bytes: int
+        :param backup_count: Number of kept rotated files.
+        :type backup_count: int
+        :param compression: Compression name, see
+            :func:`available_compressions`.
+        :type compression: str
+        :param preserve_last_backup: Whether to keep a copy of the active
+            file as a crash log, e.g. after a failed launch.
+        :type preserve_last_backup: bool
+        :raises ValueError: If the compression is not available.
+        :raises OSError: If log files of all instances are locked.
+        """
+        if compression not in available_compressions():
+            message = f"Compression {compression} is not available"
+            raise ValueError(message)
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path, self.__lock_file, is_crashed = self.__acquire_file(path)
+        super().__init__(
+            path,
+            maxBytes=max_bytes,
+            backupCount=max(backup_count, 1),
+            encoding="utf-8",
+            delay=True,
+        )
+        self.compression = compression
+        self.namer = self.__backup_name
+        self.rotator = self.__rotate
+        if is_crashed or preserve_last_backup:
+            self.__preserve_crash_log()
+
+    @property
+    def path(self) -> Path:
+        """Return the active log file path.
+
+        :returns: Active file path.
+        :rtype: Path
+        """
+        return Path(self.baseFilename)
+
+    def log_files(self) -> List[Path]:
+        """Return existing log files, newest first.
+
+        Includes the active file, rotated files and crash logs.
+
+        :returns: Log file paths.
+        :rtype: List[Path]
+        """
+        path = self.path
+        files = [
+            file
+            for file in path.parent.glob(f"{path.stem}*{path.suffix}*")
+            if file.is_file()
+            and file.suffix != LOCK_FILE_EXTENSION
+            and file.stat().st_size > 0
+        ]
+        return sorted(files, key=lambda file: file.stat().st_mtime)[::-1]
+
+    def close(self) -> None:
+        """Close the handler and mark a clean shutdown."""
+        super().close()
+        self.__lock_file.release()
+
+    def __acquire_file(self, path: Path) -> Tuple[Path, _LockFile, bool]:
+        for instance in range(1, self.MAX_INSTANCES + 1):
+            instance_path = (
+                path
+                if instance == 1
+                else path.with_name(f"{path.stem}-{instance}{path.suffix}")
+            )
+            lock_file = _LockFile(
+                instance_path.with_name(
+                    instance_path.name + LOCK_FILE_EXTENSION
+                )
+            )
+            is_crashed = lock_file.path.exists()
+            if lock_file.acquire():
+                return instance_path, lock_file, is_crashed
+
+        message = f"Log files {path} of all instances are in use"
+        raise OSError(message)
+
+    def __backup_name(self, default_name: str) -> str:
+        base, _, number = default_name.rpartition(".")
+        path = Path(base)
+        extension = COMPRESSION_EXTENSIONS[self.compression]
+        return str(
+            path.with_name(f"{path.stem}.{number}{path.suffix}{extension}")
+        )
+
+    def __rotate(self, source: str, destination: str) -> None:
+        source_path = Path(source)
+        if not source_path.exists():
+            return
+        self.__compress(source_path, Path(destination))
+        source_path.unlink()
+
+    def __compress(self, source: Path, destination: Path) -> None:
+        with source.open("rb") as source_file, open_compressed(
+            destination, "wb"
+        ) as destination_file:
+            shutil.copyfileobj(source_file, destination_file)
+
+    def __preserve_crash_log(self) -> None:
+        # The active file keeps growing, a compressed copy of it is kept
+        path = self.path
+        if not path.exists() or path.stat().st_size == 0:
+            return
+
+        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        extension = COMPRESSION_EXTENSIONS[self.compression]
+        self.__compress(
+            path,
+            path.with_name(
+                f"{path.stem}-crash-{timestamp}{path.suffix}{extension}"
+            ),
+        )
+
+        crash_logs = sorted(path.parent.glob(f"{path.stem}-crash-*"))
+        for old_crash_log in crash_logs[: -self.MAX_CRASH_LOGS]:
+            old_crash_log.unlink()
+
+
+class _BlockingQueueListener(QueueListener):
+    """Queue listener which waits for space in a full queue on stop."""
+
+    def enqueue_sentinel(self) -> None:
+        """Put the stop sentinel, waiting for the writer thread."""
+        self.queue.put(self._sentinel)
+
+
+class LogFileHandler(QueueHandler):
+    """Logging handler writing JSON lines records to rotating files.
+
+    Records are copied with formatted messages and put into a bounded
+    queue without blocking the logging thread. A background thread
+    writes them with :class:`CompressedRotatingFileHandler`. When the
+    queue is full new records are dropped and counted.
+    """
+
+    MAX_QUEUE_SIZE = 10000
+
+    def __init__(  # noqa: PLR0913
+        self,
+        path: Union[str, Path],
+        *,
+        max_bytes: int = 10 * 1024 * 1024,
+        backup_count: int = 5,
+        compression: str = GZIP_COMPRESSION,
+        preserve_last_backup: bool = False,
+        level: int = logging.NOTSET,
+    ) -> None:
+        """Initialize LogFileHandler instance and start the writer thread.
+
+        :param path: Active log file path.
+        :type path: Union[str, Path]
+        :param max_bytes: Size of the active file to rotate at.
+        :type max_bytes: int
+        :param backup_count: Number of kept rotated files.
+        :type backup_count: int
+        :param compression: Compression of rotated files.
+        :type compression: str
+        :param preserve_last_backup: Whether to keep a copy of the active
+            file as a crash log.
+        :type preserve_last_backup: bool
+        :param level: Handler logging level.
+        :type level: int
+        """
+        # Created first, so that logging.shutdown() closes this handler
+        # and stops the writer thread before the file handler
+        self.__file_handler = CompressedRotatingFileHandler(
+            path,
+            max_bytes=max_bytes,
+            backup_count=backup_count,
+            compression=compression,
+            preserve_last_backup=preserve_last_backup,
+        )
+        self.__file_handler.setFormatter(JsonLinesFormatter())
+
+        super().__init__(queue.Queue(self.MAX_QUEUE_SIZE))
+        self.setLevel(level)
+        self.__dropped_records = 0
+        self.__listener: Optional[QueueListener] = _BlockingQueueListener(
+            self.queue, self.__file_handler
+        )
+        self.__listener.start()
+
+    @property
+    def file_handler(self) -> CompressedRotatingFileHandler:
+        """Return the handler writing files in the background thread.
+
+        :returns: Rotating file handler.
+        :rtype: CompressedRotatingFileHandler
+        """
+        return self.__file_handler
+
+    @property
+    def dropped_records(self) -> int:
+        """Return the number of records dropped because of a full queue.
+
+        :returns: Dropped records count.
+        :rtype: int
+        """
+        return self.__dropped_records
+
+    def log_files(self) -> List[Path]:
+        """Return existing log files, newest first.
+
+        :returns: Log file paths.
+        :rtype: List[Path]
+        """
+        return self.__file_handler.log_files()
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Queue a record for writing unless the queue is full.
+
+        :param record: Prepared log record
+        :type record: logging.LogRecord
+        """
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.__dropped_records += 1
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Return a copy of a record safe to pass to another thread.
+
+        The message and the traceback are formatted in the logging thread.
+        The original record is not changed, other handlers still need its
+        exception info.
+
+        :param record: Log record
+        :type record: logging.LogRecord
+        :returns: Record copy without arguments and exception info.
+        :rtype: logging.LogRecord
+        """
+        prepared = copy.copy(record)
+        prepared.msg = record.getMessage()
+        prepared.args = None
+        if record.exc_info and not record.exc_text:
+            prepared.exc_text = self.__file_handler.formatter.formatException(  # type: ignore[union-attr]
+                record.exc_info
+            )
+        prepared.exc_info = None
+        return prepared
+
+    def close(self) -> None:
+        """Write remaining records and close the log file."""
+        listener = self.__listener
+        if listener is not None:
+            self.__listener = None
+            listener.stop()
+            self.__file_handler.close()
+        super().close()
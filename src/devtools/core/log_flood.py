@@ -0,0 +1,320 @@
+# QGIS DevTools Plugin
+# Copyright (C) 2025  NextGIS
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or any
+# later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+import logging
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+
+CallSiteKey = Tuple[str, str, int]
+
+
+@dataclass
+class LogSuppressionStatistics:
+    """Numbers of records suppressed by :class:`LogFloodGuard`.
+
+    :param passed: Records passed to handlers.
+    :type passed: int
+    :param duplicates: Identical consecutive records collapsed.
+    :type duplicates: int
+    :param call_site_limited: Records over a call site rate limit.
+    :type call_site_limited: int
+    :param rate_limited: Records over a logger token bucket.
+    :type rate_limited: int
+    :param call_sites: Suppressed records per ``file:line`` call site.
+    :type call_sites: Dict[str, int]
+    """
+
+    passed: int = 0
+    duplicates: int = 0
+    call_site_limited: int = 0
+    rate_limited: int = 0
+    call_sites: Dict[str, int] = field(default_factory=Counter)
+
+    @property
+    def suppressed(self) -> int:
+        """Return the total number of suppressed records.
+
+        :returns: Suppressed records count.
+        :rtype: int
+        """
+        return self.duplicates + self.call_site_limited + self.rate_limited
+
+
+class _TokenBucket:
+    """Token bucket refilled continuously at a constant rate."""
+
+    def __init__(self, rate: float, capacity: int) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+
+    def consume(self, now: float) -> bool:
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.updated) * self.rate
+        )
+        self.updated = now
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+
+@dataclass
+class _LastMessage:
+    """Last record of a logger and the number of its repeats."""
+
+    record: logging.LogRecord
+    message: str
+    repeats: int = 0
+    first_repeat: float = 0.0
+
+
+class LogFloodGuard:
+    """Protects log handlers from message floods.
+
+    Identical consecutive messages of a logger are collapsed into one
+    "repeated N times" record, except errors and records with exception
+    information. Records below ``ERROR`` are limited per call site and by
+    a token bucket per logger name. Only passed records are compared with
+    the next ones. Summaries of suppressed
+    records are emitted before the next record passed for the logger.
+
+    The guard is thread safe.
+    """
+
+    REPEAT_REPORT_INTERVAL = 10.0  # s
+
+    __lock: threading.Lock
+    __buckets: Dict[str, _TokenBucket]
+    __call_sites: Dict[CallSiteKey, Tuple[float, int]]
+    __last_messages: Dict[str, _LastMessage]
+    __pending_suppressed: Dict[str, Tuple[int, logging.LogRecord]]
+    __statistics: LogSuppressionStatistics
+
+    def __init__(
+        self,
+        *,
+        rate: float = 50.0,
+        burst: int = 200,
+        call_site_limit: int = 20,
+    ) -> None:
+        """Initialize LogFloodGuard instance.
+
+        :param rate: Records per second allowed for every logger name.
+        :type rate: float
+        :param burst: Token bucket capacity.
+        :type burst: int
+        :param call_site_limit: Records per second allowed for a call site.
+        :type call_site_limit: int
+        """
+        self.__lock = threading.Lock()
+        self.rate = rate
+        self.burst = burst
+        self.call_site_limit = call_site_limit
+        self.__last_messages = {}
+        self.__pending_suppressed = {}
+        self.reset()
+
+    def configure(
+        self, *, rate: float, burst: int, call_site_limit: int
+    ) -> None:
+        """Change limits, dropping current bucket states.
+
+        :param rate: Records per second allowed for every logger name.
+        :type rate: float
+        :param burst: Token bucket capacity.
+        :type burst: int
+        :param call_site_limit: Records per second allowed for a call site.
+        :type call_site_limit: int
+        """
+        with self.__lock:
+            self.rate = rate
+            self.burst = burst
+            self.call_site_limit = call_site_limit
+            self.__buckets = {}
+            self.__call_sites = {}
+
+    def reset(self) -> None:
+        """Forget limiter states and statistics."""
+        with self.__lock:
+            self.__buckets = {}
+            self.__call_sites = {}
+            self.__statistics = LogSuppressionStatistics()
+
+    def statistics(self) -> LogSuppressionStatistics:
+        """Return a copy of suppression statistics.
+
+        :returns: Suppression statistics.
+        :rtype: LogSuppressionStatistics
+        """
+        with self.__lock:
+            statistics = self.__statistics
+            return LogSuppressionStatistics(
+                statistics.passed,
+                statistics.duplicates,
+                statistics.call_site_limited,
+                statistics.rate_limited,
+                Counter(statistics.call_sites),
+            )
+
+    def check(
+        self, record: logging.LogRecord
+    ) -> Tuple[bool, List[logging.LogRecord]]:
+        """Decide whether a record should be handled.
+
+        :param record: Log record.
+        :type record: logging.LogRecord
+        :returns: Whether the record passes and summary records to handle
+            before it.
+        :rtype: Tuple[bool, List[logging.LogRecord]]
+        """
+        now = time.monotonic()
+        message = record.getMessage()
+        summaries: List[logging.LogRecord] = []
+        with self.__lock:
+            last = self.__last_messages.get(record.name)
+            is_collapsible = (
+                record.levelno < logging.ERROR and not record.exc_info
+            )
+            if (
+                is_collapsible
+                and last is not None
+                and last.message == message
+                and last.record.levelno == record.levelno
+            ):
+                if last.repeats == 0:
+                    last.first_repeat = now
+                last.repeats += 1
+                self.__statistics.duplicates += 1
+                if now - last.first_repeat < self.REPEAT_REPORT_INTERVAL:
+                    return False, summaries
+                summaries.append(self.__repeat_summary(last))
+                last.repeats = 0
+                return False, summaries
+
+            if last is not None and last.repeats > 0:
+                summaries.append(self.__repeat_summary(last))
+                last.repeats = 0
+
+            if record.levelno < logging.ERROR and not self.__consume(
+                record, now
+            ):
+                suppressed, _ = self.__pending_suppressed.get(
+                    record.name, (0, record)
+                )
+                self.__pending_suppressed[record.name] = (
+                    suppressed + 1,
+                    record,
+                )
+                return False, summaries
+
+            # Only passed records are remembered, so repeats are never
+            # reported for a message which was not shown
+            self.__last_messages[record.name] = _LastMessage(record, message)
+            suppressed, _ = self.__pending_suppressed.pop(
+                record.name, (0, record)
+            )
+            if suppressed > 0:
+                summaries.append(
+                    self.__summary(
+                        record,
+                        logging.WARNING,
+                        f"{suppressed:,} message(s) were suppressed by the "
+                        "log rate limit",
+                    )
+                )
+            self.__statistics.passed += 1
+        return True, summaries
+
+    def flush(self) -> List[logging.LogRecord]:
+        """Return summaries of pending repeats and suppressed records.
+
+        :returns: Summary records.
+        :rtype: List[logging.LogRecord]
+        """
+        summaries = []
+        with self.__lock:
+            for last in self.__last_messages.values():
+                if last.repeats > 0:
+                    summaries.append(self.__repeat_summary(last))
+                    last.repeats = 0
+            for suppressed, record in self.__pending_suppressed.values():
+                summaries.append(
+                    self.__summary(
+                        record,
+                        logging.WARNING,
+                        f"{suppressed:,} message(s) were suppressed by the "
+                        "log rate limit",
+                    )
+                )
+            self.__pending_suppressed = {}
+        return summaries
+
+    def __consume(self, record: logging.LogRecord, now: float) -> bool:
+        call_site = (record.name, record.pathname, record.lineno)
+        window_start, count = self.__call_sites.get(call_site, (now, 0))
+        if now - window_start >= 1.0:
+            window_start, count = now, 0
+        count += 1
+        self.__call_sites[call_site] = (window_start, count)
+        if count > self.call_site_limit:
+            self.__statistics.call_site_limited += 1
+            self.__statistics.call_sites[
+                f"{record.pathname}:{record.lineno}"
+            ] += 1
+            return False
+
+        bucket = self.__buckets.get(record.name)
+        if bucket is None:
+            bucket = _TokenBucket(self.rate, self.burst)
+            self.__buckets[record.name] = bucket
+        if not bucket.consume(now):
+            self.__statistics.rate_limited += 1
+            self.__statistics.call_sites[
+                f"{record.pathname}:{record.lineno}"
+            ] += 1
+            return False
+
+        return True
+
+    def __repeat_summary(self, last: _LastMessage) -> logging.LogRecord:
+        return self.__summary(
+            last.record,
+            last.record.levelno,
+            f"Previous message repeated {last.repeats:,} times",
+        )
+
+    def __summary(
+        self, record: logging.LogRecord, level: int, message: str
+    ) -> logging.LogRecord:
+        summary = logging.makeLogRecord(
+            {
+                "name": record.name,
+                "msg": message,
+                "levelno": level,
+                "levelname": logging.getLevelName(level),
+                "pathname": record.pathname,
+                "lineno": record.lineno,
+                "funcName": record.funcName,
+            }
+        )
+        summary.is_flood_summary = True
+        return summary
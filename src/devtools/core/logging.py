@@ -17,17 +17,30 @@
 
 import logging
 import re
-from typing import Union
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Deque, List, Optional, Union
 
 from qgis.core import Qgis, QgsApplication
+from qgis.PyQt.QtCore import QObject, QThread, QTimer, pyqtSignal, pyqtSlot
 
 from devtools.core.compat import QGIS_3_42_2
-from devtools.core.constants import PLUGIN_NAME
+from devtools.core.constants import PACKAGE_NAME, PLUGIN_NAME
+from devtools.core.log_file import (
+    GZIP_COMPRESSION,
+    LOCK_FILE_EXTENSION,
+    LogFileHandler,
+    available_compressions,
+)
+from devtools.core.log_flood import LogFloodGuard
 from devtools.core.settings import DevToolsSettings
 
 SUCCESS_LEVEL = logging.INFO + 1
 logging.addLevelName(SUCCESS_LEVEL, "SUCCESS")
 
+FORMATTING_TAGS_PATTERN = re.compile(r"</?(?:i|b)\b[^>]*?>", re.IGNORECASE)
+
 
 def map_logging_level_to_qgis(level: int) -> Qgis.MessageLevel:
     """Map Python logging level to QGIS message level.
@@ -89,6 +102,27 @@ class QgisLogger(logging.Logger):
         :type level: int
         """
         super().__init__(name, level)
+        self.flood_guard: Optional[LogFloodGuard] = None
+
+    def handle(self, record: logging.LogRecord) -> None:
+        """Pass a record to handlers unless the flood guard suppresses it.
+
+        Summaries of collapsed and suppressed records are handled before
+        the record.
+
+        :param record: Log record
+        :type record: logging.LogRecord
+        """
+        flood_guard = self.flood_guard
+        if flood_guard is None or getattr(record, "is_flood_summary", False):
+            super().handle(record)
+            return
+
+        is_passed, summaries = flood_guard.check(record)
+        for summary in summaries:
+            super().handle(summary)
+        if is_passed:
+            super().handle(record)
 
     def log(
         self,
@@ -119,26 +153,182 @@ class QgisLogger(logging.Logger):
             self._log(SUCCESS_LEVEL, message, args, **kwargs)
 
 
+class _LogFlusher(QObject):
+    """Delivers queued log records to the QGIS message log.
+
+    Lives in the GUI thread. Worker threads only emit a queued signal
+    when the queue of an idle handler receives its first record.
+    """
+
+    records_queued = pyqtSignal()
+
+    def __init__(self, handler: "QgisLoggerHandler") -> None:
+        """Initialize _LogFlusher instance.
+
+        :param handler: Handler owning the record queue.
+        :type handler: QgisLoggerHandler
+        """
+        super().__init__()
+        self.__handler = handler
+        self.__timer = QTimer(self)
+        self.__timer.setSingleShot(True)
+        self.__timer.setInterval(handler.FLUSH_INTERVAL_MS)
+        self.__timer.timeout.connect(self.__flush)
+        self.records_queued.connect(self.__timer.start)
+
+    def stop(self) -> None:
+        """Stop the flush timer."""
+        self.__timer.stop()
+        self.records_queued.disconnect(self.__timer.start)
+
+    @pyqtSlot()
+    def __flush(self) -> None:
+        if self.__handler.flush_batch():
+            self.__timer.start()
+
+
 class QgisLoggerHandler(logging.Handler):
     """Logging handler that sends messages to QGIS message log.
 
-    Formats and routes log records to QgsApplication.messageLog().
+    Records are accepted from any thread without blocking and queued.
+    A timer in the GUI thread formats them and passes them to
+    QgsApplication.messageLog() in batches. When the queue is full new
+    records are dropped and counted.
     """
 
+    FLUSH_INTERVAL_MS = 100
+    MAX_BATCH_SIZE = 500
+    MAX_QUEUE_SIZE = 10000
+
+    def __init__(self, level: int = logging.NOTSET) -> None:
+        """Initialize QgisLoggerHandler instance.
+
+        :param level: Handler logging level
+        :type level: int
+        """
+        super().__init__(level)
+        self.__queue: Deque[logging.LogRecord] = deque()
+        self.__queue_lock = threading.Lock()
+        self.__is_flush_scheduled = False
+        self.__dropped_records = 0
+        self.__reported_dropped_records = 0
+        self.__processed_records = 0
+        self.__flusher: Optional[_LogFlusher] = _LogFlusher(self)
+
+    @property
+    def queued_records(self) -> int:
+        """Return the number of records waiting for delivery.
+
+        :return: Queue length
+        :rtype: int
+        """
+        return len(self.__queue)
+
+    @property
+    def dropped_records(self) -> int:
+        """Return the number of records dropped because of a full queue.
+
+        :return: Dropped records count
+        :rtype: int
+        """
+        return self.__dropped_records
+
+    @property
+    def processed_records(self) -> int:
+        """Return the number of records delivered to the message log.
+
+        :return: Delivered records count
+        :rtype: int
+        """
+        return self.__processed_records
+
     def emit(self, record: logging.LogRecord) -> None:
-        """Emit a log record to QGIS message log.
+        """Queue a log record for the QGIS message log.
 
         :param record: Log record
         :type record: logging.LogRecord
         """
-        level = map_logging_level_to_qgis(record.levelno)
-        message = self.format(record)
+        if record.args:
+            # Arguments may change before the record is formatted
+            record.msg = record.getMessage()
+            record.args = None
+
+        with self.__queue_lock:
+            if len(self.__queue) >= self.MAX_QUEUE_SIZE:
+                self.__dropped_records += 1
+                return
+            self.__queue.append(record)
+            if self.__is_flush_scheduled:
+                return
+            self.__is_flush_scheduled = True
+
+        flusher = self.__flusher
+        if flusher is not None:
+            flusher.records_queued.emit()
+
+    def flush(self) -> None:
+        """Deliver all queued records if called in the GUI thread."""
+        if self.__flusher is None or not self.__is_gui_thread():
+            return
+        while self.flush_batch():
+            pass
+
+    def flush_batch(self) -> bool:
+        """Deliver up to ``MAX_BATCH_SIZE`` queued records.
+
+        Must be called in the GUI thread.
+
+        :return: True if records remain in the queue
+        :rtype: bool
+        """
+        with self.__queue_lock:
+            batch_size = min(len(self.__queue), self.MAX_BATCH_SIZE)
+            batch = [self.__queue.popleft() for _ in range(batch_size)]
+            has_more = bool(self.__queue)
+            self.__is_flush_scheduled = has_more
+            dropped_records = self.__dropped_records
+
+        if not batch and dropped_records == self.__reported_dropped_records:
+            return False
+
         message_log = QgsApplication.messageLog()
-        if record.levelno == logging.DEBUG:
-            message = f"[DEBUG]    {message}"
         assert message_log is not None
 
-        message_log.logMessage(self._process_html(message), record.name, level)
+        for record in batch:
+            try:
+                message = self.format(record)
+            except Exception:
+                self.handleError(record)
+                continue
+
+            if record.levelno == logging.DEBUG:
+                message = f"[DEBUG]    {message}"
+            message_log.logMessage(
+                self._process_html(message),
+                record.name,
+                map_logging_level_to_qgis(record.levelno),
+            )
+        self.__processed_records += len(batch)
+
+        if dropped_records > self.__reported_dropped_records:
+            message_log.logMessage(
+                f"{dropped_records - self.__reported_dropped_records} log "
+                "record(s) were dropped because the log queue was full",
+                PLUGIN_NAME,
+                Qgis.MessageLevel.Warning,
+            )
+            self.__reported_dropped_records = dropped_records
+
+        return has_more
+
+    def close(self) -> None:
+        """Deliver remaining records and stop the flush timer."""
+        if self.__flusher is not None:
+            self.flush()
+            self.__flusher.stop()
+            self.__flusher.deleteLater()
+            self.__flusher = None
+        super().close()
 
     def _process_html(self, message: str) -> str:
         """Process message for HTML compatibility in QGIS log.
@@ -154,13 +344,10 @@ class QgisLoggerHandler(logging.Handler):
             return message
 
         # https://github.com/qgis/QGIS/issues/45834
-        for tag in ("i", "b"):
-            message = re.sub(
-                rf"<{tag}\b[^>]*?>", "", message, flags=re.IGNORECASE
-            )
-            message = re.sub(rf"</{tag}>", "", message, flags=re.IGNORECASE)
+        return FORMATTING_TAGS_PATTERN.sub("", message)
 
-        return message
+    def __is_gui_thread(self) -> bool:
+        return QThread.currentThread() == self.__flusher.thread()
 
 
 def load_logger() -> QgisLogger:
@@ -179,10 +366,17 @@ def load_logger() -> QgisLogger:
         logging.setLoggerClass(original_logger_class)
 
     logger.propagate = False
+    update_log_flood_protection(logger)  # type: ignore[arg-type]
 
     handler = QgisLoggerHandler()
     logger.addHandler(handler)
 
+    # Settings are not updated yet, the flag belongs to the last launch
+    update_log_file(
+        logger,  # type: ignore[arg-type]
+        preserve_last_backup=DevToolsSettings().did_last_launch_fail,
+    )
+
     is_debug_logs_enabled = DevToolsSettings().is_debug_logs_enabled
     logger.setLevel(logging.DEBUG if is_debug_logs_enabled else logging.INFO)
     if is_debug_logs_enabled:
@@ -197,9 +391,154 @@ def update_logging_level() -> None:
     logger.setLevel(logging.DEBUG if is_debug_logs_enabled else logging.INFO)
 
 
+def update_log_flood_protection(
+    qgis_logger: Optional[QgisLogger] = None,
+) -> None:
+    """Update log flood protection based on DevTools settings.
+
+    :param qgis_logger: Logger to configure, the plugin logger by default
+    :type qgis_logger: Optional[QgisLogger]
+    """
+    if qgis_logger is None:
+        qgis_logger = logger
+
+    settings = DevToolsSettings()
+    if not settings.is_log_flood_protection_enabled:
+        qgis_logger.flood_guard = None
+        return
+
+    if qgis_logger.flood_guard is None:
+        qgis_logger.flood_guard = LogFloodGuard()
+    qgis_logger.flood_guard.configure(
+        rate=settings.log_rate_limit,
+        burst=settings.log_burst_size,
+        call_site_limit=settings.log_call_site_limit,
+    )
+
+
+def log_directory() -> Path:
+    """Return the directory with DevTools log files.
+
+    :return: Directory in the user profile
+    :rtype: Path
+    """
+    return Path(QgsApplication.qgisSettingsDirPath()) / PACKAGE_NAME / "logs"
+
+
+def log_file_handler(
+    qgis_logger: Optional[QgisLogger] = None,
+) -> Optional[LogFileHandler]:
+    """Return the log file handler of a logger.
+
+    :param qgis_logger: Logger to check, the plugin logger by default
+    :type qgis_logger: Optional[QgisLogger]
+    :return: Handler or None if log files are disabled
+    :rtype: Optional[LogFileHandler]
+    """
+    if qgis_logger is None:
+        qgis_logger = logger
+
+    for handler in qgis_logger.handlers:
+        if isinstance(handler, LogFileHandler):
+            return handler
+    return None
+
+
+def log_files() -> List[Path]:
+    """Return DevTools log files suitable for bug reports, newest first.
+
+    Includes rotated files and logs preserved from crashed sessions even
+    if writing log files is disabled now.
+
+    :return: Log file paths
+    :rtype: List[Path]
+    """
+    handler = log_file_handler()
+    if handler is not None:
+        return handler.log_files()
+
+    directory = log_directory()
+    if not directory.exists():
+        return []
+    files = [
+        file
+        for file in directory.iterdir()
+        if file.is_file() and file.suffix != LOCK_FILE_EXTENSION
+    ]
+    return sorted(files, key=lambda file: file.stat().st_mtime)[::-1]
+
+
+def update_log_file(
+    qgis_logger: Optional[QgisLogger] = None,
+    *,
+    preserve_last_backup: bool = False,
+) -> None:
+    """Add, reconfigure or remove the log file handler based on settings.
+
+    Records are written as JSON lines by a background thread to
+    ``devtools.jsonl`` in :func:`log_directory`. Rotated files are
+    compressed.
+
+    :param qgis_logger: Logger to configure, the plugin logger by default
+    :type qgis_logger: Optional[QgisLogger]
+    :param preserve_last_backup: Whether to keep a copy of the active file
+        as a crash log, e.g. after a failed launch
+    :type preserve_last_backup: bool
+    """
+    if qgis_logger is None:
+        qgis_logger = logger
+
+    settings = DevToolsSettings()
+    handler = log_file_handler(qgis_logger)
+    compression = settings.log_file_compression
+    is_compression_available = compression in available_compressions()
+    if not is_compression_available:
+        compression = GZIP_COMPRESSION
+
+    max_bytes = settings.log_file_max_size * 1024 * 1024
+    backup_count = settings.log_file_backup_count
+    if handler is not None:
+        file_handler = handler.file_handler
+        if (
+            settings.is_log_file_enabled
+            and file_handler.maxBytes == max_bytes
+            and file_handler.backupCount == backup_count
+            and file_handler.compression == compression
+        ):
+            return
+        qgis_logger.removeHandler(handler)
+        handler.close()
+
+    if not settings.is_log_file_enabled:
+        return
+
+    try:
+        handler = LogFileHandler(
+            log_directory() / f"{PACKAGE_NAME}.jsonl",
+            max_bytes=max_bytes,
+            backup_count=backup_count,
+            compression=compression,
+            preserve_last_backup=preserve_last_backup,
+        )
+    except Exception:
+        qgis_logger.exception("Log file can't be opened")
+        return
+    qgis_logger.addHandler(handler)
+
+    if not is_compression_available:
+        qgis_logger.warning(
+            "zstandard package is not installed, log files are compressed "
+            "with gzip"
+        )
+
+
 def unload_logger() -> None:
     """Remove all handlers and reset logger."""
     logger = logging.getLogger(PLUGIN_NAME)
+    flood_guard = getattr(logger, "flood_guard", None)
+    if flood_guard is not None:
+        for summary in flood_guard.flush():
+            logger.handle(summary)
 
     handlers = logger.handlers.copy()
     for handler in handlers:
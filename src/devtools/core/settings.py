@@ -31,6 +31,21 @@ class DevToolsSettings:
         f"{PLUGIN_SETTINGS_GROUP}/other/debugLogsEnabled"
     )
 
+    KEY_IS_LOG_FLOOD_PROTECTION_ENABLED = (
+        f"{PLUGIN_SETTINGS_GROUP}/logging/floodProtectionEnabled"
+    )
+    KEY_LOG_RATE_LIMIT = f"{PLUGIN_SETTINGS_GROUP}/logging/rateLimit"
+    KEY_LOG_BURST_SIZE = f"{PLUGIN_SETTINGS_GROUP}/logging/burstSize"
+    KEY_LOG_CALL_SITE_LIMIT = f"{PLUGIN_SETTINGS_GROUP}/logging/callSiteLimit"
+    KEY_IS_LOG_FILE_ENABLED = f"{PLUGIN_SETTINGS_GROUP}/logging/fileEnabled"
+    KEY_LOG_FILE_MAX_SIZE = f"{PLUGIN_SETTINGS_GROUP}/logging/fileMaxSize"
+    KEY_LOG_FILE_BACKUP_COUNT = (
+        f"{PLUGIN_SETTINGS_GROUP}/logging/fileBackupCount"
+    )
+    KEY_LOG_FILE_COMPRESSION = (
+        f"{PLUGIN_SETTINGS_GROUP}/logging/fileCompression"
+    )
+
     __settings: QgsSettings
 
     def __init__(self) -> None:
@@ -87,3 +102,141 @@ class DevToolsSettings:
     @is_debug_logs_enabled.setter
     def is_debug_logs_enabled(self, value: bool) -> None:
         self.__settings.setValue(self.KEY_IS_DEBUG_LOGS_ENABLED, value)
+
+    @property
+    def is_log_flood_protection_enabled(self) -> bool:
+        """Check if log flood protection is enabled.
+
+        :return: True if repeated and excessive messages are suppressed.
+        :rtype: bool
+        """
+        return self.__settings.value(
+            self.KEY_IS_LOG_FLOOD_PROTECTION_ENABLED,
+            defaultValue=True,
+            type=bool,
+        )
+
+    @is_log_flood_protection_enabled.setter
+    def is_log_flood_protection_enabled(self, value: bool) -> None:
+        self.__settings.setValue(
+            self.KEY_IS_LOG_FLOOD_PROTECTION_ENABLED, value
+        )
+
+    @property
+    def log_rate_limit(self) -> int:
+        """Get the number of messages per second allowed for a logger.
+
+        :return: Token bucket refill rate.
+        :rtype: int
+        """
+        return self.__settings.value(
+            self.KEY_LOG_RATE_LIMIT,
+            defaultValue=50,
+            type=int,
+        )
+
+    @log_rate_limit.setter
+    def log_rate_limit(self, value: int) -> None:
+        self.__settings.setValue(self.KEY_LOG_RATE_LIMIT, value)
+
+    @property
+    def log_burst_size(self) -> int:
+        """Get the number of messages a logger may emit at once.
+
+        :return: Token bucket capacity.
+        :rtype: int
+        """
+        return self.__settings.value(
+            self.KEY_LOG_BURST_SIZE,
+            defaultValue=200,
+            type=int,
+        )
+
+    @log_burst_size.setter
+    def log_burst_size(self, value: int) -> None:
+        self.__settings.setValue(self.KEY_LOG_BURST_SIZE, value)
+
+    @property
+    def log_call_site_limit(self) -> int:
+        """Get the number of messages per second allowed for a call site.
+
+        :return: Call site rate limit.
+        :rtype: int
+        """
+        return self.__settings.value(
+            self.KEY_LOG_CALL_SITE_LIMIT,
+            defaultValue=20,
+            type=int,
+        )
+
+    @log_call_site_limit.setter
+    def log_call_site_limit(self, value: int) -> None:
+        self.__settings.setValue(self.KEY_LOG_CALL_SITE_LIMIT, value)
+
+    @property
+    def is_log_file_enabled(self) -> bool:
+        """Check if plugin messages are written to log files.
+
+        :return: True if the rotating log file is enabled.
+        :rtype: bool
+        """
+        return self.__settings.value(
+            self.KEY_IS_LOG_FILE_ENABLED,
+            defaultValue=False,
+            type=bool,
+        )
+
+    @is_log_file_enabled.setter
+    def is_log_file_enabled(self, value: bool) -> None:
+        self.__settings.setValue(self.KEY_IS_LOG_FILE_ENABLED, value)
+
+    @property
+    def log_file_max_size(self) -> int:
+        """Get the size of the log file to rotate at.
+
+        :return: Size in MiB.
+        :rtype: int
+        """
+        return self.__settings.value(
+            self.KEY_LOG_FILE_MAX_SIZE,
+            defaultValue=10,
+            type=int,
+        )
+
+    @log_file_max_size.setter
+    def log_file_max_size(self, value: int) -> None:
+        self.__settings.setValue(self.KEY_LOG_FILE_MAX_SIZE, value)
+
+    @property
+    def log_file_backup_count(self) -> int:
+        """Get the number of kept rotated log files.
+
+        :return: Rotated files count.
+        :rtype: int
+        """
+        return self.__settings.value(
+            self.KEY_LOG_FILE_BACKUP_COUNT,
+            defaultValue=5,
+            type=int,
+        )
+
+    @log_file_backup_count.setter
+    def log_file_backup_count(self, value: int) -> None:
+        self.__settings.setValue(self.KEY_LOG_FILE_BACKUP_COUNT, value)
+
+    @property
+    def log_file_compression(self) -> str:
+        """Get the compression of rotated log files.
+
+        :return: Compression name, "gzip" or "zstd".
+        :rtype: str
+        """
+        return self.__settings.value(
+            self.KEY_LOG_FILE_COMPRESSION,
+            defaultValue="gzip",
+            type=str,
+        )
+
+    @log_file_compression.setter
+    def log_file_compression(self, value: str) -> None:
+        self.__settings.setValue(self.KEY_LOG_FILE_COMPRESSION, value)
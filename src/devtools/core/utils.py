@@ -15,10 +15,11 @@
 # with this program; if not, see <https://www.gnu.org/licenses/>.
 
 
+import math
 import platform
 import sys
 from pathlib import Path
-from typing import Union
+from typing import Sequence, Union
 
 from qgis.core import QgsApplication, QgsSettings
 from qgis.PyQt.QtCore import QByteArray, QLocale, QMimeData
@@ -126,3 +127,21 @@ def utm_tags(utm_medium: str, *, utm_campaign: str = "constant") -> str:
         f"&utm_campaign={utm_campaign}&utm_term={PACKAGE_NAME}"
         f"&utm_content={locale()}"
     )
+
+
+def percentile(values: Sequence[float], percent: float) -> float:
+    """Return the percentile of values using the nearest-rank method.
+
+    :param values: Values to compute the percentile for.
+    :type values: Sequence[float]
+    :param percent: Percentile in the range [0, 100].
+    :type percent: float
+    :returns: Percentile value or NaN for an empty sequence.
+    :rtype: float
+    """
+    if len(values) == 0:
+        return math.nan
+
+    ordered = sorted(values)
+    rank = math.ceil(percent / 100 * len(ordered))
+    return ordered[min(max(rank, 1), len(ordered)) - 1]
@@ -0,0 +1,675 @@
+# QGIS DevTools Plugin
+# Copyright (C) 2025  NextGIS
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or any
+# later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+import datetime
+import importlib.util
+import math
+from dataclasses import dataclass, field
+from itertools import repeat
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Union,
+)
+
+from qgis.core import (
+    QgsCoordinateReferenceSystem,
+    QgsFeature,
+    QgsFeatureRequest,
+    QgsFeatureSink,
+    QgsField,
+    QgsGeometry,
+    QgsPoint,
+    QgsVectorLayer,
+    QgsWkbTypes,
+)
+from qgis.PyQt.QtCore import (
+    QByteArray,
+    QDate,
+    QDateTime,
+    Qt,
+    QTime,
+    QVariant,
+)
+
+from devtools.core.compat import (
+    FeatureRequestFlag,
+    FieldType,
+    GeometryType,
+)
+from devtools.data.bulk_edit import DEFAULT_CHUNK_SIZE
+from devtools.data.exceptions import DataError, DataLibraryNotInstalledError
+
+numpy = None
+if importlib.util.find_spec("numpy"):
+    import numpy
+
+DEFAULT_BATCH_SIZE = 50000
+
+GEOMETRY_WKB = "wkb"
+GEOMETRY_XY = "xy"
+
+
+@dataclass
+class FeatureBatch:
+    """Columnar batch of features.
+
+    Integer and boolean columns are masked arrays, masked where the value
+    is NULL. Floating point and date columns use NaN and NaT, other columns
+    are object arrays with None for NULL. Date and time values are naive,
+    in the wall clock time they are stored with; values which can't be
+    parsed as dates are NaT.
+
+    :param fids: Feature ids.
+    :type fids: numpy.ndarray
+    :param columns: Attribute arrays by field name.
+    :type columns: Dict[str, numpy.ndarray]
+    :param wkb: Geometries as WKB bytes, None for NULL geometries.
+    :type wkb: Optional[numpy.ndarray]
+    :param x: X coordinates of point geometries.
+    :type x: Optional[numpy.ndarray]
+    :param y: Y coordinates of point geometries.
+    :type y: Optional[numpy.ndarray]
+    """
+
+    fids: "numpy.ndarray"
+    columns: Dict[str, "numpy.ndarray"] = field(default_factory=dict)
+    wkb: Optional["numpy.ndarray"] = None
+    x: Optional["numpy.ndarray"] = None
+    y: Optional["numpy.ndarray"] = None
+
+    def __len__(self) -> int:
+        """Return the number of features in the batch.
+
+        :returns: Number of features.
+        :rtype: int
+        """
+        return len(self.fids)
+
+
+def require_numpy() -> None:
+    """Check that NumPy can be used.
+
+    :raises DataLibraryNotInstalledError: If NumPy is not installed.
+    """
+    if numpy is None:
+        raise DataLibraryNotInstalledError("numpy")
+
+
+def validate_request(
+    layer: QgsVectorLayer,
+    fields: Optional[Sequence[str]],
+    geometry: Optional[str],
+) -> List[str]:
+    """Check arguments of a columnar read and return the field names.
+
+    :param layer: Layer to read.
+    :type layer: QgsVectorLayer
+    :param fields: Names of fields to read. All fields if None.
+    :type fields: Optional[Sequence[str]]
+    :param geometry: Geometry mode.
+    :type geometry: Optional[str]
+    :returns: Names of fields to read.
+    :rtype: List[str]
+    :raises DataLibraryNotInstalledError: If NumPy is not installed.
+    :raises DataError: If a field or the geometry mode is unknown.
+    """
+    require_numpy()
+    if geometry not in (None, GEOMETRY_WKB, GEOMETRY_XY):
+        detail = f"Unknown geometry mode {geometry!r}"
+        raise DataError(detail=detail)
+    if geometry == GEOMETRY_XY and layer.geometryType() != GeometryType.Point:
+        detail = f'Layer "{layer.name()}" is not a point layer'
+        raise DataError(detail=detail)
+
+    layer_fields = layer.fields()
+    names = list(layer_fields.names()) if fields is None else list(fields)
+    unknown = [name for name in names if layer_fields.lookupField(name) < 0]
+    if unknown:
+        detail = f"Unknown fields: {', '.join(unknown)}"
+        raise DataError(detail=detail)
+
+    return names
+
+
+def _is_null(value: Any) -> bool:  # noqa: ANN401
+    return value is None or (isinstance(value, QVariant) and value.isNull())
+
+
+def _integer_dtypes() -> Dict[FieldType, str]:
+    return {
+        FieldType.Int: "int32",
+        FieldType.UInt: "uint32",
+        FieldType.LongLong: "int64",
+        FieldType.ULongLong: "uint64",
+        FieldType.Bool: "bool",
+    }
+
+
+class _ColumnBuilder:
+    """Accumulates attribute values and converts them to an array."""
+
+    def __init__(self, field_type: FieldType) -> None:
+        self.__values: List[Any] = []
+        self.__build = self.__builder(field_type)
+
+    def append(self, value: Any) -> None:  # noqa: ANN401
+        self.__values.append(None if _is_null(value) else value)
+
+    def build(self) -> "numpy.ndarray":
+        values = self.__values
+        self.__values = []
+        return self.__build(values)
+
+    def __builder(
+        self, field_type: FieldType
+    ) -> Callable[[List[Any]], "numpy.ndarray"]:
+        integer_types = _integer_dtypes()
+        if field_type in integer_types:
+            dtype = integer_types[field_type]
+            return lambda values: self.__masked(values, dtype)
+        if field_type == FieldType.Double:
+            return lambda values: numpy.array(
+                [numpy.nan if value is None else value for value in values],
+                dtype="float64",
+            )
+        if field_type == FieldType.QDate:
+            return lambda values: numpy.array(
+                [self.__date(value) for value in values],
+                dtype="datetime64[D]",
+            )
+        if field_type == FieldType.QDateTime:
+            return lambda values: numpy.array(
+                [self.__date_time(value) for value in values],
+                dtype="datetime64[ms]",
+            )
+        return self.__objects
+
+    def __masked(self, values: List[Any], dtype: str) -> "numpy.ndarray":
+        mask = [value is None for value in values]
+        filled = [0 if value is None else value for value in values]
+        return numpy.ma.MaskedArray(
+            numpy.array(filled, dtype=dtype), mask=mask
+        )
+
+    def __objects(self, values: List[Any]) -> "numpy.ndarray":
+        array = numpy.empty(len(values), dtype=object)
+        array[:] = values
+        return array
+
+    def __date(self, value: Any) -> Any:  # noqa: ANN401
+        if isinstance(value, QDateTime):
+            value = value.date()
+        elif isinstance(value, str):
+            # Some providers (e.g. GeoPackage, CSV) return dates as text
+            value = QDate.fromString(value[:10], Qt.DateFormat.ISODate)
+        elif isinstance(value, datetime.date):
+            value = QDate(value.year, value.month, value.day)
+
+        if not isinstance(value, QDate) or not value.isValid():
+            return numpy.datetime64("NaT")
+        return numpy.datetime64(value.toString("yyyy-MM-dd"), "D")
+
+    def __date_time(self, value: Any) -> Any:  # noqa: ANN401
+        if isinstance(value, str):
+            value = QDateTime.fromString(value, Qt.DateFormat.ISODate)
+        elif isinstance(value, QDate):
+            value = QDateTime(value, QTime(0, 0))
+        elif isinstance(value, datetime.datetime):
+            return numpy.datetime64(value.replace(tzinfo=None), "ms")
+
+        if not isinstance(value, QDateTime) or not value.isValid():
+            return numpy.datetime64("NaT")
+        # Wall clock components, converting through the epoch would shift
+        # local times by the UTC offset
+        return numpy.datetime64(
+            value.toString("yyyy-MM-ddTHH:mm:ss.zzz"), "ms"
+        )
+
+
+def column_array(
+    field_type: FieldType,
+    values: Any,  # noqa: ANN401
+) -> "numpy.ndarray":
+    """Convert attribute values to an array typed as in :func:`to_arrays`.
+
+    Numeric NumPy arrays, masked or not, are converted without iterating
+    over the values. Other values are converted one by one, so NULL
+    values and dates get the representation described in
+    :class:`FeatureBatch`.
+
+    :param field_type: Type of the layer field.
+    :type field_type: FieldType
+    :param values: Sequence or NumPy array of attribute values. Masked
+        elements and None are NULL values.
+    :type values: Any
+    :returns: Column array.
+    :rtype: numpy.ndarray
+    """
+    if isinstance(values, numpy.ndarray) and values.dtype.kind in "biuf":
+        array = _numeric_column(field_type, values)
+        if array is not None:
+            return array
+
+    if isinstance(values, numpy.ndarray):
+        values = _python_values(values)
+
+    # OGR returns strings as UTF-8 bytes
+    decode = field_type == FieldType.QString
+    builder = _ColumnBuilder(field_type)
+    for value in values:
+        builder.append(
+            value.decode("utf-8", errors="replace")
+            if decode and isinstance(value, bytes)
+            else value
+        )
+    return builder.build()
+
+
+def _python_values(values: "numpy.ndarray") -> List[Any]:
+    if values.dtype.kind == "M":
+        # Nanosecond timestamps are converted to integers by tolist()
+        values = values.astype("datetime64[us]")
+    if numpy.ma.isMaskedArray(values):
+        values = values.astype(object).filled(None)
+    return values.tolist()
+
+
+def _numeric_column(
+    field_type: FieldType, values: "numpy.ndarray"
+) -> Optional["numpy.ndarray"]:
+    mask = numpy.ma.getmaskarray(values)
+    data = numpy.ma.getdata(values)
+    if data.dtype.kind == "f":
+        mask = mask | numpy.isnan(data)
+
+    if field_type == FieldType.Double:
+        array = data.astype("float64")
+        array[mask] = numpy.nan
+        return array
+
+    dtype = _integer_dtypes().get(field_type)
+    if dtype is None:
+        return None
+    return numpy.ma.MaskedArray(
+        numpy.where(mask, 0, data).astype(dtype), mask=mask
+    )
+
+
+class _GeometryBuilder:
+    """Accumulates geometries as WKB or point coordinates."""
+
+    def __init__(self, geometry: str) -> None:
+        self.__geometry = geometry
+        self.__values: List[Any] = []
+        self.__x: List[float] = []
+        self.__y: List[float] = []
+
+    def append(self, geometry: QgsGeometry) -> None:
+        if self.__geometry == GEOMETRY_WKB:
+            self.__values.append(
+                None if geometry.isNull() else bytes(geometry.asWkb())
+            )
+            return
+
+        if geometry.isNull() or geometry.isEmpty():
+            self.__x.append(numpy.nan)
+            self.__y.append(numpy.nan)
+            return
+
+        point = geometry.vertexAt(0)
+        self.__x.append(point.x())
+        self.__y.append(point.y())
+
+    def build(self, batch: FeatureBatch) -> None:
+        if self.__geometry == GEOMETRY_WKB:
+            wkb = numpy.empty(len(self.__values), dtype=object)
+            wkb[:] = self.__values
+            batch.wkb = wkb
+            self.__values = []
+            return
+
+        batch.x = numpy.array(self.__x, dtype="float64")
+        batch.y = numpy.array(self.__y, dtype="float64")
+        self.__x = []
+        self.__y = []
+
+
+def to_arrays(
+    layer: QgsVectorLayer,
+    fields: Optional[Sequence[str]] = None,
+    geometry: Optional[str] = None,
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    request: Optional[QgsFeatureRequest] = None,
+) -> Iterator[FeatureBatch]:
+    """Stream layer features as NumPy column arrays.
+
+    Only the requested fields and, if asked for, geometries are fetched
+    from the data provider. Attribute arrays are typed by field type.
+
+    :param layer: Layer to read.
+    :type layer: QgsVectorLayer
+    :param fields: Names of fields to read. All fields by default.
+    :type fields: Optional[Sequence[str]]
+    :param geometry: ``"wkb"`` for WKB geometries, ``"xy"`` for point
+        coordinates (first point of multipoints) or None to skip geometries.
+    :type geometry: Optional[str]
+    :param batch_size: Maximum number of features per batch.
+    :type batch_size: int
+    :param request: Request with additional filters. Its flags and
+        attribute subset are overridden.
+    :type request: Optional[QgsFeatureRequest]
+    :returns: Iterator over feature batches.
+    :rtype: Iterator[FeatureBatch]
+    :raises DataLibraryNotInstalledError: If NumPy is not installed.
+    :raises DataError: If a field or the geometry mode is unknown.
+    """
+    names = validate_request(layer, fields, geometry)
+    layer_fields = layer.fields()
+    indexes = [layer_fields.lookupField(name) for name in names]
+
+    request = QgsFeatureRequest(request or QgsFeatureRequest())
+    request.setSubsetOfAttributes(indexes)
+    if geometry is None:
+        request.setFlags(request.flags() | FeatureRequestFlag.NoGeometry)
+    else:
+        request.setFlags(request.flags() & ~FeatureRequestFlag.NoGeometry)
+
+    builders = [
+        _ColumnBuilder(layer_fields.at(index).type()) for index in indexes
+    ]
+    geometry_builder = (
+        _GeometryBuilder(geometry) if geometry is not None else None
+    )
+
+    fids: List[int] = []
+    feature = QgsFeature()
+    iterator = layer.getFeatures(request)
+    while iterator.nextFeature(feature):
+        fids.append(feature.id())
+        attributes = feature.attributes()
+        for builder, index in zip(builders, indexes):
+            builder.append(attributes[index])
+        if geometry_builder is not None:
+            geometry_builder.append(feature.geometry())
+
+        if len(fids) >= batch_size:
+            yield _build_batch(fids, names, builders, geometry_builder)
+            fids = []
+
+    if fids:
+        yield _build_batch(fids, names, builders, geometry_builder)
+
+
+def _build_batch(
+    fids: List[int],
+    names: List[str],
+    builders: List[_ColumnBuilder],
+    geometry_builder: Optional[_GeometryBuilder],
+) -> FeatureBatch:
+    batch = FeatureBatch(
+        fids=numpy.array(fids, dtype="int64"),
+        columns={
+            name: builder.build() for name, builder in zip(names, builders)
+        },
+    )
+    if geometry_builder is not None:
+        geometry_builder.build(batch)
+    return batch
+
+
+def memory_layer_from_arrays(  # noqa: PLR0913
+    columns: Mapping[str, Any],
+    geometry: Any = None,  # noqa: ANN401
+    crs: Union[QgsCoordinateReferenceSystem, str, None] = None,
+    *,
+    name: str = "arrays",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    spatial_index: bool = False,
+) -> QgsVectorLayer:
+    """Create a memory layer from column arrays.
+
+    Field types are derived from array dtypes. Masked values, NaN and NaT
+    are stored as NULL. Features are created with preallocated fields and
+    added to the data provider in chunks, bypassing the edit buffer.
+
+    :param columns: Attribute arrays or sequences by field name.
+    :type columns: Mapping[str, Any]
+    :param geometry: Sequence of WKB geometries, a pair of X and Y
+        coordinate arrays for points or None for a layer without geometry.
+    :type geometry: Any
+    :param crs: Layer CRS as an object or an authority identifier.
+    :type crs: Union[QgsCoordinateReferenceSystem, str, None]
+    :param name: Layer name.
+    :type name: str
+    :param chunk_size: Maximum number of features per provider call.
+    :type chunk_size: int
+    :param spatial_index: Build a spatial index after loading.
+    :type spatial_index: bool
+    :returns: New memory layer. It is not added to the project.
+    :rtype: QgsVectorLayer
+    :raises DataLibraryNotInstalledError: If NumPy is not installed.
+    :raises DataError: If array lengths differ or features can't be added.
+    """
+    require_numpy()
+
+    arrays = {
+        field_name: _normalized_array(values)
+        for field_name, values in columns.items()
+    }
+    geometry_factory = _geometry_factory(geometry)
+    count = _common_length(arrays, geometry_factory)
+
+    if isinstance(crs, str):
+        crs = QgsCoordinateReferenceSystem(crs)
+    uri = geometry_factory.geometry_type if geometry_factory else "None"
+    if crs is not None and crs.authid():
+        uri += f"?crs={crs.authid()}"
+
+    layer = QgsVectorLayer(uri, name, "memory")
+    if crs is not None and crs.isValid():
+        layer.setCrs(crs)
+
+    provider = layer.dataProvider()
+    provider.addAttributes(
+        [
+            QgsField(field_name, _field_type(array))
+            for field_name, array in arrays.items()
+        ]
+    )
+    layer.updateFields()
+
+    fields = layer.fields()
+    column_values = [_column_values(array) for array in arrays.values()]
+    chunk_size = max(chunk_size, 1)
+    for start in range(0, count, chunk_size):
+        stop = min(start + chunk_size, count)
+        rows: Iterable[Sequence[Any]] = (
+            zip(*(values[start:stop] for values in column_values))
+            if column_values
+            else repeat((), stop - start)
+        )
+
+        features = []
+        for index, row in zip(range(start, stop), rows):
+            feature = QgsFeature(fields)
+            feature.setAttributes(list(row))
+            if geometry_factory is not None:
+                feature_geometry = geometry_factory.create(index)
+                if feature_geometry is not None:
+                    feature.setGeometry(feature_geometry)
+            features.append(feature)
+
+        is_added, _ = provider.addFeatures(
+            features, QgsFeatureSink.Flag.FastInsert
+        )
+        if not is_added:
+            error = provider.lastError() or (
+                f"Features {start}-{stop - 1} were not added"
+            )
+            raise DataError(detail=error)
+
+    layer.updateExtents()
+    if spatial_index:
+        provider.createSpatialIndex()
+
+    return layer
+
+
+class _GeometryFactory:
+    """Creates feature geometries from WKB or point coordinates."""
+
+    def __init__(self, geometry: Any) -> None:  # noqa: ANN401
+        self.__wkb: Optional[List[Any]] = None
+        self.__x: List[float] = []
+        self.__y: List[float] = []
+
+        if _is_xy(geometry):
+            self.__x = numpy.asarray(geometry[0], dtype="float64").tolist()
+            self.__y = numpy.asarray(geometry[1], dtype="float64").tolist()
+            if len(self.__x) != len(self.__y):
+                detail = (
+                    "Coordinate arrays have different lengths: "
+                    f"x={len(self.__x)}, y={len(self.__y)}"
+                )
+                raise DataError(detail=detail)
+            self.geometry_type = "Point"
+        else:
+            self.__wkb = list(geometry)
+            self.geometry_type = self.__wkb_geometry_type()
+
+    def __len__(self) -> int:
+        if self.__wkb is not None:
+            return len(self.__wkb)
+        return len(self.__x)
+
+    def create(self, index: int) -> Optional[QgsGeometry]:
+        if self.__wkb is not None:
+            return _geometry_from_wkb(self.__wkb[index])
+
+        x = self.__x[index]
+        y = self.__y[index]
+        if math.isnan(x) or math.isnan(y):
+            return None
+        return QgsGeometry(QgsPoint(x, y))
+
+    def __wkb_geometry_type(self) -> str:
+        for value in self.__wkb:
+            geometry = _geometry_from_wkb(value)
+            if geometry is not None:
+                return QgsWkbTypes.displayString(geometry.wkbType())
+        return "None"
+
+
+def _is_xy(geometry: Any) -> bool:  # noqa: ANN401
+    return (
+        isinstance(geometry, (tuple, list))
+        and len(geometry) == 2  # noqa: PLR2004
+        and not isinstance(geometry[0], (bytes, bytearray, QByteArray))
+        and geometry[0] is not None
+    )
+
+
+def _geometry_from_wkb(value: Any) -> Optional[QgsGeometry]:  # noqa: ANN401
+    if value is None or len(value) == 0:
+        return None
+    geometry = QgsGeometry()
+    geometry.fromWkb(bytes(value))
+    return None if geometry.isNull() else geometry
+
+
+def _geometry_factory(
+    geometry: Any,  # noqa: ANN401
+) -> Optional[_GeometryFactory]:
+    if geometry is None:
+        return None
+    return _GeometryFactory(geometry)
+
+
+def _common_length(
+    arrays: Dict[str, "numpy.ndarray"],
+    geometry_factory: Optional[_GeometryFactory],
+) -> int:
+    lengths = {field_name: len(array) for field_name, array in arrays.items()}
+    if geometry_factory is not None:
+        lengths["geometry"] = len(geometry_factory)
+
+    if len(set(lengths.values())) > 1:
+        sizes = ", ".join(f"{key}={value}" for key, value in lengths.items())
+        detail = f"Arrays have different lengths: {sizes}"
+        raise DataError(detail=detail)
+
+    return next(iter(lengths.values()), 0)
+
+
+def _normalized_array(values: Any) -> "numpy.ndarray":  # noqa: ANN401
+    array = numpy.ma.asanyarray(values) if numpy.ma.isMA(values) else None
+    if array is None:
+        array = numpy.asarray(values)
+    if array.ndim != 1:
+        detail = f"Expected one dimensional array, got shape {array.shape}"
+        raise DataError(detail=detail)
+
+    kind = array.dtype.kind
+    if kind == "M" and numpy.datetime_data(array.dtype)[0] != "D":
+        array = array.astype("datetime64[ms]")
+    elif kind == "S":
+        array = numpy.char.decode(array, "utf-8")
+    return array
+
+
+def _field_type(array: "numpy.ndarray") -> FieldType:
+    dtype = array.dtype
+    if dtype.kind == "M":
+        if numpy.datetime_data(dtype)[0] == "D":
+            return FieldType.QDate
+        return FieldType.QDateTime
+
+    field_types = {
+        ("b", 1): FieldType.Bool,
+        ("i", 1): FieldType.Int,
+        ("i", 2): FieldType.Int,
+        ("i", 4): FieldType.Int,
+        ("i", 8): FieldType.LongLong,
+        ("u", 1): FieldType.Int,
+        ("u", 2): FieldType.Int,
+        ("u", 4): FieldType.LongLong,
+        ("u", 8): FieldType.LongLong,
+    }
+    if dtype.kind == "f":
+        return FieldType.Double
+    return field_types.get((dtype.kind, dtype.itemsize), FieldType.QString)
+
+
+def _column_values(array: "numpy.ndarray") -> List[Any]:
+    # tolist() converts to Python scalars and turns masked values and NaT
+    # into None
+    values = array.tolist()
+    if array.dtype.kind == "f":
+        values = [
+            None if value is not None and math.isnan(value) else value
+            for value in values
+        ]
+    return values
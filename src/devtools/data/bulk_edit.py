@@ -0,0 +1,265 @@
+# QGIS DevTools Plugin
+# Copyright (C) 2025  NextGIS
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or any
+# later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+import itertools
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Tuple, TypeVar
+
+from qgis.core import QgsTransaction, QgsVectorDataProvider, QgsVectorLayer
+
+from devtools.core.compat import (
+    QgsChangedAttributesMap,
+    QgsFeatureId,
+    QgsGeometryMap,
+    VectorProviderCapability,
+)
+from devtools.core.logging import logger
+from devtools.data.exceptions import DataCapabilityError, DataError
+
+DEFAULT_CHUNK_SIZE = 5000
+
+T = TypeVar("T")
+
+
+@dataclass
+class BulkEditResult:
+    """Outcome of a bulk edit.
+
+    :param changed_attributes: Number of features with changed attributes.
+    :type changed_attributes: int
+    :param changed_geometries: Number of features with changed geometry.
+    :type changed_geometries: int
+    :param chunks: Number of provider calls made.
+    :type chunks: int
+    :param duration: Elapsed time in seconds.
+    :type duration: float
+    :param used_edit_buffer: Whether changes went through the edit buffer
+        and can be undone.
+    :type used_edit_buffer: bool
+    :param used_transaction: Whether changes were applied in a
+        transaction.
+    :type used_transaction: bool
+    """
+
+    changed_attributes: int
+    changed_geometries: int
+    chunks: int
+    duration: float
+    used_edit_buffer: bool
+    used_transaction: bool
+
+
+def chunked(
+    items: Dict[QgsFeatureId, T], chunk_size: int
+) -> Iterator[Dict[QgsFeatureId, T]]:
+    """Split a per-feature map into chunks.
+
+    :param items: Map keyed by feature id.
+    :type items: Dict[QgsFeatureId, T]
+    :param chunk_size: Maximum number of features per chunk.
+    :type chunk_size: int
+    :returns: Iterator over chunk maps.
+    :rtype: Iterator[Dict[QgsFeatureId, T]]
+    """
+    iterator = iter(items.items())
+    while True:
+        chunk = dict(itertools.islice(iterator, max(chunk_size, 1)))
+        if not chunk:
+            return
+        yield chunk
+
+
+def bulk_edit(  # noqa: PLR0913
+    layer: QgsVectorLayer,
+    attributes: Optional[QgsChangedAttributesMap] = None,
+    geometries: Optional[QgsGeometryMap] = None,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    transaction: bool = False,
+    undo: Optional[bool] = None,
+) -> BulkEditResult:
+    """Change attributes and geometries of many features at once.
+
+    By default changes are written straight to the data provider with
+    ``changeAttributeValues`` and ``changeGeometryValues`` in chunks,
+    bypassing the edit buffer. Layers in edit mode, or any layer when
+    ``undo`` is True, are changed through the edit buffer inside a single
+    undo command instead, so the edit can be undone and must be
+    committed by the caller.
+
+    :param layer: Layer to change.
+    :type layer: QgsVectorLayer
+    :param attributes: New attribute values by feature id and field index.
+    :type attributes: Optional[QgsChangedAttributesMap]
+    :param geometries: New geometries by feature id.
+    :type geometries: Optional[QgsGeometryMap]
+    :param chunk_size: Maximum number of features per provider call.
+    :type chunk_size: int
+    :param transaction: Apply all chunks in a single provider transaction.
+    :type transaction: bool
+    :param undo: Use the edit buffer. Detected from the layer edit mode by
+        default.
+    :type undo: Optional[bool]
+    :returns: Edit outcome.
+    :rtype: BulkEditResult
+    :raises DataCapabilityError: If the provider can't apply the changes.
+    :raises DataError: If the provider reports an error.
+    """
+    attributes = attributes or {}
+    geometries = geometries or {}
+    use_edit_buffer = layer.isEditable() if undo is None else undo
+
+    started = time.perf_counter()
+    if use_edit_buffer:
+        _edit_buffer_edit(layer, attributes, geometries)
+        chunks = 0
+    else:
+        chunks = _provider_edit(
+            layer, attributes, geometries, chunk_size, transaction
+        )
+
+    result = BulkEditResult(
+        changed_attributes=len(attributes),
+        changed_geometries=len(geometries),
+        chunks=chunks,
+        duration=time.perf_counter() - started,
+        used_edit_buffer=use_edit_buffer,
+        used_transaction=transaction and not use_edit_buffer,
+    )
+    logger.debug(
+        f"Bulk edit of {layer.name()!r}: {result.changed_attributes} "
+        f"attribute and {result.changed_geometries} geometry changes in "
+        f"{result.duration * 1000:.0f} ms"
+    )
+    return result
+
+
+def _edit_buffer_edit(
+    layer: QgsVectorLayer,
+    attributes: QgsChangedAttributesMap,
+    geometries: QgsGeometryMap,
+) -> None:
+    if not layer.isEditable() and not layer.startEditing():
+        raise DataCapabilityError(layer.name(), "editing")
+
+    layer.beginEditCommand(f"Bulk edit of {len(attributes)} feature(s)")
+    try:
+        error = _apply_to_edit_buffer(layer, attributes, geometries)
+    except Exception:
+        layer.destroyEditCommand()
+        raise
+
+    if error is not None:
+        layer.destroyEditCommand()
+        raise DataError(detail=error)
+    layer.endEditCommand()
+
+
+def _apply_to_edit_buffer(
+    layer: QgsVectorLayer,
+    attributes: QgsChangedAttributesMap,
+    geometries: QgsGeometryMap,
+) -> Optional[str]:
+    for feature_id, values in attributes.items():
+        if not layer.changeAttributeValues(feature_id, values):
+            return f"Feature {feature_id} attributes were not changed"
+    for feature_id, geometry in geometries.items():
+        if not layer.changeGeometry(feature_id, geometry):
+            return f"Feature {feature_id} geometry was not changed"
+    return None
+
+
+def _provider_edit(
+    layer: QgsVectorLayer,
+    attributes: QgsChangedAttributesMap,
+    geometries: QgsGeometryMap,
+    chunk_size: int,
+    use_transaction: bool,
+) -> int:
+    provider = layer.dataProvider()
+    _check_capabilities(layer, provider, attributes, geometries)
+
+    transaction = _begin_transaction(layer) if use_transaction else None
+    try:
+        calls = _apply_to_provider(
+            provider, attributes, geometries, chunk_size
+        )
+    except Exception:
+        if transaction is not None:
+            transaction.rollback()
+        raise
+
+    failed = [kind for kind, succeeded in calls if not succeeded]
+    if failed:
+        if transaction is not None:
+            transaction.rollback()
+        detail = "\n".join(provider.errors()) or ", ".join(failed)
+        raise DataError(detail=detail)
+
+    if transaction is not None:
+        is_committed, error = transaction.commit()
+        if not is_committed:
+            raise DataError(detail=error)
+
+    layer.reload()
+    return len(calls)
+
+
+def _apply_to_provider(
+    provider: QgsVectorDataProvider,
+    attributes: QgsChangedAttributesMap,
+    geometries: QgsGeometryMap,
+    chunk_size: int,
+) -> List[Tuple[str, bool]]:
+    calls = [
+        ("attributes", provider.changeAttributeValues(chunk))
+        for chunk in chunked(attributes, chunk_size)
+    ]
+    calls.extend(
+        ("geometries", provider.changeGeometryValues(chunk))
+        for chunk in chunked(geometries, chunk_size)
+    )
+    return calls
+
+
+def _check_capabilities(
+    layer: QgsVectorLayer,
+    provider: QgsVectorDataProvider,
+    attributes: QgsChangedAttributesMap,
+    geometries: QgsGeometryMap,
+) -> None:
+    capabilities = provider.capabilities()
+    if attributes and not (
+        capabilities & VectorProviderCapability.ChangeAttributeValues
+    ):
+        raise DataCapabilityError(layer.name(), "ChangeAttributeValues")
+    if geometries and not (
+        capabilities & VectorProviderCapability.ChangeGeometries
+    ):
+        raise DataCapabilityError(layer.name(), "ChangeGeometries")
+
+
+def _begin_transaction(layer: QgsVectorLayer) -> QgsTransaction:
+    transaction = QgsTransaction.create({layer})
+    if transaction is None:
+        raise DataCapabilityError(layer.name(), "transactions")
+
+    is_started, error = transaction.begin()
+    if not is_started:
+        raise DataError(detail=error)
+    return transaction
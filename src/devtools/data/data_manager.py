@@ -0,0 +1,260 @@
+# QGIS DevTools Plugin
+# Copyright (C) 2025  NextGIS
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or any
+# later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Iterator,
+    Mapping,
+    Optional,
+    Sequence,
+    Union,
+)
+
+from qgis.core import (
+    QgsCoordinateReferenceSystem,
+    QgsFeatureRequest,
+    QgsVectorLayer,
+)
+from qgis.PyQt.QtCore import QObject
+
+from devtools.core.compat import QgsChangedAttributesMap, QgsGeometryMap
+from devtools.data.arrays import DEFAULT_BATCH_SIZE, FeatureBatch
+from devtools.data.arrays import (
+    memory_layer_from_arrays as create_memory_layer,
+)
+from devtools.data.arrays import to_arrays as read_arrays
+from devtools.data.bulk_edit import DEFAULT_CHUNK_SIZE, BulkEditResult
+from devtools.data.bulk_edit import bulk_edit as apply_bulk_edit
+from devtools.data.ogr_arrow import stream_arrays as read_stream
+from devtools.data.synthetic import (
+    DEFAULT_BATCH_SIZE as GENERATOR_BATCH_SIZE,
+)
+from devtools.data.synthetic import SyntheticDatasetSpec
+from devtools.data.synthetic import generate_dataset as generate
+
+if TYPE_CHECKING:
+    from devtools.devtools_interface import DevToolsInterface
+
+
+class DataManager(QObject):
+    """Data helpers manager for QGIS DevTools.
+
+    Provides fast layer data access and modification helpers for the
+    Python console and other plugins.
+    """
+
+    def __init__(self, parent: "DevToolsInterface") -> None:
+        """Initialize DataManager instance.
+
+        :param parent: Plugin interface instance.
+        :type parent: DevToolsInterface
+        """
+        super().__init__(parent)
+        self._plugin = parent
+
+    def load(self) -> None:
+        """Prepare data helpers."""
+
+    def unload(self) -> None:
+        """Release resources held by data helpers."""
+
+    def bulk_edit(  # noqa: PLR0913
+        self,
+        layer: QgsVectorLayer,
+        attributes: Optional[QgsChangedAttributesMap] = None,
+        geometries: Optional[QgsGeometryMap] = None,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        transaction: bool = False,
+        undo: Optional[bool] = None,
+    ) -> BulkEditResult:
+        """Change attributes and geometries of many features at once.
+
+        Changes are written to the data provider in chunks. Layers in edit
+        mode, or any layer when ``undo`` is True, are changed through the
+        edit buffer in a single undo command instead.
+
+        :param layer: Layer to change.
+        :type layer: QgsVectorLayer
+        :param attributes: New attribute values by feature id and field
+            index.
+        :type attributes: Optional[QgsChangedAttributesMap]
+        :param geometries: New geometries by feature id.
+        :type geometries: Optional[QgsGeometryMap]
+        :param chunk_size: Maximum number of features per provider call.
+        :type chunk_size: int
+        :param transaction: Apply all chunks in a single provider
+            transaction.
+        :type transaction: bool
+        :param undo: Use the edit buffer. Detected from the layer edit mode
+            by default.
+        :type undo: Optional[bool]
+        :returns: Edit outcome.
+        :rtype: BulkEditResult
+        :raises DataError: If the provider can't apply the changes.
+        """
+        return apply_bulk_edit(
+            layer,
+            attributes,
+            geometries,
+            chunk_size=chunk_size,
+            transaction=transaction,
+            undo=undo,
+        )
+
+    def to_arrays(
+        self,
+        layer: QgsVectorLayer,
+        fields: Optional[Sequence[str]] = None,
+        geometry: Optional[str] = None,
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        request: Optional[QgsFeatureRequest] = None,
+    ) -> Iterator[FeatureBatch]:
+        """Stream layer features as NumPy column arrays.
+
+        :param layer: Layer to read.
+        :type layer: QgsVectorLayer
+        :param fields: Names of fields to read. All fields by default.
+        :type fields: Optional[Sequence[str]]
+        :param geometry: ``"wkb"`` for WKB geometries, ``"xy"`` for point
+            coordinates or None to skip geometries.
+        :type geometry: Optional[str]
+        :param batch_size: Maximum number of features per batch.
+        :type batch_size: int
+        :param request: Request with additional filters.
+        :type request: Optional[QgsFeatureRequest]
+        :returns: Iterator over feature batches.
+        :rtype: Iterator[FeatureBatch]
+        :raises DataError: If NumPy is missing or arguments are invalid.
+        """
+        return read_arrays(
+            layer,
+            fields,
+            geometry,
+            batch_size=batch_size,
+            request=request,
+        )
+
+    def memory_layer_from_arrays(  # noqa: PLR0913
+        self,
+        columns: Mapping[str, Any],
+        geometry: Any = None,  # noqa: ANN401
+        crs: Union[QgsCoordinateReferenceSystem, str, None] = None,
+        *,
+        name: str = "arrays",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        spatial_index: bool = False,
+    ) -> QgsVectorLayer:
+        """Create a memory layer from column arrays.
+
+        :param columns: Attribute arrays or sequences by field name.
+        :type columns: Mapping[str, Any]
+        :param geometry: Sequence of WKB geometries, a pair of X and Y
+            coordinate arrays for points or None.
+        :type geometry: Any
+        :param crs: Layer CRS as an object or an authority identifier.
+        :type crs: Union[QgsCoordinateReferenceSystem, str, None]
+        :param name: Layer name.
+        :type name: str
+        :param chunk_size: Maximum number of features per provider call.
+        :type chunk_size: int
+        :param spatial_index: Build a spatial index after loading.
+        :type spatial_index: bool
+        :returns: New memory layer. It is not added to the project.
+        :rtype: QgsVectorLayer
+        :raises DataError: If NumPy is missing or features can't be added.
+        """
+        return create_memory_layer(
+            columns,
+            geometry,
+            crs,
+            name=name,
+            chunk_size=chunk_size,
+            spatial_index=spatial_index,
+        )
+
+    def stream_arrays(
+        self,
+        layer: QgsVectorLayer,
+        fields: Optional[Sequence[str]] = None,
+        geometry: Optional[str] = None,
+        *,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> Iterator[FeatureBatch]:
+        """Stream layer features as NumPy column arrays using OGR if possible.
+
+        OGR-backed layers are read with the GDAL ArrowStream API when GDAL
+        supports it, other layers fall back to :meth:`to_arrays`.
+
+        :param layer: Layer to read.
+        :type layer: QgsVectorLayer
+        :param fields: Names of fields to read. All fields by default.
+        :type fields: Optional[Sequence[str]]
+        :param geometry: ``"wkb"`` for WKB geometries, ``"xy"`` for point
+            coordinates or None to skip geometries.
+        :type geometry: Optional[str]
+        :param batch_size: Maximum number of features per batch.
+        :type batch_size: int
+        :returns: Iterator over feature batches.
+        :rtype: Iterator[FeatureBatch]
+        :raises DataError: If NumPy is missing or arguments are invalid.
+        """
+        return read_stream(layer, fields, geometry, batch_size=batch_size)
+
+    def generate_dataset(
+        self,
+        spec: Optional[SyntheticDatasetSpec] = None,
+        output: Union[str, Path, None] = None,
+        *,
+        crs: Union[QgsCoordinateReferenceSystem, str] = "EPSG:4326",
+        workers: Optional[int] = None,
+        batch_size: int = GENERATOR_BATCH_SIZE,
+    ) -> QgsVectorLayer:
+        """Generate a synthetic vector dataset for load testing.
+
+        Example::
+
+            spec = SyntheticDatasetSpec(
+                "polygon", 1_000_000, distribution="clustered", seed=42
+            )
+            layer = devtools.data.generate_dataset(spec, "/tmp/test.gpkg")
+
+        :param spec: Dataset description. 100 000 uniformly distributed
+            points by default.
+        :type spec: Optional[SyntheticDatasetSpec]
+        :param output: ``.gpkg`` or ``.shp`` file path or None for a memory
+            layer.
+        :type output: Union[str, Path, None]
+        :param crs: CRS of the dataset.
+        :type crs: Union[QgsCoordinateReferenceSystem, str]
+        :param workers: Number of worker processes. Detected from the
+            number of CPUs by default.
+        :type workers: Optional[int]
+        :param batch_size: Number of features per chunk and per write.
+        :type batch_size: int
+        :returns: Layer with generated features. It is not added to the
+            project.
+        :rtype: QgsVectorLayer
+        :raises DataError: If NumPy is missing, the specification is
+            invalid or the dataset can't be written.
+        """
+        return generate(
+            spec, output, crs=crs, workers=workers, batch_size=batch_size
+        )
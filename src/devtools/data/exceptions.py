@@ -0,0 +1,100 @@
+# QGIS DevTools Plugin
+# Copyright (C) 2025  NextGIS
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or any
+# later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+from typing import Optional
+
+from qgis.core import QgsApplication
+
+from devtools.core.exceptions import DevToolsError
+
+
+class DataError(DevToolsError):
+    """General data helpers error in QGIS DevTools.
+
+    :param log_message: Log message for debugging.
+    :type log_message: str or None
+    :param user_message: Message for user display.
+    :type user_message: str or None
+    :param detail: Detailed error description.
+    :type detail: str or None
+    """
+
+    def __init__(
+        self,
+        log_message: Optional[str] = None,
+        *,
+        user_message: Optional[str] = None,
+        detail: Optional[str] = None,
+    ) -> None:
+        """Initialize DataError.
+
+        :param log_message: Log message for debugging.
+        :type log_message: str or None
+        :param user_message: Message for user display.
+        :type user_message: str or None
+        :param detail: Detailed error description.
+        :type detail: str or None
+        """
+        default_message = QgsApplication.translate(
+            "Exceptions", "An error occurred while processing layer data"
+        )
+
+        if log_message is None:
+            log_message = default_message
+        if user_message is None:
+            user_message = default_message
+
+        super().__init__(
+            log_message=log_message,
+            user_message=user_message,
+            detail=detail,
+        )
+
+
+class DataCapabilityError(DataError):
+    """Layer data provider lacks a capability required by an operation."""
+
+    def __init__(self, layer_name: str, capability: str) -> None:
+        """Initialize DataCapabilityError.
+
+        :param layer_name: Name of the layer.
+        :type layer_name: str
+        :param capability: Name of the missing capability.
+        :type capability: str
+        """
+        message = QgsApplication.translate(
+            "Exceptions",
+            'Layer "{layer_name}" does not support "{capability}"',
+        ).format(layer_name=layer_name, capability=capability)
+        super().__init__(log_message=message, user_message=message)
+        self._need_logs = False
+
+
+class DataLibraryNotInstalledError(DataError):
+    """Library required by a data helper is not installed."""
+
+    def __init__(self, lib_name: str) -> None:
+        """Initialize DataLibraryNotInstalledError.
+
+        :param lib_name: Name of the missing library.
+        :type lib_name: str
+        """
+        message = QgsApplication.translate(
+            "Exceptions", '"{lib_name}" library is not installed.'
+        ).format(lib_name=lib_name)
+        super().__init__(log_message=message, user_message=message)
+        self._need_logs = False
@@ -0,0 +1,260 @@
+# QGIS DevTools Plugin
+# Copyright (C) 2025  NextGIS
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or any
+# later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+import importlib.util
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from osgeo import gdal, ogr
+from qgis.core import (
+    QgsFields,
+    QgsGeometry,
+    QgsProviderRegistry,
+    QgsVectorLayer,
+)
+
+from devtools.core.compat import FieldType
+from devtools.core.logging import logger
+from devtools.data.arrays import (
+    DEFAULT_BATCH_SIZE,
+    GEOMETRY_WKB,
+    GEOMETRY_XY,
+    FeatureBatch,
+    column_array,
+    to_arrays,
+    validate_request,
+)
+from devtools.data.exceptions import DataError
+
+numpy = None
+if importlib.util.find_spec("numpy"):
+    import numpy
+
+DEFAULT_FID_COLUMN = "OGC_FID"
+DEFAULT_GEOMETRY_COLUMN = "wkb_geometry"
+
+
+@dataclass(frozen=True)
+class OgrSource:
+    """OGR dataset and layer behind a vector layer.
+
+    :param path: Dataset path.
+    :type path: str
+    :param layer_name: OGR layer name.
+    :type layer_name: Optional[str]
+    :param layer_id: OGR layer index, used when the name is not set.
+    :type layer_id: Optional[int]
+    :param subset: Attribute filter of the layer.
+    :type subset: str
+    """
+
+    path: str
+    layer_name: Optional[str]
+    layer_id: Optional[int]
+    subset: str
+
+
+def is_arrow_stream_supported() -> bool:
+    """Check if GDAL can read layers as NumPy batches.
+
+    ``ogr.Layer.GetArrowStreamAsNumPy`` is available since GDAL 3.6.
+
+    :returns: True if both NumPy and the GDAL ArrowStream API are available.
+    :rtype: bool
+    """
+    return numpy is not None and hasattr(ogr.Layer, "GetArrowStreamAsNumPy")
+
+
+def ogr_source(layer: QgsVectorLayer) -> Optional[OgrSource]:
+    """Return the OGR source of a layer.
+
+    Layers with a full SQL query as subset string are not supported as
+    the query syntax depends on the provider.
+
+    :param layer: Vector layer.
+    :type layer: QgsVectorLayer
+    :returns: OGR source or None if the layer is not read through OGR.
+    :rtype: Optional[OgrSource]
+    """
+    if layer.providerType() != "ogr":
+        return None
+
+    parts = QgsProviderRegistry.instance().decodeUri("ogr", layer.source())
+    path = parts.get("path")
+    subset = layer.subsetString()
+    if not path or subset.lstrip().upper().startswith("SELECT"):
+        return None
+
+    layer_id = parts.get("layerId")
+    return OgrSource(
+        path=path,
+        layer_name=parts.get("layerName") or None,
+        layer_id=int(layer_id) if layer_id not in (None, "") else None,
+        subset=subset,
+    )
+
+
+def is_arrow_stream_available(layer: QgsVectorLayer) -> bool:
+    """Check if a layer can be read with the OGR ArrowStream API.
+
+    :param layer: Vector layer.
+    :type layer: QgsVectorLayer
+    :returns: True if the layer will be streamed by OGR.
+    :rtype: bool
+    """
+    return is_arrow_stream_supported() and ogr_source(layer) is not None
+
+
+def stream_arrays(
+    layer: QgsVectorLayer,
+    fields: Optional[Sequence[str]] = None,
+    geometry: Optional[str] = None,
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Iterator[FeatureBatch]:
+    """Stream layer features as NumPy column arrays using OGR if possible.
+
+    OGR-backed layers are read with ``ogr.Layer.GetArrowStreamAsNumPy``
+    without creating a QgsFeature per row. Other layers, and all layers
+    when GDAL is older than 3.6, are read with :func:`to_arrays`.
+
+    Columns are converted to the same dtypes and NULL representation as
+    :func:`to_arrays` returns. Layers with virtual or joined fields in the
+    request are read with :func:`to_arrays` as OGR doesn't know them.
+
+    WKB arrays of OGR batches can reference memory owned by GDAL. Copy them
+    if they are needed after the next batch is requested.
+
+    :param layer: Layer to read.
+    :type layer: QgsVectorLayer
+    :param fields: Names of fields to read. All fields by default.
+    :type fields: Optional[Sequence[str]]
+    :param geometry: ``"wkb"`` for WKB geometries, ``"xy"`` for point
+        coordinates or None to skip geometries.
+    :type geometry: Optional[str]
+    :param batch_size: Maximum number of features per batch.
+    :type batch_size: int
+    :returns: Iterator over feature batches.
+    :rtype: Iterator[FeatureBatch]
+    :raises DataLibraryNotInstalledError: If NumPy is not installed.
+    :raises DataError: If arguments are invalid or the dataset can't be
+        opened.
+    """
+    names = validate_request(layer, fields, geometry)
+
+    source = (
+        ogr_source(layer)
+        if is_arrow_stream_supported() and _has_provider_fields(layer, names)
+        else None
+    )
+    if source is None:
+        logger.debug(
+            f'Reading "{layer.name()}" with the QGIS feature iterator'
+        )
+        return to_arrays(layer, names, geometry, batch_size=batch_size)
+
+    logger.debug(f'Reading "{layer.name()}" with OGR ArrowStream')
+    field_types = {name: layer.fields().field(name).type() for name in names}
+    return _arrow_batches(source, field_types, geometry, max(batch_size, 1))
+
+
+def _has_provider_fields(layer: QgsVectorLayer, names: List[str]) -> bool:
+    fields = layer.fields()
+    return all(
+        fields.fieldOrigin(fields.lookupField(name))
+        == QgsFields.FieldOrigin.OriginProvider
+        for name in names
+    )
+
+
+def _arrow_batches(
+    source: OgrSource,
+    field_types: Dict[str, FieldType],
+    geometry: Optional[str],
+    batch_size: int,
+) -> Iterator[FeatureBatch]:
+    dataset = gdal.OpenEx(source.path, gdal.OF_VECTOR | gdal.OF_READONLY)
+    if dataset is None:
+        detail = f"OGR can't open {source.path}"
+        raise DataError(detail=detail)
+
+    ogr_layer = (
+        dataset.GetLayerByName(source.layer_name)
+        if source.layer_name is not None
+        else dataset.GetLayer(source.layer_id or 0)
+    )
+    if ogr_layer is None:
+        detail = f"Layer {source.layer_name or source.layer_id} not found"
+        raise DataError(detail=detail)
+
+    fid_column = ogr_layer.GetFIDColumn()
+    definition = ogr_layer.GetLayerDefn()
+    ignored = [
+        definition.GetFieldDefn(index).GetName()
+        for index in range(definition.GetFieldCount())
+        if definition.GetFieldDefn(index).GetName() not in field_types
+    ]
+    if geometry is None:
+        ignored.append("OGR_GEOMETRY")
+    ogr_layer.SetIgnoredFields(ignored)
+    if source.subset:
+        ogr_layer.SetAttributeFilter(source.subset)
+
+    fid_key = fid_column or DEFAULT_FID_COLUMN
+    geometry_key = ogr_layer.GetGeometryColumn() or DEFAULT_GEOMETRY_COLUMN
+    stream = ogr_layer.GetArrowStreamAsNumPy(
+        options=[f"MAX_FEATURES_IN_BATCH={batch_size}", "INCLUDE_FID=YES"]
+    )
+    for arrays in stream:
+        fids = numpy.asarray(arrays[fid_key], dtype="int64")
+        batch = FeatureBatch(
+            fids=fids,
+            columns={
+                # QGIS exposes the FID column of GeoPackages as a field
+                name: column_array(
+                    field_type, fids if name == fid_column else arrays[name]
+                )
+                for name, field_type in field_types.items()
+            },
+        )
+        if geometry == GEOMETRY_WKB:
+            batch.wkb = arrays[geometry_key]
+        elif geometry == GEOMETRY_XY:
+            batch.x, batch.y = _points_from_wkb(arrays[geometry_key])
+        yield batch
+
+    # Keep the dataset alive until the stream is exhausted
+    del stream
+    del dataset
+
+
+def _points_from_wkb(
+    wkb: "numpy.ndarray",
+) -> Tuple["numpy.ndarray", "numpy.ndarray"]:
+    x = numpy.full(len(wkb), numpy.nan)
+    y = numpy.full(len(wkb), numpy.nan)
+    geometry = QgsGeometry()
+    for index, value in enumerate(wkb):
+        if value is None or len(value) == 0:
+            continue
+        geometry.fromWkb(bytes(value))
+        if geometry.isEmpty():
+            continue
+        point = geometry.vertexAt(0)
+        x[index] = point.x()
+        y[index] = point.y()
+    return x, y
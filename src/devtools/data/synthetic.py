@@ -0,0 +1,317 @@
+# QGIS DevTools Plugin
+# Copyright (C) 2025  NextGIS
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or any
+# later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
+from typing import (
+    Any,
+    Deque,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from qgis.core import (
+    QgsCoordinateReferenceSystem,
+    QgsFeature,
+    QgsFeatureSink,
+    QgsField,
+    QgsFields,
+    QgsGeometry,
+    QgsProject,
+    QgsVectorFileWriter,
+    QgsVectorLayer,
+    QgsWkbTypes,
+)
+
+from devtools.core.compat import FieldType, WkbType
+from devtools.core.logging import logger
+from devtools.core.utils import python_path
+from devtools.data.arrays import require_numpy
+from devtools.data.exceptions import DataError
+from devtools.data.synthetic_chunks import (
+    DISTRIBUTION_CLUSTERED,
+    DISTRIBUTION_UNIFORM,
+    FIELD_DATE,
+    FIELD_DOUBLE,
+    FIELD_INTEGER,
+    FIELD_SERIAL,
+    FIELD_STRING,
+    GEOMETRY_LINE,
+    GEOMETRY_POINT,
+    GEOMETRY_POLYGON,
+    Chunk,
+    SyntheticDatasetSpec,
+    generate_chunk,
+)
+
+DEFAULT_BATCH_SIZE = 10000
+STRING_LENGTH = 32
+
+_FIELD_TYPES = {
+    FIELD_SERIAL: FieldType.LongLong,
+    FIELD_INTEGER: FieldType.Int,
+    FIELD_DOUBLE: FieldType.Double,
+    FIELD_STRING: FieldType.QString,
+    FIELD_DATE: FieldType.QDate,
+}
+
+_WKB_TYPES = {
+    GEOMETRY_POINT: WkbType.Point,
+    GEOMETRY_LINE: WkbType.LineString,
+    GEOMETRY_POLYGON: WkbType.Polygon,
+}
+
+_DRIVERS = {
+    ".gpkg": "GPKG",
+    ".shp": "ESRI Shapefile",
+}
+
+
+def generate_dataset(
+    spec: Optional[SyntheticDatasetSpec] = None,
+    output: Union[str, Path, None] = None,
+    *,
+    crs: Union[QgsCoordinateReferenceSystem, str] = "EPSG:4326",
+    workers: Optional[int] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> QgsVectorLayer:
+    """Generate a synthetic vector dataset.
+
+    Features are generated in chunks by worker processes and written in
+    batches. The output format is derived from the file extension:
+    ``.gpkg`` for GeoPackage and ``.shp`` for shapefile. A memory layer is
+    created when ``output`` is None.
+
+    :param spec: Dataset description. 100 000 uniformly distributed points
+        by default.
+    :type spec: Optional[SyntheticDatasetSpec]
+    :param output: Output file path or None for a memory layer.
+    :type output: Union[str, Path, None]
+    :param crs: CRS of the dataset.
+    :type crs: Union[QgsCoordinateReferenceSystem, str]
+    :param workers: Number of worker processes. Detected from the number
+        of CPUs by default, 0 or 1 generates features in this process.
+    :type workers: Optional[int]
+    :param batch_size: Number of features per chunk and per write.
+    :type batch_size: int
+    :returns: Layer with generated features. It is not added to the
+        project.
+    :rtype: QgsVectorLayer
+    :raises DataLibraryNotInstalledError: If NumPy is not installed.
+    :raises DataError: If the specification is invalid or the dataset
+        can't be written.
+    """
+    require_numpy()
+    spec = spec or SyntheticDatasetSpec()
+    _check_spec(spec)
+    if isinstance(crs, str):
+        crs = QgsCoordinateReferenceSystem(crs)
+
+    fields = QgsFields()
+    for name, field_type in spec.fields.items():
+        length = STRING_LENGTH if field_type == FIELD_STRING else 0
+        fields.append(QgsField(name, _FIELD_TYPES[field_type], "", length))
+
+    batch_size = max(batch_size, 1)
+    chunks = [
+        (start, min(batch_size, spec.features - start))
+        for start in range(0, spec.features, batch_size)
+    ]
+    if workers is None:
+        workers = min(os.cpu_count() or 1, len(chunks))
+
+    layer, sink = _create_sink(spec, output, crs, fields)
+    for chunk in _generate_chunks(spec, chunks, workers):
+        _write_chunk(sink, fields, chunk)
+
+    if output is None:
+        layer.updateExtents()
+        return layer
+
+    # Deleting the writer flushes and closes the file
+    del sink
+    return _open_output(Path(output))
+
+
+def _check_spec(spec: SyntheticDatasetSpec) -> None:
+    errors = []
+    if spec.geometry_type not in _WKB_TYPES:
+        errors.append(f"unknown geometry type {spec.geometry_type!r}")
+    if spec.distribution not in (DISTRIBUTION_UNIFORM, DISTRIBUTION_CLUSTERED):
+        errors.append(f"unknown distribution {spec.distribution!r}")
+    unknown_types = sorted(set(spec.fields.values()) - set(_FIELD_TYPES))
+    if unknown_types:
+        errors.append(f"unknown field types {', '.join(unknown_types)}")
+    if spec.features < 0:
+        errors.append("negative number of features")
+    # A polygon ring needs three distinct vertices
+    minimum_vertices = 3 if spec.geometry_type == GEOMETRY_POLYGON else 2
+    minimum, maximum = spec.vertices
+    if minimum < minimum_vertices or maximum < minimum:
+        errors.append(f"invalid vertex range {spec.vertices}")
+
+    if errors:
+        detail = f"Invalid dataset specification: {'; '.join(errors)}"
+        raise DataError(detail=detail)
+
+
+def _create_sink(
+    spec: SyntheticDatasetSpec,
+    output: Union[str, Path, None],
+    crs: QgsCoordinateReferenceSystem,
+    fields: QgsFields,
+) -> Tuple[Optional[QgsVectorLayer], QgsFeatureSink]:
+    wkb_type = _WKB_TYPES[spec.geometry_type]
+    if output is None:
+        geometry_name = QgsWkbTypes.displayString(wkb_type)
+        uri = f"{geometry_name}?crs={crs.authid()}"
+        layer = QgsVectorLayer(uri, "synthetic", "memory")
+        layer.setCrs(crs)
+        layer.dataProvider().addAttributes(fields.toList())
+        layer.updateFields()
+        return layer, layer.dataProvider()
+
+    path = Path(output)
+    driver_name = _DRIVERS.get(path.suffix.lower())
+    if driver_name is None:
+        detail = f"Unsupported output format {path.suffix!r}"
+        raise DataError(detail=detail)
+
+    options = QgsVectorFileWriter.SaveVectorOptions()
+    options.driverName = driver_name
+    options.layerName = path.stem
+    writer = QgsVectorFileWriter.create(
+        str(path),
+        fields,
+        wkb_type,
+        crs,
+        QgsProject.instance().transformContext(),
+        options,
+    )
+    if writer.hasError() != QgsVectorFileWriter.WriterError.NoError:
+        detail = f"Can't create {path}: {writer.errorMessage()}"
+        raise DataError(detail=detail)
+    return None, writer
+
+
+def _open_output(path: Path) -> QgsVectorLayer:
+    layer = QgsVectorLayer(str(path), path.stem, "ogr")
+    if not layer.isValid():
+        detail = f"Can't open generated dataset {path}"
+        raise DataError(detail=detail)
+    return layer
+
+
+def _write_chunk(
+    sink: QgsFeatureSink, fields: QgsFields, chunk: Chunk
+) -> None:
+    names = fields.names()
+    rows: Iterable[Sequence[Any]] = (
+        zip(*(chunk.columns[name] for name in names))
+        if names
+        else repeat((), len(chunk.wkb))
+    )
+
+    features = []
+    for row, wkb in zip(rows, chunk.wkb):
+        feature = QgsFeature(fields)
+        feature.setAttributes(list(row))
+        geometry = QgsGeometry()
+        geometry.fromWkb(wkb)
+        feature.setGeometry(geometry)
+        features.append(feature)
+
+    is_added, _ = sink.addFeatures(features, QgsFeatureSink.Flag.FastInsert)
+    if not is_added:
+        detail = f"Can't write features: {sink.lastError()}"
+        raise DataError(detail=detail)
+
+
+def _generate_chunks(
+    spec: SyntheticDatasetSpec,
+    chunks: List[Tuple[int, int]],
+    workers: int,
+) -> Iterator[Chunk]:
+    remaining: Deque[Tuple[int, int]] = deque(chunks)
+    executor = _process_pool(workers) if workers > 1 else None
+    if executor is not None:
+        with executor:
+            yield from _generate_in_pool(executor, spec, remaining, workers)
+    else:
+        logger.debug("Generating synthetic features in QGIS")
+
+    # Chunks left after a worker failure are generated in this process
+    while remaining:
+        start, count = remaining.popleft()
+        yield generate_chunk(spec, start, count)
+
+
+def _process_pool(workers: int) -> Optional[ProcessPoolExecutor]:
+    # sys.executable points to the QGIS binary inside QGIS, so workers are
+    # started with the Python interpreter QGIS is bundled with
+    context = multiprocessing.get_context("spawn")
+    try:
+        context.set_executable(python_path())
+        return ProcessPoolExecutor(max_workers=workers, mp_context=context)
+    except Exception as error:
+        logger.warning(
+            f"Can't start worker processes, generating in QGIS: {error}",
+            exc_info=True,
+        )
+        return None
+
+
+def _generate_in_pool(
+    executor: ProcessPoolExecutor,
+    spec: SyntheticDatasetSpec,
+    remaining: Deque[Tuple[int, int]],
+    workers: int,
+) -> Iterator[Chunk]:
+    # Bounded window of pending chunks keeps memory usage flat while the
+    # results are written in order
+    pending: Deque[Tuple[Tuple[int, int], Future]] = deque()
+    while remaining or pending:
+        while remaining and len(pending) < workers * 2:
+            chunk = remaining.popleft()
+            pending.append(
+                (chunk, executor.submit(generate_chunk, spec, *chunk))
+            )
+
+        chunk, future = pending.popleft()
+        try:
+            result = future.result()
+        except Exception as error:
+            # Includes broken pools and errors of importing the chunk
+            # generator in the worker interpreter
+            logger.warning(
+                f"Worker processes failed, generating in QGIS: {error}",
+                exc_info=True,
+            )
+            remaining.extendleft(
+                reversed([chunk, *(item for item, _ in pending)])
+            )
+            return
+        yield result
@@ -0,0 +1,260 @@
+# QGIS DevTools Plugin
+# Copyright (C) 2025  NextGIS
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or any
+# later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+# Imported by the worker processes of generate_dataset(), which run
+# outside of QGIS. Only the standard library and NumPy may be used here.
+
+import importlib.util
+import struct
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+numpy = None
+if importlib.util.find_spec("numpy"):
+    import numpy
+
+GEOMETRY_POINT = "point"
+GEOMETRY_LINE = "line"
+GEOMETRY_POLYGON = "polygon"
+
+DISTRIBUTION_UNIFORM = "uniform"
+DISTRIBUTION_CLUSTERED = "clustered"
+
+FIELD_SERIAL = "serial"
+FIELD_INTEGER = "integer"
+FIELD_DOUBLE = "double"
+FIELD_STRING = "string"
+FIELD_DATE = "date"
+
+CATEGORIES = (
+    "residential",
+    "commercial",
+    "industrial",
+    "forest",
+    "farmland",
+    "meadow",
+    "water",
+    "wetland",
+    "park",
+    "cemetery",
+    "retail",
+    "military",
+)
+
+# Little endian WKB headers
+_WKB_POINT = struct.Struct("<BIdd")
+_WKB_LINE_HEADER = struct.Struct("<BII")
+_WKB_POLYGON_HEADER = struct.Struct("<BIII")
+
+
+def _default_fields() -> Dict[str, str]:
+    return {
+        "id": FIELD_SERIAL,
+        "value": FIELD_DOUBLE,
+        "category": FIELD_STRING,
+        "updated": FIELD_DATE,
+    }
+
+
+@dataclass(frozen=True)
+class SyntheticDatasetSpec:
+    """Description of a synthetic dataset.
+
+    The same specification and seed always produce the same features,
+    independently of the number of worker processes.
+
+    :param geometry_type: ``"point"``, ``"line"`` or ``"polygon"``.
+    :type geometry_type: str
+    :param features: Number of features.
+    :type features: int
+    :param vertices: Minimum and maximum number of vertices of lines and
+        polygon rings, at least 2 for lines and 3 for polygons.
+    :type vertices: Tuple[int, int]
+    :param fields: Field types by field name. Supported types are
+        ``"serial"``, ``"integer"``, ``"double"``, ``"string"`` and
+        ``"date"``.
+    :type fields: Dict[str, str]
+    :param distribution: ``"uniform"`` or ``"clustered"``.
+    :type distribution: str
+    :param clusters: Number of clusters of the clustered distribution.
+    :type clusters: int
+    :param cluster_spread: Standard deviation of clusters as a share of
+        the extent width.
+    :type cluster_spread: float
+    :param extent: Extent as xmin, ymin, xmax and ymax.
+    :type extent: Tuple[float, float, float, float]
+    :param feature_size: Approximate size of lines and polygons in
+        extent units. A thousandth of the extent width by default.
+    :type feature_size: Optional[float]
+    :param seed: Seed of the random generator.
+    :type seed: int
+    """
+
+    geometry_type: str = GEOMETRY_POINT
+    features: int = 100000
+    vertices: Tuple[int, int] = (4, 16)
+    fields: Dict[str, str] = field(default_factory=_default_fields)
+    distribution: str = DISTRIBUTION_UNIFORM
+    clusters: int = 10
+    cluster_spread: float = 0.01
+    extent: Tuple[float, float, float, float] = (-180.0, -90.0, 180.0, 90.0)
+    feature_size: Optional[float] = None
+    seed: int = 0
+
+
+@dataclass
+class Chunk:
+    """Generated features of a chunk.
+
+    :param columns: Attribute values by field name.
+    :type columns: Dict[str, List[Any]]
+    :param wkb: Little endian WKB geometries.
+    :type wkb: List[bytes]
+    """
+
+    columns: Dict[str, List[Any]]
+    wkb: List[bytes]
+
+
+def generate_chunk(
+    spec: SyntheticDatasetSpec, start: int, count: int
+) -> Chunk:
+    """Generate features of a chunk.
+
+    Features depend only on the specification and the chunk start, so
+    chunks can be generated in any process and order.
+
+    :param spec: Dataset description.
+    :type spec: SyntheticDatasetSpec
+    :param start: Index of the first feature of the chunk.
+    :type start: int
+    :param count: Number of features in the chunk.
+    :type count: int
+    :returns: Generated features.
+    :rtype: Chunk
+    """
+    random = numpy.random.default_rng([spec.seed, start])
+    xmin, _, xmax, _ = spec.extent
+    size = spec.feature_size or (xmax - xmin) / 1000
+
+    x, y = _anchor_points(spec, random, count)
+    if spec.geometry_type == GEOMETRY_POINT:
+        wkb = [_WKB_POINT.pack(1, 1, px, py) for px, py in zip(x, y)]
+    else:
+        minimum, maximum = spec.vertices
+        vertices = random.integers(minimum, maximum + 1, count)
+        build = (
+            _line_wkb if spec.geometry_type == GEOMETRY_LINE else _polygon_wkb
+        )
+        wkb = [
+            build(random, px, py, size, int(number))
+            for px, py, number in zip(x, y, vertices)
+        ]
+
+    columns = {
+        name: _column_values(field_type, random, start, count)
+        for name, field_type in spec.fields.items()
+    }
+    return Chunk(columns, wkb)
+
+
+def _anchor_points(
+    spec: SyntheticDatasetSpec, random: "numpy.random.Generator", count: int
+) -> Tuple["numpy.ndarray", "numpy.ndarray"]:
+    xmin, ymin, xmax, ymax = spec.extent
+    if spec.distribution == DISTRIBUTION_UNIFORM:
+        return (
+            random.uniform(xmin, xmax, count),
+            random.uniform(ymin, ymax, count),
+        )
+
+    # Cluster centers depend only on the seed to be shared by all chunks
+    centers = numpy.random.default_rng(spec.seed)
+    center_x = centers.uniform(xmin, xmax, max(spec.clusters, 1))
+    center_y = centers.uniform(ymin, ymax, max(spec.clusters, 1))
+    cluster = random.integers(0, len(center_x), count)
+    sigma = spec.cluster_spread * (xmax - xmin)
+    x = numpy.clip(
+        center_x[cluster] + random.normal(0, sigma, count), xmin, xmax
+    )
+    y = numpy.clip(
+        center_y[cluster] + random.normal(0, sigma, count), ymin, ymax
+    )
+    return x, y
+
+
+def _line_wkb(
+    random: "numpy.random.Generator",
+    x: float,
+    y: float,
+    size: float,
+    vertices: int,
+) -> bytes:
+    # Random walk with a slowly changing direction
+    heading = random.uniform(0, 2 * numpy.pi) + numpy.cumsum(
+        random.normal(0, 0.5, vertices - 1)
+    )
+    step = size / (vertices - 1)
+    coordinates = numpy.empty((vertices, 2))
+    coordinates[0] = (x, y)
+    coordinates[1:, 0] = x + numpy.cumsum(step * numpy.cos(heading))
+    coordinates[1:, 1] = y + numpy.cumsum(step * numpy.sin(heading))
+    return (
+        _WKB_LINE_HEADER.pack(1, 2, vertices)
+        + coordinates.astype("<f8").tobytes()
+    )
+
+
+def _polygon_wkb(
+    random: "numpy.random.Generator",
+    x: float,
+    y: float,
+    size: float,
+    vertices: int,
+) -> bytes:
+    # Star-shaped ring around the anchor point, always simple
+    angles = numpy.sort(random.uniform(0, 2 * numpy.pi, vertices))
+    radii = size / 2 * random.uniform(0.5, 1.0, vertices)
+    coordinates = numpy.empty((vertices + 1, 2))
+    coordinates[:-1, 0] = x + radii * numpy.cos(angles)
+    coordinates[:-1, 1] = y + radii * numpy.sin(angles)
+    coordinates[-1] = coordinates[0]
+    return (
+        _WKB_POLYGON_HEADER.pack(1, 3, 1, vertices + 1)
+        + coordinates.astype("<f8").tobytes()
+    )
+
+
+def _column_values(
+    field_type: str,
+    random: "numpy.random.Generator",
+    start: int,
+    count: int,
+) -> List[Any]:
+    if field_type == FIELD_SERIAL:
+        return list(range(start + 1, start + count + 1))
+    if field_type == FIELD_INTEGER:
+        return random.integers(0, 1000000, count).tolist()
+    if field_type == FIELD_DOUBLE:
+        return random.uniform(0, 1000, count).round(3).tolist()
+    if field_type == FIELD_STRING:
+        return [
+            CATEGORIES[index]
+            for index in random.integers(0, len(CATEGORIES), count)
+        ]
+    days = random.integers(0, 3650, count)
+    return (numpy.datetime64("2015-01-01") + days).tolist()
@@ -29,8 +29,13 @@ from devtools.core.logging import logger, unload_logger
 from devtools.shared.qobject_metaclass import QObjectMetaClass
 
 if TYPE_CHECKING:
+    from devtools.bench.bench_manager import BenchmarkManager
+    from devtools.data.data_manager import DataManager
     from devtools.debug.debug_interface import DebugInterface
+    from devtools.inspectors.inspectors_manager import InspectorsManager
+    from devtools.logs.logs_manager import LogsManager
     from devtools.notifier.notifier_interface import NotifierInterface
+    from devtools.profiling.profiling_manager import ProfilingManager
 
 
 class DevToolsInterface(QObject, metaclass=QObjectMetaClass):
@@ -115,6 +120,56 @@ class DevToolsInterface(QObject, metaclass=QObjectMetaClass):
         """
         ...
 
+    @property
+    @abstractmethod
+    def profiler(self) -> "ProfilingManager":
+        """Return the profiling manager.
+
+        :returns: An instance of ProfilingManager.
+        :rtype: ProfilingManager
+        """
+        ...
+
+    @property
+    @abstractmethod
+    def bench(self) -> "BenchmarkManager":
+        """Return the benchmark manager.
+
+        :returns: An instance of BenchmarkManager.
+        :rtype: BenchmarkManager
+        """
+        ...
+
+    @property
+    @abstractmethod
+    def data(self) -> "DataManager":
+        """Return the data helpers manager.
+
+        :returns: An instance of DataManager.
+        :rtype: DataManager
+        """
+        ...
+
+    @property
+    @abstractmethod
+    def inspectors(self) -> "InspectorsManager":
+        """Return the layer inspectors manager.
+
+        :returns: An instance of InspectorsManager.
+        :rtype: InspectorsManager
+        """
+        ...
+
+    @property
+    @abstractmethod
+    def logs(self) -> "LogsManager":
+        """Return the cross-plugin log capture manager.
+
+        :returns: An instance of LogsManager.
+        :rtype: LogsManager
+        """
+        ...
+
     def initGui(self) -> None:
         """Initialize the GUI components and load necessary resources."""
         self.__translators = list()
@@ -34,14 +34,19 @@ from qgis.PyQt.QtGui import QDesktopServices, QIcon
 from qgis.PyQt.QtWidgets import QAction, QPushButton, QToolBar
 from qgis.utils import iface
 
+from devtools.bench.bench_manager import BenchmarkManager
 from devtools.core import utils
 from devtools.core.compat import parse_version
 from devtools.core.constants import MENU_NAME, PACKAGE_NAME, PLUGIN_NAME
 from devtools.core.logging import logger
 from devtools.core.settings import DevToolsSettings
+from devtools.data.data_manager import DataManager
 from devtools.debug.debug_manager import DebugManager
 from devtools.devtools_interface import DevToolsInterface
+from devtools.inspectors.inspectors_manager import InspectorsManager
+from devtools.logs.logs_manager import LogsManager
 from devtools.notifier.message_bar_notifier import MessageBarNotifier
+from devtools.profiling.profiling_manager import ProfilingManager
 from devtools.ui.about_dialog import AboutDialog
 from devtools.ui.devtools_settings_page import DevToolsSettingsPageFactory
 from devtools.ui.utils import plugin_icon
@@ -62,6 +67,11 @@ class DevToolsPlugin(DevToolsInterface):
     __toolbar: Optional[QToolBar]
     __notifier: Optional[MessageBarNotifier]
     __debug_manager: Optional[DebugManager]
+    __profiling_manager: Optional[ProfilingManager]
+    __bench_manager: Optional[BenchmarkManager]
+    __data_manager: Optional[DataManager]
+    __inspectors_manager: Optional[InspectorsManager]
+    __logs_manager: Optional[LogsManager]
     __about_plugin_action: Optional[QAction]  # type: ignore reportInvalidTypeForm
     __about_plugin_help_action: Optional[QAction]  # type: ignore reportInvalidTypeForm
     __devtools_settings_page_factory: Optional[DevToolsSettingsPageFactory]
@@ -95,6 +105,11 @@ class DevToolsPlugin(DevToolsInterface):
         self.__toolbar = None
         self.__notifier = None
         self.__debug_manager = None
+        self.__profiling_manager = None
+        self.__bench_manager = None
+        self.__data_manager = None
+        self.__inspectors_manager = None
+        self.__logs_manager = None
         self.__about_plugin_action = None
         self.__about_plugin_help_action = None
         self.__devtools_settings_page_factory = None
@@ -135,6 +150,71 @@ class DevToolsPlugin(DevToolsInterface):
         )
         return self.__debug_manager
 
+    @property
+    def profiler(self) -> ProfilingManager:
+        """Return the profiling manager.
+
+        :returns: Profiling manager instance.
+        :rtype: ProfilingManager
+        :raises AssertionError: If profiling manager is not initialized.
+        """
+        assert self.__profiling_manager is not None, (
+            "Profiling manager is not initialized"
+        )
+        return self.__profiling_manager
+
+    @property
+    def bench(self) -> BenchmarkManager:
+        """Return the benchmark manager.
+
+        :returns: Benchmark manager instance.
+        :rtype: BenchmarkManager
+        :raises AssertionError: If benchmark manager is not initialized.
+        """
+        assert self.__bench_manager is not None, (
+            "Benchmark manager is not initialized"
+        )
+        return self.__bench_manager
+
+    @property
+    def data(self) -> DataManager:
+        """Return the data helpers manager.
+
+        :returns: Data manager instance.
+        :rtype: DataManager
+        :raises AssertionError: If data manager is not initialized.
+        """
+        assert self.__data_manager is not None, (
+            "Data manager is not initialized"
+        )
+        return self.__data_manager
+
+    @property
+    def inspectors(self) -> InspectorsManager:
+        """Return the layer inspectors manager.
+
+        :returns: Inspectors manager instance.
+        :rtype: InspectorsManager
+        :raises AssertionError: If inspectors manager is not initialized.
+        """
+        assert self.__inspectors_manager is not None, (
+            "Inspectors manager is not initialized"
+        )
+        return self.__inspectors_manager
+
+    @property
+    def logs(self) -> LogsManager:
+        """Return the cross-plugin log capture manager.
+
+        :returns: Logs manager instance.
+        :rtype: LogsManager
+        :raises AssertionError: If logs manager is not initialized.
+        """
+        assert self.__logs_manager is not None, (
+            "Logs manager is not initialized"
+        )
+        return self.__logs_manager
+
     def _load(self) -> None:
         """Load the plugin resources and initialize components."""
         self._add_translator(
@@ -146,7 +226,12 @@ class DevToolsPlugin(DevToolsInterface):
         # self.__toolbar.setObjectName("DevToolsToolBar")
 
         self.__load_settings_page()
+        self.__load_logs_manager()
         self.__load_debug_manager()
+        self.__load_profiling_manager()
+        self.__load_bench_manager()
+        self.__load_data_manager()
+        self.__load_inspectors_manager()
         self.__load_about_dialog_actions()
         self.__add_icons_to_menu()
 
@@ -166,7 +251,12 @@ class DevToolsPlugin(DevToolsInterface):
 
         self.__deintegrate_from_python_console()
         self.__unload_about_dialog_actions()
+        self.__unload_inspectors_manager()
+        self.__unload_data_manager()
+        self.__unload_bench_manager()
+        self.__unload_profiling_manager()
         self.__unload_debug_manager()
+        self.__unload_logs_manager()
         self.__unload_settings_page()
 
         # if self.__toolbar is not None:
@@ -220,6 +310,56 @@ class DevToolsPlugin(DevToolsInterface):
             self.__debug_manager.unload()
             self.__debug_manager = None
 
+    def __load_profiling_manager(self) -> None:
+        self.__profiling_manager = ProfilingManager(self)
+        self.__profiling_manager.load()
+
+    def __unload_profiling_manager(self) -> None:
+        if self.__profiling_manager is not None:
+            self.__profiling_manager.unload()
+            self.__profiling_manager.deleteLater()
+            self.__profiling_manager = None
+
+    def __load_bench_manager(self) -> None:
+        self.__bench_manager = BenchmarkManager(self)
+        self.__bench_manager.load()
+
+    def __unload_bench_manager(self) -> None:
+        if self.__bench_manager is not None:
+            self.__bench_manager.unload()
+            self.__bench_manager.deleteLater()
+            self.__bench_manager = None
+
+    def __load_data_manager(self) -> None:
+        self.__data_manager = DataManager(self)
+        self.__data_manager.load()
+
+    def __unload_data_manager(self) -> None:
+        if self.__data_manager is not None:
+            self.__data_manager.unload()
+            self.__data_manager.deleteLater()
+            self.__data_manager = None
+
+    def __load_inspectors_manager(self) -> None:
+        self.__inspectors_manager = InspectorsManager(self)
+        self.__inspectors_manager.load()
+
+    def __unload_inspectors_manager(self) -> None:
+        if self.__inspectors_manager is not None:
+            self.__inspectors_manager.unload()
+            self.__inspectors_manager.deleteLater()
+            self.__inspectors_manager = None
+
+    def __load_logs_manager(self) -> None:
+        self.__logs_manager = LogsManager(self)
+        self.__logs_manager.load()
+
+    def __unload_logs_manager(self) -> None:
+        if self.__logs_manager is not None:
+            self.__logs_manager.unload()
+            self.__logs_manager.deleteLater()
+            self.__logs_manager = None
+
     def __load_settings_page(self) -> None:
         self.__devtools_settings_page_factory = DevToolsSettingsPageFactory()
         iface.registerOptionsWidgetFactory(
@@ -37,8 +37,13 @@ from devtools.notifier.message_bar_notifier import MessageBarNotifier
 if TYPE_CHECKING:
     from qgis.PyQt.QtWidgets import QToolBar
 
+    from devtools.bench.bench_manager import BenchmarkManager
+    from devtools.data.data_manager import DataManager
     from devtools.debug.debug_interface import DebugInterface
+    from devtools.inspectors.inspectors_manager import InspectorsManager
+    from devtools.logs.logs_manager import LogsManager
     from devtools.notifier.notifier_interface import NotifierInterface
+    from devtools.profiling.profiling_manager import ProfilingManager
 
 assert isinstance(iface, QgisInterface)
 
@@ -96,6 +101,51 @@ class DevToolsPluginStub(DevToolsInterface):
         """
         raise NotImplementedError
 
+    @property
+    def profiler(self) -> "ProfilingManager":
+        """Return the profiling manager.
+
+        :returns: An instance of ProfilingManager.
+        :rtype: ProfilingManager
+        """
+        raise NotImplementedError
+
+    @property
+    def bench(self) -> "BenchmarkManager":
+        """Return the benchmark manager.
+
+        :returns: An instance of BenchmarkManager.
+        :rtype: BenchmarkManager
+        """
+        raise NotImplementedError
+
+    @property
+    def data(self) -> "DataManager":
+        """Return the data helpers manager.
+
+        :returns: An instance of DataManager.
+        :rtype: DataManager
+        """
+        raise NotImplementedError
+
+    @property
+    def inspectors(self) -> "InspectorsManager":
+        """Return the layer inspectors manager.
+
+        :returns: An instance of InspectorsManager.
+        :rtype: InspectorsManager
+        """
+        raise NotImplementedError
+
+    @property
+    def logs(self) -> "LogsManager":
+        """Return the cross-plugin log capture manager.
+
+        :returns: An instance of LogsManager.
+        :rtype: LogsManager
+        """
+        raise NotImplementedError
+
     def _load(self) -> None:
         """Load the plugin resources and initialize components."""
         self._add_translator(
@@ -0,0 +1,465 @@
+# QGIS DevTools Plugin
+# Copyright (C) 2025  NextGIS
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or any
+# later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+import statistics
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from qgis.core import (
+    QgsExpression,
+    QgsExpressionNode,
+    QgsExpressionNodeBinaryOperator,
+    QgsExpressionNodeColumnRef,
+    QgsExpressionNodeInOperator,
+    QgsExpressionNodeLiteral,
+    QgsFeature,
+    QgsFeatureIterator,
+    QgsFeatureRequest,
+    QgsProject,
+    QgsVectorLayer,
+)
+from qgis.PyQt.QtCore import QObject
+
+from devtools.core.call_site import caller_site
+from devtools.core.compat import FeatureRequestFlag, VectorProviderCapability
+from devtools.core.logging import logger
+from devtools.inspectors.exceptions import InspectorError
+from devtools.profiling.get_features_hook import get_features_hook
+
+BinaryOperator = QgsExpressionNodeBinaryOperator.BinaryOperator
+
+INDEXABLE_OPERATORS = (
+    BinaryOperator.boEQ,
+    BinaryOperator.boGE,
+    BinaryOperator.boGT,
+    BinaryOperator.boLE,
+    BinaryOperator.boLT,
+)
+
+
+@dataclass
+class AttributeIndexCandidate:
+    """Field used in observed filter expressions.
+
+    :param layer_id: Layer id.
+    :type layer_id: str
+    :param layer_name: Layer name.
+    :type layer_name: str
+    :param field_name: Filtered field name.
+    :type field_name: str
+    :param can_create: The provider can create attribute indexes.
+    :type can_create: bool
+    :param calls: Number of sampled filter calls using the field.
+    :type calls: int
+    :param expressions: Examples of filter expressions.
+    :type expressions: List[str]
+    :param plugins: Plugins filtering on the field.
+    :type plugins: Set[str]
+    :param values: Examples of compared values.
+    :type values: List[Any]
+    """
+
+    layer_id: str
+    layer_name: str
+    field_name: str
+    can_create: bool
+    calls: int = 0
+    expressions: List[str] = field(default_factory=list)
+    plugins: Set[str] = field(default_factory=set)
+    values: List[Any] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class AttributeIndexBenchmark:
+    """Filter request times before and after creating an attribute index.
+
+    :param layer_name: Layer name.
+    :type layer_name: str
+    :param field_name: Indexed field name.
+    :type field_name: str
+    :param requests: Number of timed requests.
+    :type requests: int
+    :param before: Median request time without the index in seconds.
+    :type before: float
+    :param after: Median request time with the index in seconds.
+    :type after: float
+    :param is_created: The provider reported success.
+    :type is_created: bool
+    """
+
+    layer_name: str
+    field_name: str
+    requests: int
+    before: float
+    after: float
+    is_created: bool
+
+    @property
+    def speedup(self) -> float:
+        """Return the speedup of filter requests.
+
+        :returns: Ratio of times before and after.
+        :rtype: float
+        """
+        return self.before / self.after if self.after else 1.0
+
+    def __str__(self) -> str:
+        """Return a one line summary.
+
+        :returns: Summary text.
+        :rtype: str
+        """
+        if not self.is_created:
+            return (
+                f"Attribute index on {self.layer_name}.{self.field_name} "
+                "was not created"
+            )
+        return (
+            f"Attribute index on {self.layer_name}.{self.field_name}: "
+            f"{self.before * 1000:.2f} ms -> {self.after * 1000:.2f} ms "
+            f"per request ({self.speedup:.1f}x)"
+        )
+
+
+def indexable_comparisons(
+    expression: QgsExpression,
+) -> List[Tuple[str, Optional[Any]]]:
+    """Find field comparisons a provider could answer with an index.
+
+    Comparisons of a column with a literal and ``IN`` lists of literals
+    are reported, also when combined with ``AND`` or ``OR``.
+
+    :param expression: Filter expression.
+    :type expression: QgsExpression
+    :returns: Field names with a compared value or None for ``IN`` lists.
+    :rtype: List[Tuple[str, Optional[Any]]]
+    """
+    root = expression.rootNode()
+    return _comparisons(root) if root is not None else []
+
+
+def _comparisons(node: QgsExpressionNode) -> List[Tuple[str, Optional[Any]]]:
+    if isinstance(node, QgsExpressionNodeBinaryOperator):
+        operator = node.op()
+        if operator in (BinaryOperator.boAnd, BinaryOperator.boOr):
+            return _comparisons(node.opLeft()) + _comparisons(node.opRight())
+        if operator not in INDEXABLE_OPERATORS:
+            return []
+
+        left, right = node.opLeft(), node.opRight()
+        if isinstance(right, QgsExpressionNodeColumnRef):
+            left, right = right, left
+        if isinstance(left, QgsExpressionNodeColumnRef) and isinstance(
+            right, QgsExpressionNodeLiteral
+        ):
+            return [(left.name(), right.value())]
+        return []
+
+    if (
+        isinstance(node, QgsExpressionNodeInOperator)
+        and not node.isNotIn()
+        and isinstance(node.node(), QgsExpressionNodeColumnRef)
+        and all(
+            isinstance(item, QgsExpressionNodeLiteral)
+            for item in node.list().list()
+        )
+    ):
+        return [(node.node().name(), None)]
+
+    return []
+
+
+class AttributeIndexAdvisor(QObject):
+    """Ranks fields used in filter expressions as attribute index candidates.
+
+    While running, Python calls of ``QgsVectorLayer.getFeatures`` with a
+    filter expression are sampled per layer. Fields compared with
+    literals are ranked by the number of sampled calls.
+    """
+
+    SAMPLED_FIRST_CALLS = 3
+    SAMPLE_EVERY = 10
+    MAX_EXAMPLES = 5
+    MAX_VALUES = 20
+
+    __candidates: Dict[Tuple[str, str], AttributeIndexCandidate]
+    __layer_calls: Dict[str, int]
+    __is_running: bool
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        """Initialize AttributeIndexAdvisor instance.
+
+        :param parent: Parent QObject.
+        :type parent: Optional[QObject]
+        """
+        super().__init__(parent)
+        self.__is_running = False
+        self.reset()
+
+    @property
+    def is_running(self) -> bool:
+        """Check whether ``getFeatures`` calls are observed.
+
+        :returns: True if the advisor is running.
+        :rtype: bool
+        """
+        return self.__is_running
+
+    def start(self) -> None:
+        """Start observing filter expressions."""
+        if self.__is_running:
+            return
+        get_features_hook.add_listener(self.__on_get_features)
+        self.__is_running = True
+        logger.debug("Attribute index advisor started")
+
+    def stop(self) -> None:
+        """Stop observing and log the report."""
+        if not self.__is_running:
+            return
+        get_features_hook.remove_listener(self.__on_get_features)
+        self.__is_running = False
+        logger.debug("Attribute index advisor stopped")
+
+        if self.__candidates:
+            logger.info(self.report())
+
+    def reset(self) -> None:
+        """Forget all observed filters."""
+        self.__candidates = {}
+        self.__layer_calls = {}
+
+    def candidates(self) -> List[AttributeIndexCandidate]:
+        """Return candidate fields.
+
+        :returns: Candidates, most filtered first.
+        :rtype: List[AttributeIndexCandidate]
+        """
+        return sorted(
+            self.__candidates.values(),
+            key=lambda candidate: candidate.calls,
+            reverse=True,
+        )
+
+    def create_index(
+        self,
+        layer: QgsVectorLayer,
+        field_name: str,
+        *,
+        requests: int = 10,
+    ) -> AttributeIndexBenchmark:
+        """Create an attribute index and time filter requests around it.
+
+        Requests compare the field with observed values or, if none were
+        observed, with existing field values. The requests are run once
+        without timing before the first measurement to warm up caches.
+
+        :param layer: Layer to index.
+        :type layer: QgsVectorLayer
+        :param field_name: Field to index.
+        :type field_name: str
+        :param requests: Number of timed requests before and after.
+        :type requests: int
+        :returns: Request times before and after creating the index.
+        :rtype: AttributeIndexBenchmark
+        :raises InspectorError: If the field does not exist.
+        """
+        field_index = layer.fields().lookupField(field_name)
+        if field_index < 0:
+            detail = f"Field {field_name!r} not found in {layer.name()!r}"
+            raise InspectorError(detail=detail)
+
+        candidate = self.__candidates.get((layer.id(), field_name))
+        values = [
+            value
+            for value in (candidate.values if candidate is not None else [])
+            if value is not None
+        ]
+        if not values:
+            values = list(layer.uniqueValues(field_index, self.MAX_VALUES))
+        values = (values * requests)[: max(requests, 1)] or [None]
+
+        # Untimed pass, so that "before" isn't inflated by a cold file
+        # and provider cache
+        self.__request_time(layer, field_name, values)
+        before = self.__request_time(layer, field_name, values)
+        is_created = layer.dataProvider().createAttributeIndex(field_index)
+        after = self.__request_time(layer, field_name, values)
+
+        benchmark = AttributeIndexBenchmark(
+            layer_name=layer.name(),
+            field_name=field_name,
+            requests=len(values),
+            before=before,
+            after=after,
+            is_created=is_created,
+        )
+        logger.info(str(benchmark))
+        return benchmark
+
+    def create_indexes(
+        self, *, min_calls: int = 1, requests: int = 10
+    ) -> List[AttributeIndexBenchmark]:
+        """Create indexes for all candidates the provider can index.
+
+        :param min_calls: Minimum number of sampled filter calls.
+        :type min_calls: int
+        :param requests: Number of timed requests before and after.
+        :type requests: int
+        :returns: Benchmarks of created indexes.
+        :rtype: List[AttributeIndexBenchmark]
+        """
+        project = QgsProject.instance()
+        benchmarks = []
+        for candidate in self.candidates():
+            layer = project.mapLayer(candidate.layer_id)
+            if (
+                not isinstance(layer, QgsVectorLayer)
+                or not candidate.can_create
+                or candidate.calls < min_calls
+            ):
+                continue
+            benchmarks.append(
+                self.create_index(
+                    layer, candidate.field_name, requests=requests
+                )
+            )
+        return benchmarks
+
+    def report(self) -> str:
+        """Return candidate fields grouped by layer.
+
+        :returns: Multiline report text.
+        :rtype: str
+        """
+        candidates = self.candidates()
+        if not candidates:
+            return "No filter expressions on layer fields observed"
+
+        lines = ["Attribute index candidates (sampled filter calls):"]
+        for candidate in candidates:
+            plugins = ", ".join(sorted(candidate.plugins)) or "<unknown>"
+            suffix = "" if candidate.can_create else ", provider can't index"
+            lines.append(
+                f"  {candidate.layer_name}.{candidate.field_name}: "
+                f"{candidate.calls} call(s) from {plugins}{suffix}"
+            )
+            lines.extend(
+                f"    {expression}" for expression in candidate.expressions
+            )
+        return "\n".join(lines)
+
+    def __on_get_features(
+        self,
+        layer: QgsVectorLayer,
+        request: QgsFeatureRequest,
+        iterator: QgsFeatureIterator,
+    ) -> QgsFeatureIterator:
+        expression = request.filterExpression()
+        if expression is None:
+            return iterator
+
+        calls = self.__layer_calls.get(layer.id(), 0) + 1
+        self.__layer_calls[layer.id()] = calls
+        if not self.__should_sample(calls):
+            return iterator
+
+        comparisons = indexable_comparisons(expression)
+        if not comparisons:
+            return iterator
+
+        plugin = caller_site(depth=2).plugin
+        fields = layer.fields()
+        for field_name, value in comparisons:
+            field_index = fields.lookupField(field_name)
+            if field_index < 0:
+                continue
+            candidate = self.__candidate(layer, fields.at(field_index).name())
+            self.__record(candidate, expression.expression(), plugin, value)
+
+        return iterator
+
+    def __should_sample(self, call_number: int) -> bool:
+        return (
+            call_number <= self.SAMPLED_FIRST_CALLS
+            or call_number % self.SAMPLE_EVERY == 0
+        )
+
+    def __candidate(
+        self, layer: QgsVectorLayer, field_name: str
+    ) -> AttributeIndexCandidate:
+        key = (layer.id(), field_name)
+        candidate = self.__candidates.get(key)
+        if candidate is None:
+            capabilities = layer.dataProvider().capabilities()
+            candidate = AttributeIndexCandidate(
+                layer_id=layer.id(),
+                layer_name=layer.name(),
+                field_name=field_name,
+                can_create=bool(
+                    capabilities
+                    & VectorProviderCapability.CreateAttributeIndex
+                ),
+            )
+            self.__candidates[key] = candidate
+        return candidate
+
+    def __record(
+        self,
+        candidate: AttributeIndexCandidate,
+        expression: str,
+        plugin: Optional[str],
+        value: Optional[Any],  # noqa: ANN401
+    ) -> None:
+        candidate.calls += 1
+        if plugin:
+            candidate.plugins.add(plugin)
+        if (
+            expression not in candidate.expressions
+            and len(candidate.expressions) < self.MAX_EXAMPLES
+        ):
+            candidate.expressions.append(expression)
+        if (
+            value is not None
+            and value not in candidate.values
+            and len(candidate.values) < self.MAX_VALUES
+        ):
+            candidate.values.append(value)
+
+    def __request_time(
+        self, layer: QgsVectorLayer, field_name: str, values: List[Any]
+    ) -> float:
+        times = []
+        feature = QgsFeature()
+        for value in values:
+            request = QgsFeatureRequest(
+                QgsExpression(
+                    QgsExpression.createFieldEqualityExpression(
+                        field_name, value
+                    )
+                )
+            )
+            request.setFlags(FeatureRequestFlag.NoGeometry)
+            request.setNoAttributes()
+
+            started = time.perf_counter()
+            iterator = get_features_hook.original(layer, request)
+            while iterator.nextFeature(feature):
+                pass
+            times.append(time.perf_counter() - started)
+        return statistics.median(times)
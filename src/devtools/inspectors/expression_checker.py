@@ -0,0 +1,484 @@
+# QGIS DevTools Plugin
+# Copyright (C) 2025  NextGIS
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or any
+# later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+import re
+import statistics
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Union
+
+from qgis.core import (
+    QgsAbstractFeatureIterator,
+    QgsExpression,
+    QgsExpressionNode,
+    QgsExpressionNodeBinaryOperator,
+    QgsExpressionNodeUnaryOperator,
+    QgsFeature,
+    QgsFeatureIterator,
+    QgsFeatureRequest,
+    QgsFields,
+    QgsProject,
+    QgsSettings,
+    QgsVectorLayer,
+)
+from qgis.PyQt.QtCore import QObject, Qt, pyqtSignal, pyqtSlot
+
+from devtools.core.call_site import caller_site
+from devtools.core.compat import FeatureRequestFlag
+from devtools.core.logging import logger
+from devtools.inspectors.exceptions import InspectorError
+from devtools.profiling.get_features_hook import get_features_hook
+
+COMPILED = "compiled"
+PARTIALLY_COMPILED = "partially compiled"
+NOT_COMPILED = "not compiled"
+NOT_CHECKED = "not checked"
+
+COMPILE_EXPRESSIONS_KEY = "qgis/compileExpressions"
+
+CompileStatus = QgsAbstractFeatureIterator.CompileStatus
+BinaryOperator = QgsExpressionNodeBinaryOperator.BinaryOperator
+UnaryOperator = QgsExpressionNodeUnaryOperator.UnaryOperator
+
+# String and number literals, double quoted field names are matched to be
+# skipped as a whole
+_LITERALS = re.compile(
+    r"'(?:[^']|'')*'|\"(?:[^\"]|\"\")*\"|\b\d+(?:\.\d+)?(?:[eE][-+]?\d+)?\b"
+)
+
+_STATUSES = {
+    CompileStatus.Compiled: COMPILED,
+    CompileStatus.PartiallyCompiled: PARTIALLY_COMPILED,
+    CompileStatus.NoCompilation: NOT_COMPILED,
+}
+
+
+@dataclass
+class ExpressionCheck:
+    """Compilation status of a filter expression on a layer provider.
+
+    :param layer_id: Layer id.
+    :type layer_id: str
+    :param layer_name: Layer name.
+    :type layer_name: str
+    :param provider: Data provider key.
+    :type provider: str
+    :param expression: Filter expression.
+    :type expression: str
+    :param status: ``"compiled"``, ``"partially compiled"``,
+        ``"not compiled"`` or ``"not checked"`` while a runtime check is
+        pending.
+    :type status: str
+    :param blockers: Smallest sub-expressions which are not compiled.
+    :type blockers: List[str]
+    :param hints: Expression parts providers usually can't compile.
+    :type hints: List[str]
+    :param features: Number of matching features, -1 if not timed.
+    :type features: int
+    :param compiled_time: Median request time with compilation enabled.
+    :type compiled_time: Optional[float]
+    :param uncompiled_time: Median request time with compilation disabled.
+    :type uncompiled_time: Optional[float]
+    :param calls: Number of observed runtime calls.
+    :type calls: int
+    :param plugins: Plugins using the expression.
+    :type plugins: Set[str]
+    """
+
+    layer_id: str
+    layer_name: str
+    provider: str
+    expression: str
+    status: str
+    blockers: List[str] = field(default_factory=list)
+    hints: List[str] = field(default_factory=list)
+    features: int = -1
+    compiled_time: Optional[float] = None
+    uncompiled_time: Optional[float] = None
+    calls: int = 0
+    plugins: Set[str] = field(default_factory=set)
+
+    @property
+    def is_compiled(self) -> bool:
+        """Return True if the whole expression runs on the provider side.
+
+        :returns: Whether the expression is fully compiled.
+        :rtype: bool
+        """
+        return self.status == COMPILED
+
+    def summary(self) -> str:
+        """Return a human readable description.
+
+        :returns: Multiline summary.
+        :rtype: str
+        """
+        lines = [
+            f"{self.layer_name} [{self.provider}]: {self.status}",
+            f"  {self.expression}",
+        ]
+        lines.extend(f"  blocked by: {blocker}" for blocker in self.blockers)
+        lines.extend(f"  hint: {hint}" for hint in self.hints)
+        if self.compiled_time is not None and self.uncompiled_time:
+            lines.append(
+                f"  {self.features} feature(s): "
+                f"{self.compiled_time * 1000:.1f} ms with compilation, "
+                f"{self.uncompiled_time * 1000:.1f} ms without "
+                f"({self.uncompiled_time / max(self.compiled_time, 1e-9):.1f}x)"
+            )
+        if self.plugins:
+            lines.append(f"  used by: {', '.join(sorted(self.plugins))}")
+        return "\n".join(lines)
+
+
+@contextmanager
+def expression_compilation(enabled: bool) -> Iterator[None]:
+    """Temporarily enable or disable provider expression compilation.
+
+    The ``qgis/compileExpressions`` setting is global. While the context
+    is active, every feature request in QGIS, including requests of other
+    threads and plugins, uses the given state, and the setting is written
+    to the user profile. Keep the context around the measured requests
+    only and never enter it from a ``getFeatures`` hook.
+
+    :param enabled: Compilation state inside the context.
+    :type enabled: bool
+    """
+    settings = QgsSettings()
+    previous = settings.value(COMPILE_EXPRESSIONS_KEY, True, type=bool)
+    settings.setValue(COMPILE_EXPRESSIONS_KEY, enabled)
+    try:
+        yield
+    finally:
+        settings.setValue(COMPILE_EXPRESSIONS_KEY, previous)
+
+
+def compile_status(layer: QgsVectorLayer, expression: str) -> str:
+    """Return how the layer provider compiles a filter expression.
+
+    The provider iterator is created with compilation enabled and closed
+    before any feature is fetched. Compilation is enabled through the
+    global setting, see :func:`expression_compilation`.
+
+    :param layer: Vector layer.
+    :type layer: QgsVectorLayer
+    :param expression: Filter expression.
+    :type expression: str
+    :returns: Compilation status.
+    :rtype: str
+    """
+    request = QgsFeatureRequest(QgsExpression(expression))
+    request.setFlags(FeatureRequestFlag.NoGeometry)
+    request.setNoAttributes()
+    request.setLimit(1)
+
+    with expression_compilation(enabled=True):
+        iterator = layer.dataProvider().getFeatures(request)
+        status = iterator.compileStatus()
+        iterator.close()
+    return _STATUSES.get(status, NOT_COMPILED)
+
+
+def normalized_expression(expression: str) -> str:
+    """Replace string and number literals of an expression with ``?``.
+
+    Expressions differing only by compared values, like filters built for
+    each feature id, get the same normalized text.
+
+    :param expression: Expression text.
+    :type expression: str
+    :returns: Expression text without literals.
+    :rtype: str
+    """
+
+    def replace(match: "re.Match") -> str:
+        text = match.group(0)
+        return text if text.startswith('"') else "?"
+
+    return _LITERALS.sub(replace, expression)
+
+
+def compilation_hints(
+    layer: QgsVectorLayer, expression: QgsExpression
+) -> List[str]:
+    """Find expression parts which usually prevent compilation.
+
+    :param layer: Vector layer.
+    :type layer: QgsVectorLayer
+    :param expression: Filter expression.
+    :type expression: QgsExpression
+    :returns: Descriptions of suspicious expression parts.
+    :rtype: List[str]
+    """
+    hints = [
+        f"function {name}() is evaluated by QGIS"
+        for name in sorted(expression.referencedFunctions())
+    ]
+
+    fields = layer.fields()
+    origins = {
+        QgsFields.FieldOrigin.OriginExpression: "virtual field",
+        QgsFields.FieldOrigin.OriginJoin: "joined field",
+    }
+    for name in sorted(expression.referencedColumns()):
+        index = fields.lookupField(name)
+        if index < 0:
+            continue
+        origin = origins.get(fields.fieldOrigin(index))
+        if origin is not None:
+            hints.append(f"{origin} {name} does not exist in the provider")
+    return hints
+
+
+class ExpressionChecker(QObject):
+    """Checks whether filter expressions are compiled to provider queries.
+
+    An expression that is not compiled is evaluated by QGIS on every
+    feature fetched from the provider. Expressions can be checked on
+    demand or collected at runtime from Python ``getFeatures`` calls.
+
+    Runtime expressions are grouped by their text without literals. They
+    are checked later in the main thread, so the observed calls are not
+    slowed down.
+    """
+
+    TIMING_REPEAT = 3
+    MAX_CHECKS = 1000
+
+    _check_requested = pyqtSignal()
+
+    __checks: Dict[Tuple[str, str], ExpressionCheck]
+    __unchecked: List[Tuple[ExpressionCheck, QgsExpression]]
+    __is_running: bool
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        """Initialize ExpressionChecker instance.
+
+        :param parent: Parent QObject.
+        :type parent: Optional[QObject]
+        """
+        super().__init__(parent)
+        self.__is_running = False
+        self.__checks = {}
+        self.__unchecked = []
+        self._check_requested.connect(
+            self.__check_pending, Qt.ConnectionType.QueuedConnection
+        )
+
+    @property
+    def is_running(self) -> bool:
+        """Check whether ``getFeatures`` calls are observed.
+
+        :returns: True if the checker is running.
+        :rtype: bool
+        """
+        return self.__is_running
+
+    def start(self) -> None:
+        """Start checking filter expressions used at runtime."""
+        if self.__is_running:
+            return
+        get_features_hook.add_listener(self.__on_get_features)
+        self.__is_running = True
+        logger.debug("Expression compilation checker started")
+
+    def stop(self) -> None:
+        """Stop checking and log not compiled expressions."""
+        if not self.__is_running:
+            return
+        get_features_hook.remove_listener(self.__on_get_features)
+        self.__is_running = False
+        logger.debug("Expression compilation checker stopped")
+
+        self.__check_pending()
+        if any(not check.is_compiled for check in self.__checks.values()):
+            logger.info(self.report())
+
+    def reset(self) -> None:
+        """Forget all runtime checks."""
+        self.__checks = {}
+        self.__unchecked = []
+
+    def checks(self) -> List[ExpressionCheck]:
+        """Return expressions observed at runtime.
+
+        :returns: Checks, most called first.
+        :rtype: List[ExpressionCheck]
+        """
+        self.__check_pending()
+        return sorted(
+            self.__checks.values(), key=lambda check: check.calls, reverse=True
+        )
+
+    def check(
+        self,
+        layer: QgsVectorLayer,
+        expression: Union[str, QgsExpression],
+        *,
+        timing: bool = True,
+    ) -> ExpressionCheck:
+        """Check compilation of a filter expression on a layer.
+
+        :param layer: Vector layer.
+        :type layer: QgsVectorLayer
+        :param expression: Filter expression.
+        :type expression: Union[str, QgsExpression]
+        :param timing: Time the request with and without compilation.
+        :type timing: bool
+        :returns: Compilation status with blocking sub-expressions.
+        :rtype: ExpressionCheck
+        :raises InspectorError: If the expression can't be parsed.
+        """
+        parsed = QgsExpression(expression)
+        if parsed.hasParserError():
+            detail = f"Invalid expression: {parsed.parserErrorString()}"
+            raise InspectorError(detail=detail)
+
+        result = self.__static_check(layer, parsed)
+        if timing:
+            self.__time(layer, result)
+        return result
+
+    def report(self) -> str:
+        """Return not compiled expressions observed at runtime.
+
+        :returns: Multiline report text.
+        :rtype: str
+        """
+        checks = [check for check in self.checks() if not check.is_compiled]
+        if not checks:
+            return "All observed filter expressions are compiled"
+
+        lines = ["Filter expressions evaluated by QGIS:"]
+        lines.extend(
+            f"{check.summary()}\n  calls: {check.calls}" for check in checks
+        )
+        return "\n".join(lines)
+
+    def __on_get_features(
+        self,
+        layer: QgsVectorLayer,
+        request: QgsFeatureRequest,
+        iterator: QgsFeatureIterator,
+    ) -> QgsFeatureIterator:
+        expression = request.filterExpression()
+        if expression is None or not expression.expression():
+            return iterator
+
+        key = (layer.id(), normalized_expression(expression.expression()))
+        check = self.__checks.get(key)
+        if check is None:
+            if len(self.__checks) >= self.MAX_CHECKS:
+                return iterator
+
+            check = ExpressionCheck(
+                layer_id=layer.id(),
+                layer_name=layer.name(),
+                provider=layer.providerType(),
+                expression=expression.expression(),
+                status=NOT_CHECKED,
+            )
+            self.__checks[key] = check
+            self.__unchecked.append((check, QgsExpression(expression)))
+            self._check_requested.emit()
+
+        check.calls += 1
+        plugin = caller_site(depth=2).plugin
+        if plugin:
+            check.plugins.add(plugin)
+        return iterator
+
+    @pyqtSlot()
+    def __check_pending(self) -> None:
+        unchecked, self.__unchecked = self.__unchecked, []
+        project = QgsProject.instance()
+        for check, expression in unchecked:
+            layer = project.mapLayer(check.layer_id)
+            if not isinstance(layer, QgsVectorLayer):
+                continue
+
+            result = self.__static_check(layer, expression)
+            check.status = result.status
+            check.blockers = result.blockers
+            check.hints = result.hints
+
+    def __static_check(
+        self, layer: QgsVectorLayer, expression: QgsExpression
+    ) -> ExpressionCheck:
+        text = expression.expression()
+        status = compile_status(layer, text)
+        check = ExpressionCheck(
+            layer_id=layer.id(),
+            layer_name=layer.name(),
+            provider=layer.providerType(),
+            expression=text,
+            status=status,
+        )
+        if status != COMPILED:
+            root = expression.rootNode()
+            check.blockers = (
+                self.__blockers(layer, root) if root is not None else []
+            )
+            check.hints = compilation_hints(layer, expression)
+        return check
+
+    def __blockers(
+        self, layer: QgsVectorLayer, node: QgsExpressionNode
+    ) -> List[str]:
+        operands: List[QgsExpressionNode] = []
+        if isinstance(node, QgsExpressionNodeBinaryOperator) and node.op() in (
+            BinaryOperator.boAnd,
+            BinaryOperator.boOr,
+        ):
+            operands = [node.opLeft(), node.opRight()]
+        elif (
+            isinstance(node, QgsExpressionNodeUnaryOperator)
+            and node.op() == UnaryOperator.uoNot
+        ):
+            operands = [node.operand()]
+
+        blockers = []
+        for operand in operands:
+            if compile_status(layer, operand.dump()) != COMPILED:
+                blockers.extend(self.__blockers(layer, operand))
+
+        # The node itself blocks if all of its operands compile
+        return blockers or [node.dump()]
+
+    def __time(self, layer: QgsVectorLayer, check: ExpressionCheck) -> None:
+        request = QgsFeatureRequest(QgsExpression(check.expression))
+        request.setFlags(FeatureRequestFlag.NoGeometry)
+        request.setNoAttributes()
+
+        feature = QgsFeature()
+        for enabled in (True, False):
+            times = []
+            with expression_compilation(enabled=enabled):
+                for _ in range(self.TIMING_REPEAT):
+                    features = 0
+                    started = time.perf_counter()
+                    iterator = get_features_hook.original(layer, request)
+                    while iterator.nextFeature(feature):
+                        features += 1
+                    times.append(time.perf_counter() - started)
+
+            check.features = features
+            if enabled:
+                check.compiled_time = statistics.median(times)
+            else:
+                check.uncompiled_time = statistics.median(times)
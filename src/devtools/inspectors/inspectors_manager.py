@@ -0,0 +1,173 @@
+# QGIS DevTools Plugin
+# Copyright (C) 2025  NextGIS
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or any
+# later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+from typing import TYPE_CHECKING, Optional
+
+from qgis.PyQt.QtCore import QObject, pyqtSlot
+from qgis.PyQt.QtWidgets import QAction
+from qgis.utils import iface
+
+from devtools.core.constants import MENU_NAME
+from devtools.inspectors.attribute_index_advisor import AttributeIndexAdvisor
+from devtools.inspectors.expression_checker import ExpressionChecker
+from devtools.inspectors.raster_advisor import RasterAdvisor
+from devtools.inspectors.spatial_index_advisor import SpatialIndexAdvisor
+from devtools.inspectors.ui.spatial_index_dialog import SpatialIndexDialog
+
+if TYPE_CHECKING:
+    from qgis.gui import QgisInterface
+
+    from devtools.devtools_interface import DevToolsInterface
+
+    assert isinstance(iface, QgisInterface)
+
+
+class InspectorsManager(QObject):
+    """Layer inspectors manager for QGIS DevTools.
+
+    Provides advisors checking project layers for common performance
+    problems.
+    """
+
+    __spatial_index_advisor: Optional[SpatialIndexAdvisor]
+    __attribute_index_advisor: Optional[AttributeIndexAdvisor]
+    __expression_checker: Optional[ExpressionChecker]
+    __raster_advisor: Optional[RasterAdvisor]
+    __spatial_index_dialog: Optional[SpatialIndexDialog]
+    __spatial_index_action: Optional[QAction]  # type: ignore reportInvalidTypeForm
+
+    def __init__(self, parent: "DevToolsInterface") -> None:
+        """Initialize InspectorsManager instance.
+
+        :param parent: Plugin interface instance.
+        :type parent: DevToolsInterface
+        """
+        super().__init__(parent)
+        self._plugin = parent
+        self.__spatial_index_advisor = None
+        self.__attribute_index_advisor = None
+        self.__expression_checker = None
+        self.__raster_advisor = None
+        self.__spatial_index_dialog = None
+        self.__spatial_index_action = None
+
+    @property
+    def spatial_index(self) -> SpatialIndexAdvisor:
+        """Return the spatial index advisor.
+
+        :returns: Spatial index advisor instance.
+        :rtype: SpatialIndexAdvisor
+        :raises AssertionError: If the manager is not loaded.
+        """
+        assert self.__spatial_index_advisor is not None, (
+            "Inspectors manager is not loaded"
+        )
+        return self.__spatial_index_advisor
+
+    @property
+    def attribute_index(self) -> AttributeIndexAdvisor:
+        """Return the attribute index advisor.
+
+        :returns: Attribute index advisor instance.
+        :rtype: AttributeIndexAdvisor
+        :raises AssertionError: If the manager is not loaded.
+        """
+        assert self.__attribute_index_advisor is not None, (
+            "Inspectors manager is not loaded"
+        )
+        return self.__attribute_index_advisor
+
+    @property
+    def expressions(self) -> ExpressionChecker:
+        """Return the expression compilation checker.
+
+        :returns: Expression checker instance.
+        :rtype: ExpressionChecker
+        :raises AssertionError: If the manager is not loaded.
+        """
+        assert self.__expression_checker is not None, (
+            "Inspectors manager is not loaded"
+        )
+        return self.__expression_checker
+
+    @property
+    def raster(self) -> RasterAdvisor:
+        """Return the raster overview and GDAL cache advisor.
+
+        :returns: Raster advisor instance.
+        :rtype: RasterAdvisor
+        :raises AssertionError: If the manager is not loaded.
+        """
+        assert self.__raster_advisor is not None, (
+            "Inspectors manager is not loaded"
+        )
+        return self.__raster_advisor
+
+    def load(self) -> None:
+        """Create inspectors and add their actions to the plugin menu."""
+        self.__spatial_index_advisor = SpatialIndexAdvisor(parent=self)
+        self.__attribute_index_advisor = AttributeIndexAdvisor(self)
+        self.__expression_checker = ExpressionChecker(self)
+        self.__raster_advisor = RasterAdvisor(self)
+
+        self.__spatial_index_action = QAction(
+            text=self.tr("Spatial Index Advisor…")
+        )
+        self.__spatial_index_action.triggered.connect(
+            self.__show_spatial_index_dialog
+        )
+        iface.addPluginToMenu(MENU_NAME, self.__spatial_index_action)
+
+    def unload(self) -> None:
+        """Remove inspector actions and dialogs."""
+        if self.__spatial_index_action is not None:
+            iface.removePluginMenu(MENU_NAME, self.__spatial_index_action)
+            self.__spatial_index_action.deleteLater()
+            self.__spatial_index_action = None
+
+        if self.__spatial_index_dialog is not None:
+            self.__spatial_index_dialog.close()
+            self.__spatial_index_dialog.deleteLater()
+            self.__spatial_index_dialog = None
+
+        if self.__raster_advisor is not None:
+            self.__raster_advisor.deleteLater()
+            self.__raster_advisor = None
+
+        if self.__expression_checker is not None:
+            self.__expression_checker.stop()
+            self.__expression_checker.deleteLater()
+            self.__expression_checker = None
+
+        if self.__attribute_index_advisor is not None:
+            self.__attribute_index_advisor.stop()
+            self.__attribute_index_advisor.deleteLater()
+            self.__attribute_index_advisor = None
+
+        if self.__spatial_index_advisor is not None:
+            self.__spatial_index_advisor.deleteLater()
+            self.__spatial_index_advisor = None
+
+    @pyqtSlot()
+    def __show_spatial_index_dialog(self) -> None:
+        if self.__spatial_index_dialog is None:
+            self.__spatial_index_dialog = SpatialIndexDialog(
+                self.spatial_index, iface.mainWindow()
+            )
+        self.__spatial_index_dialog.show()
+        self.__spatial_index_dialog.raise_()
+        self.__spatial_index_dialog.activateWindow()
@@ -0,0 +1,559 @@
+# QGIS DevTools Plugin
+# Copyright (C) 2025  NextGIS
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or any
+# later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+import statistics
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from osgeo import gdal
+from qgis.core import (
+    QgsApplication,
+    QgsProject,
+    QgsProviderRegistry,
+    QgsRasterDataProvider,
+    QgsRasterLayer,
+    QgsRectangle,
+    QgsTask,
+)
+from qgis.PyQt.QtCore import QObject, pyqtSignal, pyqtSlot
+from qgis.utils import iface
+
+from devtools.core.logging import logger
+from devtools.inspectors.exceptions import InspectorError
+
+MEGABYTE = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class RasterOverviewStatus:
+    """Overview state of a GDAL raster layer.
+
+    :param layer_id: Layer id.
+    :type layer_id: str
+    :param layer_name: Layer name.
+    :type layer_name: str
+    :param path: Dataset path.
+    :type path: str
+    :param width: Width in pixels.
+    :type width: int
+    :param height: Height in pixels.
+    :type height: int
+    :param band_overviews: Number of overviews of every band.
+    :type band_overviews: Tuple[int, ...]
+    :param block_size: Native block width and height of the first band.
+    :type block_size: Tuple[int, int]
+    """
+
+    layer_id: str
+    layer_name: str
+    path: str
+    width: int
+    height: int
+    band_overviews: Tuple[int, ...]
+    block_size: Tuple[int, int]
+
+    @property
+    def has_overviews(self) -> bool:
+        """Return True if every band has overviews.
+
+        :returns: Overview presence.
+        :rtype: bool
+        """
+        return bool(self.band_overviews) and min(self.band_overviews) > 0
+
+    @property
+    def needs_overviews(self) -> bool:
+        """Return True if the raster is large and lacks overviews.
+
+        :returns: Whether overviews should be built.
+        :rtype: bool
+        """
+        return (
+            max(self.width, self.height) > RasterAdvisor.OVERVIEW_THRESHOLD
+            and not self.has_overviews
+        )
+
+
+@dataclass(frozen=True)
+class RasterReadMeasurement:
+    """Median ``block()`` read times for a tile size and a GDAL cache size.
+
+    :param cache_size: GDAL block cache size in megabytes.
+    :type cache_size: int
+    :param tile_size: Requested tile width and height in pixels.
+    :type tile_size: int
+    :param cold_time: Read time of a tile after flushing the cache.
+    :type cold_time: float
+    :param warm_time: Read time of the same tile read again.
+    :type warm_time: float
+    :param overview_time: Time of reading the full extent into one tile.
+    :type overview_time: float
+    """
+
+    cache_size: int
+    tile_size: int
+    cold_time: float
+    warm_time: float
+    overview_time: float
+
+    @property
+    def throughput(self) -> float:
+        """Return warm read throughput.
+
+        :returns: Megapixels per second.
+        :rtype: float
+        """
+        if not self.warm_time:
+            return 0.0
+        return self.tile_size**2 / self.warm_time / 1e6
+
+
+@dataclass
+class RasterBenchmarkResult:
+    """Raster read benchmark with configuration suggestions.
+
+    :param status: Overview state of the layer.
+    :type status: RasterOverviewStatus
+    :param measurements: Measurements for every setting combination.
+    :type measurements: List[RasterReadMeasurement]
+    """
+
+    status: RasterOverviewStatus
+    measurements: List[RasterReadMeasurement] = field(default_factory=list)
+
+    def suggestions(self) -> Dict[str, str]:
+        """Suggest GDAL configuration values and read sizes.
+
+        The suggested cache is the smallest one whose warm reads are within
+        10% of the best measured cache.
+
+        :returns: Suggested values by option name.
+        :rtype: Dict[str, str]
+        """
+        if not self.measurements:
+            return {}
+
+        warm_by_cache: Dict[int, List[float]] = {}
+        for item in self.measurements:
+            warm_by_cache.setdefault(item.cache_size, []).append(
+                item.warm_time
+            )
+        cache_times = {
+            cache_size: sum(times)
+            for cache_size, times in warm_by_cache.items()
+        }
+        best_time = min(cache_times.values())
+        cache_size = min(
+            size
+            for size, total in cache_times.items()
+            if total <= best_time * 1.1
+        )
+        best_tile = max(self.measurements, key=lambda item: item.throughput)
+
+        suggestions = {
+            "GDAL_CACHEMAX": f"{cache_size}MB",
+            "tile size": f"{best_tile.tile_size} px",
+        }
+        if self.status.needs_overviews:
+            suggestions["overviews"] = (
+                "build overviews, full extent reads take "
+                f"{best_tile.overview_time * 1000:.0f} ms"
+            )
+        return suggestions
+
+    def table(self) -> str:
+        """Return the measurements as a text table.
+
+        :returns: Multiline table text.
+        :rtype: str
+        """
+        status = self.status
+        overviews = ", ".join(map(str, status.band_overviews)) or "none"
+        title = (
+            f"{status.layer_name}: {status.width}x{status.height} px, "
+            f"block {status.block_size[0]}x{status.block_size[1]}, "
+            f"overviews per band: {overviews}"
+        )
+        lines = [
+            title,
+            "  cache, MB   tile, px   cold, ms   warm, ms   full extent, ms",
+        ]
+        lines.extend(
+            f"  {item.cache_size:>9} {item.tile_size:>10} "
+            f"{item.cold_time * 1000:>10.1f} {item.warm_time * 1000:>10.1f} "
+            f"{item.overview_time * 1000:>17.1f}"
+            for item in self.measurements
+        )
+        lines.extend(
+            f"  suggested {name}: {value}"
+            for name, value in self.suggestions().items()
+        )
+        return "\n".join(lines)
+
+
+def _open_dataset(path: str) -> Optional["gdal.Dataset"]:
+    # gdal.Open raises instead of returning None when exceptions are
+    # enabled with gdal.UseExceptions() by QGIS or another plugin
+    try:
+        return gdal.Open(path, gdal.GA_ReadOnly)
+    except RuntimeError as error:
+        logger.debug(f"GDAL can't open {path}: {error}")
+        return None
+
+
+def overview_levels(width: int, height: int, minimum_size: int) -> List[int]:
+    """Return overview decimation factors down to a minimum size.
+
+    :param width: Raster width.
+    :type width: int
+    :param height: Raster height.
+    :type height: int
+    :param minimum_size: Size of the smallest overview.
+    :type minimum_size: int
+    :returns: Factors 2, 4, 8 and so on.
+    :rtype: List[int]
+    """
+    levels = []
+    factor = 2
+    while max(width, height) / factor >= minimum_size:
+        levels.append(factor)
+        factor *= 2
+    return levels
+
+
+class OverviewBuildTask(QgsTask):
+    """Background task building external overviews with GDAL."""
+
+    def __init__(
+        self, layer: QgsRasterLayer, path: str, resampling: str
+    ) -> None:
+        """Initialize OverviewBuildTask instance.
+
+        :param layer: Raster layer to build overviews for.
+        :type layer: QgsRasterLayer
+        :param path: GDAL dataset path.
+        :type path: str
+        :param resampling: GDAL resampling method.
+        :type resampling: str
+        """
+        super().__init__(
+            QgsApplication.translate(
+                "RasterAdvisor", "Building overviews of {layer_name}"
+            ).format(layer_name=layer.name()),
+            QgsTask.Flag.CanCancel,
+        )
+        self.layer_id = layer.id()
+        self.error: Optional[str] = None
+        self.__path = path
+        self.__resampling = resampling
+        layer.willBeDeleted.connect(self.cancel)
+
+    def run(self) -> bool:
+        """Build the overviews.
+
+        :returns: True on success.
+        :rtype: bool
+        """
+        # A read-only dataset gets external .ovr overviews
+        dataset = _open_dataset(self.__path)
+        if dataset is None:
+            self.error = gdal.GetLastErrorMsg() or f"Can't open {self.__path}"
+            return False
+
+        levels = overview_levels(
+            dataset.RasterXSize,
+            dataset.RasterYSize,
+            RasterAdvisor.OVERVIEW_MINIMUM_SIZE,
+        )
+        # With exceptions enabled a failure or cancellation raises instead
+        # of returning an error code
+        try:
+            result = dataset.BuildOverviews(
+                self.__resampling, levels, callback=self.__progress
+            )
+        except RuntimeError as error:
+            self.error = str(error)
+            return False
+        finally:
+            dataset = None
+        if result != 0:
+            self.error = gdal.GetLastErrorMsg()
+            return False
+        return True
+
+    def __progress(self, complete: float, *_: object) -> int:
+        self.setProgress(complete * 100)
+        return 0 if self.isCanceled() else 1
+
+
+class RasterAdvisor(QObject):
+    """Checks raster overviews and benchmarks GDAL read settings."""
+
+    build_finished = pyqtSignal(str)
+
+    OVERVIEW_THRESHOLD = 2048
+    OVERVIEW_MINIMUM_SIZE = 256
+    TILES_PER_MEASUREMENT = 4
+
+    __tasks: Dict[str, OverviewBuildTask]
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        """Initialize RasterAdvisor instance.
+
+        :param parent: Parent QObject.
+        :type parent: Optional[QObject]
+        """
+        super().__init__(parent)
+        self.__tasks = {}
+
+    def scan(
+        self, layers: Optional[Sequence[QgsRasterLayer]] = None
+    ) -> List[RasterOverviewStatus]:
+        """Check overviews of GDAL raster layers.
+
+        :param layers: Layers to scan. All project raster layers by default.
+        :type layers: Optional[Sequence[QgsRasterLayer]]
+        :returns: Overview states, layers needing overviews first.
+        :rtype: List[RasterOverviewStatus]
+        """
+        if layers is None:
+            layers = [
+                layer
+                for layer in QgsProject.instance().mapLayers().values()
+                if isinstance(layer, QgsRasterLayer)
+            ]
+
+        statuses = [
+            status
+            for status in map(self.__status, layers)
+            if status is not None
+        ]
+        return sorted(statuses, key=lambda status: not status.needs_overviews)
+
+    def benchmark(
+        self,
+        layer: QgsRasterLayer,
+        *,
+        tile_sizes: Sequence[int] = (256, 512, 1024),
+        cache_sizes: Sequence[int] = (16, 64, 256, 1024),
+        band: int = 1,
+    ) -> RasterBenchmarkResult:
+        """Time ``block()`` reads for tile and GDAL cache sizes.
+
+        The GDAL block cache is process-wide. It is flushed and resized
+        before every combination and its size is restored afterwards, so
+        other layers lose their cached blocks. Map canvas rendering is
+        stopped and the canvas is frozen while the benchmark runs, so
+        canvas reads neither use the cache nor distort the timings.
+
+        :param layer: GDAL raster layer.
+        :type layer: QgsRasterLayer
+        :param tile_sizes: Tile widths and heights in pixels.
+        :type tile_sizes: Sequence[int]
+        :param cache_sizes: GDAL cache sizes in megabytes.
+        :type cache_sizes: Sequence[int]
+        :param band: Band number to read.
+        :type band: int
+        :returns: Measurements with suggested settings.
+        :rtype: RasterBenchmarkResult
+        :raises InspectorError: If the layer is not a GDAL raster.
+        """
+        status = self.__status(layer)
+        if status is None:
+            detail = f'Layer "{layer.name()}" is not a GDAL raster'
+            raise InspectorError(detail=detail)
+
+        provider = layer.dataProvider()
+        result = RasterBenchmarkResult(status)
+        original_cache = gdal.GetCacheMax()
+        canvas = iface.mapCanvas() if iface is not None else None
+        was_frozen = canvas is not None and canvas.isFrozen()
+        if canvas is not None:
+            canvas.stopRendering()
+            canvas.freeze(True)
+        try:
+            for cache_size in cache_sizes:
+                for tile_size in tile_sizes:
+                    result.measurements.append(
+                        self.__measure(provider, band, cache_size, tile_size)
+                    )
+        finally:
+            gdal.SetCacheMax(original_cache)
+            if canvas is not None and not was_frozen:
+                canvas.freeze(False)
+                canvas.refresh()
+
+        logger.debug(result.table())
+        return result
+
+    def build_overviews(
+        self, layer: QgsRasterLayer, *, resampling: str = "AVERAGE"
+    ) -> OverviewBuildTask:
+        """Build external overviews in a background task.
+
+        The layer is reloaded when the task finishes.
+
+        :param layer: GDAL raster layer.
+        :type layer: QgsRasterLayer
+        :param resampling: GDAL resampling method.
+        :type resampling: str
+        :returns: Started task.
+        :rtype: OverviewBuildTask
+        :raises InspectorError: If the layer is not a GDAL raster or a build
+            for it is already running.
+        """
+        status = self.__status(layer)
+        if status is None:
+            detail = f'Layer "{layer.name()}" is not a GDAL raster'
+            raise InspectorError(detail=detail)
+        if layer.id() in self.__tasks:
+            detail = f'Overviews of "{layer.name()}" are already being built'
+            raise InspectorError(detail=detail)
+
+        task = OverviewBuildTask(layer, status.path, resampling)
+        task.taskCompleted.connect(self.__on_task_finished)
+        task.taskTerminated.connect(self.__on_task_finished)
+        self.__tasks[layer.id()] = task
+        QgsApplication.taskManager().addTask(task)
+        return task
+
+    def report(self) -> str:
+        """Return overview states of project raster layers.
+
+        :returns: Multiline report text.
+        :rtype: str
+        """
+        statuses = self.scan()
+        if not statuses:
+            return "No GDAL raster layers found"
+
+        lines = ["Raster overviews:"]
+        for status in statuses:
+            advice = ", build overviews" if status.needs_overviews else ""
+            overviews = ", ".join(map(str, status.band_overviews))
+            lines.append(
+                f"  {status.layer_name} ({status.width}x{status.height}): "
+                f"overviews per band {overviews}{advice}"
+            )
+        return "\n".join(lines)
+
+    @pyqtSlot()
+    def __on_task_finished(self) -> None:
+        finished = [
+            layer_id
+            for layer_id, task in self.__tasks.items()
+            if task.status()
+            in (QgsTask.TaskStatus.Complete, QgsTask.TaskStatus.Terminated)
+        ]
+        for layer_id in finished:
+            task = self.__tasks.pop(layer_id)
+            if task.error:
+                logger.warning(f"Overviews were not built: {task.error}")
+
+            layer = QgsProject.instance().mapLayer(layer_id)
+            if isinstance(layer, QgsRasterLayer):
+                layer.reload()
+                layer.triggerRepaint()
+            self.build_finished.emit(layer_id)
+
+    def __status(
+        self, layer: QgsRasterLayer
+    ) -> Optional[RasterOverviewStatus]:
+        if not layer.isValid() or layer.providerType() != "gdal":
+            return None
+
+        path = (
+            QgsProviderRegistry.instance()
+            .decodeUri("gdal", layer.source())
+            .get("path")
+        )
+        dataset = _open_dataset(path or layer.source())
+        if dataset is None:
+            return None
+
+        bands = [
+            dataset.GetRasterBand(number)
+            for number in range(1, dataset.RasterCount + 1)
+        ]
+        block_size = bands[0].GetBlockSize() if bands else (0, 0)
+        return RasterOverviewStatus(
+            layer_id=layer.id(),
+            layer_name=layer.name(),
+            path=path or layer.source(),
+            width=dataset.RasterXSize,
+            height=dataset.RasterYSize,
+            band_overviews=tuple(band.GetOverviewCount() for band in bands),
+            block_size=(block_size[0], block_size[1]),
+        )
+
+    def __measure(
+        self,
+        provider: QgsRasterDataProvider,
+        band: int,
+        cache_size: int,
+        tile_size: int,
+    ) -> RasterReadMeasurement:
+        # Setting the cache to zero flushes cached blocks
+        gdal.SetCacheMax(0)
+        gdal.SetCacheMax(cache_size * MEGABYTE)
+
+        tiles = list(self.__tiles(provider, tile_size))
+        cold_times = [
+            self.__read_time(provider, band, tile, tile_size) for tile in tiles
+        ]
+        warm_times = [
+            self.__read_time(provider, band, tile, tile_size) for tile in tiles
+        ]
+        overview_time = self.__read_time(
+            provider, band, provider.extent(), tile_size
+        )
+        return RasterReadMeasurement(
+            cache_size=cache_size,
+            tile_size=tile_size,
+            cold_time=statistics.median(cold_times),
+            warm_time=statistics.median(warm_times),
+            overview_time=overview_time,
+        )
+
+    def __tiles(
+        self, provider: QgsRasterDataProvider, tile_size: int
+    ) -> Iterator[QgsRectangle]:
+        # Native resolution tiles along the diagonal of the raster
+        extent = provider.extent()
+        pixel_width = extent.width() / provider.xSize()
+        pixel_height = extent.height() / provider.ySize()
+        tile_width = min(tile_size * pixel_width, extent.width())
+        tile_height = min(tile_size * pixel_height, extent.height())
+
+        count = self.TILES_PER_MEASUREMENT
+        for index in range(count):
+            share = (index + 0.5) / count
+            x = extent.xMinimum() + (extent.width() - tile_width) * share
+            y = extent.yMinimum() + (extent.height() - tile_height) * share
+            yield QgsRectangle(x, y, x + tile_width, y + tile_height)
+
+    def __read_time(
+        self,
+        provider: QgsRasterDataProvider,
+        band: int,
+        extent: QgsRectangle,
+        tile_size: int,
+    ) -> float:
+        started = time.perf_counter()
+        provider.block(band, extent, tile_size, tile_size)
+        return time.perf_counter() - started
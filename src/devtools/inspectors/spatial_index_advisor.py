@@ -0,0 +1,422 @@
+# QGIS DevTools Plugin
+# Copyright (C) 2025  NextGIS
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or any
+# later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+import math
+import random
+import statistics
+import time
+from dataclasses import dataclass, replace
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from qgis.core import (
+    QgsApplication,
+    QgsDataProvider,
+    QgsFeature,
+    QgsFeatureRequest,
+    QgsProject,
+    QgsProviderRegistry,
+    QgsRectangle,
+    QgsTask,
+    QgsVectorDataProvider,
+    QgsVectorLayer,
+)
+from qgis.PyQt.QtCore import QObject, pyqtSignal, pyqtSlot
+
+from devtools.core.compat import SpatialIndexPresence, VectorProviderCapability
+from devtools.core.logging import logger
+
+PRESENT = "present"
+MISSING = "missing"
+UNKNOWN = "unknown"
+
+
+@dataclass(frozen=True)
+class SpatialIndexStatus:
+    """Spatial index state and bounding box request cost of a layer.
+
+    :param layer_id: Layer id.
+    :type layer_id: str
+    :param layer_name: Layer name.
+    :type layer_name: str
+    :param provider: Data provider key.
+    :type provider: str
+    :param presence: ``"present"``, ``"missing"`` or ``"unknown"``.
+    :type presence: str
+    :param can_create: The provider can create a spatial index.
+    :type can_create: bool
+    :param features: Number of features, -1 if unknown.
+    :type features: int
+    :param request_time: Median time of a bounding box request in seconds,
+        NaN if not measured.
+    :type request_time: float
+    :param indexed_request_time: Median request time after building the
+        index.
+    :type indexed_request_time: Optional[float]
+    """
+
+    layer_id: str
+    layer_name: str
+    provider: str
+    presence: str
+    can_create: bool
+    features: int
+    request_time: float
+    indexed_request_time: Optional[float] = None
+
+    @property
+    def needs_index(self) -> bool:
+        """Return True if an index is missing and can be built.
+
+        :returns: Whether an index should be built.
+        :rtype: bool
+        """
+        return self.presence != PRESENT and self.can_create
+
+    @property
+    def speedup(self) -> Optional[float]:
+        """Return the request speedup after building the index.
+
+        :returns: Speedup or None if the layer was not re-measured.
+        :rtype: Optional[float]
+        """
+        if not self.indexed_request_time or math.isnan(self.request_time):
+            return None
+        return self.request_time / self.indexed_request_time
+
+
+class SpatialIndexBuildTask(QgsTask):
+    """Background task creating spatial indexes of vector layers.
+
+    Providers of project layers are not thread safe, so indexes are
+    created by providers opened from the layer sources in the task thread.
+    Memory layers keep features in their provider only and are indexed in
+    the main thread when the task finishes.
+    """
+
+    def __init__(self, layers: Sequence[QgsVectorLayer]) -> None:
+        """Initialize SpatialIndexBuildTask instance.
+
+        :param layers: Layers to index.
+        :type layers: Sequence[QgsVectorLayer]
+        """
+        super().__init__(
+            QgsApplication.translate(
+                "SpatialIndexAdvisor", "Building spatial indexes"
+            ),
+            QgsTask.Flag.CanCancel,
+        )
+        # Sources are resolved in the main thread
+        self.__sources: Dict[str, Tuple[str, str]] = {
+            layer.id(): (layer.providerType(), layer.source())
+            for layer in layers
+            if layer.providerType() != "memory"
+        }
+        self.__memory_layer_ids = [
+            layer.id() for layer in layers if layer.providerType() == "memory"
+        ]
+        self.built_layer_ids: List[str] = []
+        self.failed_layer_ids: List[str] = []
+
+        for layer in layers:
+            layer.willBeDeleted.connect(self.cancel)
+
+    def run(self) -> bool:
+        """Create the indexes of file and database layers.
+
+        :returns: False if the task was canceled.
+        :rtype: bool
+        """
+        total = len(self.__sources)
+        for number, (layer_id, (provider_key, source)) in enumerate(
+            self.__sources.items()
+        ):
+            if self.isCanceled():
+                return False
+
+            provider = QgsProviderRegistry.instance().createProvider(
+                provider_key, source, QgsDataProvider.ProviderOptions()
+            )
+            if (
+                isinstance(provider, QgsVectorDataProvider)
+                and provider.isValid()
+                and provider.createSpatialIndex()
+            ):
+                self.built_layer_ids.append(layer_id)
+            else:
+                self.failed_layer_ids.append(layer_id)
+            # Close the dataset before the layer is reloaded
+            del provider
+            self.setProgress((number + 1) / total * 100)
+
+        return True
+
+    def finished(self, result: bool) -> None:
+        """Create the indexes of memory layers in the main thread.
+
+        :param result: Result of :meth:`run`.
+        :type result: bool
+        """
+        if not result:
+            return
+
+        project = QgsProject.instance()
+        for layer_id in self.__memory_layer_ids:
+            layer = project.mapLayer(layer_id)
+            if not isinstance(layer, QgsVectorLayer):
+                continue
+            if layer.dataProvider().createSpatialIndex():
+                self.built_layer_ids.append(layer_id)
+            else:
+                self.failed_layer_ids.append(layer_id)
+
+
+class SpatialIndexAdvisor(QObject):
+    """Reports missing spatial indexes of project layers and builds them.
+
+    The cost of a missing index is estimated by timing bounding box
+    requests covering a small share of the layer extent.
+    """
+
+    scanned = pyqtSignal()
+    build_progress_changed = pyqtSignal(float)
+    build_finished = pyqtSignal()
+
+    REQUEST_EXTENT_SHARE = 0.05
+
+    __statuses: Dict[str, SpatialIndexStatus]
+    __task: Optional[SpatialIndexBuildTask]
+
+    def __init__(
+        self, *, samples: int = 20, parent: Optional[QObject] = None
+    ) -> None:
+        """Initialize SpatialIndexAdvisor instance.
+
+        :param samples: Number of bounding box requests per layer.
+        :type samples: int
+        :param parent: Parent object.
+        :type parent: Optional[QObject]
+        """
+        super().__init__(parent)
+        self.__samples = max(samples, 1)
+        self.__statuses = {}
+        self.__task = None
+
+    @property
+    def is_building(self) -> bool:
+        """Return True if the build task is running.
+
+        :returns: Build state.
+        :rtype: bool
+        """
+        return self.__task is not None
+
+    def statuses(self) -> List[SpatialIndexStatus]:
+        """Return the statuses of the last scan.
+
+        :returns: Statuses, slowest requests first.
+        :rtype: List[SpatialIndexStatus]
+        """
+        return sorted(
+            self.__statuses.values(),
+            key=lambda status: (
+                -1.0
+                if math.isnan(status.request_time)
+                else status.request_time
+            ),
+            reverse=True,
+        )
+
+    def scan(
+        self, layers: Optional[Sequence[QgsVectorLayer]] = None
+    ) -> List[SpatialIndexStatus]:
+        """Check spatial indexes and time bounding box requests.
+
+        :param layers: Layers to scan. All project vector layers by default.
+        :type layers: Optional[Sequence[QgsVectorLayer]]
+        :returns: Statuses, slowest requests first.
+        :rtype: List[SpatialIndexStatus]
+        """
+        if layers is None:
+            layers = self.__project_layers()
+
+        self.__statuses = {
+            layer.id(): self.__status(layer)
+            for layer in layers
+            if layer.isValid() and layer.isSpatial()
+        }
+        self.scanned.emit()
+        return self.statuses()
+
+    def build(
+        self, layer_ids: Optional[Sequence[str]] = None
+    ) -> Optional[SpatialIndexBuildTask]:
+        """Build missing spatial indexes in a background task.
+
+        Layers are measured again when the task finishes.
+
+        :param layer_ids: Layers to index. All scanned layers needing an
+            index by default.
+        :type layer_ids: Optional[Sequence[str]]
+        :returns: Started task or None if nothing needs to be built or a
+            build is already running.
+        :rtype: Optional[SpatialIndexBuildTask]
+        """
+        if self.__task is not None:
+            logger.warning("Spatial index build is already running")
+            return None
+
+        if layer_ids is None:
+            layer_ids = [
+                status.layer_id
+                for status in self.__statuses.values()
+                if status.needs_index
+            ]
+
+        project = QgsProject.instance()
+        layers = [
+            layer
+            for layer in map(project.mapLayer, layer_ids)
+            if isinstance(layer, QgsVectorLayer) and layer.isValid()
+        ]
+        if not layers:
+            return None
+
+        self.__task = SpatialIndexBuildTask(layers)
+        self.__task.progressChanged.connect(self.build_progress_changed)
+        self.__task.taskCompleted.connect(self.__on_task_finished)
+        self.__task.taskTerminated.connect(self.__on_task_finished)
+        QgsApplication.taskManager().addTask(self.__task)
+        return self.__task
+
+    def report(self) -> str:
+        """Return the last scan as text.
+
+        :returns: Multiline report.
+        :rtype: str
+        """
+        statuses = self.statuses()
+        if not statuses:
+            return "No spatial layers scanned"
+
+        lines = ["Spatial index status (median bounding box request time)"]
+        for status in statuses:
+            line = (
+                f"  {status.layer_name} [{status.provider}]: "
+                f"{status.presence}, "
+                f"{self.__format_time(status.request_time)}"
+            )
+            speedup = status.speedup
+            if speedup is not None:
+                line += (
+                    f" -> {self.__format_time(status.indexed_request_time)}"
+                    f" ({speedup:.1f}x)"
+                )
+            elif status.needs_index:
+                line += ", index can be built"
+            lines.append(line)
+        return "\n".join(lines)
+
+    @pyqtSlot()
+    def __on_task_finished(self) -> None:
+        task = self.__task
+        self.__task = None
+        if task is None:
+            return
+
+        project = QgsProject.instance()
+        for layer_id in task.built_layer_ids:
+            layer = project.mapLayer(layer_id)
+            previous = self.__statuses.get(layer_id)
+            if not isinstance(layer, QgsVectorLayer) or previous is None:
+                continue
+
+            # Indexes were created through another connection
+            if layer.providerType() != "memory":
+                layer.reload()
+
+            current = self.__status(layer)
+            self.__statuses[layer_id] = replace(
+                current,
+                request_time=previous.request_time,
+                indexed_request_time=current.request_time,
+            )
+
+        for layer_id in task.failed_layer_ids:
+            logger.warning(f"Spatial index was not created for {layer_id}")
+
+        self.build_finished.emit()
+
+    def __project_layers(self) -> List[QgsVectorLayer]:
+        return [
+            layer
+            for layer in QgsProject.instance().mapLayers().values()
+            if isinstance(layer, QgsVectorLayer)
+        ]
+
+    def __status(self, layer: QgsVectorLayer) -> SpatialIndexStatus:
+        provider = layer.dataProvider()
+        presences = {
+            SpatialIndexPresence.Present: PRESENT,
+            SpatialIndexPresence.NotPresent: MISSING,
+        }
+        return SpatialIndexStatus(
+            layer_id=layer.id(),
+            layer_name=layer.name(),
+            provider=layer.providerType(),
+            presence=presences.get(layer.hasSpatialIndex(), UNKNOWN),
+            can_create=bool(
+                provider.capabilities()
+                & VectorProviderCapability.CreateSpatialIndex
+            ),
+            features=layer.featureCount(),
+            request_time=self.__request_time(layer),
+        )
+
+    def __request_time(self, layer: QgsVectorLayer) -> float:
+        extent = layer.extent()
+        if extent.isNull() or extent.isEmpty():
+            return math.nan
+
+        # The same rectangles are used before and after building an index
+        generator = random.Random(layer.id())
+        width = extent.width() * self.REQUEST_EXTENT_SHARE
+        height = extent.height() * self.REQUEST_EXTENT_SHARE
+
+        times = []
+        feature = QgsFeature()
+        for _ in range(self.__samples):
+            x = generator.uniform(extent.xMinimum(), extent.xMaximum() - width)
+            y = generator.uniform(
+                extent.yMinimum(), extent.yMaximum() - height
+            )
+            request = QgsFeatureRequest(
+                QgsRectangle(x, y, x + width, y + height)
+            )
+            request.setNoAttributes()
+
+            started = time.perf_counter()
+            iterator = layer.getFeatures(request)
+            while iterator.nextFeature(feature):
+                pass
+            times.append(time.perf_counter() - started)
+
+        return statistics.median(times)
+
+    def __format_time(self, seconds: Optional[float]) -> str:
+        if seconds is None or math.isnan(seconds):
+            return "not measured"
+        return f"{seconds * 1000:.1f} ms"
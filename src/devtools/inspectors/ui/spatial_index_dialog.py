@@ -0,0 +1,215 @@
+# QGIS DevTools Plugin
+# Copyright (C) 2025  NextGIS
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or any
+# later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+import math
+from pathlib import Path
+from typing import List, Optional
+
+from qgis.PyQt import uic
+from qgis.PyQt.QtCore import QSortFilterProxyModel, Qt, pyqtSlot
+from qgis.PyQt.QtGui import QGuiApplication, QStandardItem, QStandardItemModel
+from qgis.PyQt.QtWidgets import (
+    QDialog,
+    QHeaderView,
+    QTableView,
+    QVBoxLayout,
+    QWidget,
+)
+
+from devtools.core.exceptions import DevToolsUiLoadError
+from devtools.inspectors.spatial_index_advisor import (
+    SpatialIndexAdvisor,
+    SpatialIndexStatus,
+)
+
+SORT_ROLE = Qt.ItemDataRole.UserRole + 1
+LAYER_ID_ROLE = Qt.ItemDataRole.UserRole + 2
+
+
+class SpatialIndexDialog(QDialog):
+    """Dialog showing spatial index status of project layers."""
+
+    def __init__(
+        self, advisor: SpatialIndexAdvisor, parent: Optional[QWidget] = None
+    ) -> None:
+        """Initialize the spatial index dialog.
+
+        :param advisor: Advisor scanning layers and building indexes.
+        :type advisor: SpatialIndexAdvisor
+        :param parent: Optional parent widget.
+        :type parent: Optional[QWidget]
+        """
+        super().__init__(parent)
+        self.setWindowTitle(self.tr("Spatial Index Advisor"))
+        self.__advisor = advisor
+        self.__advisor.scanned.connect(self.refresh)
+        self.__advisor.build_finished.connect(self.__on_build_finished)
+        self.__advisor.build_progress_changed.connect(
+            self.__on_build_progress_changed
+        )
+
+        self.__load_ui()
+        self.refresh()
+
+    @pyqtSlot()
+    def refresh(self) -> None:
+        """Reload statuses from the advisor."""
+        statuses = self.__advisor.statuses()
+        self.__model.removeRows(0, self.__model.rowCount())
+        for status in statuses:
+            self.__model.appendRow(self.__row(status))
+
+        missing = sum(1 for status in statuses if status.needs_index)
+        self.__widget.build_button.setEnabled(
+            missing > 0 and not self.__advisor.is_building
+        )
+        if not statuses:
+            self.__widget.summary_label.setText(
+                self.tr("Scan layers to check their spatial indexes")
+            )
+        else:
+            self.__widget.summary_label.setText(
+                self.tr(
+                    "{missing} of {total} layer(s) can get a spatial index"
+                ).format(missing=missing, total=len(statuses))
+            )
+
+    def __load_ui(self) -> None:
+        widget: Optional[QWidget] = None
+        try:
+            widget = uic.loadUi(
+                str(Path(__file__).parent / "spatial_index_dialog_base.ui")
+            )
+        except Exception as error:
+            raise DevToolsUiLoadError from error
+
+        if widget is None:
+            raise DevToolsUiLoadError
+
+        self.__widget = widget
+        self.__widget.setParent(self)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.__widget)
+
+        self.__model = QStandardItemModel(0, 7, self)
+        self.__model.setHorizontalHeaderLabels(
+            [
+                self.tr("Layer"),
+                self.tr("Provider"),
+                self.tr("Index"),
+                self.tr("Features"),
+                self.tr("Request, ms"),
+                self.tr("Indexed, ms"),
+                self.tr("Speed-up"),
+            ]
+        )
+
+        self.__proxy_model = QSortFilterProxyModel(self)
+        self.__proxy_model.setSourceModel(self.__model)
+        self.__proxy_model.setSortRole(SORT_ROLE)
+
+        table_view: QTableView = self.__widget.table_view
+        table_view.setModel(self.__proxy_model)
+        table_view.sortByColumn(4, Qt.SortOrder.DescendingOrder)
+        table_view.horizontalHeader().setSectionResizeMode(
+            QHeaderView.ResizeMode.ResizeToContents
+        )
+
+        self.__widget.scan_button.clicked.connect(self.__scan)
+        self.__widget.build_button.clicked.connect(self.__build)
+
+    @pyqtSlot()
+    def __scan(self) -> None:
+        self.__widget.scan_button.setEnabled(False)
+        QGuiApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+        try:
+            self.__advisor.scan()
+        finally:
+            QGuiApplication.restoreOverrideCursor()
+            self.__widget.scan_button.setEnabled(True)
+
+    @pyqtSlot()
+    def __build(self) -> None:
+        selected_ids = {
+            index.data(LAYER_ID_ROLE)
+            for index in self.__widget.table_view.selectionModel().selectedRows()
+        }
+        layer_ids = [
+            status.layer_id
+            for status in self.__advisor.statuses()
+            if status.needs_index
+            and (not selected_ids or status.layer_id in selected_ids)
+        ]
+
+        if self.__advisor.build(layer_ids) is None:
+            return
+
+        self.__widget.progress_bar.setValue(0)
+        self.__widget.build_button.setEnabled(False)
+        self.__widget.scan_button.setEnabled(False)
+
+    @pyqtSlot(float)
+    def __on_build_progress_changed(self, progress: float) -> None:
+        self.__widget.progress_bar.setValue(int(progress))
+
+    @pyqtSlot()
+    def __on_build_finished(self) -> None:
+        self.__widget.progress_bar.setValue(100)
+        self.__widget.scan_button.setEnabled(True)
+        self.refresh()
+
+    def __row(self, status: SpatialIndexStatus) -> List[QStandardItem]:
+        name_item = QStandardItem(status.layer_name)
+        name_item.setData(status.layer_name.lower(), SORT_ROLE)
+        name_item.setData(status.layer_id, LAYER_ID_ROLE)
+        name_item.setToolTip(status.layer_id)
+
+        provider_item = QStandardItem(status.provider)
+        provider_item.setData(status.provider, SORT_ROLE)
+
+        presence_item = QStandardItem(status.presence)
+        presence_item.setData(status.presence, SORT_ROLE)
+        if status.needs_index:
+            presence_item.setToolTip(self.tr("Index can be built"))
+
+        speedup = status.speedup
+        return [
+            name_item,
+            provider_item,
+            presence_item,
+            self.__number_item(status.features, str(status.features)),
+            self.__time_item(status.request_time),
+            self.__time_item(status.indexed_request_time),
+            self.__number_item(
+                speedup or 0.0, f"{speedup:.1f}x" if speedup else ""
+            ),
+        ]
+
+    def __number_item(self, value: float, text: str) -> QStandardItem:
+        item = QStandardItem(text)
+        item.setData(value, SORT_ROLE)
+        item.setTextAlignment(
+            Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+        )
+        return item
+
+    def __time_item(self, seconds: Optional[float]) -> QStandardItem:
+        if seconds is None or math.isnan(seconds):
+            return self.__number_item(-1.0, "")
+        return self.__number_item(seconds, f"{seconds * 1000:.1f}")
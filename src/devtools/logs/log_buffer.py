@@ -0,0 +1,487 @@
+# QGIS DevTools Plugin
+# Copyright (C) 2025  NextGIS
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or any
+# later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+import gzip
+import json
+import re
+import time
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import (
+    Collection,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Pattern,
+    Union,
+)
+
+from qgis.core import Qgis
+
+from devtools.logs.exceptions import LogBufferError
+
+TimeBound = Union[float, datetime, timedelta]
+"""Epoch seconds, a datetime, or a time span back from now."""
+
+FILE_FORMAT_VERSION = 1
+
+
+@dataclass(frozen=True)
+class LogEntry:
+    """Message received by the QGIS message log.
+
+    :param time: Receive time in seconds since the epoch.
+    :type time: float
+    :param tag: Message tag, usually a plugin name.
+    :type tag: str
+    :param level: QGIS message level value.
+    :type level: int
+    :param message: Message text.
+    :type message: str
+    """
+
+    time: float
+    tag: str
+    level: int
+    message: str
+
+    def __str__(self) -> str:
+        """Return the entry as a log line.
+
+        :returns: Time, level, tag and message.
+        :rtype: str
+        """
+        timestamp = datetime.fromtimestamp(self.time).isoformat(
+            sep=" ", timespec="milliseconds"
+        )
+        try:
+            level = Qgis.MessageLevel(self.level).name
+        except ValueError:
+            level = str(self.level)
+        return f"{timestamp} {level:<8} {self.tag}: {self.message}"
+
+
+class LogRingBuffer:
+    """Fixed-size ring buffer of log messages.
+
+    Times, levels and interned tag ids are stored in typed arrays; only
+    message texts are Python objects. Entries are addressed by a growing
+    sequence number and indexed by tag and level. Entries are expected to
+    be appended in time order, so time bounds are found by binary search.
+
+    The buffer is not thread safe and should be used from one thread.
+    Only :meth:`find` may run in a worker thread while entries are
+    appended.
+    """
+
+    DEFAULT_CAPACITY = 1_000_000
+
+    __capacity: int
+    __times: "array[float]"
+    __levels: "array[int]"
+    __tag_ids: "array[int]"
+    __messages: List[Optional[str]]
+    __tags: List[str]
+    __tag_lookup: Dict[str, int]
+    __tag_index: Dict[int, "array[int]"]
+    __level_index: Dict[int, "array[int]"]
+    __next_sequence: int
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        """Initialize LogRingBuffer instance.
+
+        :param capacity: Maximum number of stored entries.
+        :type capacity: int
+        :raises LogBufferError: If the capacity is not positive.
+        """
+        if capacity <= 0:
+            detail = f"Log buffer capacity must be positive, got {capacity}"
+            raise LogBufferError(detail=detail)
+
+        self.__capacity = capacity
+        self.__times = array("d", [0.0]) * capacity
+        self.__levels = array("b", [0]) * capacity
+        self.__tag_ids = array("I", [0]) * capacity
+        self.__messages = [None] * capacity
+        self.__tags = []
+        self.__tag_lookup = {}
+        self.clear()
+
+    def __len__(self) -> int:
+        """Return the number of stored entries.
+
+        :returns: Number of entries.
+        :rtype: int
+        """
+        return self.__next_sequence - self.first_sequence
+
+    @property
+    def capacity(self) -> int:
+        """Return the maximum number of stored entries.
+
+        :returns: Buffer capacity.
+        :rtype: int
+        """
+        return self.__capacity
+
+    @property
+    def first_sequence(self) -> int:
+        """Return the sequence number of the oldest stored entry.
+
+        :returns: Oldest entry sequence number.
+        :rtype: int
+        """
+        return max(self.__next_sequence - self.__capacity, 0)
+
+    @property
+    def next_sequence(self) -> int:
+        """Return the sequence number the next entry will get.
+
+        :returns: Sequence number after the newest entry.
+        :rtype: int
+        """
+        return self.__next_sequence
+
+    @property
+    def total(self) -> int:
+        """Return the number of entries appended since the last clear.
+
+        :returns: Appended entries count, including overwritten ones.
+        :rtype: int
+        """
+        return self.__next_sequence
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self.__messages = [None] * self.__capacity
+        self.__tag_index = {}
+        self.__level_index = {}
+        self.__next_sequence = 0
+
+    def append(
+        self, tag: str, level: int, message: str, time_: Optional[float] = None
+    ) -> None:
+        """Append an entry, overwriting the oldest one if the buffer is full.
+
+        :param tag: Message tag.
+        :type tag: str
+        :param level: QGIS message level value.
+        :type level: int
+        :param message: Message text.
+        :type message: str
+        :param time_: Time in seconds since the epoch, now by default.
+        :type time_: Optional[float]
+        """
+        tag_id = self.__tag_lookup.get(tag)
+        if tag_id is None:
+            tag_id = len(self.__tags)
+            self.__tags.append(tag)
+            self.__tag_lookup[tag] = tag_id
+
+        sequence = self.__next_sequence
+        position = sequence % self.__capacity
+        self.__times[position] = time.time() if time_ is None else time_
+        self.__levels[position] = int(level)
+        self.__tag_ids[position] = tag_id
+        self.__messages[position] = message
+        self.__next_sequence = sequence + 1
+
+        self.__index(self.__tag_index, tag_id).append(sequence)
+        self.__index(self.__level_index, int(level)).append(sequence)
+        if self.__next_sequence % self.__capacity == 0:
+            self.__compact()
+
+    def tags(self) -> Dict[str, int]:
+        """Return tags of stored entries with their entry counts.
+
+        :returns: Entries count by tag.
+        :rtype: Dict[str, int]
+        """
+        first = self.first_sequence
+        counts = {
+            self.__tags[tag_id]: len(index) - bisect_left(index, first)
+            for tag_id, index in self.__tag_index.items()
+        }
+        return {tag: count for tag, count in counts.items() if count > 0}
+
+    def query(  # noqa: PLR0913
+        self,
+        *,
+        tag: Optional[str] = None,
+        level: Optional[int] = None,
+        min_level: Optional[int] = None,
+        since: Optional[TimeBound] = None,
+        until: Optional[TimeBound] = None,
+        contains: Optional[str] = None,
+        pattern: Union[str, Pattern[str], None] = None,
+        limit: Optional[int] = None,
+        newest_first: bool = False,
+    ) -> List[LogEntry]:
+        """Return entries matching all given conditions.
+
+        Tag, level and time bounds are resolved through indexes, text
+        conditions are checked only for the remaining entries.
+
+        :param tag: Exact message tag.
+        :type tag: Optional[str]
+        :param level: Exact QGIS message level.
+        :type level: Optional[int]
+        :param min_level: Minimal QGIS message level.
+        :type min_level: Optional[int]
+        :param since: Inclusive lower time bound.
+        :type since: Optional[TimeBound]
+        :param until: Exclusive upper time bound.
+        :type until: Optional[TimeBound]
+        :param contains: Case insensitive substring of the message.
+        :type contains: Optional[str]
+        :param pattern: Regular expression searched in the message.
+        :type pattern: Union[str, Pattern[str], None]
+        :param limit: Maximum number of entries.
+        :type limit: Optional[int]
+        :param newest_first: Return the newest entries first.
+        :type newest_first: bool
+        :returns: Matching entries.
+        :rtype: List[LogEntry]
+        """
+        start = self.__sequence_at(since, self.first_sequence)
+        end = self.__sequence_at(until, self.__next_sequence)
+        if tag is not None and tag not in self.__tag_lookup:
+            return []
+
+        sequences = self.__candidates(tag, level, start, end)
+        if newest_first:
+            sequences = reversed(sequences)
+
+        tag_id = self.__tag_lookup.get(tag) if tag is not None else None
+        level_value = int(level) if level is not None else None
+        min_level_value = int(min_level) if min_level is not None else None
+        needle = contains.lower() if contains is not None else None
+        regex = re.compile(pattern) if isinstance(pattern, str) else pattern
+
+        result: List[LogEntry] = []
+        capacity = self.__capacity
+        for sequence in sequences:
+            position = sequence % capacity
+            entry_level = self.__levels[position]
+            if (
+                (tag_id is not None and self.__tag_ids[position] != tag_id)
+                or (level_value is not None and entry_level != level_value)
+                or (
+                    min_level_value is not None
+                    and entry_level < min_level_value
+                )
+            ):
+                continue
+
+            message = self.__messages[position] or ""
+            if (needle is not None and needle not in message.lower()) or (
+                regex is not None and regex.search(message) is None
+            ):
+                continue
+
+            result.append(self.__entry(position))
+            if limit is not None and len(result) >= limit:
+                break
+        return result
+
+    def entry(self, sequence: int) -> Optional[LogEntry]:
+        """Return an entry by its sequence number.
+
+        :param sequence: Entry sequence number.
+        :type sequence: int
+        :returns: Entry or None if it was overwritten or does not exist.
+        :rtype: Optional[LogEntry]
+        """
+        if not self.first_sequence <= sequence < self.__next_sequence:
+            return None
+        return self.__entry(sequence % self.__capacity)
+
+    def find(
+        self,
+        start: int,
+        end: int,
+        *,
+        levels: Optional[Collection[int]] = None,
+        pattern: Optional[Pattern[str]] = None,
+    ) -> "array[int]":
+        """Return sequence numbers of matching entries in a range.
+
+        Used for incremental filtering, possibly from another thread.
+        Entries overwritten during the call may be reported; callers
+        should skip sequences older than :attr:`first_sequence`.
+
+        :param start: First sequence number to check.
+        :type start: int
+        :param end: Sequence number after the last one to check.
+        :type end: int
+        :param levels: Accepted QGIS message level values.
+        :type levels: Optional[Collection[int]]
+        :param pattern: Regular expression searched in tags and messages.
+        :type pattern: Optional[Pattern[str]]
+        :returns: Matching sequence numbers in ascending order.
+        :rtype: array[int]
+        """
+        start = max(start, self.first_sequence)
+        end = min(end, self.__next_sequence)
+        capacity = self.__capacity
+        accepted_levels = frozenset(levels) if levels is not None else None
+        search = pattern.search if pattern is not None else None
+
+        result = array("q")
+        for sequence in range(start, end):
+            position = sequence % capacity
+            if (
+                accepted_levels is not None
+                and self.__levels[position] not in accepted_levels
+            ):
+                continue
+            if search is not None and (
+                search(self.__messages[position] or "") is None
+                and search(self.__tags[self.__tag_ids[position]]) is None
+            ):
+                continue
+            result.append(sequence)
+        return result
+
+    def entries(self) -> Iterator[LogEntry]:
+        """Iterate over stored entries from the oldest.
+
+        :returns: Entries iterator.
+        :rtype: Iterator[LogEntry]
+        """
+        for sequence in range(self.first_sequence, self.__next_sequence):
+            yield self.__entry(sequence % self.__capacity)
+
+    def save(
+        self, path: Union[str, Path], *, limit: Optional[int] = None
+    ) -> int:
+        """Write stored entries to a gzip compressed JSON lines file.
+
+        :param path: File path.
+        :type path: Union[str, Path]
+        :param limit: Maximum number of the newest entries to write. All
+            stored entries by default.
+        :type limit: Optional[int]
+        :returns: Number of written entries.
+        :rtype: int
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        first = self.first_sequence
+        if limit is not None:
+            first = max(first, self.__next_sequence - max(limit, 0))
+
+        count = 0
+        with gzip.open(path, "wt", encoding="utf-8") as file:
+            file.write(json.dumps({"version": FILE_FORMAT_VERSION}) + "\n")
+            for sequence in range(first, self.__next_sequence):
+                entry = self.__entry(sequence % self.__capacity)
+                row = [entry.time, entry.tag, entry.level, entry.message]
+                file.write(json.dumps(row, ensure_ascii=False) + "\n")
+                count += 1
+        return count
+
+    def load(self, path: Union[str, Path]) -> int:
+        """Append entries from a file written by :meth:`save`.
+
+        :param path: File path.
+        :type path: Union[str, Path]
+        :returns: Number of read entries.
+        :rtype: int
+        :raises LogBufferError: If the file has an unsupported format.
+        """
+        count = 0
+        with gzip.open(Path(path), "rt", encoding="utf-8") as file:
+            header = json.loads(file.readline() or "{}")
+            if header.get("version") != FILE_FORMAT_VERSION:
+                detail = f"Unsupported log file format: {header!r}"
+                raise LogBufferError(detail=detail)
+
+            for line in file:
+                time_, tag, level, message = json.loads(line)
+                self.append(tag, level, message, time_)
+                count += 1
+        return count
+
+    def __index(
+        self, indexes: Dict[int, "array[int]"], key: int
+    ) -> "array[int]":
+        index = indexes.get(key)
+        if index is None:
+            index = array("q")
+            indexes[key] = index
+        return index
+
+    def __compact(self) -> None:
+        # Drop sequences of overwritten entries once per buffer turn
+        first = self.first_sequence
+        for indexes in (self.__tag_index, self.__level_index):
+            for key, index in list(indexes.items()):
+                del index[: bisect_left(index, first)]
+                if not index:
+                    del indexes[key]
+
+    def __candidates(
+        self, tag: Optional[str], level: Optional[int], start: int, end: int
+    ) -> Union[range, "array[int]"]:
+        if start >= end:
+            return range(0)
+
+        indexes = []
+        if tag is not None:
+            indexes.append(self.__tag_index.get(self.__tag_lookup[tag]))
+        if level is not None:
+            indexes.append(self.__level_index.get(int(level)))
+        if not indexes:
+            return range(start, end)
+        if any(index is None for index in indexes):
+            return range(0)
+
+        index = min(indexes, key=len)
+        return index[bisect_left(index, start) : bisect_left(index, end)]
+
+    def __sequence_at(self, bound: Optional[TimeBound], default: int) -> int:
+        if bound is None:
+            return default
+
+        if isinstance(bound, timedelta):
+            timestamp = time.time() - bound.total_seconds()
+        elif isinstance(bound, datetime):
+            timestamp = bound.timestamp()
+        else:
+            timestamp = float(bound)
+
+        low, high = self.first_sequence, self.__next_sequence
+        while low < high:
+            middle = (low + high) // 2
+            if self.__times[middle % self.__capacity] < timestamp:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def __entry(self, position: int) -> LogEntry:
+        return LogEntry(
+            self.__times[position],
+            self.__tags[self.__tag_ids[position]],
+            self.__levels[position],
+            self.__messages[position] or "",
+        )
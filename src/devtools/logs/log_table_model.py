@@ -0,0 +1,539 @@
+# QGIS DevTools Plugin
+# Copyright (C) 2025  NextGIS
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or any
+# later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+import threading
+from array import array
+from bisect import bisect_left
+from contextlib import suppress
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, FrozenSet, Optional, Pattern, Tuple
+
+from qgis.core import Qgis
+from qgis.PyQt.QtCore import (
+    QAbstractTableModel,
+    QModelIndex,
+    QObject,
+    Qt,
+    QTimer,
+    pyqtSignal,
+    pyqtSlot,
+)
+from qgis.PyQt.QtGui import QColor
+
+from devtools.core.logging import logger
+from devtools.logs.log_buffer import LogEntry, LogRingBuffer
+
+
+def level_value(level: Qgis.MessageLevel) -> int:
+    """Return the integer value of a QGIS message level.
+
+    :param level: QGIS message level.
+    :type level: Qgis.MessageLevel
+    :returns: Level value as stored in the log buffer.
+    :rtype: int
+    """
+    return int(getattr(level, "value", level))
+
+
+@dataclass(frozen=True)
+class LogFilter:
+    """Conditions of displayed log messages.
+
+    :param levels: Accepted QGIS message level values, all if None.
+    :type levels: Optional[FrozenSet[int]]
+    :param pattern: Regular expression searched in tags and messages.
+    :type pattern: Optional[Pattern[str]]
+    """
+
+    levels: Optional[FrozenSet[int]] = None
+    pattern: Optional[Pattern[str]] = None
+
+    @property
+    def is_empty(self) -> bool:
+        """Check whether every message matches.
+
+        :returns: True if there are no conditions.
+        :rtype: bool
+        """
+        return self.levels is None and self.pattern is None
+
+
+class LogTableModel(QAbstractTableModel):
+    """Virtual table of messages stored in a log ring buffer.
+
+    Rows are not copied from the buffer: a row is mapped to an entry
+    sequence number, newest messages first, and entries are read only for
+    visible rows. Rows are exposed lazily in batches through
+    :meth:`fetchMore`.
+
+    Filtered views keep an array of matching sequence numbers. Stored
+    messages are scanned in a worker thread from newest to oldest, and
+    matches are added as each chunk is scanned. Messages received later
+    are checked on the periodic refresh.
+    """
+
+    filtering_finished = pyqtSignal()
+    """Signal emitted when all stored messages were scanned."""
+
+    _matches_found = pyqtSignal(int, object)
+    _scan_finished = pyqtSignal(int)
+
+    FETCH_SIZE = 10_000
+    SCAN_CHUNK_SIZE = 50_000
+    LIVE_SCAN_LIMIT = 20_000
+    REFRESH_INTERVAL_MS = 250
+    MESSAGE_TOOLTIP_LENGTH = 2000
+
+    TIME_COLUMN = 0
+    LEVEL_COLUMN = 1
+    TAG_COLUMN = 2
+    MESSAGE_COLUMN = 3
+
+    __buffer: LogRingBuffer
+    __filter: LogFilter
+    __generation: int
+    __stop_event: threading.Event
+    __is_filtering: bool
+    __end: int
+    __head: "array[int]"
+    __tail: "array[int]"
+    __loaded_rows: int
+    __cached_entry: Optional[Tuple[int, Optional[LogEntry]]]
+    __refresh_timer: QTimer
+
+    def __init__(
+        self, buffer: LogRingBuffer, parent: Optional[QObject] = None
+    ) -> None:
+        """Initialize LogTableModel instance.
+
+        :param buffer: Buffer with displayed messages.
+        :type buffer: LogRingBuffer
+        :param parent: Parent QObject.
+        :type parent: Optional[QObject]
+        """
+        super().__init__(parent)
+        self.__buffer = buffer
+        self.__filter = LogFilter()
+        self.__generation = 0
+        self.__stop_event = threading.Event()
+        self.__is_filtering = False
+        self.__cached_entry = None
+
+        self._matches_found.connect(self.__on_matches_found)
+        self._scan_finished.connect(self.__on_scan_finished)
+
+        self.__refresh_timer = QTimer(self)
+        self.__refresh_timer.setInterval(self.REFRESH_INTERVAL_MS)
+        self.__refresh_timer.timeout.connect(self.refresh)
+
+        self.__restart()
+
+    @property
+    def filter(self) -> LogFilter:
+        """Return conditions of displayed messages.
+
+        :returns: Current filter.
+        :rtype: LogFilter
+        """
+        return self.__filter
+
+    @property
+    def is_filtering(self) -> bool:
+        """Check whether stored messages are being scanned.
+
+        :returns: True while the worker thread is running.
+        :rtype: bool
+        """
+        return self.__is_filtering
+
+    @property
+    def matched_count(self) -> int:
+        """Return the number of messages matching the filter.
+
+        Includes rows which were not fetched yet.
+
+        :returns: Number of matching messages found so far.
+        :rtype: int
+        """
+        return self.__available_rows()
+
+    @property
+    def total_count(self) -> int:
+        """Return the number of stored messages.
+
+        :returns: Number of messages in the buffer.
+        :rtype: int
+        """
+        return len(self.__buffer)
+
+    def set_filter(self, log_filter: LogFilter) -> None:
+        """Display messages matching conditions.
+
+        :param log_filter: New conditions.
+        :type log_filter: LogFilter
+        """
+        if log_filter == self.__filter:
+            return
+        self.__filter = log_filter
+        self.__restart()
+
+    def set_live_updates(self, enabled: bool) -> None:
+        """Enable or disable periodic checks for new messages.
+
+        :param enabled: Whether new messages should be added.
+        :type enabled: bool
+        """
+        if enabled:
+            self.refresh()
+            self.__refresh_timer.start()
+        else:
+            self.__refresh_timer.stop()
+
+    def stop(self) -> None:
+        """Stop live updates and the filtering worker."""
+        self.__refresh_timer.stop()
+        self.__stop_event.set()
+        self.__generation += 1
+        self.__is_filtering = False
+
+    def entry(self, row: int) -> Optional[LogEntry]:
+        """Return an entry displayed in a row.
+
+        :param row: Row number.
+        :type row: int
+        :returns: Entry or None if it was overwritten.
+        :rtype: Optional[LogEntry]
+        """
+        if self.__cached_entry is not None and self.__cached_entry[0] == row:
+            return self.__cached_entry[1]
+
+        sequence = self.__sequence(row)
+        entry = self.__buffer.entry(sequence) if sequence is not None else None
+        self.__cached_entry = (row, entry)
+        return entry
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: B008, N802
+        """Return the number of fetched rows.
+
+        :param parent: Parent index.
+        :type parent: QModelIndex
+        :returns: Rows count.
+        :rtype: int
+        """
+        return 0 if parent.isValid() else self.__loaded_rows
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: B008, N802
+        """Return the number of columns.
+
+        :param parent: Parent index.
+        :type parent: QModelIndex
+        :returns: Columns count.
+        :rtype: int
+        """
+        return 0 if parent.isValid() else 4
+
+    def canFetchMore(self, parent: QModelIndex) -> bool:  # noqa: N802
+        """Check whether more matching rows can be shown.
+
+        :param parent: Parent index.
+        :type parent: QModelIndex
+        :returns: True if some rows were not fetched yet.
+        :rtype: bool
+        """
+        if parent.isValid():
+            return False
+        return self.__loaded_rows < self.__available_rows()
+
+    def fetchMore(self, parent: QModelIndex) -> None:  # noqa: N802
+        """Show the next batch of older rows.
+
+        :param parent: Parent index.
+        :type parent: QModelIndex
+        """
+        if parent.isValid():
+            return
+        count = min(
+            self.FETCH_SIZE, self.__available_rows() - self.__loaded_rows
+        )
+        if count <= 0:
+            return
+        self.beginInsertRows(
+            QModelIndex(), self.__loaded_rows, self.__loaded_rows + count - 1
+        )
+        self.__loaded_rows += count
+        self.endInsertRows()
+
+    def headerData(  # noqa: N802
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> Any:  # noqa: ANN401
+        """Return column titles.
+
+        :param section: Column number.
+        :type section: int
+        :param orientation: Header orientation.
+        :type orientation: Qt.Orientation
+        :param role: Data role.
+        :type role: int
+        :returns: Column title for the display role.
+        :rtype: Any
+        """
+        if (
+            orientation != Qt.Orientation.Horizontal
+            or role != Qt.ItemDataRole.DisplayRole
+        ):
+            return None
+        titles = (
+            self.tr("Time"),
+            self.tr("Level"),
+            self.tr("Tag"),
+            self.tr("Message"),
+        )
+        return titles[section] if 0 <= section < len(titles) else None
+
+    def data(
+        self,
+        index: QModelIndex,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> Any:  # noqa: ANN401
+        """Return cell data.
+
+        :param index: Cell index.
+        :type index: QModelIndex
+        :param role: Data role.
+        :type role: int
+        :returns: Data for the role.
+        :rtype: Any
+        """
+        if not index.isValid():
+            return None
+
+        if role not in (
+            Qt.ItemDataRole.DisplayRole,
+            Qt.ItemDataRole.ToolTipRole,
+            Qt.ItemDataRole.ForegroundRole,
+        ):
+            return None
+
+        entry = self.entry(index.row())
+        if entry is None:
+            return None
+
+        if role == Qt.ItemDataRole.ForegroundRole:
+            return self.__level_color(entry.level)
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return self.__tooltip(entry, index.column())
+        return self.__text(entry, index.column())
+
+    @pyqtSlot()
+    def refresh(self) -> None:
+        """Add new messages and remove overwritten ones."""
+        next_sequence = self.__buffer.next_sequence
+        if next_sequence < self.__end:
+            # Buffer was cleared
+            self.__restart()
+            return
+
+        self.__remove_overwritten()
+        if next_sequence == self.__end:
+            return
+
+        if self.__filter.is_empty:
+            new_rows = next_sequence - max(
+                self.__end, self.__buffer.first_sequence
+            )
+        elif next_sequence - self.__end > self.LIVE_SCAN_LIMIT:
+            # Flood of messages is scanned in the worker thread again
+            self.__restart()
+            return
+        else:
+            found = self.__find(self.__end, next_sequence, self.__filter)
+            self.__head.extend(found)
+            new_rows = len(found)
+
+        self.__end = next_sequence
+        if new_rows == 0:
+            return
+
+        self.__cached_entry = None
+        self.beginInsertRows(QModelIndex(), 0, new_rows - 1)
+        self.__loaded_rows += new_rows
+        self.endInsertRows()
+
+    def __restart(self) -> None:
+        self.__stop_event.set()
+        self.__generation += 1
+
+        self.beginResetModel()
+        self.__end = self.__buffer.next_sequence
+        self.__head = array("q")
+        self.__tail = array("q")
+        self.__loaded_rows = 0
+        self.__cached_entry = None
+        self.endResetModel()
+
+        if self.__filter.is_empty:
+            self.__is_filtering = False
+            self.fetchMore(QModelIndex())
+            return
+
+        self.__is_filtering = True
+        self.__stop_event = threading.Event()
+        threading.Thread(
+            target=self.__scan,
+            args=(
+                self.__generation,
+                self.__filter,
+                self.__buffer.first_sequence,
+                self.__end,
+                self.__stop_event,
+            ),
+            name="DevToolsLogFilter",
+            daemon=True,
+        ).start()
+
+    def __scan(
+        self,
+        generation: int,
+        log_filter: LogFilter,
+        start: int,
+        end: int,
+        stop_event: threading.Event,
+    ) -> None:
+        try:
+            chunk_end = end
+            while chunk_end > start and not stop_event.is_set():
+                chunk_start = max(start, chunk_end - self.SCAN_CHUNK_SIZE)
+                found = self.__find(chunk_start, chunk_end, log_filter)
+                chunk_end = chunk_start
+                if len(found) == 0:
+                    continue
+                found.reverse()
+                self._matches_found.emit(generation, found)
+        except RuntimeError:
+            # Model was deleted while scanning
+            return
+        except Exception:
+            logger.exception("Log messages filtering failed")
+
+        with suppress(RuntimeError):
+            self._scan_finished.emit(generation)
+
+    def __find(
+        self, start: int, end: int, log_filter: LogFilter
+    ) -> "array[int]":
+        return self.__buffer.find(
+            start, end, levels=log_filter.levels, pattern=log_filter.pattern
+        )
+
+    @pyqtSlot(int, object)
+    def __on_matches_found(self, generation: int, found: "array[int]") -> None:
+        if generation != self.__generation:
+            return
+
+        first_sequence = self.__buffer.first_sequence
+        while len(found) > 0 and found[-1] < first_sequence:
+            found.pop()
+        self.__tail.extend(found)
+
+        if self.__loaded_rows < self.FETCH_SIZE:
+            self.fetchMore(QModelIndex())
+
+    @pyqtSlot(int)
+    def __on_scan_finished(self, generation: int) -> None:
+        if generation != self.__generation:
+            return
+        self.__is_filtering = False
+        self.filtering_finished.emit()
+
+    def __remove_overwritten(self) -> None:
+        first_sequence = self.__buffer.first_sequence
+        if not self.__filter.is_empty:
+            tail = self.__tail
+            while len(tail) > 0 and tail[-1] < first_sequence:
+                tail.pop()
+            if len(tail) == 0 and len(self.__head) > 0:
+                del self.__head[: bisect_left(self.__head, first_sequence)]
+
+        available_rows = self.__available_rows()
+        if self.__loaded_rows <= available_rows:
+            return
+
+        self.__cached_entry = None
+        self.beginRemoveRows(
+            QModelIndex(), available_rows, self.__loaded_rows - 1
+        )
+        self.__loaded_rows = available_rows
+        self.endRemoveRows()
+
+    def __available_rows(self) -> int:
+        if self.__filter.is_empty:
+            return max(self.__end - self.__buffer.first_sequence, 0)
+        return len(self.__head) + len(self.__tail)
+
+    def __sequence(self, row: int) -> Optional[int]:
+        if row < 0:
+            return None
+        if self.__filter.is_empty:
+            return self.__end - 1 - row
+
+        head_length = len(self.__head)
+        if row < head_length:
+            return self.__head[head_length - 1 - row]
+        row -= head_length
+        return self.__tail[row] if row < len(self.__tail) else None
+
+    def __text(self, entry: LogEntry, column: int) -> Optional[str]:
+        if column == self.TIME_COLUMN:
+            timestamp = datetime.fromtimestamp(entry.time)
+            return timestamp.isoformat(timespec="milliseconds")[11:]
+        if column == self.LEVEL_COLUMN:
+            return self.__level_name(entry.level)
+        if column == self.TAG_COLUMN:
+            return entry.tag
+        if column == self.MESSAGE_COLUMN:
+            return entry.message.split("\n", 1)[0]
+        return None
+
+    def __tooltip(self, entry: LogEntry, column: int) -> Optional[str]:
+        if column == self.TIME_COLUMN:
+            return datetime.fromtimestamp(entry.time).isoformat(
+                sep=" ", timespec="milliseconds"
+            )
+        if column == self.MESSAGE_COLUMN:
+            return entry.message[: self.MESSAGE_TOOLTIP_LENGTH]
+        return self.__text(entry, column)
+
+    def __level_color(self, level: int) -> Optional[QColor]:
+        colors = {
+            level_value(Qgis.MessageLevel.Warning): QColor(204, 122, 0),
+            level_value(Qgis.MessageLevel.Critical): QColor(219, 68, 55),
+            level_value(Qgis.MessageLevel.Success): QColor(52, 168, 83),
+        }
+        return colors.get(level)
+
+    def __level_name(self, level: int) -> str:
+        names = {
+            level_value(Qgis.MessageLevel.Info): self.tr("Info"),
+            level_value(Qgis.MessageLevel.Warning): self.tr("Warning"),
+            level_value(Qgis.MessageLevel.Critical): self.tr("Critical"),
+            level_value(Qgis.MessageLevel.Success): self.tr("Success"),
+        }
+        return names.get(level, str(level))
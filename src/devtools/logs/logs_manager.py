@@ -0,0 +1,246 @@
+# QGIS DevTools Plugin
+# Copyright (C) 2025  NextGIS
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or any
+# later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional, Union
+
+from qgis.core import Qgis, QgsApplication
+from qgis.PyQt.QtCore import QObject, Qt, pyqtSlot
+from qgis.PyQt.QtWidgets import QAction
+from qgis.utils import iface
+
+from devtools.core.constants import MENU_NAME, PACKAGE_NAME
+from devtools.core.logging import logger
+from devtools.logs.log_buffer import LogEntry, LogRingBuffer
+from devtools.logs.ui.log_viewer_dock import LogViewerDock
+
+if TYPE_CHECKING:
+    from devtools.devtools_interface import DevToolsInterface
+
+
+class LogsManager(QObject):
+    """Cross-plugin log capture manager for QGIS DevTools.
+
+    Captures messages of all tags from the QGIS message log into a ring
+    buffer, which can be browsed in the Log Viewer dock. The newest
+    messages are saved to the user profile when QGIS quits. On the next
+    start the file is renamed to the previous session file, which is read
+    on demand, so that the startup is not slowed down. Plugin reloads
+    neither save nor rotate the files.
+    """
+
+    LOG_FILE_NAME = "logs.jsonl.gz"
+    PREVIOUS_LOG_FILE_NAME = "logs.previous.jsonl.gz"
+    MAX_SAVED_MESSAGES = 20000
+
+    __buffer: Optional[LogRingBuffer]
+    __previous_session: Optional[LogRingBuffer]
+    __has_unsaved_messages: bool
+    __log_viewer_dock: Optional[LogViewerDock]
+    __log_viewer_action: Optional[QAction]  # type: ignore reportInvalidTypeForm
+
+    def __init__(self, parent: "DevToolsInterface") -> None:
+        """Initialize LogsManager instance.
+
+        :param parent: Plugin interface instance.
+        :type parent: DevToolsInterface
+        """
+        super().__init__(parent)
+        self._plugin = parent
+        self.__buffer = None
+        self.__previous_session = None
+        self.__has_unsaved_messages = False
+        self.__log_viewer_dock = None
+        self.__log_viewer_action = None
+
+    @property
+    def buffer(self) -> LogRingBuffer:
+        """Return the captured messages buffer.
+
+        :returns: Log ring buffer instance.
+        :rtype: LogRingBuffer
+        :raises AssertionError: If the manager is not loaded.
+        """
+        assert self.__buffer is not None, "Logs manager is not loaded"
+        return self.__buffer
+
+    @property
+    def file_path(self) -> Path:
+        """Return the file the buffer is saved to on exit.
+
+        :returns: Path in the user profile.
+        :rtype: Path
+        """
+        return self.__profile_directory() / self.LOG_FILE_NAME
+
+    @property
+    def previous_file_path(self) -> Path:
+        """Return the file with messages of the previous session.
+
+        :returns: Path in the user profile.
+        :rtype: Path
+        """
+        return self.__profile_directory() / self.PREVIOUS_LOG_FILE_NAME
+
+    def load(self) -> None:
+        """Start capturing messages of all tags."""
+        self.__buffer = LogRingBuffer()
+        self.__rotate()
+
+        message_log = QgsApplication.messageLog()
+        assert message_log is not None
+        message_log.messageReceived.connect(self.__on_message_received)
+        QgsApplication.instance().aboutToQuit.connect(self.save)
+
+        self.__log_viewer_action = QAction(text=self.tr("Log Viewer"))
+        self.__log_viewer_action.triggered.connect(self.__show_log_viewer)
+        iface.addPluginToMenu(MENU_NAME, self.__log_viewer_action)
+
+    def unload(self) -> None:
+        """Stop capturing messages.
+
+        Messages are not saved, the file of the current session is written
+        only when QGIS quits.
+        """
+        if self.__buffer is None:
+            return
+
+        if self.__log_viewer_action is not None:
+            iface.removePluginMenu(MENU_NAME, self.__log_viewer_action)
+            self.__log_viewer_action.deleteLater()
+            self.__log_viewer_action = None
+
+        if self.__log_viewer_dock is not None:
+            self.__log_viewer_dock.stop()
+            iface.removeDockWidget(self.__log_viewer_dock)
+            self.__log_viewer_dock.deleteLater()
+            self.__log_viewer_dock = None
+
+        QgsApplication.instance().aboutToQuit.disconnect(self.save)
+        message_log = QgsApplication.messageLog()
+        assert message_log is not None
+        message_log.messageReceived.disconnect(self.__on_message_received)
+
+        self.__buffer = None
+        self.__previous_session = None
+
+    def query(self, **conditions) -> List[LogEntry]:  # noqa: ANN003
+        """Return captured messages matching conditions.
+
+        Accepts the keyword arguments of :meth:`LogRingBuffer.query`, e.g.
+        ``devtools.logs.query(tag="MyPlugin", min_level=Qgis.Warning,
+        since=timedelta(minutes=5))``.
+
+        :returns: Matching entries.
+        :rtype: List[LogEntry]
+        """
+        return self.buffer.query(**conditions)
+
+    def tags(self) -> Dict[str, int]:
+        """Return tags of captured messages with their counts.
+
+        :returns: Messages count by tag.
+        :rtype: Dict[str, int]
+        """
+        return self.buffer.tags()
+
+    def previous_session(self) -> LogRingBuffer:
+        """Return messages saved by the previous QGIS session.
+
+        The file is read on the first call.
+
+        :returns: Buffer with saved messages, empty if there are none.
+        :rtype: LogRingBuffer
+        """
+        if self.__previous_session is None:
+            self.__previous_session = self.__restore()
+        return self.__previous_session
+
+    @pyqtSlot()
+    def save(self, path: Union[str, Path, None] = None) -> None:
+        """Save captured messages.
+
+        Only the newest ``MAX_SAVED_MESSAGES`` messages are written to the
+        profile log file, so that quitting QGIS is not delayed. Saving to
+        it is skipped if nothing was captured since the last save.
+
+        :param path: File path for all captured messages, the profile log
+            file by default.
+        :type path: Union[str, Path, None]
+        """
+        limit = None
+        if path is None:
+            if not self.__has_unsaved_messages:
+                return
+            path = self.file_path
+            limit = self.MAX_SAVED_MESSAGES
+            self.__has_unsaved_messages = False
+
+        # Nothing is logged on success, a captured message would make the
+        # buffer unsaved again
+        try:
+            self.buffer.save(path, limit=limit)
+        except Exception:
+            logger.exception("Captured log messages were not saved")
+
+    def __profile_directory(self) -> Path:
+        return Path(QgsApplication.qgisSettingsDirPath()) / PACKAGE_NAME
+
+    def __rotate(self) -> None:
+        # The session file exists only after QGIS quit, plugin reloads
+        # keep the previous session file
+        path = self.file_path
+        if not path.exists():
+            return
+        try:
+            path.replace(self.previous_file_path)
+        except OSError:
+            logger.exception("Saved log messages were not rotated")
+
+    def __restore(self) -> LogRingBuffer:
+        buffer = LogRingBuffer(self.buffer.capacity)
+        path = self.previous_file_path
+        if not path.exists():
+            return buffer
+
+        try:
+            count = buffer.load(path)
+        except Exception:
+            logger.exception("Saved log messages were not restored")
+            return buffer
+        logger.debug(f"{count} log message(s) were restored from {path}")
+        return buffer
+
+    @pyqtSlot()
+    def __show_log_viewer(self) -> None:
+        if self.__log_viewer_dock is None:
+            self.__log_viewer_dock = LogViewerDock(
+                self.buffer, iface.mainWindow()
+            )
+            iface.addDockWidget(
+                Qt.DockWidgetArea.BottomDockWidgetArea,
+                self.__log_viewer_dock,
+            )
+        self.__log_viewer_dock.setUserVisible(True)
+        self.__log_viewer_dock.raise_()
+
+    @pyqtSlot(str, str, Qgis.MessageLevel)
+    def __on_message_received(
+        self, message: str, tag: str, level: Qgis.MessageLevel
+    ) -> None:
+        self.buffer.append(tag, int(getattr(level, "value", level)), message)
+        self.__has_unsaved_messages = True
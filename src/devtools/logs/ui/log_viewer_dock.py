@@ -0,0 +1,209 @@
+# QGIS DevTools Plugin
+# Copyright (C) 2025  NextGIS
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or any
+# later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+import re
+from pathlib import Path
+from typing import Optional
+
+from qgis.core import Qgis
+from qgis.gui import QgsDockWidget
+from qgis.PyQt import uic
+from qgis.PyQt.QtCore import QTimer, pyqtSlot
+from qgis.PyQt.QtGui import QHideEvent, QShowEvent
+from qgis.PyQt.QtWidgets import (
+    QApplication,
+    QComboBox,
+    QHeaderView,
+    QTableView,
+    QWidget,
+)
+
+from devtools.core.exceptions import DevToolsUiLoadError
+from devtools.logs.log_buffer import LogRingBuffer
+from devtools.logs.log_table_model import LogFilter, LogTableModel, level_value
+
+
+class LogViewerDock(QgsDockWidget):
+    """Dock widget with captured messages of all plugins.
+
+    Unlike the Log Messages panel, rows are not materialized as widgets
+    or items, so the viewer stays responsive with millions of messages.
+    """
+
+    FILTER_DELAY_MS = 300
+    COPY_LIMIT = 100_000
+
+    def __init__(
+        self, buffer: LogRingBuffer, parent: Optional[QWidget] = None
+    ) -> None:
+        """Initialize the log viewer dock.
+
+        :param buffer: Buffer with captured messages.
+        :type buffer: LogRingBuffer
+        :param parent: Optional parent widget.
+        :type parent: Optional[QWidget]
+        """
+        super().__init__(parent)
+        self.setObjectName("DevToolsLogViewerDock")
+        self.setWindowTitle(self.tr("Log Viewer"))
+
+        self.__model = LogTableModel(buffer, self)
+        self.__filter_timer = QTimer(self)
+        self.__filter_timer.setSingleShot(True)
+        self.__filter_timer.setInterval(self.FILTER_DELAY_MS)
+        self.__filter_timer.timeout.connect(self.__apply_filter)
+
+        self.__load_ui()
+        self.__update_summary()
+
+    def stop(self) -> None:
+        """Stop following the buffer and cancel filtering."""
+        self.__filter_timer.stop()
+        self.__model.stop()
+
+    def showEvent(self, event: QShowEvent) -> None:
+        """Start following new messages when the dock is shown.
+
+        :param event: Show event.
+        :type event: QShowEvent
+        """
+        super().showEvent(event)
+        self.__model.set_live_updates(True)
+
+    def hideEvent(self, event: QHideEvent) -> None:
+        """Stop following new messages while the dock is hidden.
+
+        :param event: Hide event.
+        :type event: QHideEvent
+        """
+        super().hideEvent(event)
+        self.__model.set_live_updates(False)
+
+    def __load_ui(self) -> None:
+        widget: Optional[QWidget] = None
+        try:
+            widget = uic.loadUi(
+                str(Path(__file__).parent / "log_viewer_dock_base.ui")
+            )
+        except Exception as error:
+            raise DevToolsUiLoadError from error
+
+        if widget is None:
+            raise DevToolsUiLoadError
+
+        self.__widget = widget
+        self.setWidget(self.__widget)
+
+        table_view: QTableView = self.__widget.table_view
+        table_view.setModel(self.__model)
+
+        # Fixed row heights let the view skip measuring rows
+        vertical_header = table_view.verticalHeader()
+        vertical_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        vertical_header.setDefaultSectionSize(
+            table_view.fontMetrics().height() + 6
+        )
+        header = table_view.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        header.setStretchLastSection(True)
+        character_width = table_view.fontMetrics().averageCharWidth()
+        header.resizeSection(LogTableModel.TIME_COLUMN, character_width * 16)
+        header.resizeSection(LogTableModel.LEVEL_COLUMN, character_width * 10)
+        header.resizeSection(LogTableModel.TAG_COLUMN, character_width * 20)
+
+        level_combobox: QComboBox = self.__widget.level_combobox
+        level_combobox.addItem(self.tr("All levels"), None)
+        level_combobox.addItem(
+            self.tr("Warnings and errors"),
+            (Qgis.MessageLevel.Warning, Qgis.MessageLevel.Critical),
+        )
+        level_combobox.addItem(
+            self.tr("Errors"), (Qgis.MessageLevel.Critical,)
+        )
+        level_combobox.addItem(self.tr("Info"), (Qgis.MessageLevel.Info,))
+        level_combobox.addItem(
+            self.tr("Success"), (Qgis.MessageLevel.Success,)
+        )
+        level_combobox.currentIndexChanged.connect(self.__apply_filter)
+
+        self.__widget.filter_lineedit.textChanged.connect(
+            self.__filter_timer.start
+        )
+        self.__widget.copy_button.clicked.connect(self.__copy_selected)
+
+        self.__model.modelReset.connect(self.__update_summary)
+        self.__model.rowsInserted.connect(self.__update_summary)
+        self.__model.rowsRemoved.connect(self.__update_summary)
+        self.__model.filtering_finished.connect(self.__update_summary)
+
+    @pyqtSlot()
+    def __apply_filter(self) -> None:
+        self.__filter_timer.stop()
+
+        filter_lineedit = self.__widget.filter_lineedit
+        text = filter_lineedit.text()
+        pattern = None
+        if text:
+            try:
+                pattern = re.compile(text, re.IGNORECASE)
+            except re.error as error:
+                filter_lineedit.setToolTip(
+                    self.tr("Invalid regular expression: {error}").format(
+                        error=error
+                    )
+                )
+                return
+        filter_lineedit.setToolTip("")
+
+        levels = self.__widget.level_combobox.currentData()
+        self.__model.set_filter(
+            LogFilter(
+                levels=frozenset(level_value(level) for level in levels)
+                if levels is not None
+                else None,
+                pattern=pattern,
+            )
+        )
+
+    @pyqtSlot()
+    def __copy_selected(self) -> None:
+        selection_model = self.__widget.table_view.selectionModel()
+        rows = sorted(index.row() for index in selection_model.selectedRows())
+        if len(rows) == 0:
+            rows = range(min(self.__model.rowCount(), self.COPY_LIMIT))
+
+        # Rows are ordered newest first, copied text reads like a log file
+        lines = []
+        for row in reversed(rows[: self.COPY_LIMIT]):
+            entry = self.__model.entry(row)
+            if entry is not None:
+                lines.append(str(entry))
+        QApplication.clipboard().setText("\n".join(lines))
+
+    @pyqtSlot()
+    def __update_summary(self) -> None:
+        matched = self.__model.matched_count
+        total = self.__model.total_count
+        if self.__model.filter.is_empty:
+            text = self.tr("{total} message(s)").format(total=total)
+        else:
+            text = self.tr("{matched} of {total} message(s) match").format(
+                matched=matched, total=total
+            )
+        if self.__model.is_filtering:
+            text += " " + self.tr("(filtering…)")
+        self.__widget.summary_label.setText(text)
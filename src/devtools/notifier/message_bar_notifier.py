@@ -25,11 +25,11 @@ from qgis.PyQt.QtGui import QDesktopServices
 from qgis.PyQt.QtWidgets import QMessageBox, QPushButton, QWidget
 from qgis.utils import iface
 
-from devtools import DevToolsInterface
 from devtools.core.constants import PLUGIN_NAME
 from devtools.core.exceptions import DevToolsError, DevToolsWarning
-from devtools.core.logging import logger
+from devtools.core.logging import log_directory, log_files, logger
 from devtools.core.utils import utm_tags
+from devtools.devtools_interface import DevToolsInterface
 from devtools.notifier.notifier_interface import NotifierInterface
 
 if TYPE_CHECKING:
@@ -55,6 +55,11 @@ def open_logs() -> None:
     iface.openMessageLog()
 
 
+def open_log_directory() -> None:
+    """Open the directory with DevTools log files to attach them."""
+    QDesktopServices.openUrl(QUrl.fromLocalFile(str(log_directory())))
+
+
 class MessageBarNotifier(NotifierInterface):
     """Notifier implementation for displaying messages and exceptions in QGIS.
 
@@ -203,6 +208,11 @@ class MessageBarNotifier(NotifierInterface):
             widget.layout().addWidget(button)
 
         if type(error) is DevToolsError:
+            if log_files():
+                button = QPushButton(self.tr("Log files"))
+                button.pressed.connect(open_log_directory)
+                widget.layout().addWidget(button)
+
             button = QPushButton(self.tr("Let us know"))
             button.pressed.connect(let_us_know)
             widget.layout().addWidget(button)
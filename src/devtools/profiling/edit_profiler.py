@@ -0,0 +1,521 @@
+# QGIS DevTools Plugin
+# Copyright (C) 2025  NextGIS
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or any
+# later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+import functools
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from qgis.core import (
+    QgsMapLayer,
+    QgsProject,
+    QgsVectorDataProvider,
+    QgsVectorLayer,
+)
+from qgis.PyQt.QtCore import QObject, pyqtSlot
+
+from devtools.core.call_site import CallSite, caller_site
+from devtools.core.compat import (
+    QgsChangedAttributesMap,
+    QgsFeatureIds,
+    QgsFeatureList,
+    QgsGeometryMap,
+)
+from devtools.core.logging import logger
+
+PER_FEATURE_METHODS: Tuple[Tuple[type, str], ...] = (
+    (QgsVectorLayer, "changeAttributeValue"),
+    (QgsVectorLayer, "changeAttributeValues"),
+    (QgsVectorLayer, "changeGeometry"),
+    (QgsVectorLayer, "addFeature"),
+    (QgsVectorLayer, "deleteFeature"),
+)
+"""Edit methods which change a single feature per call."""
+
+BULK_METHODS: Tuple[Tuple[type, str], ...] = (
+    (QgsVectorLayer, "addFeatures"),
+    (QgsVectorLayer, "deleteFeatures"),
+    (QgsVectorDataProvider, "addFeatures"),
+    (QgsVectorDataProvider, "deleteFeatures"),
+    (QgsVectorDataProvider, "changeAttributeValues"),
+    (QgsVectorDataProvider, "changeGeometryValues"),
+    (QgsVectorDataProvider, "changeFeatures"),
+)
+"""Edit methods which change many features per call."""
+
+BATCHING_ADVICE = {
+    "changeAttributeValue": (
+        "collect {fid: {index: value}} and call "
+        "dataProvider().changeAttributeValues()"
+    ),
+    "changeAttributeValues": (
+        "collect {fid: {index: value}} and call "
+        "dataProvider().changeAttributeValues()"
+    ),
+    "changeGeometry": (
+        "collect {fid: geometry} and call "
+        "dataProvider().changeGeometryValues()"
+    ),
+    "addFeature": "collect features and call addFeatures()",
+    "deleteFeature": "collect ids and call deleteFeatures()",
+}
+
+
+@dataclass
+class EditCallStatistics:
+    """Python edit calls made from a single call site.
+
+    :param call_site: Location of the calls.
+    :type call_site: CallSite
+    :param method: Qualified name of the called method.
+    :type method: str
+    :param is_bulk: Whether the method changes many features per call.
+    :type is_bulk: bool
+    :param calls: Number of calls.
+    :type calls: int
+    :param total_time: Total time spent in the calls in seconds.
+    :type total_time: float
+    """
+
+    call_site: CallSite
+    method: str
+    is_bulk: bool
+    calls: int = 0
+    total_time: float = 0.0
+
+    @property
+    def advice(self) -> str:
+        """Return how to batch the calls.
+
+        :returns: Advice text or an empty string for bulk methods.
+        :rtype: str
+        """
+        if self.is_bulk:
+            return ""
+        return BATCHING_ADVICE.get(self.method.split(".")[-1], "")
+
+
+@dataclass
+class CommitPhase:
+    """Part of ``commitChanges`` ended by a ``committed*`` signal.
+
+    :param name: Phase name.
+    :type name: str
+    :param duration: Phase duration in seconds.
+    :type duration: float
+    :param items: Number of committed items.
+    :type items: int
+    """
+
+    name: str
+    duration: float
+    items: int
+
+
+@dataclass
+class CommitProfile:
+    """Timings of a single ``commitChanges`` call.
+
+    :param layer_id: Layer identifier.
+    :type layer_id: str
+    :param layer_name: Layer name.
+    :type layer_name: str
+    :param timestamp: Wall clock time when the commit started.
+    :type timestamp: float
+    :param duration: Commit duration in seconds.
+    :type duration: float
+    :param succeeded: Whether the commit succeeded.
+    :type succeeded: bool
+    :param phases: Commit phases in execution order.
+    :type phases: List[CommitPhase]
+    :param buffered_edits: Edit buffer changes committed, by kind.
+    :type buffered_edits: Counter[str]
+    """
+
+    layer_id: str
+    layer_name: str
+    timestamp: float
+    duration: float = 0.0
+    succeeded: bool = False
+    phases: List[CommitPhase] = field(default_factory=list)
+    buffered_edits: "Counter[str]" = field(default_factory=Counter)
+
+    def summary(self) -> str:
+        """Return a human readable summary.
+
+        :returns: Multiline summary text.
+        :rtype: str
+        """
+        status = "" if self.succeeded else " (failed)"
+        edits = ", ".join(
+            f"{count} {kind}" for kind, count in self.buffered_edits.items()
+        )
+        header = (
+            f"Commit of {self.layer_name!r}{status}: "
+            f"{self.duration * 1000:.0f} ms, {edits or 'no buffered edits'}"
+        )
+        lines = [header]
+        lines.extend(
+            f"  {phase.name}: {phase.duration * 1000:.0f} ms "
+            f"({phase.items} item(s))"
+            for phase in self.phases
+        )
+        return "\n".join(lines)
+
+
+class _LayerTracker(QObject):
+    """Collects edit buffer changes and commit timings of a layer."""
+
+    __edits: "Counter[str]"
+    __commit: Optional[CommitProfile]
+    __commit_started: float
+    __last_mark: float
+
+    def __init__(
+        self, layer: QgsVectorLayer, profiler: "EditProfiler"
+    ) -> None:
+        super().__init__(profiler)
+        self.__layer = layer
+        self.__profiler = profiler
+        self.__edits = Counter()
+        self.__commit = None
+        self.__commit_started = 0.0
+        self.__last_mark = 0.0
+
+        layer.editingStarted.connect(self.__connect_edit_buffer)
+        layer.beforeCommitChanges.connect(self.__on_before_commit)
+        layer.committedFeaturesRemoved.connect(self.__on_features_removed)
+        layer.committedFeaturesAdded.connect(self.__on_features_added)
+        layer.committedGeometriesChanges.connect(self.__on_geometries_changed)
+        layer.committedAttributeValuesChanges.connect(
+            self.__on_attribute_values_changed
+        )
+        layer.afterCommitChanges.connect(self.__on_after_commit)
+        layer.afterRollBack.connect(self.__on_after_rollback)
+        if layer.isEditable():
+            self.__connect_edit_buffer()
+
+    def finish_failed_commit(self) -> None:
+        if self.__commit is not None:
+            self.__finish_commit(succeeded=False)
+
+    @pyqtSlot()
+    def __connect_edit_buffer(self) -> None:
+        edit_buffer = self.__layer.editBuffer()
+        if edit_buffer is None:
+            return
+        edit_buffer.attributeValueChanged.connect(
+            self.__on_attribute_value_changed
+        )
+        edit_buffer.geometryChanged.connect(self.__on_geometry_changed)
+        edit_buffer.featureAdded.connect(self.__on_feature_added)
+        edit_buffer.featureDeleted.connect(self.__on_feature_deleted)
+
+    def __on_attribute_value_changed(self, *_: Any) -> None:  # noqa: ANN401
+        self.__count_edit("attribute value changes")
+
+    def __on_geometry_changed(self, *_: Any) -> None:  # noqa: ANN401
+        self.__count_edit("geometry changes")
+
+    def __on_feature_added(self, *_: Any) -> None:  # noqa: ANN401
+        self.__count_edit("added features")
+
+    def __on_feature_deleted(self, *_: Any) -> None:  # noqa: ANN401
+        self.__count_edit("deleted features")
+
+    def __count_edit(self, kind: str) -> None:
+        if self.__profiler.is_running and self.__commit is None:
+            self.__edits[kind] += 1
+
+    def __on_before_commit(self, *_: Any) -> None:  # noqa: ANN401
+        if not self.__profiler.is_running:
+            return
+        self.finish_failed_commit()
+        self.__commit = CommitProfile(
+            self.__layer.id(),
+            self.__layer.name(),
+            time.time(),
+            buffered_edits=self.__edits.copy(),
+        )
+        self.__commit_started = time.perf_counter()
+        self.__last_mark = self.__commit_started
+
+    def __on_features_removed(
+        self, _: str, feature_ids: QgsFeatureIds
+    ) -> None:
+        self.__mark_phase("delete features", len(feature_ids))
+
+    def __on_features_added(self, _: str, features: QgsFeatureList) -> None:
+        self.__mark_phase("add features", len(features))
+
+    def __on_geometries_changed(
+        self, _: str, geometries: QgsGeometryMap
+    ) -> None:
+        self.__mark_phase("change geometries", len(geometries))
+
+    def __on_attribute_values_changed(
+        self, _: str, attributes: QgsChangedAttributesMap
+    ) -> None:
+        self.__mark_phase("change attribute values", len(attributes))
+
+    @pyqtSlot()
+    def __on_after_commit(self) -> None:
+        if self.__commit is not None:
+            self.__finish_commit(succeeded=True)
+
+    @pyqtSlot()
+    def __on_after_rollback(self) -> None:
+        self.__edits.clear()
+
+    def __mark_phase(self, name: str, items: int) -> None:
+        if self.__commit is None:
+            return
+        now = time.perf_counter()
+        self.__commit.phases.append(
+            CommitPhase(name, now - self.__last_mark, items)
+        )
+        self.__last_mark = now
+
+    def __finish_commit(self, *, succeeded: bool) -> None:
+        assert self.__commit is not None
+        commit = self.__commit
+        self.__commit = None
+        commit.duration = time.perf_counter() - self.__commit_started
+        commit.succeeded = succeeded
+        if succeeded:
+            self.__edits.clear()
+        self.__profiler.add_commit(commit)
+
+
+class EditProfiler(QObject):
+    """Profiles vector layer editing and ``commitChanges``.
+
+    Edit buffer signals of project layers are counted, ``commitChanges``
+    is split into phases by the ``committed*`` signals, and Python calls of
+    per-feature and bulk edit methods are counted per call site, so loops
+    editing one feature at a time can be spotted.
+    """
+
+    EDIT_LOOP_THRESHOLD = 100
+
+    __trackers: Dict[str, _LayerTracker]
+    __originals: Dict[Tuple[type, str], Callable[..., Any]]
+    __calls: Dict[Tuple[CallSite, str], EditCallStatistics]
+    __commits: List[CommitProfile]
+    __is_running: bool
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        """Initialize EditProfiler instance.
+
+        :param parent: Parent QObject.
+        :type parent: Optional[QObject]
+        """
+        super().__init__(parent)
+        self.__trackers = {}
+        self.__originals = {}
+        self.__is_running = False
+        self.reset()
+
+    @property
+    def is_running(self) -> bool:
+        """Check whether editing is being profiled.
+
+        :returns: True if the profiler is running.
+        :rtype: bool
+        """
+        return self.__is_running
+
+    def start(self) -> None:
+        """Start profiling edits of project layers."""
+        if self.__is_running:
+            return
+
+        project = QgsProject.instance()
+        project.layersAdded.connect(self.__track_layers)
+        project.layersWillBeRemoved.connect(self.__untrack_layers)
+        self.__track_layers(list(project.mapLayers().values()))
+
+        for method in PER_FEATURE_METHODS:
+            self.__patch(method, is_bulk=False)
+        for method in BULK_METHODS:
+            self.__patch(method, is_bulk=True)
+        self.__patch_commit_changes()
+
+        self.__is_running = True
+        logger.debug("Edit profiler started")
+
+    def stop(self) -> None:
+        """Stop profiling and log the report."""
+        if not self.__is_running:
+            return
+
+        self.__is_running = False
+        project = QgsProject.instance()
+        project.layersAdded.disconnect(self.__track_layers)
+        project.layersWillBeRemoved.disconnect(self.__untrack_layers)
+        self.__untrack_layers(list(self.__trackers))
+
+        for (owner, name), original in self.__originals.items():
+            setattr(owner, name, original)
+        self.__originals.clear()
+        logger.debug("Edit profiler stopped")
+
+        if self.__commits or self.__calls:
+            logger.info(self.report())
+
+    def reset(self) -> None:
+        """Forget all collected statistics."""
+        self.__calls = {}
+        self.__commits = []
+
+    def commits(self) -> List[CommitProfile]:
+        """Return profiled commits, oldest first.
+
+        :returns: Commit profiles.
+        :rtype: List[CommitProfile]
+        """
+        return list(self.__commits)
+
+    def calls(self) -> List[EditCallStatistics]:
+        """Return Python edit call statistics.
+
+        :returns: Call statistics, most time consuming first.
+        :rtype: List[EditCallStatistics]
+        """
+        return sorted(
+            self.__calls.values(),
+            key=lambda statistics: statistics.total_time,
+            reverse=True,
+        )
+
+    def edit_loops(self) -> List[EditCallStatistics]:
+        """Return call sites editing features one by one in a loop.
+
+        :returns: Per-feature call statistics above the loop threshold.
+        :rtype: List[EditCallStatistics]
+        """
+        return [
+            statistics
+            for statistics in self.calls()
+            if not statistics.is_bulk
+            and statistics.calls >= self.EDIT_LOOP_THRESHOLD
+        ]
+
+    def add_commit(self, commit: CommitProfile) -> None:
+        """Store a finished commit profile.
+
+        :param commit: Commit profile.
+        :type commit: CommitProfile
+        """
+        self.__commits.append(commit)
+        logger.debug(commit.summary())
+
+    def report(self) -> str:
+        """Return a human readable report.
+
+        :returns: Multiline report text.
+        :rtype: str
+        """
+        per_feature_calls = sum(
+            statistics.calls
+            for statistics in self.__calls.values()
+            if not statistics.is_bulk
+        )
+        bulk_calls = sum(
+            statistics.calls
+            for statistics in self.__calls.values()
+            if statistics.is_bulk
+        )
+        lines = [
+            f"Edit calls: {per_feature_calls} per-feature, {bulk_calls} bulk"
+        ]
+        lines.extend(commit.summary() for commit in self.__commits)
+
+        edit_loops = self.edit_loops()
+        if edit_loops:
+            lines.append("Per-feature edit loops that should be batched:")
+        for statistics in edit_loops:
+            lines.append(
+                f"  {statistics.call_site}: {statistics.method} called "
+                f"{statistics.calls} times, "
+                f"{statistics.total_time * 1000:.0f} ms"
+            )
+            lines.append(f"    {statistics.advice}")
+        return "\n".join(lines)
+
+    def __track_layers(self, layers: List[QgsMapLayer]) -> None:
+        for layer in layers:
+            if not isinstance(layer, QgsVectorLayer):
+                continue
+            if layer.id() in self.__trackers:
+                continue
+            self.__trackers[layer.id()] = _LayerTracker(layer, self)
+
+    def __untrack_layers(self, layer_ids: List[str]) -> None:
+        for layer_id in layer_ids:
+            tracker = self.__trackers.pop(layer_id, None)
+            if tracker is not None:
+                tracker.deleteLater()
+
+    def __patch(self, method: Tuple[type, str], *, is_bulk: bool) -> None:
+        owner, name = method
+        original = getattr(owner, name)
+        qualified_name = f"{owner.__name__}.{name}"
+        calls = self.__calls_statistics
+
+        @functools.wraps(original)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+            started = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                statistics = calls(caller_site(), qualified_name, is_bulk)
+                statistics.calls += 1
+                statistics.total_time += time.perf_counter() - started
+
+        self.__originals[method] = original
+        setattr(owner, name, wrapper)
+
+    def __patch_commit_changes(self) -> None:
+        original = QgsVectorLayer.commitChanges
+        trackers = self.__trackers
+
+        @functools.wraps(original)
+        def commit_changes(
+            layer: QgsVectorLayer,
+            *args: Any,  # noqa: ANN401
+            **kwargs: Any,  # noqa: ANN401
+        ) -> bool:
+            result = original(layer, *args, **kwargs)
+            tracker = trackers.get(layer.id())
+            if not result and tracker is not None:
+                tracker.finish_failed_commit()
+            return result
+
+        self.__originals[(QgsVectorLayer, "commitChanges")] = original
+        QgsVectorLayer.commitChanges = commit_changes
+
+    def __calls_statistics(
+        self, call_site: CallSite, method: str, is_bulk: bool
+    ) -> EditCallStatistics:
+        key = (call_site, method)
+        statistics = self.__calls.get(key)
+        if statistics is None:
+            statistics = EditCallStatistics(call_site, method, is_bulk)
+            self.__calls[key] = statistics
+        return statistics
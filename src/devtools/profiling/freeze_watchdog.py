@@ -0,0 +1,351 @@
+# QGIS DevTools Plugin
+# Copyright (C) 2025  NextGIS
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or any
+# later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+import bisect
+import sys
+import threading
+import time
+import traceback
+from collections import Counter
+from dataclasses import dataclass, field
+from types import FrameType
+from typing import Dict, List, Optional, Tuple
+
+from qgis.PyQt.QtCore import QObject, Qt, QTimer, pyqtSignal, pyqtSlot
+
+from devtools.core.logging import logger
+
+StackSignature = Tuple[str, ...]
+"""Formatted frames of a stack, outermost first."""
+
+NATIVE_STACK: StackSignature = ("<native code or stack not captured>",)
+
+
+@dataclass
+class Stall:
+    """Single period when the Qt main loop did not respond.
+
+    :param duration: Stall duration in seconds.
+    :type duration: float
+    :param stack: Most frequently sampled main thread stack.
+    :type stack: StackSignature
+    :param timestamp: Wall clock time when the stall ended.
+    :type timestamp: float
+    """
+
+    duration: float
+    stack: StackSignature
+    timestamp: float
+
+    @property
+    def location(self) -> str:
+        """Return the innermost frame of the stall stack.
+
+        :returns: Innermost frame description.
+        :rtype: str
+        """
+        return self.stack[-1]
+
+
+@dataclass
+class BlockerStatistics:
+    """Aggregated stalls that share the same main thread stack.
+
+    :param stack: Main thread stack of the stalls.
+    :type stack: StackSignature
+    :param count: Number of stalls.
+    :type count: int
+    :param total_duration: Total stall duration in seconds.
+    :type total_duration: float
+    :param max_duration: Longest stall duration in seconds.
+    :type max_duration: float
+    """
+
+    stack: StackSignature
+    count: int = 0
+    total_duration: float = 0.0
+    max_duration: float = 0.0
+
+    def add(self, stall: Stall) -> None:
+        """Account a stall in the statistics.
+
+        :param stall: Stall to add.
+        :type stall: Stall
+        """
+        self.count += 1
+        self.total_duration += stall.duration
+        self.max_duration = max(self.max_duration, stall.duration)
+
+
+@dataclass
+class _StallSamples:
+    beat: float = 0.0
+    stacks: List[StackSignature] = field(default_factory=list)
+
+
+class FreezeWatchdog(QObject):
+    """Detects Qt main loop stalls and captures what the main thread does.
+
+    A ``QTimer`` heartbeat runs in the main thread. A background thread
+    checks the heartbeat age and, when the main loop stalls longer than the
+    threshold, samples the main thread Python stack through
+    ``sys._current_frames()``. Stalls are aggregated into a duration
+    histogram and a list of top blockers.
+    """
+
+    stall_detected = pyqtSignal(object)
+    """Signal emitted in the main thread with a finished :class:`Stall`."""
+
+    HISTOGRAM_BOUNDS_MS = (200, 500, 1000, 2000, 5000, 10000)
+    MAX_STACK_DEPTH = 15
+    MAX_SAMPLES_PER_STALL = 100
+
+    __threshold: float
+    __heartbeat_interval: float
+    __timer: QTimer
+    __monitor: Optional[threading.Thread]
+    __stop_event: threading.Event
+    __lock: threading.Lock
+    __last_beat: float
+    __samples: _StallSamples
+    __blockers: Dict[StackSignature, BlockerStatistics]
+    __histogram: List[int]
+    __stalls_count: int
+
+    def __init__(
+        self,
+        parent: Optional[QObject] = None,
+        *,
+        threshold_ms: int = 200,
+        heartbeat_ms: int = 50,
+    ) -> None:
+        """Initialize FreezeWatchdog instance.
+
+        :param parent: Parent QObject.
+        :type parent: Optional[QObject]
+        :param threshold_ms: Minimal stall duration to report.
+        :type threshold_ms: int
+        :param heartbeat_ms: Heartbeat timer interval.
+        :type heartbeat_ms: int
+        """
+        super().__init__(parent)
+        self.__threshold = threshold_ms / 1000
+        self.__heartbeat_interval = heartbeat_ms / 1000
+
+        self.__timer = QTimer(self)
+        self.__timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.__timer.setInterval(heartbeat_ms)
+        self.__timer.timeout.connect(self.__on_heartbeat)
+
+        self.__monitor = None
+        self.__stop_event = threading.Event()
+        self.__lock = threading.Lock()
+        self.__last_beat = time.monotonic()
+        self.__samples = _StallSamples()
+        self.reset()
+
+    @property
+    def is_running(self) -> bool:
+        """Check whether the watchdog is running.
+
+        :returns: True if the main loop is being watched.
+        :rtype: bool
+        """
+        return self.__monitor is not None
+
+    @property
+    def threshold_ms(self) -> int:
+        """Return the minimal stall duration to report.
+
+        :returns: Threshold in milliseconds.
+        :rtype: int
+        """
+        return round(self.__threshold * 1000)
+
+    @threshold_ms.setter
+    def threshold_ms(self, value: int) -> None:
+        """Set the minimal stall duration to report.
+
+        :param value: Threshold in milliseconds.
+        :type value: int
+        """
+        self.__threshold = max(value, 1) / 1000
+
+    @property
+    def stalls_count(self) -> int:
+        """Return the number of stalls since the last reset.
+
+        :returns: Number of stalls.
+        :rtype: int
+        """
+        return self.__stalls_count
+
+    def start(self) -> None:
+        """Start watching the main loop."""
+        if self.is_running:
+            return
+
+        self.__last_beat = time.monotonic()
+        self.__stop_event.clear()
+        self.__monitor = threading.Thread(
+            target=self.__watch,
+            args=(threading.get_ident(),),
+            name="DevToolsFreezeWatchdog",
+            daemon=True,
+        )
+        self.__monitor.start()
+        self.__timer.start()
+        logger.debug(f"Freeze watchdog started ({self.threshold_ms} ms)")
+
+    def stop(self) -> None:
+        """Stop watching the main loop."""
+        if not self.is_running:
+            return
+
+        self.__timer.stop()
+        self.__stop_event.set()
+        self.__monitor.join()
+        self.__monitor = None
+        logger.debug("Freeze watchdog stopped")
+
+        if self.__stalls_count > 0:
+            logger.info(self.report())
+
+    def reset(self) -> None:
+        """Forget all collected stalls."""
+        self.__blockers = {}
+        self.__histogram = [0] * (len(self.HISTOGRAM_BOUNDS_MS) + 1)
+        self.__stalls_count = 0
+
+    def histogram(self) -> List[Tuple[str, int]]:
+        """Return the stall duration histogram.
+
+        :returns: List of (bucket label, stalls count) pairs.
+        :rtype: List[Tuple[str, int]]
+        """
+        bounds = self.HISTOGRAM_BOUNDS_MS
+        labels = [f"< {bounds[0]} ms"]
+        labels.extend(
+            f"{lower}–{upper} ms" for lower, upper in zip(bounds, bounds[1:])
+        )
+        labels.append(f"≥ {bounds[-1]} ms")
+        return list(zip(labels, self.__histogram))
+
+    def top_blockers(self, limit: int = 10) -> List[BlockerStatistics]:
+        """Return stacks ranked by total stall duration.
+
+        :param limit: Maximum number of blockers to return.
+        :type limit: int
+        :returns: Blocker statistics, worst first.
+        :rtype: List[BlockerStatistics]
+        """
+        blockers = sorted(
+            self.__blockers.values(),
+            key=lambda blocker: blocker.total_duration,
+            reverse=True,
+        )
+        return blockers[:limit]
+
+    def report(self, limit: int = 5) -> str:
+        """Return a human readable report.
+
+        :param limit: Maximum number of top blockers to include.
+        :type limit: int
+        :returns: Multiline report text.
+        :rtype: str
+        """
+        lines = [f"UI stalls: {self.__stalls_count}"]
+        lines.extend(
+            f"  {label:>14}: {count}"
+            for label, count in self.histogram()
+            if count > 0
+        )
+        for index, blocker in enumerate(self.top_blockers(limit), start=1):
+            lines.append(
+                f"#{index}: {blocker.count} stall(s), "
+                f"total {blocker.total_duration * 1000:.0f} ms, "
+                f"max {blocker.max_duration * 1000:.0f} ms"
+            )
+            lines.extend(f"    {frame}" for frame in blocker.stack)
+        return "\n".join(lines)
+
+    @pyqtSlot()
+    def __on_heartbeat(self) -> None:
+        now = time.monotonic()
+        with self.__lock:
+            previous_beat = self.__last_beat
+            self.__last_beat = now
+            samples = self.__samples
+            if samples.beat == previous_beat:
+                self.__samples = _StallSamples()
+
+        duration = now - previous_beat - self.__heartbeat_interval
+        if duration < self.__threshold:
+            return
+
+        stacks = samples.stacks if samples.beat == previous_beat else []
+        stack = (
+            Counter(stacks).most_common(1)[0][0] if stacks else NATIVE_STACK
+        )
+        self.__add_stall(Stall(duration, stack, time.time()))
+
+    def __add_stall(self, stall: Stall) -> None:
+        self.__stalls_count += 1
+        bucket = bisect.bisect_right(
+            self.HISTOGRAM_BOUNDS_MS, stall.duration * 1000
+        )
+        self.__histogram[bucket] += 1
+
+        blocker = self.__blockers.get(stall.stack)
+        if blocker is None:
+            blocker = BlockerStatistics(stall.stack)
+            self.__blockers[stall.stack] = blocker
+        blocker.add(stall)
+
+        logger.debug(
+            f"UI was blocked for {stall.duration * 1000:.0f} ms "
+            f"at {stall.location}"
+        )
+        self.stall_detected.emit(stall)
+
+    def __watch(self, main_thread_id: int) -> None:
+        check_interval = self.__heartbeat_interval
+        while not self.__stop_event.wait(check_interval):
+            last_beat = self.__last_beat
+            lag = time.monotonic() - last_beat - self.__heartbeat_interval
+            if lag < self.__threshold:
+                continue
+
+            frame = sys._current_frames().get(main_thread_id)  # noqa: SLF001
+            stack = self.__format_stack(frame)
+
+            with self.__lock:
+                if self.__last_beat != last_beat:
+                    continue
+                if self.__samples.beat != last_beat:
+                    self.__samples = _StallSamples(last_beat)
+                if len(self.__samples.stacks) < self.MAX_SAMPLES_PER_STALL:
+                    self.__samples.stacks.append(stack)
+
+    def __format_stack(self, frame: Optional[FrameType]) -> StackSignature:
+        if frame is None:
+            return NATIVE_STACK
+
+        summary = traceback.extract_stack(frame, limit=self.MAX_STACK_DEPTH)
+        return tuple(
+            f"{item.filename}:{item.lineno} in {item.name}" for item in summary
+        )
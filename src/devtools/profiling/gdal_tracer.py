@@ -0,0 +1,320 @@
+# QGIS DevTools Plugin
+# Copyright (C) 2025  NextGIS
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or any
+# later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from osgeo import gdal
+from qgis.PyQt.QtCore import QObject, pyqtSignal, pyqtSlot
+
+from devtools.core.logging import logger
+
+OperationKey = Tuple[str, str]
+
+MESSAGE_PATTERN = re.compile(
+    r"^(?:\[\d+(?:\.\d+)?\]\s*)?"
+    r"(?P<driver>[\w\-/ ]{1,32}):\s*"
+    r"(?:\[\d+(?:\.\d+)?\]\s*)?"
+    r"(?P<message>.*)$",
+    re.DOTALL,
+)
+QUOTED_PATTERN = re.compile(r"(['\"]).*?\1")
+PATH_PATTERN = re.compile(r"(?:/vsi\w+)?(?:[A-Za-z]:)?[/\\][^\s,;()]+")
+NUMBER_PATTERN = re.compile(r"(?<![\w.])(?:0x[0-9a-fA-F]+|[-+]?\d+(?:\.\d+)?)")
+
+
+@dataclass(frozen=True)
+class GdalMessage:
+    """GDAL message received by the error handler.
+
+    :param level: GDAL error class (``gdal.CE_Debug``, ``gdal.CE_Warning``
+        etc.).
+    :type level: int
+    :param code: GDAL error number.
+    :type code: int
+    :param driver: Debug category, usually a driver name.
+    :type driver: str
+    :param message: Message text without category and timestamp.
+    :type message: str
+    :param thread_name: Name of the thread the message came from.
+    :type thread_name: str
+    """
+
+    level: int
+    code: int
+    driver: str
+    message: str
+    thread_name: str
+
+    def __str__(self) -> str:
+        """Return the message with its thread and driver.
+
+        :returns: Formatted message.
+        :rtype: str
+        """
+        return f"[{self.thread_name}] {self.driver}: {self.message}"
+
+
+@dataclass
+class GdalOperationStatistics:
+    """Timings aggregated for a GDAL operation.
+
+    An operation takes the time until the next GDAL message from the same
+    thread. Gaps longer than ``GdalTracer.MAX_OPERATION_TIME`` are idle
+    time between operations and are not counted.
+
+    :param driver: Debug category, usually a driver name.
+    :type driver: str
+    :param operation: Message text with numbers, quoted strings and paths
+        replaced by placeholders.
+    :type operation: str
+    :param calls: Number of messages.
+    :type calls: int
+    :param total_time: Accumulated time in seconds.
+    :type total_time: float
+    :param max_time: Longest time in seconds.
+    :type max_time: float
+    """
+
+    driver: str
+    operation: str
+    calls: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+
+
+def operation_name(message: str) -> str:
+    """Return a message with variable parts replaced by placeholders.
+
+    :param message: GDAL message text.
+    :type message: str
+    :returns: Message usable as an aggregation key.
+    :rtype: str
+    """
+    message = QUOTED_PATTERN.sub("'…'", message.strip())
+    message = PATH_PATTERN.sub("<path>", message)
+    return NUMBER_PATTERN.sub("#", message)[:120]
+
+
+class GdalTracer(QObject):
+    """Routes GDAL debug output to the DevTools log and times operations.
+
+    While started, ``CPL_DEBUG`` and ``CPL_TIMESTAMP`` are enabled and a
+    Python error handler is pushed on top of the GDAL handler stack. The
+    handler only parses the message and updates statistics under a lock.
+    Logging happens in the thread owning the tracer through a queued
+    signal.
+
+    Only the thread that called :meth:`start`, normally the main thread,
+    is traced. GDAL handler stacks are thread local, and the process-wide
+    handler installed by QGIS is never replaced, so map render threads
+    and tasks keep reporting to QGIS and their GDAL work is missing from
+    the statistics.
+    """
+
+    message_received = pyqtSignal(object)
+    """Signal emitted with a :class:`GdalMessage` from any thread."""
+
+    CONFIG_OPTIONS = (
+        ("CPL_DEBUG", "ON"),
+        ("CPL_TIMESTAMP", "ON"),
+        ("CPL_CURL_VERBOSE", "NO"),
+    )
+    MAX_OPERATION_TIME = 1.0
+    """Longest gap between messages in seconds counted as an operation."""
+
+    __lock: threading.Lock
+    __statistics: Dict[OperationKey, GdalOperationStatistics]
+    __pending: Dict[int, Tuple[OperationKey, float]]
+    __saved_options: Dict[str, Optional[str]]
+    __is_running: bool
+    __handler_thread: Optional[int]
+    __log_messages: bool
+
+    def __init__(
+        self, parent: Optional[QObject] = None, *, log_messages: bool = True
+    ) -> None:
+        """Initialize GdalTracer instance.
+
+        :param parent: Parent QObject.
+        :type parent: Optional[QObject]
+        :param log_messages: Whether to write every message to the log.
+        :type log_messages: bool
+        """
+        super().__init__(parent)
+        self.__lock = threading.Lock()
+        self.__statistics = {}
+        self.__pending = {}
+        self.__saved_options = {}
+        self.__is_running = False
+        self.__handler_thread = None
+        self.__log_messages = log_messages
+        self.message_received.connect(self.__on_message_received)
+
+    @property
+    def is_running(self) -> bool:
+        """Check whether GDAL messages are traced.
+
+        :returns: True if the error handler is installed.
+        :rtype: bool
+        """
+        return self.__is_running
+
+    def start(self) -> None:
+        """Enable GDAL debug output and push the error handler.
+
+        The handler is thread local, :meth:`stop` must be called from the
+        same thread.
+        """
+        if self.__is_running:
+            return
+
+        for key, value in self.CONFIG_OPTIONS:
+            self.__saved_options[key] = gdal.GetConfigOption(key)
+            gdal.SetConfigOption(key, value)
+
+        # Replacing the global handler with SetErrorHandler would drop the
+        # handler QGIS installed, and it can't be restored from Python
+        gdal.PushErrorHandler(self.__handle)
+        self.__handler_thread = threading.get_ident()
+        self.__is_running = True
+        logger.debug("GDAL tracing started")
+
+    def stop(self) -> None:
+        """Restore GDAL configuration and pop the error handler."""
+        if not self.__is_running:
+            return
+
+        if self.__handler_thread == threading.get_ident():
+            gdal.PopErrorHandler()
+        else:
+            logger.warning(
+                "GDAL tracing was stopped from another thread, the error "
+                "handler stays installed in the starting thread"
+            )
+        self.__handler_thread = None
+        for key, value in self.__saved_options.items():
+            gdal.SetConfigOption(key, value)
+        self.__saved_options = {}
+        self.__is_running = False
+
+        with self.__lock:
+            self.__pending = {}
+        logger.debug("GDAL tracing stopped")
+
+        if self.__statistics:
+            logger.info(self.report())
+
+    def reset(self) -> None:
+        """Forget collected statistics."""
+        with self.__lock:
+            self.__statistics = {}
+            self.__pending = {}
+
+    def slowest(self, limit: int = 10) -> List[GdalOperationStatistics]:
+        """Return operations ranked by total time.
+
+        :param limit: Maximum number of operations.
+        :type limit: int
+        :returns: Operation statistics, slowest first.
+        :rtype: List[GdalOperationStatistics]
+        """
+        with self.__lock:
+            result = [
+                GdalOperationStatistics(
+                    item.driver,
+                    item.operation,
+                    item.calls,
+                    item.total_time,
+                    item.max_time,
+                )
+                for item in self.__statistics.values()
+            ]
+        result.sort(key=lambda item: item.total_time, reverse=True)
+        return result[:limit]
+
+    def report(self, limit: int = 10) -> str:
+        """Return the slowest GDAL operations summary.
+
+        :param limit: Maximum number of rows.
+        :type limit: int
+        :returns: Multiline report text.
+        :rtype: str
+        """
+        lines = [
+            "Slowest GDAL operations (main thread only):",
+            f"{'calls':>8} {'total ms':>10} {'max ms':>9}  driver: operation",
+        ]
+        lines.extend(
+            f"{item.calls:>8} {item.total_time * 1000:>10.1f} "
+            f"{item.max_time * 1000:>9.1f}  {item.driver}: {item.operation}"
+            for item in self.slowest(limit)
+        )
+        return "\n".join(lines)
+
+    def __handle(self, level: int, code: int, text: str) -> None:
+        # Called by GDAL in any thread, must not touch Qt objects directly
+        match = MESSAGE_PATTERN.match(text or "")
+        if match is None or level != gdal.CE_Debug:
+            driver, message = "GDAL", text or ""
+        else:
+            driver = match.group("driver").strip()
+            message = match.group("message")
+
+        # The handler runs synchronously, so the local clock is used for
+        # all messages instead of the CPL_TIMESTAMP prefix of debug ones
+        now = time.monotonic()
+        thread = threading.current_thread()
+        key = (driver, operation_name(message))
+        with self.__lock:
+            previous = self.__pending.get(thread.ident)
+            self.__pending[thread.ident] = (key, now)
+            if previous is not None:
+                self.__account(*previous, now)
+
+        self.message_received.emit(
+            GdalMessage(level, code, driver, message.strip(), thread.name)
+        )
+
+    def __account(
+        self, key: OperationKey, started: float, finished: float
+    ) -> None:
+        duration = max(finished - started, 0.0)
+        if duration > self.MAX_OPERATION_TIME:
+            # The thread was idle or busy outside GDAL
+            return
+
+        statistics = self.__statistics.get(key)
+        if statistics is None:
+            statistics = GdalOperationStatistics(*key)
+            self.__statistics[key] = statistics
+
+        statistics.calls += 1
+        statistics.total_time += duration
+        statistics.max_time = max(statistics.max_time, duration)
+
+    @pyqtSlot(object)
+    def __on_message_received(self, message: GdalMessage) -> None:
+        if message.level >= gdal.CE_Failure:
+            logger.error(f"GDAL error {message.code}: {message}")
+        elif message.level == gdal.CE_Warning:
+            logger.warning(f"GDAL: {message}")
+        elif self.__log_messages:
+            logger.debug(f"GDAL: {message}")
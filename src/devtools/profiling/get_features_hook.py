@@ -0,0 +1,151 @@
+# QGIS DevTools Plugin
+# Copyright (C) 2025  NextGIS
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or any
+# later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+import functools
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from qgis.core import (
+    QgsExpression,
+    QgsFeatureIterator,
+    QgsFeatureRequest,
+    QgsRectangle,
+    QgsVectorLayer,
+)
+
+from devtools.core.logging import logger
+
+GetFeaturesListener = Callable[
+    [QgsVectorLayer, QgsFeatureRequest, QgsFeatureIterator],
+    QgsFeatureIterator,
+]
+"""Callback receiving the layer, the effective request and the iterator.
+
+The returned object is given to the caller instead of the iterator, so a
+listener may wrap it.
+"""
+
+
+def feature_request(
+    args: Tuple[Any, ...], kwargs: Dict[str, Any]
+) -> QgsFeatureRequest:
+    """Build the request equivalent to ``getFeatures`` arguments.
+
+    :param args: Positional ``getFeatures`` arguments.
+    :type args: Tuple[Any, ...]
+    :param kwargs: Keyword ``getFeatures`` arguments.
+    :type kwargs: Dict[str, Any]
+    :returns: Feature request used by the call.
+    :rtype: QgsFeatureRequest
+    """
+    argument = args[0] if args else next(iter(kwargs.values()), None)
+    if argument is None:
+        return QgsFeatureRequest()
+    if isinstance(argument, QgsFeatureRequest):
+        return argument
+    if isinstance(argument, str):
+        return QgsFeatureRequest(QgsExpression(argument))
+    if isinstance(argument, (QgsExpression, QgsRectangle, int)):
+        return QgsFeatureRequest(argument)
+    return QgsFeatureRequest().setFilterFids(list(argument))
+
+
+class GetFeaturesHook:
+    """Dispatches Python calls of ``QgsVectorLayer.getFeatures``.
+
+    The method is replaced on the class while at least one listener is
+    registered. Calls made from C++ code are not intercepted.
+    """
+
+    __listeners: List[GetFeaturesListener]
+    __original: Optional[Callable[..., QgsFeatureIterator]]
+
+    def __init__(self) -> None:
+        """Initialize GetFeaturesHook instance."""
+        self.__listeners = []
+        self.__original = None
+
+    @property
+    def original(self) -> Callable[..., QgsFeatureIterator]:
+        """Return the not instrumented ``getFeatures`` method.
+
+        :returns: Original unbound method.
+        :rtype: Callable[..., QgsFeatureIterator]
+        """
+        if self.__original is not None:
+            return self.__original
+        return QgsVectorLayer.getFeatures
+
+    def add_listener(self, listener: GetFeaturesListener) -> None:
+        """Register a listener and install the hook if needed.
+
+        :param listener: Listener to add.
+        :type listener: GetFeaturesListener
+        """
+        if listener in self.__listeners:
+            return
+        self.__listeners.append(listener)
+        if self.__original is None:
+            self.__install()
+
+    def remove_listener(self, listener: GetFeaturesListener) -> None:
+        """Unregister a listener and remove the hook if it was the last.
+
+        :param listener: Listener to remove.
+        :type listener: GetFeaturesListener
+        """
+        if listener not in self.__listeners:
+            return
+        self.__listeners.remove(listener)
+        if not self.__listeners:
+            self.__uninstall()
+
+    def __install(self) -> None:
+        original = QgsVectorLayer.getFeatures
+        listeners = self.__listeners
+
+        @functools.wraps(original)
+        def get_features(
+            layer: QgsVectorLayer,
+            *args: Any,  # noqa: ANN401
+            **kwargs: Any,  # noqa: ANN401
+        ) -> QgsFeatureIterator:
+            iterator = original(layer, *args, **kwargs)
+            if not listeners:
+                return iterator
+
+            try:
+                request = feature_request(args, kwargs)
+                for listener in list(listeners):
+                    iterator = listener(layer, request, iterator)
+            except Exception:
+                logger.exception("getFeatures listener failed")
+            return iterator
+
+        self.__original = original
+        QgsVectorLayer.getFeatures = get_features
+        logger.debug("getFeatures hook installed")
+
+    def __uninstall(self) -> None:
+        if self.__original is None:
+            return
+        QgsVectorLayer.getFeatures = self.__original
+        self.__original = None
+        logger.debug("getFeatures hook removed")
+
+
+get_features_hook = GetFeaturesHook()
+"""Shared hook used by all DevTools feature request tools."""
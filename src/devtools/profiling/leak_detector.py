@@ -0,0 +1,549 @@
+# QGIS DevTools Plugin
+# Copyright (C) 2025  NextGIS
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or any
+# later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+import functools
+import gc
+import time
+import types
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from qgis import utils as qgis_utils
+from qgis.PyQt import sip
+from qgis.PyQt.QtCore import (
+    QCoreApplication,
+    QEvent,
+    QObject,
+    QTimer,
+    pyqtSignal,
+)
+
+from devtools.core.constants import PACKAGE_NAME
+from devtools.core.logging import logger
+
+ObjectKey = Tuple[int, int]
+"""Identity of a live wrapper: ``(id(object), id(type(object)))``."""
+
+UNKNOWN_OWNER = ""
+
+
+@dataclass
+class QObjectSnapshot:
+    """Live sip-wrapped QObjects at a moment in time.
+
+    :param counts: Number of objects per ``(owner plugin, class name)``.
+    :type counts: Counter
+    :param keys: Identities of all live wrappers.
+    :type keys: Set[ObjectKey]
+    :param elapsed: Time spent to take the snapshot, in seconds.
+    :type elapsed: float
+    """
+
+    counts: "Counter[Tuple[str, str]]"
+    keys: Set[ObjectKey]
+    elapsed: float
+
+    def count_by_class(self, owner: Optional[str] = None) -> "Counter[str]":
+        """Return object counts grouped by class name.
+
+        :param owner: Restrict counts to the given owner plugin.
+        :type owner: Optional[str]
+        :returns: Number of objects per class name.
+        :rtype: Counter[str]
+        """
+        result: Counter[str] = Counter()
+        for (object_owner, class_name), count in self.counts.items():
+            if owner is not None and object_owner != owner:
+                continue
+            result[class_name] += count
+        return result
+
+
+@dataclass
+class LeakedObject:
+    """QObject wrapper which survived the unload of its plugin.
+
+    :param class_name: Qualified class name of the object.
+    :type class_name: str
+    :param object_name: Value of ``QObject.objectName()``.
+    :type object_name: str
+    :param is_deleted: True if the C++ object is already deleted and only
+        the Python wrapper is kept alive.
+    :type is_deleted: bool
+    :param parent_chain: Descriptions of the parents, nearest first.
+    :type parent_chain: List[str]
+    :param referrers: Descriptions of Python objects referring to it.
+    :type referrers: List[str]
+    """
+
+    class_name: str
+    object_name: str
+    is_deleted: bool
+    parent_chain: List[str] = field(default_factory=list)
+    referrers: List[str] = field(default_factory=list)
+
+    def __str__(self) -> str:
+        """Return a multiline human readable description."""
+        title = self.class_name
+        if self.object_name:
+            title += f' "{self.object_name}"'
+        if self.is_deleted:
+            title += " (C++ object deleted, wrapper alive)"
+
+        lines = [title]
+        if self.parent_chain:
+            lines.append("    parents: " + " → ".join(self.parent_chain))
+        lines.extend(f"    referred by: {item}" for item in self.referrers)
+        return "\n".join(lines)
+
+
+@dataclass
+class LeakReport:
+    """Result of comparing snapshots taken around a plugin lifetime.
+
+    :param plugin_name: Package name of the checked plugin.
+    :type plugin_name: str
+    :param before: Snapshot taken before the plugin was started.
+    :type before: QObjectSnapshot
+    :param after: Snapshot taken after the plugin was unloaded.
+    :type after: QObjectSnapshot
+    :param survivors: Detailed descriptions of leaked objects.
+    :type survivors: List[LeakedObject]
+    :param survivor_counts: Number of leaked objects per class name.
+    :type survivor_counts: Counter[str]
+    :param unattributed_counts: Number of new objects per class name which
+        could not be attributed to any plugin.
+    :type unattributed_counts: Counter[str]
+    """
+
+    plugin_name: str
+    before: QObjectSnapshot
+    after: QObjectSnapshot
+    survivors: List[LeakedObject]
+    survivor_counts: "Counter[str]"
+    unattributed_counts: "Counter[str]"
+
+    @property
+    def has_leaks(self) -> bool:
+        """Check whether any object owned by the plugin survived.
+
+        :returns: True if leaked objects were found.
+        :rtype: bool
+        """
+        return sum(self.survivor_counts.values()) > 0
+
+    def summary(self) -> str:
+        """Return a human readable report.
+
+        :returns: Multiline report text.
+        :rtype: str
+        """
+        total = sum(self.survivor_counts.values())
+        lines = [
+            f'Plugin "{self.plugin_name}": {total} QObject(s) survived unload'
+        ]
+        lines.extend(
+            f"  {count:>6} × {class_name}"
+            for class_name, count in self.survivor_counts.most_common()
+        )
+
+        unattributed = sum(self.unattributed_counts.values())
+        if unattributed > 0:
+            lines.append(
+                f"  {unattributed} new object(s) without a known owner"
+            )
+
+        lines.extend(str(survivor) for survivor in self.survivors)
+        return "\n".join(lines)
+
+
+class LeakDetector(QObject):
+    """Detects QObjects which outlive the plugin that created them.
+
+    A snapshot of all live sip wrappers is taken before a plugin is started
+    and compared with a snapshot taken after it is unloaded. Objects created
+    in between and still alive are reported together with their parent
+    chain and Python referrers.
+    """
+
+    leaks_detected = pyqtSignal(object)
+    """Signal emitted with a :class:`LeakReport` when leaks are found."""
+
+    MAX_DETAILED_SURVIVORS = 20
+    MAX_ATTRIBUTED_OBJECTS = 1000
+    MAX_REFERRERS = 5
+
+    __snapshots: Dict[str, QObjectSnapshot]
+    __original_start_plugin: Optional[Callable[[str], Any]]
+    __original_unload_plugin: Optional[Callable[[str], Any]]
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        """Initialize LeakDetector instance.
+
+        :param parent: Parent QObject.
+        :type parent: Optional[QObject]
+        """
+        super().__init__(parent)
+        self.__snapshots = {}
+        self.__original_start_plugin = None
+        self.__original_unload_plugin = None
+
+    @property
+    def is_installed(self) -> bool:
+        """Check whether plugin lifecycle hooks are installed.
+
+        :returns: True if the detector tracks plugin reloads.
+        :rtype: bool
+        """
+        return self.__original_start_plugin is not None
+
+    def install(self) -> None:
+        """Track plugin start and unload performed through ``qgis.utils``."""
+        if self.is_installed:
+            return
+
+        self.__original_start_plugin = qgis_utils.startPlugin
+        self.__original_unload_plugin = qgis_utils.unloadPlugin
+        qgis_utils.startPlugin = self.__wrap_start_plugin(
+            self.__original_start_plugin
+        )
+        qgis_utils.unloadPlugin = self.__wrap_unload_plugin(
+            self.__original_unload_plugin
+        )
+        logger.debug("Leak detector installed")
+
+    def uninstall(self) -> None:
+        """Restore original ``qgis.utils`` functions."""
+        if not self.is_installed:
+            return
+
+        qgis_utils.startPlugin = self.__original_start_plugin
+        qgis_utils.unloadPlugin = self.__original_unload_plugin
+        self.__original_start_plugin = None
+        self.__original_unload_plugin = None
+        self.__snapshots.clear()
+        logger.debug("Leak detector uninstalled")
+
+    def snapshot(self) -> QObjectSnapshot:
+        """Take a snapshot of all live sip-wrapped QObjects.
+
+        :returns: Snapshot of live objects.
+        :rtype: QObjectSnapshot
+        """
+        start = time.perf_counter()
+        plugin_names = self.__plugin_names()
+
+        counts: Counter[Tuple[str, str]] = Counter()
+        keys: Set[ObjectKey] = set()
+        for qobject in self.__live_qobjects():
+            keys.add((id(qobject), id(type(qobject))))
+            owner = self.__owner(qobject, plugin_names)
+            counts[(owner, self.__class_name(qobject))] += 1
+
+        return QObjectSnapshot(counts, keys, time.perf_counter() - start)
+
+    def compare(
+        self,
+        plugin_name: str,
+        before: QObjectSnapshot,
+        after: Optional[QObjectSnapshot] = None,
+    ) -> LeakReport:
+        """Compare a snapshot taken before plugin start with the current state.
+
+        :param plugin_name: Package name of the checked plugin.
+        :type plugin_name: str
+        :param before: Snapshot taken before the plugin was started.
+        :type before: QObjectSnapshot
+        :param after: Snapshot taken after unload. Taken now if omitted.
+        :type after: Optional[QObjectSnapshot]
+        :returns: Leak report.
+        :rtype: LeakReport
+        """
+        if after is None:
+            after = self.snapshot()
+
+        plugin_names = self.__plugin_names()
+        survivors: List[LeakedObject] = []
+        survivor_counts: Counter[str] = Counter()
+        unattributed_counts: Counter[str] = Counter()
+
+        objects = gc.get_objects()
+        candidates = [
+            candidate
+            for candidate in objects
+            if isinstance(candidate, QObject)
+        ]
+        ignored_referrers = {id(objects), id(candidates)}
+
+        new_objects: List[Tuple[QObject, str]] = []
+        unattributed: Dict[int, QObject] = {}
+        for qobject in candidates:
+            if (id(qobject), id(type(qobject))) in before.keys:
+                continue
+            owner = self.__owner(qobject, plugin_names)
+            if (
+                owner == UNKNOWN_OWNER
+                and len(unattributed) < self.MAX_ATTRIBUTED_OBJECTS
+            ):
+                unattributed[id(qobject)] = qobject
+            new_objects.append((qobject, owner))
+
+        owners = self.__owners_by_referrers(
+            objects, unattributed, plugin_names
+        )
+        del objects, candidates, unattributed
+
+        for qobject, class_owner in new_objects:
+            owner = (
+                owners.get(id(qobject), UNKNOWN_OWNER)
+                if class_owner == UNKNOWN_OWNER
+                else class_owner
+            )
+
+            class_name = self.__class_name(qobject)
+            if owner != plugin_name:
+                if owner == UNKNOWN_OWNER:
+                    unattributed_counts[class_name] += 1
+                continue
+
+            survivor_counts[class_name] += 1
+            if len(survivors) < self.MAX_DETAILED_SURVIVORS:
+                survivors.append(self.__describe(qobject, ignored_referrers))
+
+        return LeakReport(
+            plugin_name,
+            before,
+            after,
+            survivors,
+            survivor_counts,
+            unattributed_counts,
+        )
+
+    def __wrap_start_plugin(
+        self, start_plugin: Callable[[str], Any]
+    ) -> Callable[[str], Any]:
+        @functools.wraps(start_plugin)
+        def wrapper(package_name: str) -> Any:  # noqa: ANN401
+            if package_name != PACKAGE_NAME:
+                self.__snapshots[package_name] = self.snapshot()
+            return start_plugin(package_name)
+
+        return wrapper
+
+    def __wrap_unload_plugin(
+        self, unload_plugin: Callable[[str], Any]
+    ) -> Callable[[str], Any]:
+        @functools.wraps(unload_plugin)
+        def wrapper(package_name: str) -> Any:  # noqa: ANN401
+            result = unload_plugin(package_name)
+            if package_name in self.__snapshots:
+                # Let deleteLater() calls issued during unload take effect
+                QTimer.singleShot(0, lambda: self.__check(package_name))
+            return result
+
+        return wrapper
+
+    def __check(self, package_name: str) -> None:
+        before = self.__snapshots.pop(package_name, None)
+        if before is None:
+            return
+
+        QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+        gc.collect()
+
+        report = self.compare(package_name, before)
+        logger.debug(
+            f"Leak check for {package_name} took "
+            f"{(before.elapsed + report.after.elapsed) * 1000:.1f} ms"
+        )
+        if not report.has_leaks:
+            return
+
+        logger.warning(report.summary())
+        self.leaks_detected.emit(report)
+
+    def __live_qobjects(self) -> List[QObject]:
+        return [
+            candidate
+            for candidate in gc.get_objects()
+            if isinstance(candidate, QObject)
+        ]
+
+    def __plugin_names(self) -> Set[str]:
+        return set(qgis_utils.available_plugins) | set(qgis_utils.plugins)
+
+    def __class_name(self, qobject: QObject) -> str:
+        object_type = type(qobject)
+        return f"{object_type.__module__}.{object_type.__qualname__}"
+
+    def __owner(self, qobject: QObject, plugin_names: Set[str]) -> str:
+        """Find the plugin owning an object by its class or its parents."""
+        current: Optional[QObject] = qobject
+        while current is not None:
+            package = type(current).__module__.split(".", 1)[0]
+            if package in plugin_names:
+                return package
+            if sip.isdeleted(current):
+                break
+            current = current.parent()
+        return UNKNOWN_OWNER
+
+    def __owners_by_referrers(
+        self,
+        objects: List[Any],
+        targets: Dict[int, QObject],
+        plugin_names: Set[str],
+    ) -> Dict[int, str]:
+        """Find plugins owning objects by modules or instances keeping them.
+
+        Objects of plain Qt classes (e.g. ``QAction``) have no plugin in their
+        class module, but are usually stored in plugin instances or modules.
+        Instead of asking the garbage collector for referrers of every
+        object, all tracked objects are scanned twice: once for attribute
+        dicts holding the targets and once for instances owning those dicts.
+
+        :returns: Owner plugin by target object id.
+        """
+        owners: Dict[int, str] = {}
+        if not targets:
+            return owners
+
+        pending_dicts: Dict[int, List[int]] = {}
+        for candidate in objects:
+            if not isinstance(candidate, dict):
+                continue
+            held = [
+                id(value)
+                for value in candidate.values()
+                if id(value) in targets
+            ]
+            if not held:
+                continue
+
+            module_name = candidate.get("__name__")
+            if isinstance(module_name, str) and "__builtins__" in candidate:
+                self.__assign_owner(
+                    owners, held, module_name.split(".", 1)[0], plugin_names
+                )
+            else:
+                pending_dicts.setdefault(id(candidate), []).extend(held)
+
+        if not pending_dicts:
+            return owners
+
+        for candidate in objects:
+            try:
+                attributes = object.__getattribute__(candidate, "__dict__")
+            except (AttributeError, TypeError):
+                continue
+            held = pending_dicts.get(id(attributes))
+            if held is not None:
+                self.__assign_owner(
+                    owners,
+                    held,
+                    type(candidate).__module__.split(".", 1)[0],
+                    plugin_names,
+                )
+        return owners
+
+    def __assign_owner(
+        self,
+        owners: Dict[int, str],
+        target_ids: List[int],
+        package: str,
+        plugin_names: Set[str],
+    ) -> None:
+        if package not in plugin_names:
+            return
+        for target_id in target_ids:
+            owners.setdefault(target_id, package)
+
+    def __describe(
+        self, qobject: QObject, ignored_referrers: Set[int]
+    ) -> LeakedObject:
+        is_deleted = sip.isdeleted(qobject)
+        object_name = "" if is_deleted else qobject.objectName()
+
+        parent_chain: List[str] = []
+        if not is_deleted:
+            parent = qobject.parent()
+            while parent is not None and not sip.isdeleted(parent):
+                description = type(parent).__name__
+                if parent.objectName():
+                    description += f' "{parent.objectName()}"'
+                parent_chain.append(description)
+                parent = parent.parent()
+
+        return LeakedObject(
+            self.__class_name(qobject),
+            object_name,
+            is_deleted,
+            parent_chain,
+            self.__referrers(qobject, ignored_referrers),
+        )
+
+    def __referrers(
+        self, qobject: QObject, ignored_referrers: Set[int]
+    ) -> List[str]:
+        result: List[str] = []
+        for referrer in gc.get_referrers(qobject):
+            if len(result) >= self.MAX_REFERRERS:
+                break
+            if id(referrer) in ignored_referrers:
+                continue
+            if isinstance(referrer, types.FrameType):
+                if referrer.f_code.co_filename != __file__:
+                    code = referrer.f_code
+                    result.append(
+                        f"frame {code.co_name} "
+                        f"({code.co_filename}:{referrer.f_lineno})"
+                    )
+                continue
+            result.append(self.__describe_referrer(referrer, qobject))
+        return result
+
+    def __describe_referrer(self, referrer: object, target: QObject) -> str:
+        if isinstance(referrer, dict):
+            keys = [
+                str(key) for key, value in referrer.items() if value is target
+            ]
+            module_name = referrer.get("__name__")
+            if isinstance(module_name, str) and "__builtins__" in referrer:
+                owner = f"module {module_name}"
+            else:
+                owner = next(
+                    (
+                        f"{type(holder).__module__}."
+                        f"{type(holder).__qualname__} instance"
+                        for holder in gc.get_referrers(referrer)
+                        if getattr(holder, "__dict__", None) is referrer
+                    ),
+                    "dict",
+                )
+            return f"{owner} [{', '.join(keys)}]" if keys else owner
+
+        if isinstance(referrer, types.MethodType):
+            return f"bound method {referrer.__qualname__}"
+
+        if type(referrer).__name__ == "cell":
+            return "closure cell"
+
+        if isinstance(referrer, (list, tuple, set)):
+            return f"{type(referrer).__name__} of {len(referrer)} items"
+
+        return type(referrer).__qualname__
@@ -0,0 +1,359 @@
+# QGIS DevTools Plugin
+# Copyright (C) 2025  NextGIS
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or any
+# later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, List, Optional
+
+from qgis.core import (
+    QgsNetworkAccessManager,
+    QgsNetworkReplyContent,
+    QgsNetworkRequestParameters,
+)
+from qgis.PyQt import sip
+from qgis.PyQt.QtCore import QObject, QTimer, pyqtSignal, pyqtSlot
+from qgis.PyQt.QtNetwork import (
+    QNetworkAccessManager,
+    QNetworkReply,
+    QNetworkRequest,
+)
+
+from devtools.core.call_site import caller_site
+from devtools.core.logging import logger
+
+OPERATION_NAMES = {
+    QNetworkAccessManager.Operation.HeadOperation: "HEAD",
+    QNetworkAccessManager.Operation.GetOperation: "GET",
+    QNetworkAccessManager.Operation.PutOperation: "PUT",
+    QNetworkAccessManager.Operation.PostOperation: "POST",
+    QNetworkAccessManager.Operation.DeleteOperation: "DELETE",
+}
+
+
+@dataclass
+class NetworkRequestRecord:
+    """Request made through ``QgsNetworkAccessManager``.
+
+    :param request_id: QGIS network request id.
+    :type request_id: int
+    :param url: Requested URL.
+    :type url: str
+    :param operation: HTTP method.
+    :type operation: str
+    :param initiator: Plugin which created the request, or the QGIS class
+        reported by the request parameters.
+    :type initiator: str
+    :param started: Monotonic time the creation signal was handled at.
+    :type started: float
+    :param finished: Monotonic time the reply finished at.
+    :type finished: Optional[float]
+    :param bytes_received: Downloaded size in bytes.
+    :type bytes_received: int
+    :param status_code: HTTP status code.
+    :type status_code: Optional[int]
+    :param from_cache: Whether the reply came from the network cache.
+    :type from_cache: bool
+    :param error: Error message of a failed request.
+    :type error: str
+    :param timed_out: Whether the request timed out.
+    :type timed_out: bool
+    """
+
+    request_id: int
+    url: str
+    operation: str
+    initiator: str
+    started: float
+    finished: Optional[float] = None
+    bytes_received: int = 0
+    status_code: Optional[int] = None
+    from_cache: bool = False
+    error: str = ""
+    timed_out: bool = False
+
+    @property
+    def is_finished(self) -> bool:
+        """Check whether the reply finished.
+
+        :returns: True if the reply finished.
+        :rtype: bool
+        """
+        return self.finished is not None
+
+    @property
+    def latency(self) -> Optional[float]:
+        """Return the time from creation to the finished reply.
+
+        :returns: Latency in seconds or None for running requests.
+        :rtype: Optional[float]
+        """
+        if self.finished is None:
+            return None
+        return self.finished - self.started
+
+
+@dataclass(frozen=True)
+class WaterfallBar:
+    """Request position on a waterfall timeline.
+
+    :param record: Request record.
+    :type record: NetworkRequestRecord
+    :param offset: Start time relative to the first request in seconds.
+    :type offset: float
+    :param duration: Latency, or the elapsed time of running requests.
+    :type duration: float
+    """
+
+    record: NetworkRequestRecord
+    offset: float
+    duration: float
+
+
+class NetworkProfiler(QObject):
+    """Records requests made through ``QgsNetworkAccessManager``.
+
+    Requests created by Python code in the main thread are attributed to
+    the calling plugin. Requests from worker threads keep the initiator
+    class reported by QGIS.
+
+    Creation signals of worker thread requests are delivered to the main
+    thread through its event loop. Their start time is taken late, so
+    their latency is underestimated while the main thread is busy.
+    """
+
+    requests_changed = pyqtSignal()
+    """Signal emitted at most every ``NOTIFY_INTERVAL_MS`` after changes."""
+
+    MAX_REQUESTS = 10000
+    NOTIFY_INTERVAL_MS = 250
+
+    __records: Deque[NetworkRequestRecord]
+    __by_id: Dict[int, NetworkRequestRecord]
+    __notify_timer: QTimer
+    __is_running: bool
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        """Initialize NetworkProfiler instance.
+
+        :param parent: Parent QObject.
+        :type parent: Optional[QObject]
+        """
+        super().__init__(parent)
+        self.__is_running = False
+        self.__notify_timer = QTimer(self)
+        self.__notify_timer.setSingleShot(True)
+        self.__notify_timer.setInterval(self.NOTIFY_INTERVAL_MS)
+        self.__notify_timer.timeout.connect(self.requests_changed)
+        self.reset()
+
+    @property
+    def is_running(self) -> bool:
+        """Check whether requests are recorded.
+
+        :returns: True if the profiler is running.
+        :rtype: bool
+        """
+        return self.__is_running
+
+    def start(self) -> None:
+        """Start recording network requests."""
+        if self.__is_running:
+            return
+
+        # The signals also have deprecated overloads and finished() is
+        # inherited from QNetworkAccessManager with a QNetworkReply argument
+        manager = QgsNetworkAccessManager.instance()
+        manager.requestAboutToBeCreated[QgsNetworkRequestParameters].connect(
+            self.__on_request_created
+        )
+        manager.downloadProgress.connect(self.__on_download_progress)
+        manager.finished[QgsNetworkReplyContent].connect(self.__on_finished)
+        manager.requestTimedOut[QgsNetworkRequestParameters].connect(
+            self.__on_timed_out
+        )
+        self.__is_running = True
+        logger.debug("Network profiler started")
+
+    def stop(self) -> None:
+        """Stop recording and log the report."""
+        if not self.__is_running:
+            return
+
+        manager = QgsNetworkAccessManager.instance()
+        manager.requestAboutToBeCreated[
+            QgsNetworkRequestParameters
+        ].disconnect(self.__on_request_created)
+        manager.downloadProgress.disconnect(self.__on_download_progress)
+        manager.finished[QgsNetworkReplyContent].disconnect(self.__on_finished)
+        manager.requestTimedOut[QgsNetworkRequestParameters].disconnect(
+            self.__on_timed_out
+        )
+        self.__is_running = False
+        logger.debug("Network profiler stopped")
+
+        if self.__records:
+            logger.info(self.report())
+
+    def reset(self) -> None:
+        """Forget recorded requests."""
+        self.__records = deque()
+        self.__by_id = {}
+        self.requests_changed.emit()
+
+    def records(self) -> List[NetworkRequestRecord]:
+        """Return recorded requests in creation order.
+
+        :returns: Request records.
+        :rtype: List[NetworkRequestRecord]
+        """
+        return list(self.__records)
+
+    def waterfall(self) -> List[WaterfallBar]:
+        """Return requests placed on a common timeline.
+
+        :returns: Bars in creation order.
+        :rtype: List[WaterfallBar]
+        """
+        if not self.__records:
+            return []
+
+        now = time.monotonic()
+        origin = self.__records[0].started
+        return [
+            WaterfallBar(
+                record,
+                record.started - origin,
+                (record.finished or now) - record.started,
+            )
+            for record in self.__records
+        ]
+
+    def report(self, limit: int = 10) -> str:
+        """Return request totals per initiator and the slowest requests.
+
+        :param limit: Maximum number of slowest requests.
+        :type limit: int
+        :returns: Multiline report text.
+        :rtype: str
+        """
+        finished = [record for record in self.__records if record.finished]
+        cached = sum(1 for record in finished if record.from_cache)
+        summary = (
+            f"Network requests: {len(self.__records)}, "
+            f"finished {len(finished)}, from cache {cached}"
+        )
+        lines = [summary]
+
+        initiators: Dict[str, List[NetworkRequestRecord]] = {}
+        for record in finished:
+            initiators.setdefault(record.initiator, []).append(record)
+        for initiator, records in sorted(
+            initiators.items(), key=lambda item: -len(item[1])
+        ):
+            latency = sum(record.latency or 0.0 for record in records)
+            size = sum(record.bytes_received for record in records)
+            lines.append(
+                f"  {initiator}: {len(records)} request(s), "
+                f"mean {latency / len(records) * 1000:.0f} ms, "
+                f"{size / 1024:.0f} KiB"
+            )
+
+        slowest = sorted(
+            finished, key=lambda record: record.latency or 0.0, reverse=True
+        )
+        lines.extend(
+            f"  {(record.latency or 0.0) * 1000:>8.0f} ms  "
+            f"{record.operation} {record.url}"
+            for record in slowest[:limit]
+        )
+        return "\n".join(lines)
+
+    @pyqtSlot(QgsNetworkRequestParameters)
+    def __on_request_created(
+        self, parameters: QgsNetworkRequestParameters
+    ) -> None:
+        # Python frames above the slot belong to the code creating the
+        # request only for requests made in the main thread
+        plugin = (
+            caller_site(depth=1).plugin
+            if self.__is_own_thread(parameters.originatingThreadId())
+            else None
+        )
+        record = NetworkRequestRecord(
+            request_id=parameters.requestId(),
+            url=parameters.request().url().toString(),
+            operation=OPERATION_NAMES.get(parameters.operation(), "CUSTOM"),
+            initiator=plugin or parameters.initiatorClassName() or "QGIS",
+            started=time.monotonic(),
+        )
+
+        if len(self.__records) >= self.MAX_REQUESTS:
+            oldest = self.__records.popleft()
+            self.__by_id.pop(oldest.request_id, None)
+        self.__records.append(record)
+        self.__by_id[record.request_id] = record
+        self.__notify()
+
+    @pyqtSlot(int, "qint64", "qint64")
+    def __on_download_progress(
+        self, request_id: int, received: int, _total: int
+    ) -> None:
+        record = self.__by_id.get(request_id)
+        if record is not None:
+            record.bytes_received = max(record.bytes_received, received)
+
+    @pyqtSlot(QgsNetworkReplyContent)
+    def __on_finished(self, reply: QgsNetworkReplyContent) -> None:
+        record = self.__by_id.get(reply.requestId())
+        if record is None:
+            return
+
+        record.finished = time.monotonic()
+        status_code = reply.attribute(
+            QNetworkRequest.Attribute.HttpStatusCodeAttribute
+        )
+        record.status_code = int(status_code) if status_code else None
+        record.from_cache = bool(
+            reply.attribute(
+                QNetworkRequest.Attribute.SourceIsFromCacheAttribute
+            )
+        )
+        content_length = bytes(reply.rawHeader(b"Content-Length"))
+        if not record.bytes_received and content_length.isdigit():
+            record.bytes_received = int(content_length)
+        if reply.error() != QNetworkReply.NetworkError.NoError:
+            record.error = reply.errorString()
+        self.__notify()
+
+    @pyqtSlot(QgsNetworkRequestParameters)
+    def __on_timed_out(self, parameters: QgsNetworkRequestParameters) -> None:
+        record = self.__by_id.get(parameters.requestId())
+        if record is not None:
+            record.timed_out = True
+            self.__notify()
+
+    def __notify(self) -> None:
+        if not self.__notify_timer.isActive():
+            self.__notify_timer.start()
+
+    def __is_own_thread(self, thread_id: str) -> bool:
+        # QGIS formats the address of the originating QThread as hex
+        try:
+            return int(thread_id, 16) == sip.unwrapinstance(self.thread())
+        except ValueError:
+            return False
@@ -0,0 +1,461 @@
+# QGIS DevTools Plugin
+# Copyright (C) 2025  NextGIS
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or any
+# later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, see <https://www.gnu.org/licenses/>.
+
+import time
+from typing import TYPE_CHECKING, Optional
+
+from qgis.core import Qgis
+from qgis.PyQt.QtCore import QObject, Qt, pyqtSlot
+from qgis.PyQt.QtWidgets import QAction, QPushButton
+from qgis.utils import iface
+
+from devtools.core.constants import MENU_NAME
+from devtools.core.logging import logger
+from devtools.profiling.edit_profiler import EditProfiler
+from devtools.profiling.freeze_watchdog import FreezeWatchdog, Stall
+from devtools.profiling.gdal_tracer import GdalTracer
+from devtools.profiling.leak_detector import LeakDetector, LeakReport
+from devtools.profiling.network_profiler import NetworkProfiler
+from devtools.profiling.profiling_settings import ProfilingSettings
+from devtools.profiling.query_log import QueryLogRecorder
+from devtools.profiling.render_profiler import RenderProfiler
+from devtools.profiling.request_advisor import RequestAdvisor
+from devtools.profiling.signal_profiler import SignalProfiler
+from devtools.profiling.ui.network_profiler_dock import NetworkProfilerDock
+from devtools.profiling.ui.profiling_settings_page import (
+    ProfilingSettingsPageFactory,
+)
+from devtools.profiling.ui.render_profiler_dock import RenderProfilerDock
+from devtools.profiling.ui.signal_profiler_dialog import SignalProfilerDialog
+
+if TYPE_CHECKING:
+    from qgis.gui import QgisInterface
+
+    from devtools.devtools_interface import DevToolsInterface
+
+    assert isinstance(iface, QgisInterface)
+
+
+class ProfilingManager(QObject):
+    """Profiling manager for QGIS DevTools.
+
+    Owns the profiling and diagnostics tools and applies profiling
+    settings to them.
+    """
+
+    STALL_NOTIFICATION_THRESHOLD = 1.0  # s
+    STALL_NOTIFICATION_INTERVAL = 60.0  # s
+
+    __leak_detector: Optional[LeakDetector]
+    __freeze_watchdog: Optional[FreezeWatchdog]
+    __signal_profiler: Optional[SignalProfiler]
+    __signal_profiler_dialog: Optional[SignalProfilerDialog]
+    __signal_profiler_action: Optional[QAction]  # type: ignore reportInvalidTypeForm
+    __render_profiler: Optional[RenderProfiler]
+    __render_profiler_dock: Optional[RenderProfilerDock]
+    __render_profiler_action: Optional[QAction]  # type: ignore reportInvalidTypeForm
+    __request_advisor: Optional[RequestAdvisor]
+    __edit_profiler: Optional[EditProfiler]
+    __gdal_tracer: Optional[GdalTracer]
+    __query_log_recorder: Optional[QueryLogRecorder]
+    __network_profiler: Optional[NetworkProfiler]
+    __network_profiler_dock: Optional[NetworkProfilerDock]
+    __network_profiler_action: Optional[QAction]  # type: ignore reportInvalidTypeForm
+    __last_stall_notification: float
+    __settings_page_factory: Optional[ProfilingSettingsPageFactory]
+
+    def __init__(self, parent: "DevToolsInterface") -> None:
+        """Initialize ProfilingManager instance.
+
+        :param parent: Plugin interface instance.
+        :type parent: DevToolsInterface
+        """
+        super().__init__(parent)
+        self._plugin = parent
+        self.__leak_detector = None
+        self.__freeze_watchdog = None
+        self.__signal_profiler = None
+        self.__signal_profiler_dialog = None
+        self.__signal_profiler_action = None
+        self.__render_profiler = None
+        self.__render_profiler_dock = None
+        self.__render_profiler_action = None
+        self.__request_advisor = None
+        self.__edit_profiler = None
+        self.__gdal_tracer = None
+        self.__query_log_recorder = None
+        self.__network_profiler = None
+        self.__network_profiler_dock = None
+        self.__network_profiler_action = None
+        self.__last_stall_notification = 0.0
+        self.__settings_page_factory = None
+
+    @property
+    def leaks(self) -> LeakDetector:
+        """Return the QObject leak detector.
+
+        :returns: Leak detector instance.
+        :rtype: LeakDetector
+        :raises AssertionError: If the manager is not loaded.
+        """
+        assert self.__leak_detector is not None, (
+            "Profiling manager is not loaded"
+        )
+        return self.__leak_detector
+
+    @property
+    def watchdog(self) -> FreezeWatchdog:
+        """Return the UI freeze watchdog.
+
+        :returns: Freeze watchdog instance.
+        :rtype: FreezeWatchdog
+        :raises AssertionError: If the manager is not loaded.
+        """
+        assert self.__freeze_watchdog is not None, (
+            "Profiling manager is not loaded"
+        )
+        return self.__freeze_watchdog
+
+    @property
+    def signals(self) -> SignalProfiler:
+        """Return the signal handler profiler.
+
+        :returns: Signal profiler instance.
+        :rtype: SignalProfiler
+        :raises AssertionError: If the manager is not loaded.
+        """
+        assert self.__signal_profiler is not None, (
+            "Profiling manager is not loaded"
+        )
+        return self.__signal_profiler
+
+    @property
+    def rendering(self) -> RenderProfiler:
+        """Return the map canvas render profiler.
+
+        :returns: Render profiler instance.
+        :rtype: RenderProfiler
+        :raises AssertionError: If the manager is not loaded.
+        """
+        assert self.__render_profiler is not None, (
+            "Profiling manager is not loaded"
+        )
+        return self.__render_profiler
+
+    @property
+    def requests(self) -> RequestAdvisor:
+        """Return the feature request over-fetching advisor.
+
+        :returns: Request advisor instance.
+        :rtype: RequestAdvisor
+        :raises AssertionError: If the manager is not loaded.
+        """
+        assert self.__request_advisor is not None, (
+            "Profiling manager is not loaded"
+        )
+        return self.__request_advisor
+
+    @property
+    def edits(self) -> EditProfiler:
+        """Return the vector layer editing profiler.
+
+        :returns: Edit profiler instance.
+        :rtype: EditProfiler
+        :raises AssertionError: If the manager is not loaded.
+        """
+        assert self.__edit_profiler is not None, (
+            "Profiling manager is not loaded"
+        )
+        return self.__edit_profiler
+
+    @property
+    def gdal(self) -> GdalTracer:
+        """Return the GDAL call tracer.
+
+        :returns: GDAL tracer instance.
+        :rtype: GdalTracer
+        :raises AssertionError: If the manager is not loaded.
+        """
+        assert self.__gdal_tracer is not None, (
+            "Profiling manager is not loaded"
+        )
+        return self.__gdal_tracer
+
+    @property
+    def queries(self) -> QueryLogRecorder:
+        """Return the provider SQL query log recorder.
+
+        :returns: Query log recorder instance.
+        :rtype: QueryLogRecorder
+        :raises AssertionError: If the manager is not loaded.
+        """
+        assert self.__query_log_recorder is not None, (
+            "Profiling manager is not loaded"
+        )
+        return self.__query_log_recorder
+
+    @property
+    def network(self) -> NetworkProfiler:
+        """Return the network request profiler.
+
+        :returns: Network profiler instance.
+        :rtype: NetworkProfiler
+        :raises AssertionError: If the manager is not loaded.
+        """
+        assert self.__network_profiler is not None, (
+            "Profiling manager is not loaded"
+        )
+        return self.__network_profiler
+
+    def load(self) -> None:
+        """Create profiling tools and register the settings page."""
+        self.__leak_detector = LeakDetector(self)
+        self.__leak_detector.leaks_detected.connect(self.__on_leaks_detected)
+
+        self.__freeze_watchdog = FreezeWatchdog(self)
+        self.__freeze_watchdog.stall_detected.connect(self.__on_stall_detected)
+
+        self.__load_signal_profiler()
+        self.__load_render_profiler()
+        self.__load_network_profiler()
+
+        self.__request_advisor = RequestAdvisor(self)
+        self.__edit_profiler = EditProfiler(self)
+        self.__gdal_tracer = GdalTracer(self)
+        self.__query_log_recorder = QueryLogRecorder(self)
+
+        self.__settings_page_factory = ProfilingSettingsPageFactory()
+        iface.registerOptionsWidgetFactory(self.__settings_page_factory)
+
+        self._plugin.settings_changed.connect(self.__apply_settings)
+        self.__apply_settings()
+
+    def unload(self) -> None:
+        """Stop profiling tools and unregister the settings page."""
+        self._plugin.settings_changed.disconnect(self.__apply_settings)
+
+        if self.__settings_page_factory is not None:
+            iface.unregisterOptionsWidgetFactory(self.__settings_page_factory)
+            self.__settings_page_factory.deleteLater()
+            self.__settings_page_factory = None
+
+        if self.__query_log_recorder is not None:
+            self.__query_log_recorder.stop()
+            self.__query_log_recorder.deleteLater()
+            self.__query_log_recorder = None
+
+        if self.__gdal_tracer is not None:
+            self.__gdal_tracer.stop()
+            self.__gdal_tracer.deleteLater()
+            self.__gdal_tracer = None
+
+        if self.__edit_profiler is not None:
+            self.__edit_profiler.stop()
+            self.__edit_profiler.deleteLater()
+            self.__edit_profiler = None
+
+        if self.__request_advisor is not None:
+            self.__request_advisor.stop()
+            self.__request_advisor.deleteLater()
+            self.__request_advisor = None
+
+        self.__unload_network_profiler()
+        self.__unload_render_profiler()
+        self.__unload_signal_profiler()
+
+        if self.__freeze_watchdog is not None:
+            self.__freeze_watchdog.stop()
+            self.__freeze_watchdog.deleteLater()
+            self.__freeze_watchdog = None
+
+        if self.__leak_detector is not None:
+            self.__leak_detector.uninstall()
+            self.__leak_detector.deleteLater()
+            self.__leak_detector = None
+
+    def __load_signal_profiler(self) -> None:
+        self.__signal_profiler = SignalProfiler(self)
+        self.__signal_profiler_action = QAction(
+            text=self.tr("Signal Profiler…")
+        )
+        self.__signal_profiler_action.triggered.connect(
+            self.__show_signal_profiler
+        )
+        iface.addPluginToMenu(MENU_NAME, self.__signal_profiler_action)
+
+    def __unload_signal_profiler(self) -> None:
+        if self.__signal_profiler_action is not None:
+            iface.removePluginMenu(MENU_NAME, self.__signal_profiler_action)
+            self.__signal_profiler_action.deleteLater()
+            self.__signal_profiler_action = None
+
+        if self.__signal_profiler_dialog is not None:
+            self.__signal_profiler_dialog.close()
+            self.__signal_profiler_dialog.deleteLater()
+            self.__signal_profiler_dialog = None
+
+        if self.__signal_profiler is not None:
+            self.__signal_profiler.restore()
+            self.__signal_profiler.deleteLater()
+            self.__signal_profiler = None
+
+    def __load_render_profiler(self) -> None:
+        self.__render_profiler = RenderProfiler(self)
+        self.__render_profiler_action = QAction(
+            text=self.tr("Render Profiler")
+        )
+        self.__render_profiler_action.triggered.connect(
+            self.__show_render_profiler
+        )
+        iface.addPluginToMenu(MENU_NAME, self.__render_profiler_action)
+
+    def __unload_render_profiler(self) -> None:
+        if self.__render_profiler_action is not None:
+            iface.removePluginMenu(MENU_NAME, self.__render_profiler_action)
+            self.__render_profiler_action.deleteLater()
+            self.__render_profiler_action = None
+
+        if self.__render_profiler_dock is not None:
+            iface.removeDockWidget(self.__render_profiler_dock)
+            self.__render_profiler_dock.deleteLater()
+            self.__render_profiler_dock = None
+
+        if self.__render_profiler is not None:
+            self.__render_profiler.stop()
+            self.__render_profiler.cancel()
+            self.__render_profiler.deleteLater()
+            self.__render_profiler = None
+
+    def __load_network_profiler(self) -> None:
+        self.__network_profiler = NetworkProfiler(self)
+        self.__network_profiler_action = QAction(
+            text=self.tr("Network Profiler")
+        )
+        self.__network_profiler_action.triggered.connect(
+            self.__show_network_profiler
+        )
+        iface.addPluginToMenu(MENU_NAME, self.__network_profiler_action)
+
+    def __unload_network_profiler(self) -> None:
+        if self.__network_profiler_action is not None:
+            iface.removePluginMenu(MENU_NAME, self.__network_profiler_action)
+            self.__network_profiler_action.deleteLater()
+            self.__network_profiler_action = None
+
+        if self.__network_profiler_dock is not None:
+            iface.removeDockWidget(self.__network_profiler_dock)
+            self.__network_profiler_dock.deleteLater()
+            self.__network_profiler_dock = None
+
+        if self.__network_profiler is not None:
+            self.__network_profiler.stop()
+            self.__network_profiler.deleteLater()
+            self.__network_profiler = None
+
+    @pyqtSlot()
+    def __apply_settings(self) -> None:
+        settings = ProfilingSettings()
+        if settings.detect_leaks_on_reload:
+            self.leaks.install()
+        else:
+            self.leaks.uninstall()
+
+        self.watchdog.threshold_ms = settings.freeze_threshold_ms
+        if settings.is_freeze_watchdog_enabled:
+            self.watchdog.start()
+        else:
+            self.watchdog.stop()
+
+        if settings.is_gdal_tracing_enabled:
+            self.gdal.start()
+        else:
+            self.gdal.stop()
+
+    @pyqtSlot()
+    def __show_signal_profiler(self) -> None:
+        if self.__signal_profiler_dialog is None:
+            self.__signal_profiler_dialog = SignalProfilerDialog(
+                self.signals, iface.mainWindow()
+            )
+        self.__signal_profiler_dialog.show()
+        self.__signal_profiler_dialog.raise_()
+        self.__signal_profiler_dialog.activateWindow()
+
+    @pyqtSlot()
+    def __show_render_profiler(self) -> None:
+        if self.__render_profiler_dock is None:
+            self.__render_profiler_dock = RenderProfilerDock(
+                self.rendering, iface.mainWindow()
+            )
+            iface.addDockWidget(
+                Qt.DockWidgetArea.RightDockWidgetArea,
+                self.__render_profiler_dock,
+            )
+        self.__render_profiler_dock.setUserVisible(True)
+        self.__render_profiler_dock.raise_()
+
+    @pyqtSlot()
+    def __show_network_profiler(self) -> None:
+        if self.__network_profiler_dock is None:
+            self.__network_profiler_dock = NetworkProfilerDock(
+                self.network, iface.mainWindow()
+            )
+            iface.addDockWidget(
+                Qt.DockWidgetArea.BottomDockWidgetArea,
+                self.__network_profiler_dock,
+            )
+        self.__network_profiler_dock.setUserVisible(True)
+        self.__network_profiler_dock.raise_()
+
+    @pyqtSlot(object)
+    def __on_leaks_detected(self, report: LeakReport) -> None:
+        count = sum(report.survivor_counts.values())
+        self._plugin.notifier.display_message(
+            self.tr(
+                '{count} Qt object(s) created by plugin "{plugin}" '
+                "survived its unload. See the log for details."
+            ).format(count=count, plugin=report.plugin_name),
+            level=Qgis.MessageLevel.Warning,
+        )
+
+    @pyqtSlot(object)
+    def __on_stall_detected(self, stall: Stall) -> None:
+        if stall.duration < self.STALL_NOTIFICATION_THRESHOLD:
+            return
+
+        now = time.monotonic()
+        if (
+            self.__last_stall_notification
+            and now - self.__last_stall_notification
+            < self.STALL_NOTIFICATION_INTERVAL
+        ):
+            return
+        self.__last_stall_notification = now
+
+        def show_report() -> None:
+            logger.warning(self.watchdog.report())
+            iface.openMessageLog()
+
+        report_button = QPushButton(self.tr("Show report"))
+        report_button.clicked.connect(show_report)
+
+        self._plugin.notifier.display_message(
+            self.tr("QGIS was not responding for {duration:.1f} s").format(
+                duration=stall.duration
+            ),
+            level=Qgis.MessageLevel.Warning,
+            widgets=[report_button],
+        )
@@ -0,0 +1,121 @@
+# QGIS DevTools Plugin
+# Copyright (C) 2025  NextGIS
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or any
+# later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+from qgis.core import QgsSettings
+
+from devtools.core.constants import PLUGIN_SETTINGS_GROUP
+
+
+class ProfilingSettings:
+    """Manage persistent profiling settings for the QGIS DevTools plugin.
+
+    This class provides accessors and mutators for profiling-related
+    settings stored in QGIS settings.
+    """
+
+    PROFILING_GROUP = f"{PLUGIN_SETTINGS_GROUP}/profiling"
+    KEY_DETECT_LEAKS = f"{PROFILING_GROUP}/detectLeaksOnReload"
+    KEY_WATCHDOG_ENABLED = f"{PROFILING_GROUP}/freezeWatchdog/enabled"
+    KEY_WATCHDOG_THRESHOLD = f"{PROFILING_GROUP}/freezeWatchdog/thresholdMs"
+    KEY_GDAL_TRACING_ENABLED = f"{PROFILING_GROUP}/gdalTracing/enabled"
+
+    def __init__(self) -> None:
+        """Initialize ProfilingSettings instance."""
+        self._settings = QgsSettings()
+
+    @property
+    def detect_leaks_on_reload(self) -> bool:
+        """Get the leak detection on plugin reload setting.
+
+        :returns: True if leaked QObjects should be reported after plugin
+            unload, False otherwise.
+        :rtype: bool
+        """
+        return self._settings.value(
+            self.KEY_DETECT_LEAKS, defaultValue=False, type=bool
+        )
+
+    @detect_leaks_on_reload.setter
+    def detect_leaks_on_reload(self, value: bool) -> None:
+        """Set the leak detection on plugin reload setting.
+
+        :param value: True to enable leak detection, False to disable.
+        :type value: bool
+        """
+        self._settings.setValue(self.KEY_DETECT_LEAKS, value)
+
+    @property
+    def is_freeze_watchdog_enabled(self) -> bool:
+        """Get the UI freeze watchdog setting.
+
+        :returns: True if main loop stalls should be detected, False
+            otherwise.
+        :rtype: bool
+        """
+        return self._settings.value(
+            self.KEY_WATCHDOG_ENABLED, defaultValue=False, type=bool
+        )
+
+    @is_freeze_watchdog_enabled.setter
+    def is_freeze_watchdog_enabled(self, value: bool) -> None:
+        """Set the UI freeze watchdog setting.
+
+        :param value: True to enable the watchdog, False to disable.
+        :type value: bool
+        """
+        self._settings.setValue(self.KEY_WATCHDOG_ENABLED, value)
+
+    @property
+    def freeze_threshold_ms(self) -> int:
+        """Get the minimal main loop stall duration to report.
+
+        :returns: Threshold in milliseconds.
+        :rtype: int
+        """
+        return self._settings.value(
+            self.KEY_WATCHDOG_THRESHOLD, defaultValue=200, type=int
+        )
+
+    @freeze_threshold_ms.setter
+    def freeze_threshold_ms(self, value: int) -> None:
+        """Set the minimal main loop stall duration to report.
+
+        :param value: Threshold in milliseconds.
+        :type value: int
+        """
+        self._settings.setValue(self.KEY_WATCHDOG_THRESHOLD, value)
+
+    @property
+    def is_gdal_tracing_enabled(self) -> bool:
+        """Get the GDAL call tracing setting.
+
+        :returns: True if GDAL debug output of the main thread should be
+            routed to the log, False otherwise.
+        :rtype: bool
+        """
+        return self._settings.value(
+            self.KEY_GDAL_TRACING_ENABLED, defaultValue=False, type=bool
+        )
+
+    @is_gdal_tracing_enabled.setter
+    def is_gdal_tracing_enabled(self, value: bool) -> None:
+        """Set the GDAL call tracing setting.
+
+        :param value: True to enable tracing, False to disable.
+        :type value: bool
+        """
+        self._settings.setValue(self.KEY_GDAL_TRACING_ENABLED, value)
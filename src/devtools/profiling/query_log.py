@@ -0,0 +1,567 @@
+# QGIS DevTools Plugin
+# Copyright (C) 2025  NextGIS
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or any
+# later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+import csv
+import io
+import json
+import re
+import time
+from collections import Counter, deque
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Tuple, Union
+
+from qgis.core import (
+    QgsFeatureIterator,
+    QgsFeatureRequest,
+    QgsMapLayer,
+    QgsProject,
+    QgsProviderRegistry,
+    QgsVectorLayer,
+)
+from qgis.PyQt.QtCore import QObject, pyqtSlot
+
+from devtools.core.call_site import caller_site
+from devtools.core.compat import database_query_log
+from devtools.core.logging import logger
+from devtools.core.utils import percentile
+from devtools.profiling.get_features_hook import get_features_hook
+
+QueryKey = Tuple[str, str, Optional[str]]
+"""Normalized SQL, provider key and layer id."""
+
+STRING_LITERAL_PATTERN = re.compile(r"'(?:[^']|'')*'")
+NUMBER_LITERAL_PATTERN = re.compile(r"(?<![\w.\"])[-+]?\d+(?:\.\d+)?\b")
+PARAMETERS_LIST_PATTERN = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def normalize_sql(sql: str) -> str:
+    """Return SQL with literals replaced by placeholders.
+
+    Queries differing only in literal values get the same text, so that
+    per-feature queries of N+1 patterns are grouped together.
+
+    :param sql: SQL statement.
+    :type sql: str
+    :returns: Normalized statement.
+    :rtype: str
+    """
+    sql = STRING_LITERAL_PATTERN.sub("?", sql)
+    sql = NUMBER_LITERAL_PATTERN.sub("?", sql)
+    sql = PARAMETERS_LIST_PATTERN.sub("(?, …)", sql)
+    return WHITESPACE_PATTERN.sub(" ", sql).strip()
+
+
+@dataclass(frozen=True)
+class QueryRecord:
+    """Finished provider query.
+
+    :param query_id: Query log entry id.
+    :type query_id: int
+    :param provider: Data provider key.
+    :type provider: str
+    :param uri: Connection URI reported by the provider.
+    :type uri: str
+    :param sql: Executed statement.
+    :type sql: str
+    :param normalized_sql: Statement with literals replaced.
+    :type normalized_sql: str
+    :param layer_id: Id of the initiating layer if it was recognized.
+    :type layer_id: Optional[str]
+    :param started: Start time in milliseconds since the epoch.
+    :type started: int
+    :param duration: Duration in seconds.
+    :type duration: float
+    :param fetched_rows: Number of fetched rows or -1 if unknown.
+    :type fetched_rows: int
+    :param initiator: Class which issued the query.
+    :type initiator: str
+    :param error: Error message of a failed query.
+    :type error: str
+    :param is_canceled: Whether the query was canceled.
+    :type is_canceled: bool
+    """
+
+    query_id: int
+    provider: str
+    uri: str
+    sql: str
+    normalized_sql: str
+    layer_id: Optional[str]
+    started: int
+    duration: float
+    fetched_rows: int
+    initiator: str
+    error: str
+    is_canceled: bool
+
+    @property
+    def key(self) -> QueryKey:
+        """Return the aggregation key.
+
+        :returns: Normalized SQL, provider key and layer id.
+        :rtype: QueryKey
+        """
+        return (self.normalized_sql, self.provider, self.layer_id)
+
+
+@dataclass
+class QueryStatistics:
+    """Durations aggregated for a normalized statement.
+
+    :param normalized_sql: Statement with literals replaced.
+    :type normalized_sql: str
+    :param provider: Data provider key.
+    :type provider: str
+    :param layer_id: Id of the initiating layer.
+    :type layer_id: Optional[str]
+    :param layer_name: Name of the initiating layer.
+    :type layer_name: Optional[str]
+    :param count: Number of executions.
+    :type count: int
+    :param total_time: Total duration in seconds.
+    :type total_time: float
+    :param mean_time: Mean duration in seconds.
+    :type mean_time: float
+    :param p95_time: 95th percentile of duration in seconds.
+    :type p95_time: float
+    :param errors: Number of failed executions.
+    :type errors: int
+    """
+
+    normalized_sql: str
+    provider: str
+    layer_id: Optional[str]
+    layer_name: Optional[str]
+    count: int
+    total_time: float
+    mean_time: float
+    p95_time: float
+    errors: int
+
+
+@dataclass
+class NPlusOnePattern:
+    """Burst of the same statement executed once per feature.
+
+    :param statistics: Statistics of the repeated statement.
+    :type statistics: QueryStatistics
+    :param burst: Largest number of executions within the time window.
+    :type burst: int
+    :param plugins: Plugins which requested features of the layer during
+        the burst, most active first.
+    :type plugins: List[str]
+    """
+
+    statistics: QueryStatistics
+    burst: int
+    plugins: List[str] = field(default_factory=list)
+
+
+class QueryLogRecorder(QObject):
+    """Captures provider SQL queries from the QGIS database query log.
+
+    Finished queries are stored in a bounded in-memory store indexed by
+    normalized SQL, provider and initiating layer. Python ``getFeatures``
+    calls are recorded too, so that N+1 bursts can be attributed to the
+    plugins that caused them.
+
+    The query log is not usable before QGIS 3.34; the recorder does
+    nothing there.
+    """
+
+    MAX_RECORDS = 100000
+    MAX_FEATURE_CALLS = 10000
+    N_PLUS_ONE_THRESHOLD = 20
+    N_PLUS_ONE_WINDOW = 1.0  # s
+
+    __records: Deque[QueryRecord]
+    __index: Dict[QueryKey, Deque[QueryRecord]]
+    __feature_calls: Deque[Tuple[int, str, str]]
+    __layer_ids: Dict[Tuple[str, str, str], Optional[str]]
+    __in_flight: Dict[int, Any]
+    __was_log_enabled: bool
+    __is_running: bool
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        """Initialize QueryLogRecorder instance.
+
+        :param parent: Parent QObject.
+        :type parent: Optional[QObject]
+        """
+        super().__init__(parent)
+        self.__was_log_enabled = False
+        self.__is_running = False
+        self.reset()
+
+    @property
+    def is_available(self) -> bool:
+        """Check whether the QGIS database query log can be used.
+
+        :returns: True on QGIS 3.34 and newer.
+        :rtype: bool
+        """
+        return database_query_log() is not None
+
+    @property
+    def is_running(self) -> bool:
+        """Check whether queries are captured.
+
+        :returns: True if the recorder is running.
+        :rtype: bool
+        """
+        return self.__is_running
+
+    @property
+    def in_flight(self) -> int:
+        """Return the number of started but not finished queries.
+
+        :returns: Number of running queries.
+        :rtype: int
+        """
+        return len(self.__in_flight)
+
+    def start(self) -> None:
+        """Enable the query log and start capturing queries."""
+        query_log = database_query_log()
+        if query_log is None:
+            logger.warning("Provider query log requires QGIS 3.34 or newer")
+            return
+        if self.__is_running:
+            return
+
+        self.__was_log_enabled = query_log.enabled()
+        query_log.setEnabled(True)
+        query_log.queryStarted.connect(self.__on_query_started)
+        query_log.queryFinished.connect(self.__on_query_finished)
+
+        project = QgsProject.instance()
+        project.layersAdded.connect(self.__clear_layer_cache)
+        project.layersRemoved.connect(self.__clear_layer_cache)
+        get_features_hook.add_listener(self.__on_get_features)
+
+        self.__is_running = True
+        logger.debug("Provider query log recorder started")
+
+    def stop(self) -> None:
+        """Stop capturing and log the slowest statements."""
+        if not self.__is_running:
+            return
+
+        get_features_hook.remove_listener(self.__on_get_features)
+        project = QgsProject.instance()
+        project.layersAdded.disconnect(self.__clear_layer_cache)
+        project.layersRemoved.disconnect(self.__clear_layer_cache)
+
+        query_log = database_query_log()
+        query_log.queryStarted.disconnect(self.__on_query_started)
+        query_log.queryFinished.disconnect(self.__on_query_finished)
+        query_log.setEnabled(self.__was_log_enabled)
+
+        self.__in_flight = {}
+        self.__is_running = False
+        logger.debug("Provider query log recorder stopped")
+
+        if self.__records:
+            logger.info(self.report())
+
+    def reset(self) -> None:
+        """Forget captured queries."""
+        self.__records = deque()
+        self.__index = {}
+        self.__feature_calls = deque(maxlen=self.MAX_FEATURE_CALLS)
+        self.__layer_ids = {}
+        self.__in_flight = {}
+
+    def records(
+        self,
+        *,
+        layer_id: Optional[str] = None,
+        provider: Optional[str] = None,
+    ) -> List[QueryRecord]:
+        """Return captured queries in execution order.
+
+        :param layer_id: Only return queries of the layer.
+        :type layer_id: Optional[str]
+        :param provider: Only return queries of the provider.
+        :type provider: Optional[str]
+        :returns: Query records.
+        :rtype: List[QueryRecord]
+        """
+        if layer_id is None and provider is None:
+            return list(self.__records)
+
+        result = [
+            record
+            for key, records in self.__index.items()
+            if (layer_id is None or key[2] == layer_id)
+            and (provider is None or key[1] == provider)
+            for record in records
+        ]
+        result.sort(key=lambda record: (record.started, record.query_id))
+        return result
+
+    def statistics(self) -> List[QueryStatistics]:
+        """Return statistics of normalized statements.
+
+        :returns: Statistics sorted by total time, slowest first.
+        :rtype: List[QueryStatistics]
+        """
+        result = [
+            self.__statistics(key, records)
+            for key, records in self.__index.items()
+        ]
+        result.sort(key=lambda item: item.total_time, reverse=True)
+        return result
+
+    def n_plus_one(
+        self,
+        *,
+        threshold: int = N_PLUS_ONE_THRESHOLD,
+        window: float = N_PLUS_ONE_WINDOW,
+    ) -> List[NPlusOnePattern]:
+        """Find statements repeated in bursts.
+
+        :param threshold: Minimal number of executions within the window.
+        :type threshold: int
+        :param window: Time window in seconds.
+        :type window: float
+        :returns: Detected patterns, largest bursts first.
+        :rtype: List[NPlusOnePattern]
+        """
+        window_ms = window * 1000
+        patterns = []
+        for key, records in self.__index.items():
+            if len(records) < threshold:
+                continue
+
+            started = sorted(record.started for record in records)
+            burst, burst_start = 0, 0
+            first = 0
+            for last, time_ms in enumerate(started):
+                while time_ms - started[first] > window_ms:
+                    first += 1
+                if last - first + 1 > burst:
+                    burst, burst_start = last - first + 1, started[first]
+            if burst < threshold:
+                continue
+
+            patterns.append(
+                NPlusOnePattern(
+                    self.__statistics(key, records),
+                    burst,
+                    self.__plugins(key[2], burst_start, window_ms),
+                )
+            )
+        patterns.sort(key=lambda pattern: pattern.burst, reverse=True)
+        return patterns
+
+    def report(self, limit: int = 10) -> str:
+        """Return the slowest statements and N+1 patterns.
+
+        :param limit: Maximum number of statements.
+        :type limit: int
+        :returns: Multiline report text.
+        :rtype: str
+        """
+        header = (
+            f"{'count':>7} {'total ms':>10} {'mean ms':>9} {'p95 ms':>9}"
+            "  provider  layer: statement"
+        )
+        lines = [f"Provider queries: {len(self.__records)}", header]
+        lines.extend(
+            f"{item.count:>7} {item.total_time * 1000:>10.1f} "
+            f"{item.mean_time * 1000:>9.1f} {item.p95_time * 1000:>9.1f}  "
+            f"{item.provider}  {item.layer_name or '<unknown>'}: "
+            f"{item.normalized_sql[:200]}"
+            for item in self.statistics()[:limit]
+        )
+        for pattern in self.n_plus_one():
+            plugins = ", ".join(pattern.plugins) or "<unknown>"
+            lines.append(
+                f"Possible N+1: {pattern.burst} executions within "
+                f"{self.N_PLUS_ONE_WINDOW:g} s from {plugins}: "
+                f"{pattern.statistics.normalized_sql[:200]}"
+            )
+        return "\n".join(lines)
+
+    def to_csv(self, path: Union[str, Path, None] = None) -> str:
+        """Export captured queries to CSV.
+
+        :param path: Optional file to write the CSV to.
+        :type path: Union[str, Path, None]
+        :returns: CSV document.
+        :rtype: str
+        """
+        stream = io.StringIO()
+        columns = list(QueryRecord.__dataclass_fields__)
+        writer = csv.DictWriter(stream, fieldnames=columns)
+        writer.writeheader()
+        writer.writerows(asdict(record) for record in self.__records)
+
+        document = stream.getvalue()
+        if path is not None:
+            Path(path).write_text(document, encoding="utf-8", newline="")
+        return document
+
+    def to_json(self, path: Union[str, Path, None] = None) -> str:
+        """Export captured queries and statistics to JSON.
+
+        :param path: Optional file to write the JSON to.
+        :type path: Union[str, Path, None]
+        :returns: JSON document.
+        :rtype: str
+        """
+        document = json.dumps(
+            {
+                "statistics": [asdict(item) for item in self.statistics()],
+                "n_plus_one": [asdict(item) for item in self.n_plus_one()],
+                "queries": [asdict(record) for record in self.__records],
+            },
+            indent=2,
+            ensure_ascii=False,
+        )
+        if path is not None:
+            Path(path).write_text(document, encoding="utf-8")
+        return document
+
+    @pyqtSlot(object)
+    def __on_query_started(self, entry: Any) -> None:  # noqa: ANN401
+        self.__in_flight[entry.queryId] = entry
+
+    @pyqtSlot(object)
+    def __on_query_finished(self, entry: Any) -> None:  # noqa: ANN401
+        self.__in_flight.pop(entry.queryId, None)
+
+        finished = entry.finishedTime if entry.finishedTime > 0 else None
+        duration = (
+            (finished - entry.startedTime) / 1000
+            if finished is not None
+            else 0.0
+        )
+        record = QueryRecord(
+            query_id=entry.queryId,
+            provider=entry.provider,
+            uri=entry.uri,
+            sql=entry.query,
+            normalized_sql=normalize_sql(entry.query),
+            layer_id=self.__layer_id(entry.provider, entry.uri, entry.query),
+            started=entry.startedTime,
+            duration=max(duration, 0.0),
+            fetched_rows=entry.fetchedRows,
+            initiator=entry.initiatorClass,
+            error=entry.error,
+            is_canceled=entry.canceled,
+        )
+        self.__add(record)
+
+    def __add(self, record: QueryRecord) -> None:
+        if len(self.__records) >= self.MAX_RECORDS:
+            oldest = self.__records.popleft()
+            records = self.__index[oldest.key]
+            records.popleft()
+            if not records:
+                del self.__index[oldest.key]
+
+        self.__records.append(record)
+        self.__index.setdefault(record.key, deque()).append(record)
+
+    def __statistics(
+        self, key: QueryKey, records: Deque[QueryRecord]
+    ) -> QueryStatistics:
+        durations = [record.duration for record in records]
+        total_time = sum(durations)
+        layer = (
+            QgsProject.instance().mapLayer(key[2])
+            if key[2] is not None
+            else None
+        )
+        return QueryStatistics(
+            normalized_sql=key[0],
+            provider=key[1],
+            layer_id=key[2],
+            layer_name=layer.name() if layer is not None else None,
+            count=len(durations),
+            total_time=total_time,
+            mean_time=total_time / len(durations),
+            p95_time=percentile(durations, 95),
+            errors=sum(1 for record in records if record.error),
+        )
+
+    def __plugins(
+        self, layer_id: Optional[str], started: float, window_ms: float
+    ) -> List[str]:
+        plugins = Counter(
+            plugin
+            for time_ms, call_layer_id, plugin in self.__feature_calls
+            if started - window_ms <= time_ms <= started + window_ms
+            and (layer_id is None or call_layer_id == layer_id)
+        )
+        return [plugin for plugin, _ in plugins.most_common()]
+
+    def __layer_id(self, provider: str, uri: str, sql: str) -> Optional[str]:
+        # Providers report the connection, not the table, so layers sharing
+        # a connection are told apart by the table name in the statement
+        cache_key = (provider, uri, normalize_sql(sql))
+        if cache_key in self.__layer_ids:
+            return self.__layer_ids[cache_key]
+
+        layer_id = None
+        for layer in QgsProject.instance().mapLayers().values():
+            if layer.providerType() != provider:
+                continue
+            if layer.source() == uri:
+                layer_id = layer.id()
+                break
+            table = self.__table_name(layer)
+            if table and re.search(rf"\b{re.escape(table)}\b", sql):
+                layer_id = layer.id()
+                break
+
+        self.__layer_ids[cache_key] = layer_id
+        return layer_id
+
+    def __table_name(self, layer: QgsMapLayer) -> str:
+        # Database providers decode the table name, OGR the layer name and
+        # the dataset path of single layer files like shapefiles
+        parts = QgsProviderRegistry.instance().decodeUri(
+            layer.providerType(), layer.source()
+        )
+        table = parts.get("table") or parts.get("layerName")
+        if table:
+            return str(table)
+
+        path = parts.get("path")
+        return Path(path).stem if path else ""
+
+    @pyqtSlot()
+    def __clear_layer_cache(self) -> None:
+        self.__layer_ids = {}
+
+    def __on_get_features(
+        self,
+        layer: QgsVectorLayer,
+        request: QgsFeatureRequest,  # noqa: ARG002
+        iterator: QgsFeatureIterator,
+    ) -> QgsFeatureIterator:
+        plugin = caller_site(depth=2).plugin
+        if plugin is not None:
+            self.__feature_calls.append(
+                (int(time.time() * 1000), layer.id(), plugin)
+            )
+        return iterator
@@ -0,0 +1,428 @@
+# QGIS DevTools Plugin
+# Copyright (C) 2025  NextGIS
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or any
+# later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+import math
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, List, Optional, Tuple
+
+from qgis.core import (
+    QgsMapLayer,
+    QgsMapRendererJob,
+    QgsMapRendererParallelJob,
+    QgsMapSettings,
+)
+from qgis.gui import QgsMapCanvas
+from qgis.PyQt import sip
+from qgis.PyQt.QtCore import QObject, pyqtSignal, pyqtSlot
+from qgis.utils import iface
+
+from devtools.core.logging import logger
+from devtools.core.utils import percentile
+
+Extent = Tuple[float, float, float, float]
+"""Map extent as (xmin, ymin, xmax, ymax)."""
+
+
+@dataclass(frozen=True)
+class RenderSample:
+    """Rendering time of a single layer in a single frame.
+
+    :param layer_id: Layer identifier.
+    :type layer_id: str
+    :param layer_name: Layer name at the time of rendering.
+    :type layer_name: str
+    :param scale: Map scale denominator.
+    :type scale: float
+    :param extent: Visible map extent in map CRS units.
+    :type extent: Extent
+    :param duration: Rendering time in seconds.
+    :type duration: float
+    :param timestamp: Wall clock time of the measurement.
+    :type timestamp: float
+    """
+
+    layer_id: str
+    layer_name: str
+    scale: float
+    extent: Extent
+    duration: float
+    timestamp: float
+
+
+@dataclass
+class LayerRenderStatistics:
+    """Aggregated rendering times of a layer.
+
+    :param layer_id: Layer identifier.
+    :type layer_id: str
+    :param layer_name: Latest known layer name.
+    :type layer_name: str
+    :param samples: Number of measured frames.
+    :type samples: int
+    :param p50: Median rendering time in seconds.
+    :type p50: float
+    :param p95: 95th percentile of rendering time in seconds.
+    :type p95: float
+    :param max_time: Longest rendering time in seconds.
+    :type max_time: float
+    :param share: Share of the median frame time spent on this layer.
+    :type share: float
+    """
+
+    layer_id: str
+    layer_name: str
+    samples: int
+    p50: float
+    p95: float
+    max_time: float
+    share: float
+
+    @property
+    def is_dominant(self) -> bool:
+        """Check whether the layer dominates the frame time.
+
+        :returns: True if the layer takes at least half of the frame.
+        :rtype: bool
+        """
+        return self.share >= RenderProfiler.DOMINANT_SHARE
+
+
+class RenderProfiler(QObject):
+    """Collects per-layer rendering times of the map canvas.
+
+    While started, the duration of every canvas refresh is recorded; no
+    additional rendering is done. The canvas does not expose its renderer
+    job and ``QgsMapRendererJob.perLayerRenderingTime()`` is not available
+    in the Python bindings, so per-layer times are measured only on an
+    explicit :meth:`measure` call: every visible layer is rendered once by
+    a separate background job. The overhead of an empty job is measured
+    first and subtracted. Samples are kept in a rolling buffer together
+    with the scale and extent of the frame.
+    """
+
+    samples_added = pyqtSignal()
+    """Signal emitted when measurements of a frame are stored."""
+
+    DOMINANT_SHARE = 0.5
+    DEFAULT_CAPACITY = 5000
+
+    __canvas: Optional[QgsMapCanvas]
+    __samples: Deque[RenderSample]
+    __frame_times: Deque[float]
+    __frame_started: Optional[float]
+    __job: Optional[QgsMapRendererJob]
+    __finished_job: Optional[QgsMapRendererJob]
+    __job_started: float
+    __job_layer: Optional[Tuple[QgsMapLayer, str, str]]
+    __job_overhead: float
+    __pending_layers: List[QgsMapLayer]
+    __settings: Optional[QgsMapSettings]
+
+    def __init__(
+        self,
+        parent: Optional[QObject] = None,
+        *,
+        capacity: int = DEFAULT_CAPACITY,
+    ) -> None:
+        """Initialize RenderProfiler instance.
+
+        :param parent: Parent QObject.
+        :type parent: Optional[QObject]
+        :param capacity: Maximum number of stored layer samples.
+        :type capacity: int
+        """
+        super().__init__(parent)
+        self.__canvas = None
+        self.__samples = deque(maxlen=capacity)
+        self.__frame_times = deque(maxlen=capacity)
+        self.__frame_started = None
+        self.__job = None
+        self.__finished_job = None
+        self.__job_started = 0.0
+        self.__job_layer = None
+        self.__job_overhead = 0.0
+        self.__pending_layers = []
+        self.__settings = None
+
+    @property
+    def is_running(self) -> bool:
+        """Check whether canvas refreshes are being profiled.
+
+        :returns: True if the profiler is attached to a canvas.
+        :rtype: bool
+        """
+        return self.__canvas is not None
+
+    def start(self, canvas: Optional[QgsMapCanvas] = None) -> None:
+        """Start profiling canvas refreshes.
+
+        :param canvas: Canvas to profile. Main map canvas by default.
+        :type canvas: Optional[QgsMapCanvas]
+        """
+        if self.is_running:
+            return
+
+        self.__canvas = canvas if canvas is not None else iface.mapCanvas()
+        self.__canvas.renderStarting.connect(self.__on_render_starting)
+        self.__canvas.mapCanvasRefreshed.connect(self.__on_canvas_refreshed)
+        logger.debug("Render profiler started")
+
+    def stop(self) -> None:
+        """Stop profiling and cancel a running measurement."""
+        self.__cancel_job()
+        if self.__canvas is None:
+            return
+
+        self.__canvas.renderStarting.disconnect(self.__on_render_starting)
+        self.__canvas.mapCanvasRefreshed.disconnect(self.__on_canvas_refreshed)
+        self.__canvas = None
+        self.__frame_started = None
+        logger.debug("Render profiler stopped")
+
+    def reset(self) -> None:
+        """Forget all collected samples."""
+        self.__samples.clear()
+        self.__frame_times.clear()
+
+    @property
+    def is_measuring(self) -> bool:
+        """Check whether layers of a frame are being rendered.
+
+        :returns: True while a :meth:`measure` call is in progress.
+        :rtype: bool
+        """
+        return self.__settings is not None
+
+    def measure(self) -> None:
+        """Render every layer of the current canvas frame once.
+
+        Layers are rendered one by one in background jobs, which adds load
+        to the layers' data sources. The call is ignored while a previous
+        measurement is in progress.
+        """
+        if self.is_measuring:
+            return
+
+        canvas = (
+            self.__canvas if self.__canvas is not None else iface.mapCanvas()
+        )
+        settings = QgsMapSettings(canvas.mapSettings())
+        if len(settings.layers()) == 0:
+            return
+
+        self.__settings = settings
+        self.__pending_layers = list(settings.layers())
+        self.__job_layer = None
+        # An empty job measures the overhead included in every layer job
+        empty_settings = QgsMapSettings(settings)
+        empty_settings.setLayers([])
+        self.__start_job(empty_settings)
+
+    def cancel(self) -> None:
+        """Cancel a running measurement."""
+        self.__cancel_job()
+
+    def samples(self) -> List[RenderSample]:
+        """Return stored layer samples, oldest first.
+
+        :returns: Layer rendering samples.
+        :rtype: List[RenderSample]
+        """
+        return list(self.__samples)
+
+    def statistics(
+        self, scale_range: Optional[Tuple[float, float]] = None
+    ) -> List[LayerRenderStatistics]:
+        """Return per-layer rendering statistics.
+
+        :param scale_range: Optional (min, max) scale denominators to limit
+            the statistics to.
+        :type scale_range: Optional[Tuple[float, float]]
+        :returns: Layer statistics, slowest first.
+        :rtype: List[LayerRenderStatistics]
+        """
+        durations: Dict[str, List[float]] = {}
+        names: Dict[str, str] = {}
+        for sample in self.__samples:
+            if scale_range is not None and not (
+                scale_range[0] <= sample.scale <= scale_range[1]
+            ):
+                continue
+            durations.setdefault(sample.layer_id, []).append(sample.duration)
+            names[sample.layer_id] = sample.layer_name
+
+        medians = {
+            layer_id: percentile(values, 50)
+            for layer_id, values in durations.items()
+        }
+        frame_time = sum(medians.values())
+
+        result = [
+            LayerRenderStatistics(
+                layer_id=layer_id,
+                layer_name=names[layer_id],
+                samples=len(values),
+                p50=medians[layer_id],
+                p95=percentile(values, 95),
+                max_time=max(values),
+                share=medians[layer_id] / frame_time if frame_time else 0.0,
+            )
+            for layer_id, values in durations.items()
+        ]
+        result.sort(key=lambda statistics: statistics.p50, reverse=True)
+        return result
+
+    def frame_time(self, percent: float = 50) -> float:
+        """Return the percentile of full canvas refresh times.
+
+        :param percent: Percentile in the range [0, 100].
+        :type percent: float
+        :returns: Refresh time in seconds or NaN without measurements.
+        :rtype: float
+        """
+        return percentile(self.__frame_times, percent)
+
+    def report(self, limit: int = 10) -> str:
+        """Return a human readable report.
+
+        :param limit: Maximum number of layers to include.
+        :type limit: int
+        :returns: Multiline report text.
+        :rtype: str
+        """
+        frame_p50 = self.frame_time(50)
+        lines = [
+            "Canvas refresh p50: "
+            + (
+                "n/a"
+                if math.isnan(frame_p50)
+                else f"{frame_p50 * 1000:.1f} ms"
+            )
+        ]
+        for statistics in self.statistics()[:limit]:
+            marker = " (dominant)" if statistics.is_dominant else ""
+            lines.append(
+                f"  {statistics.layer_name}: "
+                f"p50 {statistics.p50 * 1000:.1f} ms, "
+                f"p95 {statistics.p95 * 1000:.1f} ms, "
+                f"{statistics.share:.0%} of frame{marker}"
+            )
+        return "\n".join(lines)
+
+    @pyqtSlot()
+    def __on_render_starting(self) -> None:
+        self.__frame_started = time.perf_counter()
+
+    @pyqtSlot()
+    def __on_canvas_refreshed(self) -> None:
+        if self.__frame_started is None:
+            return
+
+        self.__frame_times.append(time.perf_counter() - self.__frame_started)
+        self.__frame_started = None
+        self.samples_added.emit()
+
+    def __start_next_layer_job(self) -> bool:
+        assert self.__settings is not None
+        while self.__pending_layers:
+            layer = self.__pending_layers.pop(0)
+            if sip.isdeleted(layer):
+                continue
+
+            self.__job_layer = (layer, layer.id(), layer.name())
+            settings = QgsMapSettings(self.__settings)
+            settings.setLayers([layer])
+            self.__start_job(settings)
+            return True
+        return False
+
+    def __start_job(self, settings: QgsMapSettings) -> None:
+        self.__job = QgsMapRendererParallelJob(settings)
+        self.__job.finished.connect(self.__on_job_finished)
+        self.__job_started = time.perf_counter()
+        self.__job.start()
+
+    @pyqtSlot()
+    def __on_job_finished(self) -> None:
+        job = self.__job
+        settings = self.__settings
+        if job is None or settings is None:
+            return
+
+        elapsed = time.perf_counter() - self.__job_started
+        # Keep the job alive until its finished signal handling is over
+        self.__finished_job = job
+        self.__job = None
+
+        if self.__job_layer is None:
+            self.__job_overhead = elapsed
+        else:
+            layer, layer_id, layer_name = self.__job_layer
+            # Removed layers are not rendered, their time is meaningless
+            if not sip.isdeleted(layer):
+                self.__store(
+                    settings,
+                    layer_id,
+                    layer_name,
+                    max(elapsed - self.__job_overhead, 0.0),
+                )
+            self.__job_layer = None
+
+        if self.__start_next_layer_job():
+            return
+
+        self.__settings = None
+        self.samples_added.emit()
+
+    def __store(
+        self,
+        settings: QgsMapSettings,
+        layer_id: str,
+        layer_name: str,
+        duration: float,
+    ) -> None:
+        extent = settings.visibleExtent()
+        frame_extent = (
+            extent.xMinimum(),
+            extent.yMinimum(),
+            extent.xMaximum(),
+            extent.yMaximum(),
+        )
+        self.__samples.append(
+            RenderSample(
+                layer_id=layer_id,
+                layer_name=layer_name,
+                scale=settings.scale(),
+                extent=frame_extent,
+                duration=duration,
+                timestamp=time.time(),
+            )
+        )
+
+    def __cancel_job(self) -> None:
+        self.__pending_layers = []
+        self.__settings = None
+        self.__job_layer = None
+        if self.__job is None:
+            return
+
+        job = self.__job
+        self.__job = None
+        job.finished.disconnect(self.__on_job_finished)
+        job.cancelWithoutBlocking()
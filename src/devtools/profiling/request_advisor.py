@@ -0,0 +1,340 @@
+# QGIS DevTools Plugin
+# Copyright (C) 2025  NextGIS
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or any
+# later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+import math
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set
+
+from qgis.core import (
+    QgsFeatureIterator,
+    QgsFeatureRequest,
+    QgsVectorLayer,
+)
+from qgis.PyQt.QtCore import QObject, QTimer
+
+from devtools.core.call_site import CallSite, caller_site
+from devtools.core.compat import FeatureRequestFlag
+from devtools.core.logging import logger
+from devtools.profiling.get_features_hook import get_features_hook
+
+MIN_SAVING_RATIO = 0.2
+
+
+@dataclass
+class RequestAdvice:
+    """Cost of fetched data at a ``getFeatures`` call site.
+
+    Ratios are measured by running the request of the first call again
+    with and without geometry and attributes. Whether the caller uses the
+    fetched data is not observed, the advice applies only if it doesn't.
+
+    :param call_site: Location of the ``getFeatures`` call.
+    :type call_site: CallSite
+    :param layer_name: Name of the last requested layer.
+    :type layer_name: str
+    :param calls: Number of calls.
+    :type calls: int
+    :param fetches_geometry: The measured request fetches geometry.
+    :type fetches_geometry: bool
+    :param fetched_fields: Number of fields fetched by the measured
+        request.
+    :type fetched_fields: int
+    :param request_time: Time of the measured request on at most
+        ``RequestAdvisor.CALIBRATION_FEATURES`` features in seconds, NaN
+        until measured.
+    :type request_time: float
+    :param geometry_ratio: Share of the request time spent on geometry,
+        NaN if not measured.
+    :type geometry_ratio: float
+    :param attributes_ratio: Share of the request time spent on
+        attributes, NaN if not measured.
+    :type attributes_ratio: float
+    """
+
+    call_site: CallSite
+    layer_name: str = ""
+    calls: int = 0
+    fetches_geometry: bool = False
+    fetched_fields: int = 0
+    request_time: float = math.nan
+    geometry_ratio: float = math.nan
+    attributes_ratio: float = math.nan
+
+    @property
+    def has_costly_geometry(self) -> bool:
+        """Check whether fetching geometry takes a significant time.
+
+        :returns: True if skipping geometry saves at least
+            ``MIN_SAVING_RATIO`` of the request time.
+        :rtype: bool
+        """
+        return (
+            not math.isnan(self.geometry_ratio)
+            and self.geometry_ratio >= MIN_SAVING_RATIO
+        )
+
+    @property
+    def has_costly_attributes(self) -> bool:
+        """Check whether fetching attributes takes a significant time.
+
+        :returns: True if skipping attributes saves at least
+            ``MIN_SAVING_RATIO`` of the request time.
+        :rtype: bool
+        """
+        return (
+            not math.isnan(self.attributes_ratio)
+            and self.attributes_ratio >= MIN_SAVING_RATIO
+        )
+
+    @property
+    def is_over_fetching(self) -> bool:
+        """Check whether the call site may fetch data it doesn't use.
+
+        :returns: True if geometry or attributes are costly to fetch.
+        :rtype: bool
+        """
+        return self.has_costly_geometry or self.has_costly_attributes
+
+    @property
+    def estimated_saving(self) -> float:
+        """Return the estimated time saving over all calls.
+
+        Requests returning more than ``CALIBRATION_FEATURES`` features
+        are underestimated.
+
+        :returns: Seconds saved if costly data is not fetched, NaN if
+            unknown.
+        :rtype: float
+        """
+        ratios = []
+        if self.has_costly_geometry:
+            ratios.append(self.geometry_ratio)
+        if self.has_costly_attributes:
+            ratios.append(self.attributes_ratio)
+        if not ratios:
+            return math.nan
+        return self.request_time * self.calls * min(sum(ratios), 1.0)
+
+    @property
+    def advice(self) -> str:
+        """Return the suggested request changes.
+
+        :returns: Advice text.
+        :rtype: str
+        """
+        changes = []
+        if self.has_costly_geometry:
+            changes.append(
+                "if geometry is not used: request.setFlags(NoGeometry) "
+                f"({self.geometry_ratio:.0%} faster)"
+            )
+        if self.has_costly_attributes:
+            changes.append(
+                "if attributes are not used: request.setNoAttributes() or "
+                "setSubsetOfAttributes() with used fields "
+                f"({self.attributes_ratio:.0%} faster)"
+            )
+        return "; ".join(changes)
+
+
+class RequestAdvisor(QObject):
+    """Detects ``getFeatures`` calls that fetch costly data.
+
+    While running, Python calls of ``QgsVectorLayer.getFeatures`` are
+    counted per call site. The callers get the original iterators. The
+    request of the first call of every call site is run again from the
+    event loop on a limited number of features, with and without
+    geometry and attributes, to measure what fetching them costs.
+
+    Whether the caller reads the fetched geometry and attributes is not
+    observed, so the report lists candidates to check.
+    """
+
+    CALIBRATION_FEATURES = 1000
+
+    __advices: Dict[CallSite, RequestAdvice]
+    __calibrated: Set[CallSite]
+    __is_running: bool
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        """Initialize RequestAdvisor instance.
+
+        :param parent: Parent QObject.
+        :type parent: Optional[QObject]
+        """
+        super().__init__(parent)
+        self.__is_running = False
+        self.reset()
+
+    @property
+    def is_running(self) -> bool:
+        """Check whether ``getFeatures`` calls are instrumented.
+
+        :returns: True if the advisor is running.
+        :rtype: bool
+        """
+        return self.__is_running
+
+    def start(self) -> None:
+        """Start instrumenting ``getFeatures`` calls."""
+        if self.__is_running:
+            return
+        get_features_hook.add_listener(self.__on_get_features)
+        self.__is_running = True
+        logger.debug("Feature request advisor started")
+
+    def stop(self) -> None:
+        """Stop instrumenting and log the report."""
+        if not self.__is_running:
+            return
+        get_features_hook.remove_listener(self.__on_get_features)
+        self.__is_running = False
+        logger.debug("Feature request advisor stopped")
+
+        if any(advice.is_over_fetching for advice in self.advices()):
+            logger.info(self.report())
+
+    def reset(self) -> None:
+        """Forget all collected statistics."""
+        self.__advices = {}
+        self.__calibrated = set()
+
+    def advices(self) -> List[RequestAdvice]:
+        """Return per call site statistics.
+
+        :returns: Call site statistics, most called first.
+        :rtype: List[RequestAdvice]
+        """
+        return sorted(
+            self.__advices.values(),
+            key=lambda advice: advice.calls,
+            reverse=True,
+        )
+
+    def report(self) -> str:
+        """Return over-fetching call sites grouped by plugin.
+
+        :returns: Multiline report text.
+        :rtype: str
+        """
+        by_plugin: Dict[str, List[RequestAdvice]] = {}
+        for advice in self.advices():
+            if not advice.is_over_fetching:
+                continue
+            plugin = advice.call_site.plugin or "<unknown>"
+            by_plugin.setdefault(plugin, []).append(advice)
+
+        if not by_plugin:
+            return "No getFeatures calls fetching costly data detected"
+
+        lines = ["getFeatures calls fetching costly data:"]
+        for plugin, advices in sorted(by_plugin.items()):
+            lines.append(f"{plugin}:")
+            for advice in advices:
+                call_site = advice.call_site
+                saving = advice.estimated_saving
+                saving_text = f"estimated saving up to {saving * 1000:.0f} ms"
+                lines.append(
+                    f"  {call_site.filename}:{call_site.lineno} "
+                    f"({call_site.function}) on {advice.layer_name!r}: "
+                    f"{advice.calls} call(s), {saving_text}"
+                )
+                lines.append(f"    {advice.advice}")
+        return "\n".join(lines)
+
+    def __on_get_features(
+        self,
+        layer: QgsVectorLayer,
+        request: QgsFeatureRequest,
+        iterator: QgsFeatureIterator,
+    ) -> QgsFeatureIterator:
+        call_site = caller_site(depth=2)
+        advice = self.__advices.get(call_site)
+        if advice is None:
+            advice = RequestAdvice(call_site)
+            self.__advices[call_site] = advice
+        advice.calls += 1
+        advice.layer_name = layer.name()
+
+        if call_site not in self.__calibrated:
+            self.__calibrated.add(call_site)
+            # Measured out of band, so the caller gets the real iterator
+            # and its loop is not slowed down
+            calibration_request = QgsFeatureRequest(request)
+            QTimer.singleShot(
+                0,
+                lambda: self.__calibrate(advice, layer, calibration_request),
+            )
+
+        return iterator
+
+    def __calibrate(
+        self,
+        advice: RequestAdvice,
+        layer: QgsVectorLayer,
+        request: QgsFeatureRequest,
+    ) -> None:
+        flags = request.flags()
+        advice.fetches_geometry = layer.isSpatial() and not (
+            flags & FeatureRequestFlag.NoGeometry
+        )
+        advice.fetched_fields = (
+            len(request.subsetOfAttributes())
+            if flags & FeatureRequestFlag.SubsetOfAttributes
+            else layer.fields().count()
+        )
+
+        without_geometry = QgsFeatureRequest(request)
+        without_geometry.setFlags(flags | FeatureRequestFlag.NoGeometry)
+        without_attributes = QgsFeatureRequest(request)
+        without_attributes.setNoAttributes()
+
+        try:
+            # Untimed pass to warm up provider caches
+            self.__iteration_time(layer, request)
+            request_time = self.__iteration_time(layer, request)
+            geometry_time = (
+                self.__iteration_time(layer, without_geometry)
+                if advice.fetches_geometry
+                else math.nan
+            )
+            attributes_time = (
+                self.__iteration_time(layer, without_attributes)
+                if advice.fetched_fields > 0
+                else math.nan
+            )
+        except RuntimeError:
+            # Layer was deleted
+            return
+
+        advice.request_time = request_time
+        if request_time > 0:
+            advice.geometry_ratio = max(1 - geometry_time / request_time, 0.0)
+            advice.attributes_ratio = max(
+                1 - attributes_time / request_time, 0.0
+            )
+
+    def __iteration_time(
+        self, layer: QgsVectorLayer, request: QgsFeatureRequest
+    ) -> float:
+        request = QgsFeatureRequest(request)
+        request.setLimit(self.CALIBRATION_FEATURES)
+        started = time.perf_counter()
+        for _ in get_features_hook.original(layer, request):
+            pass
+        return time.perf_counter() - started
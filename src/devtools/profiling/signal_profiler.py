@@ -0,0 +1,661 @@
+# QGIS DevTools Plugin
+# Copyright (C) 2025  NextGIS
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or any
+# later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+import functools
+import inspect
+import threading
+import time
+import weakref
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from qgis.core import QgsMapLayer, QgsProject, QgsVectorLayer
+from qgis.gui import QgsLayerTreeView, QgsMapCanvas
+from qgis.PyQt import sip
+from qgis.PyQt.QtCore import QObject, pyqtBoundSignal, pyqtSignal
+
+from devtools.core.logging import logger
+
+SignalKey = Tuple[str, str]
+"""Pair of (sender signal, slot) names."""
+
+DEFAULT_SIGNALS: Tuple[Tuple[type, str], ...] = (
+    (QgsProject, "cleared"),
+    (QgsProject, "readProject"),
+    (QgsProject, "layersAdded"),
+    (QgsProject, "layerWasAdded"),
+    (QgsProject, "legendLayersAdded"),
+    (QgsProject, "layersWillBeRemoved"),
+    (QgsProject, "layersRemoved"),
+    (QgsProject, "crsChanged"),
+    (QgsMapLayer, "dataChanged"),
+    (QgsMapLayer, "repaintRequested"),
+    (QgsMapLayer, "rendererChanged"),
+    (QgsMapLayer, "styleChanged"),
+    (QgsMapLayer, "nameChanged"),
+    (QgsMapLayer, "willBeDeleted"),
+    (QgsVectorLayer, "selectionChanged"),
+    (QgsVectorLayer, "featureAdded"),
+    (QgsVectorLayer, "featureDeleted"),
+    (QgsVectorLayer, "attributeValueChanged"),
+    (QgsVectorLayer, "geometryChanged"),
+    (QgsVectorLayer, "editingStarted"),
+    (QgsVectorLayer, "editingStopped"),
+    (QgsVectorLayer, "beforeCommitChanges"),
+    (QgsVectorLayer, "afterCommitChanges"),
+    (QgsVectorLayer, "subsetStringChanged"),
+    (QgsMapCanvas, "extentsChanged"),
+    (QgsMapCanvas, "scaleChanged"),
+    (QgsMapCanvas, "destinationCrsChanged"),
+    (QgsMapCanvas, "layersChanged"),
+    (QgsMapCanvas, "currentLayerChanged"),
+    (QgsMapCanvas, "selectionChanged"),
+    (QgsMapCanvas, "renderStarting"),
+    (QgsMapCanvas, "mapCanvasRefreshed"),
+    (QgsMapCanvas, "xyCoordinates"),
+    (QgsMapCanvas, "mapToolSet"),
+    (QgsLayerTreeView, "currentLayerChanged"),
+)
+
+
+@dataclass
+class SlotStatistics:
+    """Timing statistics of a slot connected to a signal.
+
+    :param signal: Sender signal name, e.g. ``QgsProject.layersAdded``.
+    :type signal: str
+    :param slot: Qualified slot name.
+    :type slot: str
+    :param calls: Number of calls.
+    :type calls: int
+    :param total_time: Total time spent in the slot, in seconds.
+    :type total_time: float
+    :param max_time: Longest call, in seconds.
+    :type max_time: float
+    """
+
+    signal: str
+    slot: str
+    calls: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+
+    @property
+    def mean_time(self) -> float:
+        """Return the mean call duration.
+
+        :returns: Mean call duration in seconds.
+        :rtype: float
+        """
+        return self.total_time / self.calls if self.calls > 0 else 0.0
+
+
+def slot_name(slot: Callable[..., Any]) -> str:
+    """Return a readable qualified name of a slot.
+
+    :param slot: Connected callable.
+    :type slot: Callable[..., Any]
+    :returns: Slot name with its source location when available.
+    :rtype: str
+    """
+    if isinstance(slot, functools.partial):
+        return f"partial({slot_name(slot.func)})"
+
+    function = getattr(slot, "__func__", slot)
+    module = getattr(function, "__module__", None) or ""
+    qualname = getattr(function, "__qualname__", None)
+    if qualname is None:
+        return repr(slot)
+
+    name = f"{module}.{qualname}" if module else qualname
+    code = getattr(function, "__code__", None)
+    if code is not None and qualname.endswith("<lambda>"):
+        name += f" ({code.co_filename}:{code.co_firstlineno})"
+    return name
+
+
+def _max_positional_arguments(slot: Callable[..., Any]) -> Optional[int]:
+    """Return how many positional arguments a slot accepts.
+
+    PyQt silently drops extra signal arguments for slots accepting fewer of
+    them, and the proxy has to do the same.
+    """
+    try:
+        parameters = inspect.signature(slot).parameters.values()
+    except (TypeError, ValueError):
+        return None
+
+    count = 0
+    for parameter in parameters:
+        if parameter.kind == inspect.Parameter.VAR_POSITIONAL:
+            return None
+        if parameter.kind in (
+            inspect.Parameter.POSITIONAL_ONLY,
+            inspect.Parameter.POSITIONAL_OR_KEYWORD,
+        ):
+            count += 1
+    return count
+
+
+class _SlotProxy(QObject):
+    """Receiver standing between a signal and a profiled Python slot.
+
+    The proxy lives in the thread of the original receiver and is deleted
+    together with it, so connection type and automatic disconnection work
+    as for the original slot. Like PyQt, the proxy keeps bound method
+    slots through weak references and other callables strongly.
+    """
+
+    def __init__(
+        self,
+        profiler: "SignalProfiler",
+        key: SignalKey,
+        connection: "_SignalConnection",
+        slot: Callable[..., Any],
+    ) -> None:
+        super().__init__()
+        self.__profiler = profiler
+        self.__key = key
+        self.__connection = connection
+        self.__arguments_count = _max_positional_arguments(slot)
+
+        receiver = getattr(slot, "__self__", None)
+        self.__slot: Callable[[], Optional[Callable[..., Any]]]
+        if receiver is not None and hasattr(slot, "__func__"):
+            self.__slot = weakref.WeakMethod(slot)  # type: ignore[arg-type]
+        else:
+            self.__slot = lambda: slot
+
+        if isinstance(receiver, QObject) and not sip.isdeleted(receiver):
+            self.moveToThread(receiver.thread())
+            receiver.destroyed.connect(self.deleteLater)
+
+    def invoke(self, *args: Any) -> Any:  # noqa: ANN401
+        slot = self.__slot()
+        if slot is None:
+            # Receiver was garbage collected
+            self.deleteLater()
+            return None
+
+        if self.__arguments_count is not None:
+            args = args[: self.__arguments_count]
+
+        if not self.__profiler.is_recording:
+            return slot(*args)
+
+        start = time.perf_counter()
+        try:
+            return slot(*args)
+        finally:
+            self.__profiler.record(self.__key, time.perf_counter() - start)
+
+    def reconnect_directly(self) -> None:
+        """Connect the original slot instead of the proxy."""
+        bound_signal = self.__connection.original_signal()
+        if bound_signal is None:
+            return
+
+        with suppress(TypeError):
+            bound_signal.disconnect(self.invoke)
+
+        slot = self.__slot()
+        if slot is not None:
+            bound_signal.connect(
+                slot, *self.__connection.args, **self.__connection.kwargs
+            )
+
+
+@dataclass
+class _SignalConnection:
+    """Connection of a profiled slot, enough to restore it without a proxy.
+
+    The sender is referenced weakly, so that the proxy does not keep
+    Python-owned senders alive.
+    """
+
+    sender: "weakref.ref[QObject]"
+    signal: pyqtSignal
+    types: Any
+    args: Tuple[Any, ...]
+    kwargs: Dict[str, Any]
+
+    def original_signal(self) -> Optional[pyqtBoundSignal]:
+        sender = self.sender()
+        if sender is None or sip.isdeleted(sender):
+            return None
+        bound_signal = self.signal.__get__(sender, type(sender))
+        if self.types is not None:
+            bound_signal = bound_signal[self.types]
+        return bound_signal
+
+
+class _ProfiledBoundSignal:
+    """Bound signal wrapper connecting Python slots through proxies.
+
+    When the profiler is not installed, new connections are made directly
+    and only disconnection of proxied slots is routed.
+    """
+
+    def __init__(
+        self,
+        bound_signal: pyqtBoundSignal,
+        sender: QObject,
+        descriptor: "_ProfiledSignalDescriptor",
+        types: Any = None,  # noqa: ANN401
+    ) -> None:
+        self.__bound_signal = bound_signal
+        self.__sender = sender
+        self.__descriptor = descriptor
+        self.__types = types
+
+    def connect(self, slot: Any, *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        if isinstance(slot, _ProfiledBoundSignal):
+            slot = slot.original_signal
+        profiler = self.__descriptor.profiler
+        if (
+            not profiler.is_installed
+            or isinstance(slot, pyqtBoundSignal)
+            or not callable(slot)
+        ):
+            return self.__bound_signal.connect(slot, *args, **kwargs)
+
+        connection = _SignalConnection(
+            weakref.ref(self.__sender),
+            self.__descriptor.original,
+            self.__types,
+            args,
+            kwargs,
+        )
+        proxy = profiler.create_proxy(
+            self.__sender, self.__descriptor.signal_name, slot, connection
+        )
+        return self.__bound_signal.connect(proxy.invoke, *args, **kwargs)
+
+    def disconnect(self, *args: Any) -> Any:  # noqa: ANN401
+        profiler = self.__descriptor.profiler
+        signal_name = self.__descriptor.signal_name
+        if len(args) == 0:
+            profiler.forget_proxies(self.__sender, signal_name)
+            return self.__bound_signal.disconnect()
+
+        slot = args[0]
+        if isinstance(slot, _ProfiledBoundSignal):
+            slot = slot.original_signal
+
+        proxy = profiler.take_proxy(self.__sender, signal_name, slot)
+        if proxy is None:
+            return self.__bound_signal.disconnect(slot)
+
+        try:
+            return self.__bound_signal.disconnect(proxy.invoke)
+        finally:
+            proxy.deleteLater()
+
+    def emit(self, *args: Any) -> None:  # noqa: ANN401
+        self.__bound_signal.emit(*args)
+
+    @property
+    def original_signal(self) -> pyqtBoundSignal:
+        return self.__bound_signal
+
+    def __call__(self, *args: Any) -> None:  # noqa: ANN401
+        # Allows connecting other signals to this one
+        self.__bound_signal.emit(*args)
+
+    def __getitem__(self, types: Any) -> "_ProfiledBoundSignal":  # noqa: ANN401
+        return _ProfiledBoundSignal(
+            self.__bound_signal[types],
+            self.__sender,
+            self.__descriptor,
+            types,
+        )
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        return getattr(self.__bound_signal, name)
+
+    def __repr__(self) -> str:
+        return f"<profiled {self.__bound_signal!r}>"
+
+
+class _ProfiledSignalDescriptor:
+    """Class attribute replacing a ``pyqtSignal`` while profiling."""
+
+    def __init__(
+        self,
+        original: pyqtSignal,
+        signal_name: str,
+        profiler: "SignalProfiler",
+    ) -> None:
+        self.original = original
+        self.signal_name = signal_name
+        self.profiler = profiler
+
+    def __get__(self, instance: Optional[QObject], owner: type) -> Any:  # noqa: ANN401
+        bound_signal = self.original.__get__(instance, owner)
+        if instance is None or not (
+            self.profiler.is_installed or self.profiler.has_proxies
+        ):
+            return bound_signal
+        return _ProfiledBoundSignal(bound_signal, instance, self)
+
+
+class SignalProfiler(QObject):
+    """Profiles Python slots connected to selected QGIS signals.
+
+    While installed, the profiler replaces signal attributes of QGIS classes
+    so that Python slots connected from then on are called through a proxy
+    measuring their duration. Statistics are collected per (sender signal,
+    slot) pair while recording.
+
+    Slots connected before installation are not measured; reloading the
+    inspected plugin after ``start()`` reconnects its slots. After
+    ``stop()`` new connections are made directly, while proxied slots can
+    still be disconnected. ``restore()`` reconnects proxied slots directly
+    and restores the original class attributes. Wrapped signals
+    are not ``pyqtBoundSignal`` instances, so APIs which strictly require
+    one (e.g. ``QSignalSpy``) should not be used while profiling.
+    """
+
+    __signals: Tuple[Tuple[type, str], ...]
+    __descriptors: List[Tuple[type, str, _ProfiledSignalDescriptor]]
+    __proxies: Dict[Tuple[int, str, Any], _SlotProxy]
+    __statistics: Dict[SignalKey, SlotStatistics]
+    __lock: threading.Lock
+    __is_installed: bool
+    __is_recording: bool
+
+    def __init__(
+        self,
+        parent: Optional[QObject] = None,
+        signals: Tuple[Tuple[type, str], ...] = DEFAULT_SIGNALS,
+    ) -> None:
+        """Initialize SignalProfiler instance.
+
+        :param parent: Parent QObject.
+        :type parent: Optional[QObject]
+        :param signals: Pairs of (class, signal name) to profile.
+        :type signals: Tuple[Tuple[type, str], ...]
+        """
+        super().__init__(parent)
+        self.__signals = signals
+        self.__descriptors = []
+        self.__proxies = {}
+        self.__statistics = {}
+        self.__lock = threading.Lock()
+        self.__is_installed = False
+        self.__is_recording = False
+
+    @property
+    def is_installed(self) -> bool:
+        """Check whether new connections are routed through proxies.
+
+        :returns: True if signal attributes are replaced.
+        :rtype: bool
+        """
+        return self.__is_installed
+
+    @property
+    def is_recording(self) -> bool:
+        """Check whether slot calls are measured.
+
+        :returns: True if statistics are collected.
+        :rtype: bool
+        """
+        return self.__is_recording
+
+    def start(self) -> None:
+        """Install signal wrappers and start recording."""
+        self.__install()
+        self.__is_recording = True
+        logger.debug("Signal profiler started")
+
+    @property
+    def has_proxies(self) -> bool:
+        """Check whether profiled slots are still connected through proxies.
+
+        :returns: True if some proxies are alive.
+        :rtype: bool
+        """
+        return len(self.__proxies) > 0
+
+    def stop(self) -> None:
+        """Stop recording slot calls.
+
+        Already created proxies stay connected and forward calls without
+        measurement until they are disconnected or :meth:`restore` is
+        called.
+        """
+        self.__is_recording = False
+        self.__uninstall()
+        logger.debug("Signal profiler stopped")
+
+    def restore(self) -> None:
+        """Stop profiling and remove every trace of it from QGIS classes.
+
+        Slots connected through proxies are reconnected directly, so that
+        plugins can disconnect them after the signal attributes of QGIS
+        classes are restored.
+        """
+        self.stop()
+        proxies = list(self.__proxies.values())
+        self.__proxies = {}
+        for proxy in proxies:
+            if sip.isdeleted(proxy):
+                continue
+            proxy.reconnect_directly()
+            proxy.deleteLater()
+        self.__restore_descriptors()
+
+    def reset(self) -> None:
+        """Forget collected statistics."""
+        with self.__lock:
+            self.__statistics = {}
+
+    def statistics(self) -> List[SlotStatistics]:
+        """Return collected statistics sorted by total time.
+
+        :returns: Statistics per (signal, slot) pair, slowest first.
+        :rtype: List[SlotStatistics]
+        """
+        with self.__lock:
+            result = [
+                SlotStatistics(
+                    item.signal,
+                    item.slot,
+                    item.calls,
+                    item.total_time,
+                    item.max_time,
+                )
+                for item in self.__statistics.values()
+            ]
+        result.sort(key=lambda item: item.total_time, reverse=True)
+        return result
+
+    def report(self, limit: int = 20) -> str:
+        """Return a human readable report.
+
+        :param limit: Maximum number of rows.
+        :type limit: int
+        :returns: Multiline report text.
+        :rtype: str
+        """
+        lines = [f"{'calls':>8} {'total ms':>10} {'max ms':>9}  signal → slot"]
+        lines.extend(
+            f"{item.calls:>8} {item.total_time * 1000:>10.1f} "
+            f"{item.max_time * 1000:>9.1f}  {item.signal} → {item.slot}"
+            for item in self.statistics()[:limit]
+        )
+        return "\n".join(lines)
+
+    def record(self, key: SignalKey, duration: float) -> None:
+        """Account a slot call.
+
+        :param key: Pair of (signal, slot) names.
+        :type key: SignalKey
+        :param duration: Call duration in seconds.
+        :type duration: float
+        """
+        with self.__lock:
+            statistics = self.__statistics.get(key)
+            if statistics is None:
+                statistics = SlotStatistics(*key)
+                self.__statistics[key] = statistics
+            statistics.calls += 1
+            statistics.total_time += duration
+            statistics.max_time = max(statistics.max_time, duration)
+
+    def create_proxy(
+        self,
+        sender: QObject,
+        signal_name: str,
+        slot: Callable[..., Any],
+        connection: _SignalConnection,
+    ) -> _SlotProxy:
+        """Create a measuring proxy for a new connection.
+
+        :param sender: Object emitting the signal.
+        :type sender: QObject
+        :param signal_name: Qualified signal name.
+        :type signal_name: str
+        :param slot: Connected callable.
+        :type slot: Callable[..., Any]
+        :param connection: Data to connect the slot without the proxy.
+        :type connection: _SignalConnection
+        :returns: Proxy to connect instead of the slot.
+        :rtype: _SlotProxy
+        """
+        proxy = _SlotProxy(
+            self, (signal_name, slot_name(slot)), connection, slot
+        )
+        key = (id(sender), signal_name, self.__slot_key(slot))
+
+        previous = self.__proxies.pop(key, None)
+        if previous is not None and not sip.isdeleted(previous):
+            previous.deleteLater()
+
+        self.__proxies[key] = proxy
+        sender.destroyed.connect(proxy.deleteLater)
+        proxy.destroyed.connect(lambda: self.__forget_proxy(key, proxy))
+        return proxy
+
+    def take_proxy(
+        self, sender: QObject, signal_name: str, slot: Callable[..., Any]
+    ) -> Optional[_SlotProxy]:
+        """Remove and return the proxy created for a connection.
+
+        :param sender: Object emitting the signal.
+        :type sender: QObject
+        :param signal_name: Qualified signal name.
+        :type signal_name: str
+        :param slot: Originally connected callable.
+        :type slot: Callable[..., Any]
+        :returns: Proxy or None if the slot was connected directly.
+        :rtype: Optional[_SlotProxy]
+        """
+        key = (id(sender), signal_name, self.__slot_key(slot))
+        proxy = self.__proxies.pop(key, None)
+        if proxy is None or sip.isdeleted(proxy):
+            return None
+        return proxy
+
+    def forget_proxies(self, sender: QObject, signal_name: str) -> None:
+        """Delete proxies of all connections of a signal.
+
+        :param sender: Object emitting the signal.
+        :type sender: QObject
+        :param signal_name: Qualified signal name.
+        :type signal_name: str
+        """
+        keys = [
+            key
+            for key in self.__proxies
+            if key[0] == id(sender) and key[1] == signal_name
+        ]
+        for key in keys:
+            proxy = self.__proxies.pop(key)
+            if not sip.isdeleted(proxy):
+                proxy.deleteLater()
+
+    def __install(self) -> None:
+        if self.__is_installed:
+            return
+
+        if len(self.__descriptors) == 0:
+            for signal_class, name in self.__signals:
+                self.__replace_signal(signal_class, name)
+
+        self.__is_installed = True
+
+    def __uninstall(self) -> None:
+        if not self.__is_installed:
+            return
+
+        self.__is_installed = False
+
+        # Descriptors with live proxies are kept to route disconnection of
+        # profiled slots, new connections are made directly
+        if self.has_proxies:
+            return
+        self.__restore_descriptors()
+
+    def __restore_descriptors(self) -> None:
+        for owner, name, descriptor in self.__descriptors:
+            if owner.__dict__.get(name) is descriptor:
+                setattr(owner, name, descriptor.original)
+        self.__descriptors = []
+
+    def __replace_signal(self, signal_class: type, name: str) -> None:
+        if not hasattr(signal_class, name):  # sip adds attributes lazily
+            logger.debug(f"Signal {signal_class.__name__}.{name} not found")
+            return
+
+        owner = next(
+            (
+                klass
+                for klass in signal_class.__mro__
+                if name in klass.__dict__
+            ),
+            None,
+        )
+        if owner is None:
+            return
+
+        original = owner.__dict__[name]
+        if isinstance(original, _ProfiledSignalDescriptor):
+            return
+
+        descriptor = _ProfiledSignalDescriptor(
+            original, f"{owner.__name__}.{name}", self
+        )
+        setattr(owner, name, descriptor)
+        self.__descriptors.append((owner, name, descriptor))
+
+    def __slot_key(self, slot: Any) -> Any:  # noqa: ANN401
+        try:
+            hash(slot)
+        except TypeError:
+            return id(slot)
+        return slot
+
+    def __forget_proxy(
+        self, key: Tuple[int, str, Any], proxy: _SlotProxy
+    ) -> None:
+        if self.__proxies.get(key) is proxy:
+            del self.__proxies[key]
+        if not self.__is_installed and not self.has_proxies:
+            self.__restore_descriptors()
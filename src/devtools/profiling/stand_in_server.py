@@ -0,0 +1,371 @@
+# QGIS DevTools Plugin
+# Copyright (C) 2025  NextGIS
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or any
+# later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+import re
+import struct
+import threading
+import time
+import zlib
+from functools import lru_cache
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import TracebackType
+from typing import Dict, Optional, Tuple, Type
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+TILE_PATH_PATTERN = re.compile(r"^/xyz/(\d+)/(\d+)/(\d+)\.png$")
+MAX_IMAGE_SIZE = 4096
+
+Color = Tuple[int, int, int, int]
+
+WMS_CAPABILITIES = """<?xml version="1.0" encoding="UTF-8"?>
+<WMS_Capabilities version="1.3.0" xmlns="http://www.opengis.net/wms"
+    xmlns:xlink="http://www.w3.org/1999/xlink">
+  <Service>
+    <Name>WMS</Name>
+    <Title>DevTools stand-in server</Title>
+    <OnlineResource xlink:href="{url}"/>
+  </Service>
+  <Capability>
+    <Request>
+      <GetCapabilities>
+        <Format>text/xml</Format>
+        <DCPType><HTTP><Get>
+          <OnlineResource xlink:href="{url}?"/>
+        </Get></HTTP></DCPType>
+      </GetCapabilities>
+      <GetMap>
+        <Format>image/png</Format>
+        <DCPType><HTTP><Get>
+          <OnlineResource xlink:href="{url}?"/>
+        </Get></HTTP></DCPType>
+      </GetMap>
+    </Request>
+    <Exception><Format>XML</Format></Exception>
+    <Layer>
+      <Title>DevTools stand-in server</Title>
+      <CRS>EPSG:3857</CRS>
+      <CRS>EPSG:4326</CRS>
+      <EX_GeographicBoundingBox>
+        <westBoundLongitude>-180</westBoundLongitude>
+        <eastBoundLongitude>180</eastBoundLongitude>
+        <southBoundLatitude>-85</southBoundLatitude>
+        <northBoundLatitude>85</northBoundLatitude>
+      </EX_GeographicBoundingBox>
+      <Layer queryable="0">
+        <Name>stand_in</Name>
+        <Title>Stand-in layer</Title>
+      </Layer>
+    </Layer>
+  </Capability>
+</WMS_Capabilities>
+"""
+
+
+@lru_cache(maxsize=64)
+def png_image(width: int, height: int, color: Color) -> bytes:
+    """Return a solid color PNG image.
+
+    :param width: Image width.
+    :type width: int
+    :param height: Image height.
+    :type height: int
+    :param color: RGBA color.
+    :type color: Tuple[int, int, int, int]
+    :returns: PNG file content.
+    :rtype: bytes
+    """
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        checksum = zlib.crc32(kind + data) & 0xFFFFFFFF
+        return (
+            struct.pack(">I", len(data))
+            + kind
+            + data
+            + struct.pack(">I", checksum)
+        )
+
+    row = b"\x00" + bytes(color) * width
+    header = struct.pack(">IIBBBBB", width, height, 8, 6, 0, 0, 0)
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", header)
+        + chunk(b"IDAT", zlib.compress(row * height))
+        + chunk(b"IEND", b"")
+    )
+
+
+class _StandInRequestHandler(BaseHTTPRequestHandler):
+    """Serves XYZ tiles and WMS images of a :class:`StandInServer`."""
+
+    server: "_StandInHttpServer"
+
+    def do_GET(self) -> None:
+        stand_in = self.server.stand_in
+        stand_in._account()  # noqa: SLF001
+        if stand_in.latency > 0:
+            time.sleep(stand_in.latency)
+
+        split = urlsplit(self.path)
+        match = TILE_PATH_PATTERN.match(split.path)
+        if match is not None:
+            z, x, y = (int(value) for value in match.groups())
+            color = (
+                (40 * z) % 256,
+                160 if (x + y) % 2 else 96,
+                200,
+                255,
+            )
+            self.__send(
+                png_image(stand_in.tile_size, stand_in.tile_size, color)
+            )
+            return
+
+        if split.path == "/wms":
+            query = {
+                key.upper(): value for key, value in parse_qsl(split.query)
+            }
+            self.__send_wms(query)
+            return
+
+        self.send_error(HTTPStatus.NOT_FOUND)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        """Do not write the access log to stderr."""
+
+    def __send_wms(self, query: Dict[str, str]) -> None:
+        request = query.get("REQUEST", "").lower()
+        if request == "getcapabilities":
+            content = WMS_CAPABILITIES.format(
+                url=self.server.stand_in.wms_url
+            ).encode()
+            self.__send(content, "text/xml")
+            return
+
+        if request == "getmap":
+            try:
+                width = int(query.get("WIDTH", "256"))
+                height = int(query.get("HEIGHT", "256"))
+            except ValueError:
+                self.send_error(HTTPStatus.BAD_REQUEST)
+                return
+            width = min(max(width, 1), MAX_IMAGE_SIZE)
+            height = min(max(height, 1), MAX_IMAGE_SIZE)
+            self.__send(png_image(width, height, (96, 160, 200, 255)))
+            return
+
+        self.send_error(HTTPStatus.BAD_REQUEST)
+
+    def __send(self, content: bytes, content_type: str = "image/png") -> None:
+        max_age = self.server.stand_in.max_age
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(content)))
+        self.send_header(
+            "Cache-Control",
+            f"max-age={max_age}" if max_age > 0 else "no-store",
+        )
+        self.end_headers()
+        self.wfile.write(content)
+
+
+class _StandInHttpServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(
+        self, address: Tuple[str, int], stand_in: "StandInServer"
+    ) -> None:
+        super().__init__(address, _StandInRequestHandler)
+        self.stand_in = stand_in
+
+
+class StandInServer:
+    """Local HTTP server standing in for XYZ and WMS services.
+
+    Serves solid color PNG tiles at ``/xyz/{z}/{x}/{y}.png`` and a minimal
+    WMS 1.3.0 at ``/wms`` with a configurable latency and cache lifetime,
+    so that tile-heavy plugins can be profiled and tested offline.
+
+    Usage::
+
+        with StandInServer(latency=0.05) as server:
+            layer = QgsRasterLayer(server.xyz_layer_uri(), "tiles", "wms")
+    """
+
+    def __init__(
+        self,
+        *,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        max_age: int = 3600,
+        tile_size: int = 256,
+    ) -> None:
+        """Initialize StandInServer instance.
+
+        :param host: Address to listen on.
+        :type host: str
+        :param port: Port to listen on, any free port by default.
+        :type port: int
+        :param latency: Delay before every response in seconds.
+        :type latency: float
+        :param max_age: ``Cache-Control`` max age in seconds, 0 disables
+            caching.
+        :type max_age: int
+        :param tile_size: XYZ tile size in pixels.
+        :type tile_size: int
+        """
+        self.latency = latency
+        self.max_age = max_age
+        self.tile_size = tile_size
+        self.__address = (host, port)
+        self.__server: Optional[_StandInHttpServer] = None
+        self.__thread: Optional[threading.Thread] = None
+        self.__lock = threading.Lock()
+        self.__requests_count = 0
+
+    def __enter__(self) -> "StandInServer":  # noqa: PYI034
+        """Start the server.
+
+        :returns: Started server.
+        :rtype: StandInServer
+        """
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Stop the server."""
+        self.stop()
+
+    @property
+    def is_running(self) -> bool:
+        """Check whether the server is running.
+
+        :returns: True if requests are served.
+        :rtype: bool
+        """
+        return self.__server is not None
+
+    @property
+    def url(self) -> str:
+        """Return the server base URL.
+
+        :returns: URL without a trailing slash.
+        :rtype: str
+        :raises AssertionError: If the server is not running.
+        """
+        assert self.__server is not None, "Stand-in server is not running"
+        host, port = self.__server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def xyz_url(self) -> str:
+        """Return the XYZ tiles URL template.
+
+        :returns: URL with ``{z}``, ``{x}`` and ``{y}`` placeholders.
+        :rtype: str
+        """
+        return f"{self.url}/xyz/{{z}}/{{x}}/{{y}}.png"
+
+    @property
+    def wms_url(self) -> str:
+        """Return the WMS endpoint URL.
+
+        :returns: URL of the WMS service.
+        :rtype: str
+        """
+        return f"{self.url}/wms"
+
+    @property
+    def requests_count(self) -> int:
+        """Return the number of served requests.
+
+        :returns: Number of requests since the start.
+        :rtype: int
+        """
+        with self.__lock:
+            return self.__requests_count
+
+    def xyz_layer_uri(self, *, zmin: int = 0, zmax: int = 19) -> str:
+        """Return a raster layer URI for the XYZ tiles.
+
+        :param zmin: Minimal zoom level.
+        :type zmin: int
+        :param zmax: Maximal zoom level.
+        :type zmax: int
+        :returns: URI for the ``wms`` provider.
+        :rtype: str
+        """
+        return urlencode(
+            {"type": "xyz", "url": self.xyz_url, "zmin": zmin, "zmax": zmax},
+            safe="/:{}",
+        )
+
+    def wms_layer_uri(self, *, crs: str = "EPSG:3857") -> str:
+        """Return a raster layer URI for the WMS layer.
+
+        :param crs: Requested CRS.
+        :type crs: str
+        :returns: URI for the ``wms`` provider.
+        :rtype: str
+        """
+        return urlencode(
+            {
+                "url": self.wms_url,
+                "layers": "stand_in",
+                "styles": "",
+                "format": "image/png",
+                "crs": crs,
+            },
+            safe="/:",
+        )
+
+    def start(self) -> None:
+        """Start serving requests in a background thread."""
+        if self.__server is not None:
+            return
+
+        with self.__lock:
+            self.__requests_count = 0
+        self.__server = _StandInHttpServer(self.__address, self)
+        self.__thread = threading.Thread(
+            target=self.__server.serve_forever,
+            name="DevToolsStandInServer",
+            daemon=True,
+        )
+        self.__thread.start()
+
+    def stop(self) -> None:
+        """Stop the server and wait for the thread to finish."""
+        if self.__server is None:
+            return
+
+        self.__server.shutdown()
+        self.__server.server_close()
+        if self.__thread is not None:
+            self.__thread.join()
+        self.__server = None
+        self.__thread = None
+
+    def _account(self) -> None:
+        with self.__lock:
+            self.__requests_count += 1
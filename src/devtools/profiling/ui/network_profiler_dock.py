@@ -0,0 +1,483 @@
+# QGIS DevTools Plugin
+# Copyright (C) 2025  NextGIS
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or any
+# later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+import time
+from pathlib import Path
+from typing import Any, List, Optional, Set, Tuple
+
+from qgis.gui import QgsDockWidget
+from qgis.PyQt import uic
+from qgis.PyQt.QtCore import (
+    QAbstractTableModel,
+    QModelIndex,
+    QObject,
+    QRectF,
+    QSortFilterProxyModel,
+    Qt,
+    pyqtSlot,
+)
+from qgis.PyQt.QtGui import QColor, QPainter
+from qgis.PyQt.QtWidgets import (
+    QHeaderView,
+    QPushButton,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
+    QTableView,
+    QWidget,
+)
+
+from devtools.core.exceptions import DevToolsUiLoadError
+from devtools.profiling.network_profiler import (
+    NetworkProfiler,
+    NetworkRequestRecord,
+)
+
+SORT_ROLE = Qt.ItemDataRole.UserRole + 1
+WATERFALL_ROLE = Qt.ItemDataRole.UserRole + 2
+
+INITIATOR_COLUMN = 0
+METHOD_COLUMN = 1
+URL_COLUMN = 2
+STATUS_COLUMN = 3
+SIZE_COLUMN = 4
+LATENCY_COLUMN = 5
+CACHE_COLUMN = 6
+WATERFALL_COLUMN = 7
+
+
+class _WaterfallDelegate(QStyledItemDelegate):
+    """Paints a request bar on the common timeline."""
+
+    NETWORK_COLOR = QColor(66, 133, 244)
+    CACHE_COLOR = QColor(52, 168, 83)
+    ERROR_COLOR = QColor(219, 68, 55)
+    RUNNING_COLOR = QColor(160, 160, 160)
+
+    def paint(
+        self,
+        painter: QPainter,
+        option: QStyleOptionViewItem,
+        index: QModelIndex,
+    ) -> None:
+        super().paint(painter, option, index)
+        bar = index.data(WATERFALL_ROLE)
+        if bar is None:
+            return
+
+        start, width, color = bar
+        rect = QRectF(option.rect).adjusted(2, 4, -2, -4)
+        bar_rect = QRectF(
+            rect.left() + rect.width() * start,
+            rect.top(),
+            max(rect.width() * width, 2.0),
+            rect.height(),
+        )
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(color)
+        painter.drawRoundedRect(bar_rect, 2, 2)
+        painter.restore()
+
+
+class _NetworkRequestModel(QAbstractTableModel):
+    """Table of profiler records, updated in place.
+
+    The profiler drops the oldest records and appends new ones, so an
+    update removes rows from the top, inserts rows at the bottom and
+    reports changes only for requests which were running.
+    """
+
+    __records: List[NetworkRequestRecord]
+    __running: Set[int]
+    __origin: float
+    __span: float
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self.__records = []
+        self.__running = set()
+        self.__origin = 0.0
+        self.__span = 0.0
+
+    @property
+    def span(self) -> float:
+        """Return the time from the first request start to the last event.
+
+        :returns: Timeline length in seconds.
+        :rtype: float
+        """
+        return self.__span
+
+    def records(self) -> List[NetworkRequestRecord]:
+        """Return the shown records.
+
+        :returns: Records in creation order.
+        :rtype: List[NetworkRequestRecord]
+        """
+        return self.__records
+
+    def update(self, records: List[NetworkRequestRecord]) -> None:
+        """Synchronize rows with profiler records.
+
+        :param records: Profiler records in creation order.
+        :type records: List[NetworkRequestRecord]
+        """
+        removed = self.__removed_count(records)
+        if removed is None:
+            self.beginResetModel()
+            self.__records = records
+            self.endResetModel()
+        else:
+            self.__apply(records, removed)
+
+        self.__running = {
+            record.request_id
+            for record in self.__records
+            if not record.is_finished
+        }
+        now = time.monotonic()
+        self.__origin = records[0].started if records else 0.0
+        self.__span = max(
+            (
+                (record.finished or now) - self.__origin
+                for record in self.__records
+            ),
+            default=0.0,
+        )
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: B008, N802
+        """Return the number of requests.
+
+        :param parent: Parent index.
+        :type parent: QModelIndex
+        :returns: Rows count.
+        :rtype: int
+        """
+        return 0 if parent.isValid() else len(self.__records)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: B008, N802
+        """Return the number of columns.
+
+        :param parent: Parent index.
+        :type parent: QModelIndex
+        :returns: Columns count.
+        :rtype: int
+        """
+        return 0 if parent.isValid() else WATERFALL_COLUMN + 1
+
+    def headerData(  # noqa: N802
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> Any:  # noqa: ANN401
+        """Return column titles.
+
+        :param section: Column number.
+        :type section: int
+        :param orientation: Header orientation.
+        :type orientation: Qt.Orientation
+        :param role: Data role.
+        :type role: int
+        :returns: Column title for the display role.
+        :rtype: Any
+        """
+        if (
+            orientation != Qt.Orientation.Horizontal
+            or role != Qt.ItemDataRole.DisplayRole
+        ):
+            return None
+        titles = (
+            self.tr("Initiator"),
+            self.tr("Method"),
+            self.tr("URL"),
+            self.tr("Status"),
+            self.tr("Size, KiB"),
+            self.tr("Latency, ms"),
+            self.tr("Cache"),
+            self.tr("Waterfall"),
+        )
+        return titles[section] if 0 <= section < len(titles) else None
+
+    def data(
+        self,
+        index: QModelIndex,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> Any:  # noqa: ANN401
+        """Return cell data.
+
+        :param index: Cell index.
+        :type index: QModelIndex
+        :param role: Data role.
+        :type role: int
+        :returns: Data for the role.
+        :rtype: Any
+        """
+        handlers = {
+            Qt.ItemDataRole.DisplayRole: self.__text,
+            Qt.ItemDataRole.ToolTipRole: self.__tooltip,
+            Qt.ItemDataRole.TextAlignmentRole: self.__alignment,
+            SORT_ROLE: self.__sort_value,
+            WATERFALL_ROLE: self.__bar,
+        }
+        handler = handlers.get(role)
+        if (
+            handler is None
+            or not index.isValid()
+            or index.row() >= len(self.__records)
+        ):
+            return None
+        return handler(self.__records[index.row()], index.column())
+
+    def __removed_count(
+        self, records: List[NetworkRequestRecord]
+    ) -> Optional[int]:
+        # Number of rows dropped from the top, None if the records can't be
+        # reached by removing and appending rows
+        current = self.__records
+        if not current:
+            return 0
+        if not records:
+            return None
+
+        first = records[0]
+        removed = next(
+            (row for row, record in enumerate(current) if record is first),
+            None,
+        )
+        if removed is None:
+            return None
+
+        kept = len(current) - removed
+        if kept > len(records) or records[kept - 1] is not current[-1]:
+            return None
+        return removed
+
+    def __apply(
+        self, records: List[NetworkRequestRecord], removed: int
+    ) -> None:
+        if removed > 0:
+            self.beginRemoveRows(QModelIndex(), 0, removed - 1)
+            self.__records = self.__records[removed:]
+            self.endRemoveRows()
+
+        kept = len(self.__records)
+        if len(records) > kept:
+            self.beginInsertRows(QModelIndex(), kept, len(records) - 1)
+            self.__records = records
+            self.endInsertRows()
+        else:
+            self.__records = records
+
+        for row, record in enumerate(records[:kept]):
+            if record.request_id in self.__running:
+                self.dataChanged.emit(
+                    self.index(row, 0), self.index(row, CACHE_COLUMN)
+                )
+
+    def __text(
+        self, record: NetworkRequestRecord, column: int
+    ) -> Optional[str]:
+        latency = record.latency
+        texts = {
+            INITIATOR_COLUMN: record.initiator,
+            METHOD_COLUMN: record.operation,
+            URL_COLUMN: record.url,
+            STATUS_COLUMN: (
+                self.tr("timed out")
+                if record.timed_out
+                else str(record.status_code or "")
+            ),
+            SIZE_COLUMN: f"{record.bytes_received / 1024:.1f}",
+            LATENCY_COLUMN: (
+                f"{latency * 1000:.0f}" if latency is not None else "…"
+            ),
+            CACHE_COLUMN: self.tr("hit") if record.from_cache else "",
+        }
+        return texts.get(column)
+
+    def __sort_value(self, record: NetworkRequestRecord, column: int) -> Any:  # noqa: ANN401
+        if column == INITIATOR_COLUMN:
+            return record.initiator.lower()
+        if column == STATUS_COLUMN:
+            return record.status_code or 0
+        if column == SIZE_COLUMN:
+            return record.bytes_received
+        if column == LATENCY_COLUMN:
+            latency = record.latency
+            return latency if latency is not None else -1.0
+        if column == WATERFALL_COLUMN:
+            return record.started - self.__origin
+        return self.__text(record, column)
+
+    def __tooltip(
+        self, record: NetworkRequestRecord, column: int
+    ) -> Optional[str]:
+        if column == URL_COLUMN:
+            return record.error or record.url
+        if column == WATERFALL_COLUMN:
+            return self.tr("Started at {offset:.0f} ms").format(
+                offset=(record.started - self.__origin) * 1000
+            )
+        return None
+
+    def __alignment(
+        self,
+        _record: NetworkRequestRecord,
+        column: int,
+    ) -> Optional[Qt.AlignmentFlag]:
+        if column not in (STATUS_COLUMN, SIZE_COLUMN, LATENCY_COLUMN):
+            return None
+        return Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+
+    def __bar(
+        self, record: NetworkRequestRecord, column: int
+    ) -> Optional[Tuple[float, float, QColor]]:
+        if column != WATERFALL_COLUMN or self.__span <= 0:
+            return None
+
+        if record.error or record.timed_out:
+            color = _WaterfallDelegate.ERROR_COLOR
+        elif not record.is_finished:
+            color = _WaterfallDelegate.RUNNING_COLOR
+        elif record.from_cache:
+            color = _WaterfallDelegate.CACHE_COLOR
+        else:
+            color = _WaterfallDelegate.NETWORK_COLOR
+
+        offset = record.started - self.__origin
+        duration = (record.finished or time.monotonic()) - record.started
+        return (
+            offset / self.__span,
+            min(duration / self.__span, 1.0),
+            color,
+        )
+
+
+class NetworkProfilerDock(QgsDockWidget):
+    """Dock widget with a waterfall of recorded network requests."""
+
+    def __init__(
+        self, profiler: NetworkProfiler, parent: Optional[QWidget] = None
+    ) -> None:
+        """Initialize the network profiler dock.
+
+        :param profiler: Profiler providing request records.
+        :type profiler: NetworkProfiler
+        :param parent: Optional parent widget.
+        :type parent: Optional[QWidget]
+        """
+        super().__init__(parent)
+        self.setObjectName("DevToolsNetworkProfilerDock")
+        self.setWindowTitle(self.tr("Network Profiler"))
+        self.__profiler = profiler
+        self.__profiler.requests_changed.connect(self.refresh)
+
+        self.__load_ui()
+        self.refresh()
+
+    @pyqtSlot()
+    def refresh(self) -> None:
+        """Update requests from the profiler."""
+        self.__model.update(self.__profiler.records())
+        # Bars of all rows move when the timeline grows
+        self.__widget.table_view.viewport().update()
+
+        records = self.__model.records()
+        if not records:
+            self.__widget.summary_label.setText(
+                self.tr("No network requests recorded yet")
+            )
+            return
+
+        finished = [record for record in records if record.is_finished]
+        cached = sum(1 for record in finished if record.from_cache)
+        size = sum(record.bytes_received for record in finished)
+        self.__widget.summary_label.setText(
+            self.tr(
+                "{count} request(s) in {span:.1f} s, {cached} from cache, "
+                "{size:.0f} KiB downloaded"
+            ).format(
+                count=len(records),
+                span=self.__model.span,
+                cached=cached,
+                size=size / 1024,
+            )
+        )
+
+    def __load_ui(self) -> None:
+        widget: Optional[QWidget] = None
+        try:
+            widget = uic.loadUi(
+                str(Path(__file__).parent / "network_profiler_dock_base.ui")
+            )
+        except Exception as error:
+            raise DevToolsUiLoadError from error
+
+        if widget is None:
+            raise DevToolsUiLoadError
+
+        self.__widget = widget
+        self.setWidget(self.__widget)
+
+        self.__model = _NetworkRequestModel(self)
+
+        self.__proxy_model = QSortFilterProxyModel(self)
+        self.__proxy_model.setSourceModel(self.__model)
+        self.__proxy_model.setSortRole(SORT_ROLE)
+        self.__proxy_model.setFilterKeyColumn(-1)
+        self.__proxy_model.setFilterCaseSensitivity(
+            Qt.CaseSensitivity.CaseInsensitive
+        )
+
+        table_view: QTableView = self.__widget.table_view
+        table_view.setModel(self.__proxy_model)
+        table_view.setItemDelegateForColumn(
+            WATERFALL_COLUMN, _WaterfallDelegate(table_view)
+        )
+        table_view.sortByColumn(WATERFALL_COLUMN, Qt.SortOrder.AscendingOrder)
+        # Measuring contents would visit every row on each refresh
+        header = table_view.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+        header.setSectionResizeMode(
+            WATERFALL_COLUMN, QHeaderView.ResizeMode.Stretch
+        )
+        character_width = table_view.fontMetrics().averageCharWidth()
+        header.resizeSection(INITIATOR_COLUMN, character_width * 20)
+        header.resizeSection(METHOD_COLUMN, character_width * 8)
+        header.resizeSection(URL_COLUMN, character_width * 40)
+        header.resizeSection(STATUS_COLUMN, character_width * 8)
+        header.resizeSection(SIZE_COLUMN, character_width * 10)
+        header.resizeSection(LATENCY_COLUMN, character_width * 10)
+        header.resizeSection(CACHE_COLUMN, character_width * 6)
+
+        self.__widget.filter_lineedit.textChanged.connect(
+            self.__proxy_model.setFilterFixedString
+        )
+
+        record_button: QPushButton = self.__widget.record_button
+        record_button.setChecked(self.__profiler.is_running)
+        record_button.toggled.connect(self.__on_record_toggled)
+        self.__widget.reset_button.clicked.connect(self.__profiler.reset)
+
+    @pyqtSlot(bool)
+    def __on_record_toggled(self, checked: bool) -> None:
+        if checked:
+            self.__profiler.start()
+        else:
+            self.__profiler.stop()
@@ -0,0 +1,190 @@
+# QGIS DevTools Plugin
+# Copyright (C) 2025  NextGIS
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or any
+# later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, see <https://www.gnu.org/licenses/>.
+
+from pathlib import Path
+from typing import List, Optional
+
+from qgis.gui import (
+    QgsOptionsPageWidget,
+    QgsOptionsWidgetFactory,
+)
+from qgis.PyQt import uic
+from qgis.PyQt.QtCore import Qt
+from qgis.PyQt.QtWidgets import (
+    QCheckBox,
+    QGroupBox,
+    QLabel,
+    QSpinBox,
+    QVBoxLayout,
+    QWidget,
+)
+
+from devtools.core.constants import PACKAGE_NAME
+from devtools.core.exceptions import DevToolsUiLoadError
+from devtools.core.logging import logger
+from devtools.devtools_interface import DevToolsInterface
+from devtools.profiling.profiling_settings import ProfilingSettings
+from devtools.ui.utils import material_icon
+
+
+class ProfilingSettingsPage(QgsOptionsPageWidget):
+    """Widget for managing profiling settings in QGIS DevTools.
+
+    Provides UI for configuring profiling and diagnostics tools.
+    """
+
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        """Initialize the profiling settings page.
+
+        :param parent: Optional parent widget.
+        :type parent: Optional[QWidget]
+        """
+        super().__init__(parent)
+        self.setObjectName("ProfilingSettingsPage")
+
+        self.__load_ui()
+        self.__load_settings()
+
+    def apply(self) -> None:
+        """Apply changes made in the settings page.
+
+        Saves profiling settings and emits a signal.
+        """
+        settings = ProfilingSettings()
+        settings.detect_leaks_on_reload = (
+            self.detect_leaks_checkbox.isChecked()
+        )
+        settings.is_freeze_watchdog_enabled = (
+            self.watchdog_groupbox.isChecked()
+        )
+        settings.freeze_threshold_ms = self.freeze_threshold_spinbox.value()
+        settings.is_gdal_tracing_enabled = (
+            self.gdal_tracing_checkbox.isChecked()
+        )
+
+        plugin = DevToolsInterface.instance()
+        plugin.settings_changed.emit()
+
+    def cancel(self) -> None:
+        """Cancel changes made in the settings page."""
+        self.__load_settings()
+
+    def __load_ui(self) -> None:
+        widget: Optional[QWidget] = None
+        try:
+            widget = uic.loadUi(
+                str(Path(__file__).parent / "profiling_settings_page_base.ui")
+            )
+        except Exception as error:
+            raise DevToolsUiLoadError from error
+
+        if widget is None:
+            raise DevToolsUiLoadError
+
+        self.__widget = widget
+        self.__widget.setParent(self)
+
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.setLayout(layout)
+        layout.addWidget(self.__widget)
+
+        self.detect_leaks_checkbox: QCheckBox = (
+            self.__widget.detect_leaks_checkbox
+        )
+        self.watchdog_groupbox: QGroupBox = self.__widget.watchdog_groupbox
+        self.freeze_threshold_spinbox: QSpinBox = (
+            self.__widget.freeze_threshold_spinbox
+        )
+        self.gdal_tracing_checkbox: QCheckBox = (
+            self.__widget.gdal_tracing_checkbox
+        )
+
+    def __load_settings(self) -> None:
+        settings = ProfilingSettings()
+        self.detect_leaks_checkbox.setChecked(settings.detect_leaks_on_reload)
+        self.watchdog_groupbox.setChecked(settings.is_freeze_watchdog_enabled)
+        self.freeze_threshold_spinbox.setValue(settings.freeze_threshold_ms)
+        self.gdal_tracing_checkbox.setChecked(settings.is_gdal_tracing_enabled)
+
+
+class ProfilingSettingsErrorPage(QgsOptionsPageWidget):
+    """Error page shown if the profiling settings page fails to load.
+
+    Displays an error message in the options dialog.
+    """
+
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        """Initialize the error page widget.
+
+        :param parent: Optional parent widget.
+        :type parent: Optional[QWidget]
+        """
+        super().__init__(parent)
+        self.setObjectName("ProfilingSettingsPage")
+
+        self.widget = QLabel(
+            self.tr("An error occurred while loading settings page"), self
+        )
+        self.widget.setAlignment(Qt.AlignmentFlag.AlignCenter)
+
+        layout = QVBoxLayout()
+        self.setLayout(layout)
+        layout.addWidget(self.widget)
+
+    def apply(self) -> None:
+        """Apply changes (no-op for error page)."""
+
+    def cancel(self) -> None:
+        """Cancel changes (no-op for error page)."""
+
+
+class ProfilingSettingsPageFactory(QgsOptionsWidgetFactory):
+    """Factory for creating the profiling settings page in QGIS options.
+
+    Registers the profiling settings page in the QGIS options dialog.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the settings page factory."""
+        super().__init__()
+        self.setTitle(self.tr("Profiling"))
+        self.setIcon(material_icon("code"))
+        self.setKey("profiling")
+
+    def path(self) -> List[str]:
+        """Return the settings page path in the options dialog.
+
+        :returns: List of path elements.
+        :rtype: List[str]
+        """
+        return [PACKAGE_NAME]
+
+    def createWidget(
+        self, parent: Optional[QWidget] = None
+    ) -> Optional[QgsOptionsPageWidget]:
+        """Create and return the profiling settings page widget.
+
+        :param parent: Optional parent widget.
+        :type parent: Optional[QWidget]
+        :returns: Settings page widget or error page if loading fails.
+        :rtype: Optional[QgsOptionsPageWidget]
+        """
+        try:
+            return ProfilingSettingsPage(parent)
+        except Exception:
+            logger.exception("An error occurred while loading settings page")
+            return ProfilingSettingsErrorPage(parent)
@@ -0,0 +1,177 @@
+# QGIS DevTools Plugin
+# Copyright (C) 2025  NextGIS
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or any
+# later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, see <https://www.gnu.org/licenses/>.
+
+
+import math
+from pathlib import Path
+from typing import List, Optional
+
+from qgis.gui import QgsDockWidget
+from qgis.PyQt import uic
+from qgis.PyQt.QtCore import QSortFilterProxyModel, Qt, pyqtSlot
+from qgis.PyQt.QtGui import QFont, QStandardItem, QStandardItemModel
+from qgis.PyQt.QtWidgets import QHeaderView, QPushButton, QTableView, QWidget
+from qgis.utils import iface
+
+from devtools.core.exceptions import DevToolsUiLoadError
+from devtools.profiling.render_profiler import (
+    LayerRenderStatistics,
+    RenderProfiler,
+)
+
+SORT_ROLE = Qt.ItemDataRole.UserRole + 1
+
+
+class RenderProfilerDock(QgsDockWidget):
+    """Dock widget with per-layer map canvas rendering times."""
+
+    SCALE_TOLERANCE = 0.1
+
+    def __init__(
+        self, profiler: RenderProfiler, parent: Optional[QWidget] = None
+    ) -> None:
+        """Initialize the render profiler dock.
+
+        :param profiler: Profiler providing statistics.
+        :type profiler: RenderProfiler
+        :param parent: Optional parent widget.
+        :type parent: Optional[QWidget]
+        """
+        super().__init__(parent)
+        self.setObjectName("DevToolsRenderProfilerDock")
+        self.setWindowTitle(self.tr("Render Profiler"))
+        self.__profiler = profiler
+        self.__profiler.samples_added.connect(self.refresh)
+
+        self.__load_ui()
+        self.refresh()
+
+    @pyqtSlot()
+    def refresh(self) -> None:
+        """Reload statistics from the profiler."""
+        scale_range = None
+        if self.__widget.current_scale_checkbox.isChecked():
+            scale = iface.mapCanvas().scale()
+            scale_range = (
+                scale * (1 - self.SCALE_TOLERANCE),
+                scale * (1 + self.SCALE_TOLERANCE),
+            )
+
+        self.__model.removeRows(0, self.__model.rowCount())
+        for statistics in self.__profiler.statistics(scale_range):
+            self.__model.appendRow(self.__row(statistics))
+
+        frame_p50 = self.__profiler.frame_time(50)
+        frame_p95 = self.__profiler.frame_time(95)
+        if math.isnan(frame_p50):
+            self.__widget.summary_label.setText(
+                self.tr("No canvas refreshes recorded yet")
+            )
+        else:
+            self.__widget.summary_label.setText(
+                self.tr(
+                    "Canvas refresh: p50 {p50:.1f} ms, p95 {p95:.1f} ms. "
+                    "Layers taking at least half of the frame are bold."
+                ).format(p50=frame_p50 * 1000, p95=frame_p95 * 1000)
+            )
+
+    def __load_ui(self) -> None:
+        widget: Optional[QWidget] = None
+        try:
+            widget = uic.loadUi(
+                str(Path(__file__).parent / "render_profiler_dock_base.ui")
+            )
+        except Exception as error:
+            raise DevToolsUiLoadError from error
+
+        if widget is None:
+            raise DevToolsUiLoadError
+
+        self.__widget = widget
+        self.setWidget(self.__widget)
+
+        self.__model = QStandardItemModel(0, 6, self)
+        self.__model.setHorizontalHeaderLabels(
+            [
+                self.tr("Layer"),
+                self.tr("Samples"),
+                self.tr("p50, ms"),
+                self.tr("p95, ms"),
+                self.tr("Max, ms"),
+                self.tr("Share"),
+            ]
+        )
+
+        self.__proxy_model = QSortFilterProxyModel(self)
+        self.__proxy_model.setSourceModel(self.__model)
+        self.__proxy_model.setSortRole(SORT_ROLE)
+
+        table_view: QTableView = self.__widget.table_view
+        table_view.setModel(self.__proxy_model)
+        table_view.sortByColumn(2, Qt.SortOrder.DescendingOrder)
+        table_view.horizontalHeader().setSectionResizeMode(
+            QHeaderView.ResizeMode.ResizeToContents
+        )
+
+        record_button: QPushButton = self.__widget.record_button
+        record_button.setChecked(self.__profiler.is_running)
+        record_button.toggled.connect(self.__on_record_toggled)
+        self.__widget.measure_button.clicked.connect(self.__profiler.measure)
+        self.__widget.reset_button.clicked.connect(self.__reset)
+        self.__widget.current_scale_checkbox.toggled.connect(self.refresh)
+
+    @pyqtSlot(bool)
+    def __on_record_toggled(self, checked: bool) -> None:
+        if checked:
+            self.__profiler.start()
+        else:
+            self.__profiler.stop()
+
+    @pyqtSlot()
+    def __reset(self) -> None:
+        self.__profiler.reset()
+        self.refresh()
+
+    def __row(self, statistics: LayerRenderStatistics) -> List[QStandardItem]:
+        name_item = QStandardItem(statistics.layer_name)
+        name_item.setData(statistics.layer_name.lower(), SORT_ROLE)
+        name_item.setToolTip(statistics.layer_id)
+
+        row = [
+            name_item,
+            self.__number_item(statistics.samples, str(statistics.samples)),
+            self.__time_item(statistics.p50),
+            self.__time_item(statistics.p95),
+            self.__time_item(statistics.max_time),
+            self.__number_item(statistics.share, f"{statistics.share:.0%}"),
+        ]
+        if statistics.is_dominant:
+            font = QFont()
+            font.setBold(True)
+            for item in row:
+                item.setFont(font)
+        return row
+
+    def __number_item(self, value: float, text: str) -> QStandardItem:
+        item = QStandardItem(text)
+        item.setData(value, SORT_ROLE)
+        item.setTextAlignment(
+            Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+        )
+        return item
+
+    def __time_item(self, seconds: float) -> QStandardItem:
+        return self.__number_item(seconds, f"{seconds * 1000:.1f}")
@@ -0,0 +1,172 @@
+# QGIS DevTools Plugin
+# Copyright (C) 2025  NextGIS
+#
+# This program is free software; you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation; either version 2 of the License, or any
+# later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License along
+# with this program; if not, see <https://www.gnu.org/licenses/>.
+
+from pathlib import Path
+from typing import Optional
+
+from qgis.PyQt import uic
+from qgis.PyQt.QtCore import (
+    QSortFilterProxyModel,
+    Qt,
+    QTimer,
+    pyqtSlot,
+)
+from qgis.PyQt.QtGui import QStandardItem, QStandardItemModel
+from qgis.PyQt.QtWidgets import (
+    QDialog,
+    QHeaderView,
+    QPushButton,
+    QTableView,
+    QVBoxLayout,
+    QWidget,
+)
+
+from devtools.core.exceptions import DevToolsUiLoadError
+from devtools.profiling.signal_profiler import SignalProfiler
+
+SORT_ROLE = Qt.ItemDataRole.UserRole + 1
+
+
+class SignalProfilerDialog(QDialog):
+    """Dialog showing a sortable table of signal handler timings."""
+
+    REFRESH_INTERVAL = 1000  # ms
+
+    def __init__(
+        self, profiler: SignalProfiler, parent: Optional[QWidget] = None
+    ) -> None:
+        """Initialize the signal profiler dialog.
+
+        :param profiler: Profiler providing statistics.
+        :type profiler: SignalProfiler
+        :param parent: Optional parent widget.
+        :type parent: Optional[QWidget]
+        """
+        super().__init__(parent)
+        self.setWindowTitle(self.tr("Signal Profiler"))
+        self.__profiler = profiler
+
+        self.__refresh_timer = QTimer(self)
+        self.__refresh_timer.setInterval(self.REFRESH_INTERVAL)
+        self.__refresh_timer.timeout.connect(self.refresh)
+
+        self.__load_ui()
+        self.refresh()
+
+    @pyqtSlot()
+    def refresh(self) -> None:
+        """Reload statistics from the profiler."""
+        self.__model.removeRows(0, self.__model.rowCount())
+        for statistics in self.__profiler.statistics():
+            row = [
+                self.__text_item(statistics.signal),
+                self.__text_item(statistics.slot),
+                self.__number_item(statistics.calls, str(statistics.calls)),
+                self.__time_item(statistics.total_time),
+                self.__time_item(statistics.mean_time),
+                self.__time_item(statistics.max_time),
+            ]
+            self.__model.appendRow(row)
+
+    def __load_ui(self) -> None:
+        widget: Optional[QWidget] = None
+        try:
+            widget = uic.loadUi(
+                str(Path(__file__).parent / "signal_profiler_dialog_base.ui")
+            )
+        except Exception as error:
+            raise DevToolsUiLoadError from error
+
+        if widget is None:
+            raise DevToolsUiLoadError
+
+        self.__widget = widget
+        self.__widget.setParent(self)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self.__widget)
+
+        self.__model = QStandardItemModel(0, 6, self)
+        self.__model.setHorizontalHeaderLabels(
+            [
+                self.tr("Signal"),
+                self.tr("Slot"),
+                self.tr("Calls"),
+                self.tr("Total, ms"),
+                self.tr("Mean, ms"),
+                self.tr("Max, ms"),
+            ]
+        )
+
+        self.__proxy_model = QSortFilterProxyModel(self)
+        self.__proxy_model.setSourceModel(self.__model)
+        self.__proxy_model.setSortRole(SORT_ROLE)
+        self.__proxy_model.setFilterKeyColumn(-1)
+        self.__proxy_model.setFilterCaseSensitivity(
+            Qt.CaseSensitivity.CaseInsensitive
+        )
+
+        table_view: QTableView = self.__widget.table_view
+        table_view.setModel(self.__proxy_model)
+        table_view.sortByColumn(3, Qt.SortOrder.DescendingOrder)
+        table_view.horizontalHeader().setSectionResizeMode(
+            QHeaderView.ResizeMode.ResizeToContents
+        )
+
+        self.__widget.filter_lineedit.textChanged.connect(
+            self.__proxy_model.setFilterFixedString
+        )
+
+        record_button: QPushButton = self.__widget.record_button
+        record_button.setChecked(self.__profiler.is_recording)
+        record_button.toggled.connect(self.__on_record_toggled)
+        self.__widget.reset_button.clicked.connect(self.__reset)
+
+        if self.__profiler.is_recording:
+            self.__refresh_timer.start()
+
+    @pyqtSlot(bool)
+    def __on_record_toggled(self, checked: bool) -> None:
+        if checked:
+            self.__profiler.start()
+            self.__refresh_timer.start()
+        else:
+            self.__profiler.stop()
+            self.__refresh_timer.stop()
+            self.refresh()
+
+    @pyqtSlot()
+    def __reset(self) -> None:
+        self.__profiler.reset()
+        self.refresh()
+
+    def __text_item(self, text: str) -> QStandardItem:
+        item = QStandardItem(text)
+        item.setData(text.lower(), SORT_ROLE)
+        item.setToolTip(text)
+        return item
+
+    def __number_item(self, value: float, text: str) -> QStandardItem:
+        item = QStandardItem(text)
+        item.setData(value, SORT_ROLE)
+        item.setTextAlignment(
+            Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+        )
+        return item
+
+    def __time_item(self, seconds: float) -> QStandardItem:
+        return self.__number_item(seconds, f"{seconds * 1000:.2f}")
@@ -22,17 +22,28 @@ from qgis.gui import (
     QgsOptionsWidgetFactory,
 )
 from qgis.PyQt import uic
-from qgis.PyQt.QtCore import Qt
+from qgis.PyQt.QtCore import Qt, QUrl, pyqtSlot
+from qgis.PyQt.QtGui import QDesktopServices
 from qgis.PyQt.QtWidgets import (
     QCheckBox,
+    QComboBox,
+    QGroupBox,
     QLabel,
+    QSpinBox,
     QVBoxLayout,
     QWidget,
 )
 
 from devtools.core.constants import PACKAGE_NAME, PLUGIN_NAME
 from devtools.core.exceptions import DevToolsUiLoadError
-from devtools.core.logging import logger, update_logging_level
+from devtools.core.log_file import available_compressions
+from devtools.core.logging import (
+    log_directory,
+    logger,
+    update_log_file,
+    update_log_flood_protection,
+    update_logging_level,
+)
 from devtools.core.settings import DevToolsSettings
 from devtools.devtools_interface import DevToolsInterface
 from devtools.ui.utils import plugin_icon
@@ -60,6 +71,7 @@ class DevToolsSettingsPage(QgsOptionsPageWidget):
         Saves settings and emits settings_changed signal.
         """
         settings = DevToolsSettings()
+        self.__save_logging(settings)
         self.__save_other(settings)
 
         plugin = DevToolsInterface.instance()
@@ -84,6 +96,37 @@ class DevToolsSettingsPage(QgsOptionsPageWidget):
         self.__widget.setParent(self)
 
         self.debug_logs_checkbox: QCheckBox = self.__widget.debug_logs_checkbox
+        self.log_flood_groupbox: QGroupBox = self.__widget.log_flood_groupbox
+        self.log_rate_limit_spinbox: QSpinBox = (
+            self.__widget.log_rate_limit_spinbox
+        )
+        self.log_burst_size_spinbox: QSpinBox = (
+            self.__widget.log_burst_size_spinbox
+        )
+        self.log_call_site_limit_spinbox: QSpinBox = (
+            self.__widget.log_call_site_limit_spinbox
+        )
+        self.__widget.log_flood_reset_button.clicked.connect(
+            self.__reset_log_flood_statistics
+        )
+        self.log_file_groupbox: QGroupBox = self.__widget.log_file_groupbox
+        self.log_file_max_size_spinbox: QSpinBox = (
+            self.__widget.log_file_max_size_spinbox
+        )
+        self.log_file_backup_count_spinbox: QSpinBox = (
+            self.__widget.log_file_backup_count_spinbox
+        )
+        self.log_file_compression_combobox: QComboBox = (
+            self.__widget.log_file_compression_combobox
+        )
+        for compression in available_compressions():
+            self.log_file_compression_combobox.addItem(
+                compression, compression
+            )
+        self.__widget.log_directory_label.setText(str(log_directory()))
+        self.__widget.log_directory_button.clicked.connect(
+            self.__open_log_directory
+        )
 
         layout = QVBoxLayout()
         layout.setContentsMargins(0, 0, 0, 0)
@@ -93,6 +136,44 @@ class DevToolsSettingsPage(QgsOptionsPageWidget):
     def __load_settings(self) -> None:
         settings = DevToolsSettings()
         self.debug_logs_checkbox.setChecked(settings.is_debug_logs_enabled)
+        self.log_flood_groupbox.setChecked(
+            settings.is_log_flood_protection_enabled
+        )
+        self.log_rate_limit_spinbox.setValue(settings.log_rate_limit)
+        self.log_burst_size_spinbox.setValue(settings.log_burst_size)
+        self.log_call_site_limit_spinbox.setValue(settings.log_call_site_limit)
+        self.__update_log_flood_statistics()
+
+        self.log_file_groupbox.setChecked(settings.is_log_file_enabled)
+        self.log_file_max_size_spinbox.setValue(settings.log_file_max_size)
+        self.log_file_backup_count_spinbox.setValue(
+            settings.log_file_backup_count
+        )
+        compression_index = self.log_file_compression_combobox.findData(
+            settings.log_file_compression
+        )
+        self.log_file_compression_combobox.setCurrentIndex(
+            max(compression_index, 0)
+        )
+
+    def __save_logging(self, settings: DevToolsSettings) -> None:
+        settings.is_log_flood_protection_enabled = (
+            self.log_flood_groupbox.isChecked()
+        )
+        settings.log_rate_limit = self.log_rate_limit_spinbox.value()
+        settings.log_burst_size = self.log_burst_size_spinbox.value()
+        settings.log_call_site_limit = self.log_call_site_limit_spinbox.value()
+        update_log_flood_protection()
+
+        settings.is_log_file_enabled = self.log_file_groupbox.isChecked()
+        settings.log_file_max_size = self.log_file_max_size_spinbox.value()
+        settings.log_file_backup_count = (
+            self.log_file_backup_count_spinbox.value()
+        )
+        settings.log_file_compression = (
+            self.log_file_compression_combobox.currentData()
+        )
+        update_log_file()
 
     def __save_other(self, settings: DevToolsSettings) -> None:
         old_debug_enabled = settings.is_debug_logs_enabled
@@ -103,6 +184,49 @@ class DevToolsSettingsPage(QgsOptionsPageWidget):
             update_logging_level()
             logger.warning(f"Debug messages were {debug_state}")
 
+    def __update_log_flood_statistics(self) -> None:
+        label: QLabel = self.__widget.log_flood_statistics_label
+        if logger.flood_guard is None:
+            label.setText(self.tr("Log flood protection is disabled"))
+            return
+
+        statistics = logger.flood_guard.statistics()
+        text = self.tr(
+            "Passed: {passed}. Suppressed: {suppressed} "
+            "(repeats: {duplicates}, call site limit: {call_site}, "
+            "rate limit: {rate})."
+        ).format(
+            passed=statistics.passed,
+            suppressed=statistics.suppressed,
+            duplicates=statistics.duplicates,
+            call_site=statistics.call_site_limited,
+            rate=statistics.rate_limited,
+        )
+        top_call_sites = sorted(
+            statistics.call_sites.items(),
+            key=lambda item: item[1],
+            reverse=True,
+        )[:3]
+        if top_call_sites:
+            text += "\n" + self.tr("Noisiest call sites:")
+            text += "".join(
+                f"\n  {call_site}: {count}"
+                for call_site, count in top_call_sites
+            )
+        label.setText(text)
+
+    @pyqtSlot()
+    def __reset_log_flood_statistics(self) -> None:
+        if logger.flood_guard is not None:
+            logger.flood_guard.reset()
+        self.__update_log_flood_statistics()
+
+    @pyqtSlot()
+    def __open_log_directory(self) -> None:
+        directory = log_directory()
+        directory.mkdir(parents=True, exist_ok=True)
+        QDesktopServices.openUrl(QUrl.fromLocalFile(str(directory)))
+
 
 class DevToolsSettingsErrorPage(QgsOptionsPageWidget):
     """Error page shown if settings page fails to load.